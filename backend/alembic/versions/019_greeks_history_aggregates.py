@@ -0,0 +1,74 @@
+"""Convert greeks_snapshots to a hypertable with continuous aggregates.
+
+History queries bucket snapshots with time_bucket in SQL. The 1m/15m/1h
+continuous aggregates store per-bucket sums and counts so any coarser
+interval can be rolled up exactly as sum(sum_x) / sum(point_count).
+
+Revision ID: 019_greeks_history_aggregates
+Revises: 018_governance_audit_log
+Create Date: 2026-02-05
+"""
+
+from alembic import op
+
+revision = "019_greeks_history_aggregates"
+down_revision = "018_governance_audit_log"
+branch_labels = None
+depends_on = None
+
+# (view name, bucket width, refresh start offset, refresh schedule)
+AGGREGATES = [
+    ("greeks_snapshots_1m", "1 minute", "2 hours", "1 minute"),
+    ("greeks_snapshots_15m", "15 minutes", "1 day", "15 minutes"),
+    ("greeks_snapshots_1h", "1 hour", "3 days", "1 hour"),
+]
+
+
+def upgrade() -> None:
+    # TimescaleDB requires the partitioning column in every unique constraint
+    op.execute("ALTER TABLE greeks_snapshots DROP CONSTRAINT greeks_snapshots_pkey")
+    op.execute("ALTER TABLE greeks_snapshots ADD PRIMARY KEY (id, as_of_ts)")
+
+    op.execute("""
+        SELECT create_hypertable(
+            'greeks_snapshots',
+            'as_of_ts',
+            chunk_time_interval => INTERVAL '1 day',
+            migrate_data => true
+        )
+    """)
+
+    for view, bucket, start_offset, schedule in AGGREGATES:
+        op.execute(f"""
+            CREATE MATERIALIZED VIEW {view}
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            SELECT
+                scope,
+                scope_id,
+                time_bucket(INTERVAL '{bucket}', as_of_ts) AS bucket,
+                COUNT(*) AS point_count,
+                SUM(dollar_delta) AS sum_dollar_delta,
+                SUM(gamma_dollar) AS sum_gamma_dollar,
+                SUM(vega_per_1pct) AS sum_vega_per_1pct,
+                SUM(theta_per_day) AS sum_theta_per_day,
+                SUM(coverage_pct) AS sum_coverage_pct
+            FROM greeks_snapshots
+            GROUP BY scope, scope_id, bucket
+            WITH NO DATA
+        """)  # noqa: S608 — names and intervals come from AGGREGATES, not user input
+        op.execute(f"CREATE INDEX ix_{view}_scope_bucket ON {view} (scope, scope_id, bucket)")
+        op.execute(f"""
+            SELECT add_continuous_aggregate_policy(
+                '{view}',
+                start_offset => INTERVAL '{start_offset}',
+                end_offset => INTERVAL '{bucket}',
+                schedule_interval => INTERVAL '{schedule}'
+            )
+        """)
+
+
+def downgrade() -> None:
+    for view, _, _, _ in reversed(AGGREGATES):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view} CASCADE")
+    # The hypertable conversion (and its (id, as_of_ts) primary key) is kept:
+    # TimescaleDB cannot convert a hypertable back to a plain table in place.
@@ -0,0 +1,50 @@
+"""Allow chain anchor records in audit_logs.
+
+Anchor records commit the heads of all sharded audit chains into the root
+chain. They are stored as 'chain_anchored' events on the 'audit_chain'
+resource type, which the audit_logs CHECK constraints must allow.
+
+Revision ID: 020_audit_chain_anchors
+Revises: 019_greeks_history_aggregates
+Create Date: 2026-02-06
+"""
+
+from alembic import op
+
+revision = "020_audit_chain_anchors"
+down_revision = "019_greeks_history_aggregates"
+branch_labels = None
+depends_on = None
+
+EVENT_TYPES = (
+    "'order_placed', 'order_acknowledged', 'order_filled', "
+    "'order_cancelled', 'order_rejected', 'config_created', 'config_updated', "
+    "'config_deleted', 'alert_emitted', 'alert_acknowledged', 'alert_resolved', "
+    "'system_started', 'system_stopped', 'health_changed', 'auth_login', "
+    "'auth_logout', 'auth_failed', 'permission_changed'"
+)
+RESOURCE_TYPES = (
+    "'order', 'position', 'config', 'alert', 'strategy', 'account', 'permission', 'session'"
+)
+
+
+def _replace_constraints(event_types: str, resource_types: str) -> None:
+    op.drop_constraint("ck_audit_logs_event_type", "audit_logs", type_="check")
+    op.create_check_constraint(
+        "ck_audit_logs_event_type", "audit_logs", f"event_type IN ({event_types})"
+    )
+    op.drop_constraint("ck_audit_logs_resource_type", "audit_logs", type_="check")
+    op.create_check_constraint(
+        "ck_audit_logs_resource_type", "audit_logs", f"resource_type IN ({resource_types})"
+    )
+
+
+def upgrade() -> None:
+    _replace_constraints(
+        f"{EVENT_TYPES}, 'chain_anchored'",
+        f"{RESOURCE_TYPES}, 'audit_chain'",
+    )
+
+
+def downgrade() -> None:
+    _replace_constraints(EVENT_TYPES, RESOURCE_TYPES)
@@ -0,0 +1,38 @@
+"""Create audit_verification_checkpoint table.
+
+Streaming chain verification records the last event through which each
+chain is intact, so later runs resume from there instead of re-reading the
+whole chain.
+
+Revision ID: 021_audit_verification_checkpoint
+Revises: 020_audit_chain_anchors
+Create Date: 2026-02-06
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "021_audit_verification_checkpoint"
+down_revision = "020_audit_chain_anchors"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_verification_checkpoint",
+        sa.Column("chain_key", sa.VARCHAR(100), primary_key=True),
+        sa.Column("sequence_id", sa.BIGINT, nullable=False),
+        sa.Column("checksum", sa.VARCHAR(64), nullable=False),
+        sa.Column("events_verified", sa.BIGINT, nullable=False),
+        sa.Column(
+            "verified_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("audit_verification_checkpoint")
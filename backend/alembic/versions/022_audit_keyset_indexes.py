@@ -0,0 +1,54 @@
+"""Keyset pagination indexes for audit_logs.
+
+Audit queries order by (timestamp DESC, sequence_id DESC) and page with a
+(timestamp, sequence_id) cursor. Each index below leads with the equality
+filter of a common query and ends with both sort keys, so a page is an index
+seek plus a LIMIT scan however deep it is. They replace the single-column
+timestamp indexes for the same filters, which could not break timestamp ties.
+
+Revision ID: 022_audit_keyset_indexes
+Revises: 021_audit_verification_checkpoint
+Create Date: 2026-02-07
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "022_audit_keyset_indexes"
+down_revision = "021_audit_verification_checkpoint"
+branch_labels = None
+depends_on = None
+
+KEYSET = [sa.text("timestamp DESC"), sa.text("sequence_id DESC")]
+
+# (index name, leading equality columns)
+INDEXES = [
+    ("idx_audit_keyset", []),
+    ("idx_audit_resource_keyset", ["resource_type", "resource_id"]),
+    ("idx_audit_actor_keyset", ["actor_id"]),
+    ("idx_audit_event_type_keyset", ["event_type"]),
+]
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES:
+        op.create_index(name, "audit_logs", [*columns, *KEYSET])
+
+    op.drop_index("idx_audit_resource", table_name="audit_logs")
+    op.drop_index("idx_audit_event_type", table_name="audit_logs")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_audit_event_type",
+        "audit_logs",
+        ["event_type", sa.text("timestamp DESC")],
+    )
+    op.create_index(
+        "idx_audit_resource",
+        "audit_logs",
+        ["resource_type", "resource_id", sa.text("timestamp DESC")],
+    )
+
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="audit_logs")
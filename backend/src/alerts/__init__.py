@@ -7,23 +7,27 @@ including:
 - Alert factory and validation
 - Notification channels (Email, Webhook)
 - Routing configuration
-- Async delivery with NotificationHub
+- Async delivery with NotificationHub (with optional digest coalescing)
 - AlertService as the main entry point
 """
 
+from src.alerts.breaker import DestinationBreaker
 from src.alerts.channels import (
     DeliveryResult,
     EmailChannel,
     NotificationChannel,
     WebhookChannel,
 )
+from src.alerts.dedupe import DedupeCache
 from src.alerts.factory import (
     COOLDOWN_WINDOW_MINUTES,
     compute_dedupe_key,
     create_alert,
+    create_digest_alert,
     validate_alert,
 )
 from src.alerts.hub import (
+    CIRCUIT_OPEN_ERROR,
     SELF_ALERT_TYPES,
     NotificationHub,
 )
@@ -71,6 +75,7 @@ __all__ = [
     # Factory
     "compute_dedupe_key",
     "create_alert",
+    "create_digest_alert",
     "validate_alert",
     # Serialization
     "sanitize_details",
@@ -81,9 +86,12 @@ __all__ = [
     "NotificationChannel",
     "WebhookChannel",
     # Hub
+    "CIRCUIT_OPEN_ERROR",
+    "DestinationBreaker",
     "NotificationHub",
     # Repository
     "AlertRepository",
+    "DedupeCache",
     # Routing
     "RoutingConfig",
     "get_destinations_for_alert",
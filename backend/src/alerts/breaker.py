@@ -0,0 +1,81 @@
+"""Per-destination circuit breaker for alert delivery.
+
+A dead webhook or mail server should not cost every alert a full retry
+schedule. NotificationHub keeps one DestinationBreaker per (channel,
+destination) and skips the destination while its breaker is open:
+
+- CLOSED: deliveries go through; consecutive failures are counted
+- OPEN: after failure_threshold consecutive failures, deliveries are
+  skipped until reset_seconds have passed
+- HALF-OPEN: one probe delivery is let through; success closes the
+  breaker, failure opens it for another reset_seconds
+"""
+
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class DestinationBreaker:
+    """Consecutive-failure circuit breaker for one delivery destination.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open the breaker
+        reset_seconds: How long the breaker stays open before a probe
+        failure_count: Current consecutive failure count
+        opened_mono: Monotonic time the breaker opened, None when closed
+        probing: Whether a half-open probe is in flight
+    """
+
+    failure_threshold: int = 5
+    reset_seconds: float = 60.0
+    failure_count: int = 0
+    opened_mono: float | None = None
+    probing: bool = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether deliveries to this destination are currently skipped."""
+        return self.opened_mono is not None
+
+    def allow(self) -> bool:
+        """Check whether a delivery may be attempted now.
+
+        Once reset_seconds have passed, the first caller is let through as
+        the half-open probe and later callers are refused until it reports.
+
+        Returns:
+            True if the delivery should be attempted
+        """
+        if self.opened_mono is None:
+            return True
+        if self.probing or time.monotonic() - self.opened_mono < self.reset_seconds:
+            return False
+        self.probing = True
+        return True
+
+    def seconds_until_probe(self) -> float:
+        """Seconds until allow() may let a probe through; 0.0 when closed or due."""
+        if self.opened_mono is None:
+            return 0.0
+        return max(0.0, self.opened_mono + self.reset_seconds - time.monotonic())
+
+    def release_probe(self) -> None:
+        """Give up a probe that ended without recording an outcome.
+
+        The breaker stays open; the next allow() may probe again.
+        """
+        self.probing = False
+
+    def record_success(self) -> None:
+        """Record a successful delivery; closes the breaker."""
+        self.failure_count = 0
+        self.opened_mono = None
+        self.probing = False
+
+    def record_failure(self) -> None:
+        """Record a failed delivery; opens the breaker at the threshold."""
+        self.failure_count += 1
+        if self.probing or self.failure_count >= self.failure_threshold:
+            self.opened_mono = time.monotonic()
+            self.probing = False
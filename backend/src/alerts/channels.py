@@ -35,7 +35,8 @@ class DeliveryResult:
 class NotificationChannel(ABC):
     """Abstract base class for notification channels.
 
-    All notification channels must implement the send() method.
+    All notification channels must implement the send() method. Channels
+    holding connections should also override aclose().
     """
 
     @abstractmethod
@@ -51,6 +52,9 @@ class NotificationChannel(ABC):
         """
         pass
 
+    async def aclose(self) -> None:  # noqa: B027 — optional hook, most channels hold no connections
+        """Release any connections held by the channel."""
+
 
 class EmailChannel(NotificationChannel):
     """SMTP-based email notification channel.
@@ -148,7 +152,9 @@ class EmailChannel(NotificationChannel):
 class WebhookChannel(NotificationChannel):
     """HTTP webhook notification channel.
 
-    Sends Slack-compatible JSON payloads via POST request.
+    Sends Slack-compatible JSON payloads via POST request. Requests share
+    one keep-alive connection pool, created on first send, so repeated
+    deliveries to the same host reuse open connections.
     """
 
     # Emoji mapping for severity levels
@@ -158,13 +164,41 @@ class WebhookChannel(NotificationChannel):
         Severity.SEV3: ":information_source:",
     }
 
-    def __init__(self, timeout_seconds: float = 10.0):
+    def __init__(
+        self,
+        timeout_seconds: float = 10.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+    ):
         """Initialize the webhook channel.
 
         Args:
             timeout_seconds: HTTP request timeout (default: 10.0 seconds)
+            max_connections: Connection pool size across all hosts (default: 20)
+            max_keepalive_connections: Idle connections kept open (default: 10)
         """
         self.timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def send(self, alert: AlertEvent, destination: str) -> DeliveryResult:
         """Send a webhook notification.
@@ -203,10 +237,9 @@ class WebhookChannel(NotificationChannel):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                response = await client.post(destination, json=payload)
-                response.raise_for_status()
-                return DeliveryResult(success=True, response_code=response.status_code)
+            response = await self._get_client().post(destination, json=payload)
+            response.raise_for_status()
+            return DeliveryResult(success=True, response_code=response.status_code)
         except httpx.TimeoutException:
             return DeliveryResult(
                 success=False,
@@ -0,0 +1,183 @@
+"""In-process dedupe cache in front of AlertRepository.persist_alert.
+
+Alerts that re-fire every cycle are duplicates almost every time, and
+finding that out through the alerts dedupe index costs a database round
+trip per emit. DedupeCache remembers the dedupe keys the database has
+already accepted, so repeats are answered from memory:
+
+    cache = DedupeCache(max_entries=10_000, ttl_seconds=600)
+    repo = AlertRepository(session, dedupe_cache=cache)
+
+A miss always falls through to the database, so the unique index stays the
+source of truth and the cache can only skip writes for keys the database
+already holds. Given a Redis client, keys are shared across processes as
+well; SET NX keeps the first writer's alert id.
+
+Duplicates answered from the cache are counted per key, and
+AlertRepository adds the counts to suppressed_count in bulk.
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from src.alerts.factory import COOLDOWN_WINDOW_MINUTES
+from src.alerts.metrics import dedupe_cache_entries, dedupe_cache_lookups_total
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class DedupeCache:
+    """Bounded, TTL'd cache of persisted dedupe keys.
+
+    Entries are evicted least-recently-used once max_entries is reached,
+    and expire ttl_seconds after they were stored.
+
+    Attributes:
+        KEY_PREFIX: Prefix for dedupe keys in Redis
+        hits: Lookups answered from memory or Redis
+        misses: Lookups that fell through to the database
+    """
+
+    KEY_PREFIX = "alerts:dedupe"
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = COOLDOWN_WINDOW_MINUTES * 60,
+        redis: "Redis | None" = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum keys held in memory (default: 10000)
+            ttl_seconds: Lifetime of a cached key (default: one cooldown window)
+            redis: Optional async Redis client to share keys across processes
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis = redis
+        self.hits = 0
+        self.misses = 0
+
+        # dedupe_key -> (expires_mono, alert_id), least recently used first
+        self._entries: OrderedDict[str, tuple[float, UUID]] = OrderedDict()
+        self._suppressed: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered without the database."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    async def get(self, dedupe_key: str) -> UUID | None:
+        """Look up a dedupe key, counting a hit as a suppressed duplicate.
+
+        Args:
+            dedupe_key: Key computed by compute_dedupe_key
+
+        Returns:
+            The alert id stored under the key, or None on a miss
+        """
+        now = time.monotonic()
+        entry = self._entries.get(dedupe_key)
+        if entry is not None:
+            expires_mono, alert_id = entry
+            if expires_mono > now:
+                self._entries.move_to_end(dedupe_key)
+                self._record_hit(dedupe_key, "hit_local")
+                return alert_id
+            del self._entries[dedupe_key]
+
+        if self.redis is not None:
+            alert_id = await self._redis_get(dedupe_key)
+            if alert_id is not None:
+                self._remember(dedupe_key, alert_id, now)
+                self._record_hit(dedupe_key, "hit_redis")
+                return alert_id
+
+        self.misses += 1
+        dedupe_cache_lookups_total.labels(result="miss").inc()
+        return None
+
+    async def put(self, dedupe_key: str, alert_id: UUID) -> None:
+        """Remember a key the database has accepted.
+
+        Args:
+            dedupe_key: Key computed by compute_dedupe_key
+            alert_id: Id of the alert row holding the key
+        """
+        self._remember(dedupe_key, alert_id, time.monotonic())
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(
+                self._redis_key(dedupe_key),
+                str(alert_id),
+                nx=True,
+                ex=math.ceil(self.ttl_seconds),
+            )
+        except RedisError as e:
+            logger.warning("Dedupe cache Redis write failed for %s: %s", dedupe_key, e)
+
+    def drain_suppressed(self) -> dict[str, int]:
+        """Take the suppressed-duplicate counts accumulated since the last drain.
+
+        Returns:
+            Mapping of dedupe_key to duplicates answered from the cache
+        """
+        suppressed, self._suppressed = self._suppressed, {}
+        return suppressed
+
+    def restore_suppressed(self, counts: dict[str, int]) -> None:
+        """Put back drained counts that could not be written.
+
+        Args:
+            counts: Counts returned by drain_suppressed
+        """
+        for dedupe_key, count in counts.items():
+            self._suppressed[dedupe_key] = self._suppressed.get(dedupe_key, 0) + count
+
+    def _remember(self, dedupe_key: str, alert_id: UUID, now: float) -> None:
+        """Store a key locally, evicting the least recently used if full."""
+        self._entries[dedupe_key] = (now + self.ttl_seconds, alert_id)
+        self._entries.move_to_end(dedupe_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        dedupe_cache_entries.set(len(self._entries))
+
+    def _record_hit(self, dedupe_key: str, result: str) -> None:
+        self.hits += 1
+        self._suppressed[dedupe_key] = self._suppressed.get(dedupe_key, 0) + 1
+        dedupe_cache_lookups_total.labels(result=result).inc()
+
+    async def _redis_get(self, dedupe_key: str) -> UUID | None:
+        """Read a key from Redis, treating errors and bad values as misses."""
+        try:
+            data = await self.redis.get(self._redis_key(dedupe_key))
+        except RedisError as e:
+            logger.warning("Dedupe cache Redis read failed for %s: %s", dedupe_key, e)
+            return None
+        if data is None:
+            return None
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        try:
+            return UUID(data)
+        except ValueError:
+            logger.warning("Invalid alert id in dedupe cache key %s", dedupe_key)
+            return None
+
+    def _redis_key(self, dedupe_key: str) -> str:
+        return f"{self.KEY_PREFIX}:{dedupe_key}"
@@ -3,6 +3,7 @@
 This module provides functions for:
 - Creating AlertEvent instances with proper defaults and normalization
 - Computing deduplication keys for alert grouping
+- Coalescing alerts into digest alerts for batched delivery
 - Validating alert constraints
 
 Usage:
@@ -37,6 +38,9 @@ from src.alerts.models import (
 # Deduplication cooldown window in minutes
 COOLDOWN_WINDOW_MINUTES = 10
 
+# Distinct alerts listed in a digest's details; the rest are counted
+DIGEST_MAX_LINES = 15
+
 
 def create_alert(
     type: AlertType,
@@ -139,6 +143,43 @@ def compute_dedupe_key(alert: AlertEvent) -> str:
         return f"{alert.fingerprint}:{bucket}"
 
 
+def create_digest_alert(alerts: list[AlertEvent]) -> AlertEvent:
+    """Coalesce alerts bound for one destination into a single digest alert.
+
+    Alerts sharing a dedupe key collapse into one line with a count. The
+    digest takes the type and severity of its most severe alert and the
+    timestamp of its latest one.
+
+    Args:
+        alerts: Alerts to coalesce (at least one), in arrival order
+
+    Returns:
+        A new AlertEvent summarizing the alerts
+    """
+    groups: dict[str, list[AlertEvent]] = {}
+    for alert in alerts:
+        try:
+            key = compute_dedupe_key(alert)
+        except ValueError:
+            key = alert.fingerprint
+        groups.setdefault(key, []).append(alert)
+
+    lead = min(alerts, key=lambda alert: alert.severity.value)
+    details: dict[str, Any] = {"alert_count": len(alerts)}
+    for i, group in enumerate(list(groups.values())[:DIGEST_MAX_LINES], start=1):
+        details[f"{i:02d}"] = f"{len(group)}x {group[0].summary}"
+    if len(groups) > DIGEST_MAX_LINES:
+        details["more"] = f"{len(groups) - DIGEST_MAX_LINES} more distinct alerts"
+
+    return create_alert(
+        type=lead.type,
+        severity=lead.severity,
+        summary=f"{len(alerts)} alerts ({len(groups)} distinct): {lead.summary}",
+        timestamp=max(alert.event_timestamp for alert in alerts),
+        details=details,
+    )
+
+
 def validate_alert(alert: AlertEvent) -> None:
     """Validate an alert event.
 
@@ -2,9 +2,15 @@
 
 This module provides the NotificationHub class which handles:
 - Async queue-based alert delivery with configurable workers
-- Exponential backoff retry for failed deliveries
+- Concurrent delivery to each of an alert's destinations
+- Exponential backoff retry for failed deliveries, scheduled on a delay
+  queue so workers never sleep through a backoff
+- Per-destination circuit breakers so dead endpoints are skipped quickly
 - Fallback synchronous delivery for SEV1 alerts when queue is full
 - Prevention of alert recursion for delivery failure alerts
+- Optional coalescing of non-SEV1 alerts into per-destination digests
+- Repository writes from concurrent deliveries on separate sessions (with a
+  session factory) or serialized on the shared one
 
 Usage:
     from src.alerts.hub import NotificationHub
@@ -12,6 +18,8 @@ Usage:
     hub = NotificationHub(
         repository=alert_repo,
         channels={"email": email_channel, "webhook": webhook_channel},
+        digest_window_seconds=30.0,
+        session_factory=async_session,
     )
     await hub.start(num_workers=3)
 
@@ -23,12 +31,21 @@ Usage:
 """
 
 import asyncio
+import contextlib
+import heapq
+import itertools
 import logging
+import time
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.alerts.breaker import DestinationBreaker
 from src.alerts.channels import NotificationChannel
-from src.alerts.factory import create_alert
+from src.alerts.factory import create_alert, create_digest_alert
 from src.alerts.models import AlertEvent, AlertType, Severity
+from src.alerts.repository import AlertRepository
 from src.alerts.routing import get_destinations_for_alert
 
 logger = logging.getLogger(__name__)
@@ -36,15 +53,27 @@ logger = logging.getLogger(__name__)
 # Alert types that should not trigger more alerts (prevent recursion)
 SELF_ALERT_TYPES: frozenset[AlertType] = frozenset({AlertType.ALERT_DELIVERY_FAILED})
 
+# Error recorded for deliveries skipped because the destination's breaker is open
+CIRCUIT_OPEN_ERROR = "Circuit open for destination"
+
+# Error recorded for retries still waiting on the delay queue at stop()
+STOPPED_ERROR = "NotificationHub stopped before retry"
+
 
 class NotificationHub:
     """Async notification hub with queue-based delivery and retry logic.
 
     Features:
     - Background worker tasks process alerts from an async queue
-    - Exponential backoff retry for failed deliveries
+    - An alert's destinations are delivered concurrently
+    - Exponential backoff retry for failed deliveries; retries wait on a
+      delay queue drained by a scheduler task, not in the worker
+    - Per-destination circuit breakers skip endpoints that keep failing
     - SEV1 alerts are never dropped (fallback sync delivery if queue full)
     - ALERT_DELIVERY_FAILED alerts don't trigger more alerts (prevent recursion)
+    - With a digest window, non-SEV1 alerts for the same destination are
+      coalesced into one digest message and their delivery attempts are
+      recorded in one batch; SEV1 alerts are always delivered immediately
     """
 
     def __init__(
@@ -55,6 +84,10 @@ class NotificationHub:
         max_retries: int = 5,
         retry_base_delay: float = 1.0,
         retry_multiplier: float = 2.0,
+        digest_window_seconds: float = 0.0,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_seconds: float = 60.0,
+        session_factory: Callable[[], AsyncSession] | None = None,
     ):
         """Initialize the NotificationHub.
 
@@ -65,6 +98,16 @@ class NotificationHub:
             max_retries: Maximum delivery attempts per destination (default: 5)
             retry_base_delay: Initial retry delay in seconds (default: 1.0)
             retry_multiplier: Multiplier for exponential backoff (default: 2.0)
+            digest_window_seconds: How long non-SEV1 alerts are held per
+                destination before being sent as one digest (default: 0.0,
+                which disables coalescing)
+            breaker_failure_threshold: Consecutive failures that open a
+                destination's circuit breaker (default: 5)
+            breaker_reset_seconds: How long an open breaker skips its
+                destination before probing it again (default: 60.0)
+            session_factory: Callable that creates AsyncSession instances;
+                each delivery write then uses its own session. Without it,
+                writes go through repository one at a time.
         """
         self.repository = repository
         self.channels = channels
@@ -72,11 +115,35 @@ class NotificationHub:
         self.max_retries = max_retries
         self.retry_base_delay = retry_base_delay
         self.retry_multiplier = retry_multiplier
+        self.digest_window_seconds = digest_window_seconds
+        self.breaker_failure_threshold = breaker_failure_threshold
+        self.breaker_reset_seconds = breaker_reset_seconds
+        self.session_factory = session_factory
+
+        # Deliveries run concurrently but an AsyncSession must not be shared
+        # between tasks; guards repository when there is no session factory
+        self._repository_lock = asyncio.Lock()
 
         self._queue: asyncio.Queue[AlertEvent] = asyncio.Queue(maxsize=max_queue_size)
         self._workers: list[asyncio.Task[None]] = []
         self._running = False
 
+        # Pending digests keyed by (channel_type, destination), each flushed
+        # by its own timer task once the window closes (or on stop)
+        self._digests: dict[tuple[str, str], list[AlertEvent]] = {}
+        self._digest_timers: set[asyncio.Task[None]] = set()
+        self._flush_digests = asyncio.Event()
+
+        # Delay queue of retries: heap of (due_mono, seq, alert, channel_type,
+        # destination, attempt), drained by the scheduler task
+        self._retry_queue: list[tuple[float, int, AlertEvent, str, str, int]] = []
+        self._retry_seq = itertools.count()
+        self._retry_wakeup = asyncio.Event()
+        self._retry_scheduler: asyncio.Task[None] | None = None
+        self._retry_tasks: set[asyncio.Task[None]] = set()
+
+        self._breakers: dict[tuple[str, str], DestinationBreaker] = {}
+
     async def start(self, num_workers: int = 3) -> None:
         """Start worker tasks for processing the alert queue.
 
@@ -84,6 +151,10 @@ class NotificationHub:
             num_workers: Number of concurrent worker tasks (default: 3)
         """
         self._running = True
+        self._flush_digests.clear()
+        self._retry_scheduler = asyncio.create_task(
+            self._run_retry_scheduler(), name="notification_retry_scheduler"
+        )
         for worker_id in range(num_workers):
             task = asyncio.create_task(
                 self._worker(worker_id), name=f"notification_worker_{worker_id}"
@@ -92,9 +163,30 @@ class NotificationHub:
         logger.info("NotificationHub started with %d workers", num_workers)
 
     async def stop(self) -> None:
-        """Stop all worker tasks gracefully."""
+        """Stop all worker tasks gracefully.
+
+        Pending digests are flushed immediately rather than dropped. Retries
+        already in flight finish; those still waiting on the delay queue are
+        given up as final failures, so a SEV1 among them is persisted as
+        ALERT_DELIVERY_FAILED. Channels are then closed.
+        """
         self._running = False
 
+        if self._digest_timers:
+            self._flush_digests.set()
+            await asyncio.gather(*self._digest_timers, return_exceptions=True)
+
+        if self._retry_scheduler is not None:
+            self._retry_scheduler.cancel()
+            await asyncio.gather(self._retry_scheduler, return_exceptions=True)
+            self._retry_scheduler = None
+            # Any retry these schedule stays on the delay queue
+            await asyncio.gather(*self._retry_tasks, return_exceptions=True)
+            await self._abandon_pending_retries()
+
+        for channel in self.channels.values():
+            await channel.aclose()
+
         if not self._workers:
             return
 
@@ -174,6 +266,11 @@ class NotificationHub:
     async def _deliver_alert(self, alert: AlertEvent) -> None:
         """Deliver an alert to all configured destinations.
 
+        Destinations are delivered concurrently; this returns once each has
+        had its first attempt, with any retries left on the delay queue.
+        When a digest window is configured, non-SEV1 alerts are added to each
+        destination's pending digest instead of being sent right away.
+
         Args:
             alert: The alert event to deliver
         """
@@ -188,6 +285,7 @@ class NotificationHub:
             )
             return
 
+        deliveries = []
         for channel_type, destination in destinations:
             channel = self.channels.get(channel_type)
             if channel is None:
@@ -198,22 +296,94 @@ class NotificationHub:
                 )
                 continue
 
-            await self._deliver_with_retry(alert, channel, channel_type, destination)
+            if self._should_coalesce(alert):
+                self._add_to_digest(alert, channel_type, destination)
+            else:
+                deliveries.append(
+                    self._deliver_with_retry(alert, channel, channel_type, destination)
+                )
+
+        results = await asyncio.gather(*deliveries, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Alert %s delivery error: %s", alert.alert_id, result)
 
-    async def _deliver_with_retry(
+    def _should_coalesce(self, alert: AlertEvent) -> bool:
+        """Whether an alert may wait for a digest instead of going out now."""
+        return (
+            self.digest_window_seconds > 0
+            and alert.severity != Severity.SEV1
+            and alert.type not in SELF_ALERT_TYPES
+        )
+
+    def _add_to_digest(self, alert: AlertEvent, channel_type: str, destination: str) -> None:
+        """Add an alert to a destination's pending digest.
+
+        The first alert for a destination opens the window and starts the
+        timer that flushes it.
+
+        Args:
+            alert: The alert event to deliver
+            channel_type: Type of channel
+            destination: Destination address
+        """
+        key = (channel_type, destination)
+        pending = self._digests.get(key)
+        if pending is not None:
+            pending.append(alert)
+            return
+
+        self._digests[key] = [alert]
+        timer = asyncio.create_task(
+            self._flush_digest_after_window(key), name=f"digest_{channel_type}"
+        )
+        self._digest_timers.add(timer)
+        timer.add_done_callback(self._digest_timers.discard)
+
+    async def _flush_digest_after_window(self, key: tuple[str, str]) -> None:
+        """Wait out the digest window (or stop()), then deliver the digest.
+
+        Args:
+            key: (channel_type, destination) of the pending digest
+        """
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._flush_digests.wait(), timeout=self.digest_window_seconds)
+
+        alerts = self._digests.pop(key, None)
+        if not alerts:
+            return
+
+        channel_type, destination = key
+        try:
+            await self._deliver_digest(
+                alerts, self.channels[channel_type], channel_type, destination
+            )
+        except Exception as e:
+            logger.exception(
+                "Digest of %d alerts via %s to %s failed: %s",
+                len(alerts),
+                channel_type,
+                destination,
+                e,
+            )
+
+    async def _deliver_digest(
         self,
-        alert: AlertEvent,
+        alerts: list[AlertEvent],
         channel: NotificationChannel,
         channel_type: str,
         destination: str,
     ) -> bool:
-        """Deliver an alert to a single destination with exponential backoff retry.
+        """Deliver coalesced alerts as one message with exponential backoff retry.
 
-        Retry delays follow exponential backoff: base_delay * (multiplier ^ attempt)
-        For defaults (base=1.0, multiplier=2.0): 1s, 2s, 4s, 8s, 16s
+        Runs in the digest's own timer task, so backoff sleeps here never hold
+        a worker. A single alert is sent as-is; several are combined with
+        create_digest_alert. Every attempt is recorded against every alert
+        the message covers, with one record_delivery_attempts call once
+        delivery has finished.
 
         Args:
-            alert: The alert event to deliver
+            alerts: The alerts to deliver, in arrival order
             channel: The notification channel to use
             channel_type: Type of channel (for logging and recording)
             destination: Destination address (email, webhook URL, etc.)
@@ -221,27 +391,177 @@ class NotificationHub:
         Returns:
             True if delivery succeeded, False if all retries exhausted
         """
+        message = alerts[0] if len(alerts) == 1 else create_digest_alert(alerts)
+        breaker = self._breaker_for(channel_type, destination)
+        attempts: list[dict] = []
         last_error: str | None = None
+        delivered = False
 
         for attempt in range(1, self.max_retries + 1):
-            # Record delivery attempt
-            delivery_id = await self.repository.record_delivery_attempt(
-                alert_id=alert.alert_id,
-                channel=channel_type,
-                destination_key=destination,
-                attempt_number=attempt,
-                status="pending",
+            response_code: int | None = None
+            if not breaker.allow():
+                last_error = CIRCUIT_OPEN_ERROR
+                attempts.extend(
+                    {
+                        "alert_id": alert.alert_id,
+                        "channel": channel_type,
+                        "destination_key": destination,
+                        "attempt_number": attempt,
+                        "status": "failed",
+                        "error_message": last_error,
+                    }
+                    for alert in alerts
+                )
+                break
+
+            try:
+                result = await channel.send(message, destination)
+                response_code = result.response_code
+                if result.success:
+                    delivered = True
+                else:
+                    last_error = result.error_message or "Unknown error"
+            except Exception as e:
+                last_error = str(e)
+
+            if delivered:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+
+            attempts.extend(
+                {
+                    "alert_id": alert.alert_id,
+                    "channel": channel_type,
+                    "destination_key": destination,
+                    "attempt_number": attempt,
+                    "status": "sent" if delivered else "failed",
+                    "response_code": response_code,
+                    "error_message": None if delivered else last_error,
+                }
+                for alert in alerts
+            )
+
+            if delivered:
+                logger.debug(
+                    "Digest of %d alerts delivered via %s to %s (attempt %d)",
+                    len(alerts),
+                    channel_type,
+                    destination,
+                    attempt,
+                )
+                break
+
+            logger.warning(
+                "Digest of %d alerts delivery failed via %s (attempt %d/%d): %s",
+                len(alerts),
+                channel_type,
+                attempt,
+                self.max_retries,
+                last_error,
             )
 
+            # Wait before retry (except on last attempt)
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_delay(attempt + 1))
+
+        async with self._repository() as repo:
+            await repo.record_delivery_attempts(attempts)
+
+        if not delivered:
+            await self._handle_delivery_failure(message, channel_type, last_error or "Unknown")
+        return delivered
+
+    async def _deliver_with_retry(
+        self,
+        alert: AlertEvent,
+        channel: NotificationChannel,
+        channel_type: str,
+        destination: str,
+        attempt: int = 1,
+    ) -> bool:
+        """Make one delivery attempt to a single destination, scheduling a retry on failure.
+
+        A failed attempt is pushed onto the delay queue with exponential
+        backoff (see retry_delay) rather than slept on, so the caller is
+        free as soon as the attempt finishes. While the destination's
+        circuit breaker is open the attempt is skipped: a SEV1 alert is
+        put back on the delay queue until the breaker can probe again, any
+        other alert is treated as a final failure.
+
+        Args:
+            alert: The alert event to deliver
+            channel: The notification channel to use
+            channel_type: Type of channel (for logging and recording)
+            destination: Destination address (email, webhook URL, etc.)
+            attempt: Attempt number, starting at 1
+
+        Returns:
+            True if this attempt delivered the alert, False otherwise
+        """
+        breaker = self._breaker_for(channel_type, destination)
+        if not breaker.allow():
+            async with self._repository() as repo:
+                await repo.record_delivery_attempts(
+                    [
+                        {
+                            "alert_id": alert.alert_id,
+                            "channel": channel_type,
+                            "destination_key": destination,
+                            "attempt_number": attempt,
+                            "status": "failed",
+                            "error_message": CIRCUIT_OPEN_ERROR,
+                        }
+                    ]
+                )
+            if alert.severity == Severity.SEV1:
+                # Hold a SEV1 until the breaker lets a probe through again
+                delay = max(breaker.seconds_until_probe(), self.retry_base_delay)
+                logger.warning(
+                    "SEV1 alert %s deferred %.1fs via %s to %s: %s",
+                    alert.alert_id,
+                    delay,
+                    channel_type,
+                    destination,
+                    CIRCUIT_OPEN_ERROR,
+                )
+                self._schedule_retry(alert, channel_type, destination, attempt, delay=delay)
+                return False
+
+            logger.warning(
+                "Alert %s skipped via %s to %s: %s",
+                alert.alert_id,
+                channel_type,
+                destination,
+                CIRCUIT_OPEN_ERROR,
+            )
+            await self._handle_delivery_failure(alert, channel_type, CIRCUIT_OPEN_ERROR)
+            return False
+
+        # allow() just claimed the half-open probe if the breaker was open
+        is_probe = breaker.probing
+        try:
+            # Record delivery attempt
+            async with self._repository() as repo:
+                delivery_id = await repo.record_delivery_attempt(
+                    alert_id=alert.alert_id,
+                    channel=channel_type,
+                    destination_key=destination,
+                    attempt_number=attempt,
+                    status="pending",
+                )
+
             try:
                 result = await channel.send(alert, destination)
 
                 if result.success:
-                    await self.repository.update_delivery_status(
-                        delivery_id=delivery_id,
-                        status="sent",
-                        response_code=result.response_code,
-                    )
+                    breaker.record_success()
+                    async with self._repository() as repo:
+                        await repo.update_delivery_status(
+                            delivery_id=delivery_id,
+                            status="sent",
+                            response_code=result.response_code,
+                        )
                     logger.debug(
                         "Alert %s delivered via %s to %s (attempt %d)",
                         alert.alert_id,
@@ -250,46 +570,168 @@ class NotificationHub:
                         attempt,
                     )
                     return True
-                else:
-                    last_error = result.error_message or "Unknown error"
-                    await self.repository.update_delivery_status(
+
+                error = result.error_message or "Unknown error"
+                async with self._repository() as repo:
+                    await repo.update_delivery_status(
                         delivery_id=delivery_id,
                         status="failed",
                         response_code=result.response_code,
-                        error_message=last_error,
-                    )
-                    logger.warning(
-                        "Alert %s delivery failed via %s (attempt %d/%d): %s",
-                        alert.alert_id,
-                        channel_type,
-                        attempt,
-                        self.max_retries,
-                        last_error,
+                        error_message=error,
                     )
-            except Exception as e:
-                last_error = str(e)
-                await self.repository.update_delivery_status(
-                    delivery_id=delivery_id,
-                    status="failed",
-                    error_message=last_error,
+                logger.warning(
+                    "Alert %s delivery failed via %s (attempt %d/%d): %s",
+                    alert.alert_id,
+                    channel_type,
+                    attempt,
+                    self.max_retries,
+                    error,
                 )
+            except Exception as e:
+                error = str(e)
+                async with self._repository() as repo:
+                    await repo.update_delivery_status(
+                        delivery_id=delivery_id,
+                        status="failed",
+                        error_message=error,
+                    )
                 logger.warning(
                     "Alert %s delivery exception via %s (attempt %d/%d): %s",
                     alert.alert_id,
                     channel_type,
                     attempt,
                     self.max_retries,
-                    last_error,
+                    error,
                 )
 
-            # Wait before retry (except on last attempt)
+            breaker.record_failure()
             if attempt < self.max_retries:
-                delay = self.retry_base_delay * (self.retry_multiplier ** (attempt - 1))
-                await asyncio.sleep(delay)
+                self._schedule_retry(alert, channel_type, destination, attempt + 1)
+            else:
+                # All retries exhausted
+                await self._handle_delivery_failure(alert, channel_type, error)
+            return False
+        finally:
+            if is_probe and breaker.probing:
+                # The attempt raised before recording an outcome (e.g. the
+                # delivery record could not be written); let a later one probe
+                breaker.release_probe()
+
+    def retry_delay(self, attempt: int) -> float:
+        """Backoff before the given attempt: base_delay * multiplier ^ (attempt - 2).
 
-        # All retries exhausted
-        await self._handle_delivery_failure(alert, channel_type, last_error or "Unknown")
-        return False
+        For defaults (base=1.0, multiplier=2.0), attempts 2-5 wait 1s, 2s, 4s, 8s.
+
+        Args:
+            attempt: The attempt about to be made (2 or more)
+
+        Returns:
+            Delay in seconds
+        """
+        return self.retry_base_delay * (self.retry_multiplier ** (attempt - 2))
+
+    def _schedule_retry(
+        self,
+        alert: AlertEvent,
+        channel_type: str,
+        destination: str,
+        attempt: int,
+        delay: float | None = None,
+    ) -> None:
+        """Push a retry onto the delay queue.
+
+        Args:
+            alert: The alert event to deliver
+            channel_type: Type of channel
+            destination: Destination address
+            attempt: Attempt number of the retry
+            delay: Seconds to wait (default: retry_delay(attempt))
+        """
+        if delay is None:
+            delay = self.retry_delay(attempt)
+        due = time.monotonic() + delay
+        entry = (due, next(self._retry_seq), alert, channel_type, destination, attempt)
+        heapq.heappush(self._retry_queue, entry)
+        if self._retry_queue[0] is entry:
+            # New earliest retry: wake the scheduler to shorten its wait
+            self._retry_wakeup.set()
+
+    async def _run_retry_scheduler(self) -> None:
+        """Scheduler loop that starts each queued retry once it is due."""
+        while self._running:
+            timeout = None
+            if self._retry_queue:
+                timeout = max(0.0, self._retry_queue[0][0] - time.monotonic())
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._retry_wakeup.wait(), timeout=timeout)
+            self._retry_wakeup.clear()
+
+            now = time.monotonic()
+            while self._retry_queue and self._retry_queue[0][0] <= now:
+                _, _, alert, channel_type, destination, attempt = heapq.heappop(self._retry_queue)
+                task = asyncio.create_task(
+                    self._run_retry(alert, channel_type, destination, attempt)
+                )
+                self._retry_tasks.add(task)
+                task.add_done_callback(self._retry_tasks.discard)
+
+    async def _run_retry(
+        self, alert: AlertEvent, channel_type: str, destination: str, attempt: int
+    ) -> None:
+        """Make a due retry, logging rather than raising errors.
+
+        Args:
+            alert: The alert event to deliver
+            channel_type: Type of channel
+            destination: Destination address
+            attempt: Attempt number of the retry
+        """
+        try:
+            await self._deliver_with_retry(
+                alert, self.channels[channel_type], channel_type, destination, attempt
+            )
+        except Exception as e:
+            logger.exception("Retry of alert %s via %s failed: %s", alert.alert_id, channel_type, e)
+
+    async def _abandon_pending_retries(self) -> None:
+        """Give up the retries left on the delay queue as final failures."""
+        if not self._retry_queue:
+            return
+        logger.warning("NotificationHub stopping with %d retries pending", len(self._retry_queue))
+        pending, self._retry_queue = self._retry_queue, []
+        for _, _, alert, channel_type, _, _ in sorted(pending):
+            try:
+                await self._handle_delivery_failure(alert, channel_type, STOPPED_ERROR)
+            except Exception as e:
+                logger.exception(
+                    "Could not record abandoned retry of alert %s: %s", alert.alert_id, e
+                )
+
+    @contextlib.asynccontextmanager
+    async def _repository(self) -> AsyncIterator[Any]:
+        """Repository for one write.
+
+        With a session factory each write gets a repository on its own
+        session; otherwise the shared repository is held under a lock.
+        """
+        if self.session_factory is not None:
+            async with self.session_factory() as session:
+                yield AlertRepository(session)
+        else:
+            async with self._repository_lock:
+                yield self.repository
+
+    def _breaker_for(self, channel_type: str, destination: str) -> DestinationBreaker:
+        """Return the circuit breaker for a destination, creating it on first use."""
+        key = (channel_type, destination)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = DestinationBreaker(
+                failure_threshold=self.breaker_failure_threshold,
+                reset_seconds=self.breaker_reset_seconds,
+            )
+            self._breakers[key] = breaker
+        return breaker
 
     async def _handle_delivery_failure(
         self, alert: AlertEvent, channel_type: str, error: str
@@ -329,7 +771,8 @@ class NotificationHub:
                 },
             )
             # Persist only - do not enqueue for delivery
-            await self.repository.persist_alert(failure_alert)
+            async with self._repository() as repo:
+                await repo.persist_alert(failure_alert)
             logger.error(
                 "Created ALERT_DELIVERY_FAILED for SEV1 alert %s (failed via %s)",
                 alert.alert_id,
@@ -367,22 +810,24 @@ class NotificationHub:
 
             try:
                 # Record delivery attempt
-                delivery_id = await self.repository.record_delivery_attempt(
-                    alert_id=alert.alert_id,
-                    channel=channel_type,
-                    destination_key=destination,
-                    attempt_number=1,
-                    status="pending",
-                )
+                async with self._repository() as repo:
+                    delivery_id = await repo.record_delivery_attempt(
+                        alert_id=alert.alert_id,
+                        channel=channel_type,
+                        destination_key=destination,
+                        attempt_number=1,
+                        status="pending",
+                    )
 
                 result = await channel.send(alert, destination)
 
                 if result.success:
-                    await self.repository.update_delivery_status(
-                        delivery_id=delivery_id,
-                        status="sent",
-                        response_code=result.response_code,
-                    )
+                    async with self._repository() as repo:
+                        await repo.update_delivery_status(
+                            delivery_id=delivery_id,
+                            status="sent",
+                            response_code=result.response_code,
+                        )
                     logger.info(
                         "Fallback: alert %s delivered via %s to %s",
                         alert.alert_id,
@@ -390,12 +835,13 @@ class NotificationHub:
                         destination,
                     )
                 else:
-                    await self.repository.update_delivery_status(
-                        delivery_id=delivery_id,
-                        status="failed",
-                        response_code=result.response_code,
-                        error_message=result.error_message,
-                    )
+                    async with self._repository() as repo:
+                        await repo.update_delivery_status(
+                            delivery_id=delivery_id,
+                            status="failed",
+                            response_code=result.response_code,
+                            error_message=result.error_message,
+                        )
                     logger.error(
                         "Fallback: alert %s delivery failed via %s: %s",
                         alert.alert_id,
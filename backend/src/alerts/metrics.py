@@ -0,0 +1,20 @@
+"""Prometheus metrics for the alert system.
+
+Metrics exported:
+- alerts_dedupe_cache_lookups_total: Counter of dedupe cache lookups by result
+- alerts_dedupe_cache_entries: Gauge of keys held in the in-process dedupe cache
+"""
+
+from prometheus_client import Counter, Gauge
+
+# Dedupe cache metrics (hit rate = hit_local + hit_redis over all lookups)
+dedupe_cache_lookups_total = Counter(
+    "alerts_dedupe_cache_lookups_total",
+    "Total number of alert dedupe cache lookups",
+    ["result"],  # hit_local, hit_redis, miss
+)
+
+dedupe_cache_entries = Gauge(
+    "alerts_dedupe_cache_entries",
+    "Number of dedupe keys held in the in-process cache",
+)
@@ -4,49 +4,79 @@ This module provides the AlertRepository class for persisting and retrieving
 alerts and delivery records from the database. Key features:
 
 - Deduplication using ON CONFLICT ... DO UPDATE
+- Bulk persistence with multi-row INSERT ... ON CONFLICT DO NOTHING RETURNING
 - Suppression counting for duplicate alerts
 - Delivery tracking with status updates
+- Bulk recording of finished delivery attempts (digest delivery)
+- Optional DedupeCache that answers repeat duplicates without the database
 
 Usage:
     from src.alerts.repository import AlertRepository
 
-    repo = AlertRepository(session)
+    repo = AlertRepository(session, dedupe_cache=DedupeCache())
     is_new, alert_id = await repo.persist_alert(alert)
     if is_new:
         delivery_id = await repo.record_delivery_attempt(...)
 """
 
 import json
+import logging
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.alerts.dedupe import DedupeCache
 from src.alerts.factory import compute_dedupe_key
-from src.alerts.models import AlertEvent
+from src.alerts.models import RECOVERY_TYPES, AlertEvent
+
+logger = logging.getLogger(__name__)
+
+# Rows per multi-row INSERT in persist_alerts (13 bind params each)
+BULK_INSERT_CHUNK = 500
+
+# Columns of a finished delivery attempt, in INSERT order
+DELIVERY_COLUMNS = (
+    "id",
+    "alert_id",
+    "channel",
+    "destination_key",
+    "attempt_number",
+    "status",
+    "response_code",
+    "error_message",
+    "sent_at",
+    "created_at",
+)
 
 
 class AlertRepository:
     """Repository for alert and delivery database operations.
 
     Uses raw SQL with INSERT ... ON CONFLICT for efficient deduplication.
+    With a dedupe cache, duplicates of keys already persisted are answered
+    from the cache and their suppressed counts are written in bulk.
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, dedupe_cache: DedupeCache | None = None):
         """Initialize repository with database session.
 
         Args:
             session: SQLAlchemy async session for database operations
+            dedupe_cache: Optional cache of persisted dedupe keys
         """
         self.session = session
+        self.dedupe_cache = dedupe_cache
 
     async def persist_alert(self, alert: AlertEvent) -> tuple[bool, UUID]:
         """Persist an alert to the database with deduplication.
 
         Uses INSERT ... ON CONFLICT (dedupe_key) DO UPDATE to handle duplicates.
         If a duplicate is detected, increments suppressed_count instead of
-        inserting a new row.
+        inserting a new row. With a dedupe cache, a cached key is reported as
+        a duplicate without touching the database; misses still go through
+        the dedupe index.
 
         Args:
             alert: The alert event to persist
@@ -58,6 +88,22 @@ class AlertRepository:
         """
         dedupe_key = compute_dedupe_key(alert)
 
+        cacheable = self.dedupe_cache is not None and alert.type not in RECOVERY_TYPES
+        if cacheable:
+            cached_id = await self.dedupe_cache.get(dedupe_key)
+            if cached_id is not None:
+                return (False, cached_id)
+
+        is_new, alert_id = await self._persist_alert(alert, dedupe_key)
+
+        if cacheable:
+            await self.dedupe_cache.put(dedupe_key, alert_id)
+            await self._flush_suppressed_quietly()
+        return (is_new, alert_id)
+
+    async def _persist_alert(self, alert: AlertEvent, dedupe_key: str) -> tuple[bool, UUID]:
+        """Persist one alert through the dedupe index (see persist_alert)."""
+
         # Extract entity fields
         account_id = alert.entity_ref.account_id if alert.entity_ref else None
         symbol = alert.entity_ref.symbol if alert.entity_ref else None
@@ -125,6 +171,175 @@ class AlertRepository:
             await self.session.commit()
             return (True, alert.alert_id)
 
+    async def persist_alerts(self, alerts: list[AlertEvent]) -> list[tuple[bool, UUID]]:
+        """Persist a batch of alerts with deduplication in bulk.
+
+        New alerts are written with one multi-row
+        INSERT ... ON CONFLICT DO NOTHING RETURNING per chunk; the rows not
+        returned already existed, and get their suppressed_count bumped with
+        a single UPDATE ... RETURNING. Commits once for the whole batch. With
+        a dedupe cache, cached keys are answered first and only the misses
+        are written.
+
+        Args:
+            alerts: The alert events to persist
+
+        Returns:
+            List of (is_new, alert_id) tuples in input order, with the same
+            meaning as persist_alert(). An alert repeating an earlier
+            dedupe_key in the same batch is reported as a duplicate.
+        """
+        if not alerts:
+            return []
+
+        keys = [compute_dedupe_key(alert) for alert in alerts]
+        if self.dedupe_cache is None:
+            return await self._persist_alerts(alerts, keys)
+
+        results: list[tuple[bool, UUID] | None] = [None] * len(alerts)
+        misses: list[int] = []
+        for i, (alert, dedupe_key) in enumerate(zip(alerts, keys, strict=True)):
+            cached_id = None
+            if alert.type not in RECOVERY_TYPES:
+                cached_id = await self.dedupe_cache.get(dedupe_key)
+            if cached_id is not None:
+                results[i] = (False, cached_id)
+            else:
+                misses.append(i)
+
+        if misses:
+            written = await self._persist_alerts(
+                [alerts[i] for i in misses], [keys[i] for i in misses]
+            )
+            for i, outcome in zip(misses, written, strict=True):
+                results[i] = outcome
+                if alerts[i].type not in RECOVERY_TYPES:
+                    await self.dedupe_cache.put(keys[i], outcome[1])
+            await self._flush_suppressed_quietly()
+
+        return results
+
+    async def _persist_alerts(
+        self, alerts: list[AlertEvent], keys: list[str]
+    ) -> list[tuple[bool, UUID]]:
+        """Persist a batch through the dedupe index (see persist_alerts)."""
+        created_at = datetime.now(tz=timezone.utc).isoformat()
+        rows: dict[str, dict] = {}
+        for alert, dedupe_key in zip(alerts, keys, strict=True):
+            if dedupe_key in rows:
+                continue
+            rows[dedupe_key] = {
+                "id": str(alert.alert_id),
+                "type": alert.type.value,
+                "severity": alert.severity.value,
+                "fingerprint": alert.fingerprint,
+                "dedupe_key": dedupe_key,
+                "summary": alert.summary,
+                "details": json.dumps(alert.details) if alert.details else None,
+                "account_id": alert.entity_ref.account_id if alert.entity_ref else None,
+                "symbol": alert.entity_ref.symbol if alert.entity_ref else None,
+                "strategy_id": alert.entity_ref.strategy_id if alert.entity_ref else None,
+                "event_timestamp": alert.event_timestamp.isoformat(),
+                "created_at": created_at,
+            }
+
+        try:
+            # dedupe_key -> id for rows this call inserted
+            inserted: dict[str, str] = {}
+            pending = list(rows.values())
+            for start in range(0, len(pending), BULK_INSERT_CHUNK):
+                chunk = pending[start : start + BULK_INSERT_CHUNK]
+                params: dict[str, object] = {}
+                values = []
+                for i, row in enumerate(chunk):
+                    params.update({f"{name}_{i}": value for name, value in row.items()})
+                    values.append(
+                        f"(:id_{i}, :type_{i}, :severity_{i}, :fingerprint_{i}, "
+                        f":dedupe_key_{i}, :summary_{i}, :details_{i}, :account_id_{i}, "
+                        f":symbol_{i}, :strategy_id_{i}, 0, :event_timestamp_{i}, "
+                        f":created_at_{i})"
+                    )
+                # No conflict target: matches the (type, dedupe_key) unique index
+                # in PostgreSQL and the dedupe_key constraint in older schemas
+                insert_sql = text(f"""
+                    INSERT INTO alerts (
+                        id, type, severity, fingerprint, dedupe_key, summary, details,
+                        entity_account_id, entity_symbol, entity_strategy_id,
+                        suppressed_count, event_timestamp, created_at
+                    ) VALUES {", ".join(values)}
+                    ON CONFLICT DO NOTHING
+                    RETURNING dedupe_key, id
+                """)  # noqa: S608 — only generated bind placeholders are interpolated
+                result = await self.session.execute(insert_sql, params)
+                inserted.update({row[0]: row[1] for row in result.fetchall()})
+
+            # Existing rows: count the suppressed duplicates and fetch their ids
+            existing: dict[str, str] = {}
+            duplicate_keys = [key for key in rows if key not in inserted]
+            if duplicate_keys:
+                update_sql = text("""
+                    UPDATE alerts
+                    SET suppressed_count = suppressed_count + 1
+                    WHERE dedupe_key IN :dedupe_keys
+                    RETURNING dedupe_key, id
+                """).bindparams(bindparam("dedupe_keys", expanding=True))
+                result = await self.session.execute(update_sql, {"dedupe_keys": duplicate_keys})
+                existing = {row[0]: row[1] for row in result.fetchall()}
+
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        results: list[tuple[bool, UUID]] = []
+        seen: set[str] = set()
+        for key in keys:
+            if key in inserted and key not in seen:
+                results.append((True, UUID(str(inserted[key]))))
+            else:
+                results.append((False, UUID(str(existing.get(key) or inserted[key]))))
+            seen.add(key)
+        return results
+
+    async def flush_suppressed_counts(self) -> int:
+        """Write duplicates answered by the dedupe cache to suppressed_count.
+
+        Runs as one batched UPDATE and one commit. On failure the counts are
+        returned to the cache for the next flush.
+
+        Returns:
+            Number of alerts whose suppressed_count was updated
+        """
+        if self.dedupe_cache is None:
+            return 0
+        counts = self.dedupe_cache.drain_suppressed()
+        if not counts:
+            return 0
+
+        update_sql = text("""
+            UPDATE alerts
+            SET suppressed_count = suppressed_count + :count
+            WHERE dedupe_key = :dedupe_key
+        """)
+        try:
+            await self.session.execute(
+                update_sql,
+                [{"dedupe_key": key, "count": count} for key, count in counts.items()],
+            )
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            self.dedupe_cache.restore_suppressed(counts)
+            raise
+        return len(counts)
+
+    async def _flush_suppressed_quietly(self) -> None:
+        """Flush suppressed counts after a write, without failing the write."""
+        try:
+            await self.flush_suppressed_counts()
+        except Exception as e:
+            logger.warning("Failed to flush cached suppressed counts: %s", e)
+
     async def get_alert(self, alert_id: UUID) -> dict | None:
         """Get an alert by ID.
 
@@ -209,6 +424,64 @@ class AlertRepository:
 
         return delivery_id
 
+    async def record_delivery_attempts(self, attempts: list[dict]) -> list[UUID]:
+        """Record finished delivery attempts in bulk.
+
+        Unlike record_delivery_attempt, each attempt is written once with
+        its outcome rather than inserted as pending and updated later, and
+        the whole batch is one multi-row INSERT per chunk and one commit.
+
+        Args:
+            attempts: Dicts with alert_id, channel, destination_key,
+                attempt_number, status, and optionally response_code and
+                error_message
+
+        Returns:
+            The UUIDs of the delivery records, in input order
+        """
+        if not attempts:
+            return []
+
+        now = datetime.now(tz=timezone.utc).isoformat()
+        delivery_ids = [uuid4() for _ in attempts]
+        rows = [
+            {
+                "id": str(delivery_id),
+                "alert_id": str(attempt["alert_id"]),
+                "channel": attempt["channel"],
+                "destination_key": attempt["destination_key"],
+                "attempt_number": attempt["attempt_number"],
+                "status": attempt["status"],
+                "response_code": attempt.get("response_code"),
+                "error_message": attempt.get("error_message"),
+                "sent_at": now if attempt["status"] == "sent" else None,
+                "created_at": now,
+            }
+            for delivery_id, attempt in zip(delivery_ids, attempts, strict=True)
+        ]
+
+        try:
+            for start in range(0, len(rows), BULK_INSERT_CHUNK):
+                chunk = rows[start : start + BULK_INSERT_CHUNK]
+                params: dict[str, object] = {}
+                values = []
+                for i, row in enumerate(chunk):
+                    params.update({f"{name}_{i}": value for name, value in row.items()})
+                    values.append(
+                        "(" + ", ".join(f":{name}_{i}" for name in DELIVERY_COLUMNS) + ")"
+                    )
+                insert_sql = text(f"""
+                    INSERT INTO alert_deliveries ({", ".join(DELIVERY_COLUMNS)})
+                    VALUES {", ".join(values)}
+                """)  # noqa: S608 — only constant columns and bind placeholders are interpolated
+                await self.session.execute(insert_sql, params)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return delivery_ids
+
     async def update_delivery_status(
         self,
         delivery_id: UUID,
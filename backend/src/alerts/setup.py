@@ -7,8 +7,9 @@ the application.
 Usage:
     from src.alerts.setup import init_alert_service, get_alert_service
 
-    # During startup (with a database session):
-    service = await init_alert_service(db_session)
+    # During startup (with a database session, and a session factory so
+    # concurrent deliveries each write on their own session):
+    service = await init_alert_service(db_session, session_factory=async_session)
 
     # Later, anywhere in the app:
     service = get_alert_service()
@@ -35,6 +36,7 @@ import logging
 import os
 
 from src.alerts.channels import EmailChannel, WebhookChannel
+from src.alerts.dedupe import DedupeCache
 from src.alerts.hub import NotificationHub
 from src.alerts.repository import AlertRepository
 from src.alerts.service import AlertService
@@ -44,14 +46,19 @@ logger = logging.getLogger(__name__)
 _alert_service: AlertService | None = None
 
 
-async def init_alert_service(db_session) -> AlertService:
+async def init_alert_service(db_session, redis=None, session_factory=None) -> AlertService:
     """Initialize alert service with channels.
 
-    Creates the AlertRepository, notification channels (email if configured,
-    webhook always), NotificationHub with workers, and AlertService.
+    Creates the AlertRepository (with an in-process dedupe cache, shared
+    through Redis when a client is given), notification channels (email if
+    configured, webhook always), NotificationHub with workers, and
+    AlertService.
 
     Args:
         db_session: Database session for persistence
+        redis: Optional async Redis client for sharing dedupe keys
+        session_factory: Optional callable creating AsyncSession instances for
+            the hub's delivery records; without it they share db_session
 
     Returns:
         Configured AlertService instance
@@ -59,7 +66,7 @@ async def init_alert_service(db_session) -> AlertService:
     global _alert_service
 
     # Create repository
-    repo = AlertRepository(db_session)
+    repo = AlertRepository(db_session, dedupe_cache=DedupeCache(redis=redis))
 
     # Create channels
     channels = {}
@@ -81,7 +88,12 @@ async def init_alert_service(db_session) -> AlertService:
     logger.info("Webhook channel configured")
 
     # Create hub
-    hub = NotificationHub(repository=repo, channels=channels)
+    hub = NotificationHub(
+        repository=repo,
+        channels=channels,
+        digest_window_seconds=float(os.getenv("ALERT_DIGEST_WINDOW_SECONDS", "30")),
+        session_factory=session_factory,
+    )
     await hub.start(num_workers=2)
 
     # Create service
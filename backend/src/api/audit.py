@@ -1,16 +1,21 @@
 # backend/src/api/audit.py
 """Audit API endpoints for viewing and verifying audit logs."""
 
+import json
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.audit.integrity import verify_chain
+from src.audit.models import AuditEventType, ResourceType
+from src.audit.repository import AuditQueryFilters, AuditRepository
+from src.audit.setup import get_audit_archive
 from src.db.database import get_session
 
 
@@ -43,12 +48,17 @@ class AuditLogResponse(BaseModel):
 
 
 class AuditLogListResponse(BaseModel):
-    """Response model for paginated audit log list."""
+    """Response model for paginated audit log list.
+
+    next_cursor continues after the last log (keyset pagination); it is
+    None on the last page. total is only counted for offset pagination.
+    """
 
     logs: list[AuditLogResponse]
-    total: int
+    total: int | None
     offset: int
     limit: int
+    next_cursor: str | None = None
 
 
 class AuditStatsResponse(BaseModel):
@@ -86,6 +96,18 @@ class AuditQueryParams(BaseModel):
 router = APIRouter(prefix="/api/audit", tags=["audit"])
 
 
+def get_audit_repository(db: AsyncSession = Depends(get_session)) -> AuditRepository:
+    """Get an AuditRepository for the request, with the configured archive.
+
+    Args:
+        db: Database session
+
+    Returns:
+        AuditRepository that also reads archived events
+    """
+    return AuditRepository(db, archive=get_audit_archive())
+
+
 @router.get("/stats", response_model=AuditStatsResponse)
 async def get_audit_stats(
     db: AsyncSession = Depends(get_session),
@@ -142,55 +164,75 @@ async def get_audit_stats(
 async def verify_chain_integrity(
     chain_key: str,
     limit: int = Query(default=100, ge=1, le=1000),
-    db: AsyncSession = Depends(get_session),
+    repo: AuditRepository = Depends(get_audit_repository),
 ) -> ChainIntegrityResponse:
     """Verify the integrity of an audit chain.
 
+    Archived events are verified first, so the live events are checked
+    against the chain boundary the archive recorded.
+
     Args:
         chain_key: The chain key to verify
         limit: Maximum number of events to verify (default 100, max 1000)
-        db: Database session
+        repo: Audit repository
 
     Returns:
         Chain integrity verification result including validity and any errors found
     """
-    # Fetch events for the chain ordered by sequence_id
-    query = text("""
-        SELECT
-            id, sequence_id, timestamp, event_type, severity,
-            actor_id, actor_type, resource_type, resource_id,
-            request_id, source, environment, service, version,
-            correlation_id, value_mode, old_value, new_value,
-            metadata, checksum, prev_checksum, chain_key
-        FROM audit_logs
-        WHERE chain_key = :chain_key
-        ORDER BY sequence_id ASC
-        LIMIT :limit
-    """)
+    result = await repo.verify_chain_prefix(chain_key, limit=limit)
 
-    result = await db.execute(query, {"chain_key": chain_key, "limit": limit})
-    rows = result.fetchall()
+    return ChainIntegrityResponse(
+        chain_key=chain_key,
+        is_valid=result.is_valid,
+        errors=result.errors,
+        events_verified=result.events_verified,
+    )
 
-    if not rows:
-        return ChainIntegrityResponse(
-            chain_key=chain_key,
-            is_valid=True,
-            errors=[],
-            events_verified=0,
-        )
 
-    # Convert rows to dicts for verify_chain
-    events = [_row_to_dict(row) for row in rows]
+@router.get("/export")
+async def export_audit_logs(
+    event_type: AuditEventType | None = Query(default=None),
+    resource_type: ResourceType | None = Query(default=None),
+    resource_id: str | None = Query(default=None),
+    actor_id: str | None = Query(default=None),
+    start_time: datetime | None = Query(default=None),
+    end_time: datetime | None = Query(default=None),
+    repo: AuditRepository = Depends(get_audit_repository),
+) -> StreamingResponse:
+    """Export matching audit logs as NDJSON, newest first.
 
-    # Verify the chain
-    is_valid, errors = verify_chain(events)
+    Rows are read through a server-side cursor and written as they arrive,
+    so the result set is never buffered in memory. The cursor lives on the
+    request's session, which FastAPI 0.118+ keeps open until the response
+    body has been sent.
 
-    return ChainIntegrityResponse(
-        chain_key=chain_key,
-        is_valid=is_valid,
-        errors=errors,
-        events_verified=len(events),
+    Args:
+        event_type: Filter by event type
+        resource_type: Filter by resource type
+        resource_id: Filter by specific resource ID
+        actor_id: Filter by actor ID
+        start_time: Filter events after this time (inclusive)
+        end_time: Filter events before this time (inclusive)
+        repo: Audit repository
+
+    Returns:
+        Streaming application/x-ndjson response, one audit log per line
+    """
+    filters = AuditQueryFilters(
+        event_type=event_type,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        actor_id=actor_id,
+        start_time=start_time,
+        end_time=end_time,
     )
+    events = repo.stream_audit_logs(filters)
+
+    async def lines() -> AsyncIterator[str]:
+        async for event in events:
+            yield _dict_to_response(event).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get("/{event_id}", response_model=AuditLogResponse)
@@ -233,18 +275,23 @@ async def get_audit_event(
 
 @router.get("", response_model=AuditLogListResponse)
 async def list_audit_logs(
-    event_type: str | None = Query(default=None),
-    resource_type: str | None = Query(default=None),
+    event_type: AuditEventType | None = Query(default=None),
+    resource_type: ResourceType | None = Query(default=None),
     resource_id: str | None = Query(default=None),
     actor_id: str | None = Query(default=None),
     start_time: datetime | None = Query(default=None),
     end_time: datetime | None = Query(default=None),
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=50, ge=1, le=100),
-    db: AsyncSession = Depends(get_session),
+    cursor: str | None = Query(default=None),
+    repo: AuditRepository = Depends(get_audit_repository),
 ) -> AuditLogListResponse:
     """List audit logs with optional filtering and pagination.
 
+    Logs are ordered newest first by (timestamp, sequence_id). Pass the
+    previous response's next_cursor to page by key instead of offset; keyset
+    pages cost the same however deep they are and skip the total count.
+
     Args:
         event_type: Filter by event type (e.g., "order_placed", "config_updated")
         resource_type: Filter by resource type (e.g., "order", "config")
@@ -252,78 +299,42 @@ async def list_audit_logs(
         actor_id: Filter by actor ID
         start_time: Filter events after this time (inclusive)
         end_time: Filter events before this time (inclusive)
-        offset: Number of records to skip (default 0)
+        offset: Number of records to skip (default 0, ignored with cursor)
         limit: Maximum number of records to return (default 50, max 100)
-        db: Database session
+        cursor: Opaque cursor from a previous page's next_cursor
+        repo: Audit repository
 
     Returns:
-        Paginated list of audit logs with total count
-    """
-    # Build WHERE clauses and params dynamically
-    where_clauses: list[str] = []
-    params: dict[str, Any] = {"limit": limit, "offset": offset}
-
-    if event_type is not None:
-        where_clauses.append("event_type = :event_type")
-        params["event_type"] = event_type
-
-    if resource_type is not None:
-        where_clauses.append("resource_type = :resource_type")
-        params["resource_type"] = resource_type
-
-    if resource_id is not None:
-        where_clauses.append("resource_id = :resource_id")
-        params["resource_id"] = resource_id
-
-    if actor_id is not None:
-        where_clauses.append("actor_id = :actor_id")
-        params["actor_id"] = actor_id
-
-    if start_time is not None:
-        where_clauses.append("timestamp >= :start_time")
-        params["start_time"] = start_time.isoformat()
-
-    if end_time is not None:
-        where_clauses.append("timestamp <= :end_time")
-        params["end_time"] = end_time.isoformat()
-
-    where_sql = ""
-    if where_clauses:
-        where_sql = "WHERE " + " AND ".join(where_clauses)
-
-    # Get total count
-    # Note: where_sql is built from hardcoded column names only, not user input
-    count_sql = text(f"SELECT COUNT(*) FROM audit_logs {where_sql}")  # noqa: S608
-    count_result = await db.execute(count_sql, params)
-    total = count_result.scalar() or 0
-
-    # Get paginated results
-    # Note: where_sql is built from hardcoded column names only, not user input
-    query_sql = text(  # noqa: S608
-        f"""
-        SELECT
-            id, sequence_id, timestamp, event_type, severity,
-            actor_id, actor_type, resource_type, resource_id,
-            request_id, source, environment, service, version,
-            correlation_id, value_mode, old_value, new_value,
-            metadata, checksum, prev_checksum, chain_key
-        FROM audit_logs
-        {where_sql}
-        ORDER BY timestamp DESC
-        LIMIT :limit OFFSET :offset
+        Paginated list of audit logs with total count (offset mode) and next cursor
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
     """
+    filters = AuditQueryFilters(
+        event_type=event_type,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        actor_id=actor_id,
+        start_time=start_time,
+        end_time=end_time,
+        offset=0 if cursor is not None else offset,
+        limit=limit,
+        cursor=cursor,
     )
+    try:
+        rows, next_cursor = await repo.query_audit_page(filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
-    result = await db.execute(query_sql, params)
-    rows = result.fetchall()
-
-    logs = [_dict_to_response(_row_to_dict(row)) for row in rows]
+    # Keyset pages skip the count; it costs a scan however deep the page is
+    total = await repo.count_audit_logs(filters) if cursor is None else None
 
     return AuditLogListResponse(
-        logs=logs,
+        logs=[_dict_to_response(row) for row in rows],
         total=total,
-        offset=offset,
+        offset=filters.offset,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -407,8 +418,6 @@ def _parse_json_field(value: str | dict | None) -> dict | None:
     if isinstance(value, dict):
         return value
     # SQLite stores JSON as string
-    import json
-
     try:
         return json.loads(value)
     except (json.JSONDecodeError, TypeError):
@@ -17,6 +17,7 @@ from src.greeks.models import AggregatedGreeks, PositionGreeks, RiskMetric
 from src.greeks.monitor import load_positions_from_db
 from src.greeks.repository import GreeksRepository
 from src.greeks.scenario import get_scenario_shocks
+from src.greeks.scenario_grid import ScenarioGridConfig, calculate_scenario_grid
 from src.greeks.v2_models import CurrentGreeks, GreeksLimitSet, ThresholdLevels
 from src.greeks.websocket import greeks_ws_manager
 from src.schemas.greeks import (
@@ -30,6 +31,8 @@ from src.schemas.greeks import (
     GreeksLimitsApiResponse,
     GreeksOverviewResponse,
     PositionGreeksResponse,
+    ScenarioGridApiResponse,
+    ScenarioGridBreachResponse,
     ScenarioResultResponse,
     ScenarioShockApiResponse,
 )
@@ -172,7 +175,7 @@ async def get_greeks_overview(
     aggregator = GreeksAggregator()
 
     # Calculate position Greeks
-    position_greeks = calculator.calculate(positions)
+    position_greeks = await calculator.calculate_async(positions)
 
     # Aggregate to account and strategy levels
     account_greeks, strategy_greeks = aggregator.aggregate_by_strategy(position_greeks, account_id)
@@ -244,7 +247,7 @@ async def get_current_greeks(
     calculator = GreeksCalculator()
     aggregator = GreeksAggregator()
 
-    position_greeks = calculator.calculate(positions)
+    position_greeks = await calculator.calculate_async(positions)
     account_greeks = aggregator.aggregate(position_greeks, scope="ACCOUNT", scope_id=account_id)
 
     return _aggregated_to_response(account_greeks)
@@ -436,7 +439,7 @@ async def get_scenario_shock(
     calculator = GreeksCalculator()
     aggregator = GreeksAggregator()
 
-    position_greeks = calculator.calculate(positions)
+    position_greeks = await calculator.calculate_async(positions)
 
     if scope == "STRATEGY":
         account_greeks, strategy_greeks = aggregator.aggregate_by_strategy(
@@ -515,6 +518,166 @@ async def get_scenario_shock(
     )
 
 
+# Points per scenario grid axis; caps a grid at MAX_GRID_AXIS_POINTS ** 3 repricings
+MAX_GRID_AXIS_POINTS = 25
+
+# Accepted ranges per scenario grid axis (spot shocks must leave a positive spot)
+MAX_SPOT_SHOCK_PCT = Decimal("1000")
+MAX_IV_SHOCK_PTS = Decimal("500")
+MAX_TIME_STEP_DAYS = 3650
+
+
+def _parse_decimal_list(raw: str | None, name: str) -> list[Decimal]:
+    """Parse a comma-separated list of finite decimals.
+
+    Raises:
+        HTTPException: 400 if a value is malformed or not finite, or the
+            list is longer than MAX_GRID_AXIS_POINTS.
+    """
+    values: list[Decimal] = []
+    if not raw:
+        return values
+    tokens = raw.split(",")
+    if len(tokens) > MAX_GRID_AXIS_POINTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{name} accepts at most {MAX_GRID_AXIS_POINTS} values",
+        )
+    for token in tokens:
+        try:
+            value = Decimal(token.strip())
+        except ArithmeticError:
+            value = None
+        if value is None or not value.is_finite():
+            raise HTTPException(status_code=400, detail=f"Invalid {name} value: {token!r}")
+        values.append(value)
+    return values
+
+
+@router.get("/accounts/{account_id}/scenario/grid", response_model=ScenarioGridApiResponse)
+async def get_scenario_grid(
+    account_id: str,
+    spot_shocks: str | None = Query(
+        None, description="Comma-separated spot shocks in percent (e.g., '-5,0,5')"
+    ),
+    iv_shocks: str | None = Query(
+        None, description="Comma-separated IV shocks in vol points (e.g., '-5,0,5')"
+    ),
+    time_steps: str | None = Query(
+        None, description="Comma-separated time steps in days (e.g., '0,1,7')"
+    ),
+    scope: Literal["ACCOUNT", "STRATEGY"] = Query("ACCOUNT", description="Scope for scenario"),
+    strategy_id: str | None = Query(None, description="Strategy ID (required if scope=STRATEGY)"),
+    db: AsyncSession = Depends(get_session),
+) -> ScenarioGridApiResponse:
+    """Get full-revaluation scenario grid.
+
+    Reprices every leg across spot shocks × IV shocks × time steps and
+    returns the P&L matrix, projected dollar Greeks and breach map.
+
+    Args:
+        account_id: Account identifier.
+        spot_shocks: Spot shocks in percent (default: ±1, 2, 3, 5, 10 and 0).
+        iv_shocks: IV shocks in vol points (default: -5, 0, 5).
+        time_steps: Days rolled forward (default: 0, 1).
+        scope: ACCOUNT or STRATEGY.
+        strategy_id: Required if scope=STRATEGY.
+        db: Database session.
+
+    Returns:
+        ScenarioGridApiResponse with grid axes, matrices and breaches.
+
+    Raises:
+        HTTPException: 400 if scope=STRATEGY and strategy_id not provided.
+        HTTPException: 400 if a shock or time step is malformed or out of
+            range, or an axis has more than MAX_GRID_AXIS_POINTS values.
+        HTTPException: 404 if no positions found.
+    """
+    if scope == "STRATEGY" and not strategy_id:
+        raise HTTPException(
+            status_code=400,
+            detail="strategy_id is required when scope=STRATEGY",
+        )
+
+    spot_values = _parse_decimal_list(spot_shocks, "spot_shocks")
+    iv_values = _parse_decimal_list(iv_shocks, "iv_shocks")
+    day_values = _parse_decimal_list(time_steps, "time_steps")
+    if any(not -100 < v <= MAX_SPOT_SHOCK_PCT for v in spot_values):
+        raise HTTPException(
+            status_code=400,
+            detail=f"spot_shocks must be above -100 and at most {MAX_SPOT_SHOCK_PCT}",
+        )
+    if any(abs(v) > MAX_IV_SHOCK_PTS for v in iv_values):
+        raise HTTPException(
+            status_code=400,
+            detail=f"iv_shocks must be within ±{MAX_IV_SHOCK_PTS}",
+        )
+    if any(not 0 <= d <= MAX_TIME_STEP_DAYS or d != d.to_integral_value() for d in day_values):
+        raise HTTPException(
+            status_code=400,
+            detail=f"time_steps must be whole days from 0 to {MAX_TIME_STEP_DAYS}",
+        )
+
+    positions = await load_positions_from_db(db, account_id)
+    if not positions:
+        raise HTTPException(status_code=404, detail="No positions found")
+
+    calculator = GreeksCalculator()
+    position_greeks = await calculator.calculate_async(positions)
+
+    if scope == "STRATEGY":
+        position_greeks = [pg for pg in position_greeks if pg.strategy_id == strategy_id]
+        if not position_greeks:
+            raise HTTPException(status_code=404, detail=f"Strategy {strategy_id} not found")
+        scope_id = strategy_id
+    else:
+        scope_id = None
+
+    config = ScenarioGridConfig()
+    if spot_values:
+        config.spot_shocks_pct = spot_values
+    if iv_values:
+        config.iv_shocks_pts = iv_values
+    if day_values:
+        config.time_steps_days = [int(d) for d in day_values]
+
+    limits_store = get_limits_store()
+    account_limits = await limits_store.get_limits(account_id)
+    limits = {
+        "dollar_delta": account_limits.dollar_delta.hard,
+        "gamma_dollar": account_limits.gamma_dollar.hard,
+        "vega_per_1pct": account_limits.vega_per_1pct.hard,
+        "theta_per_day": account_limits.theta_per_day.hard,
+    }
+
+    grid = calculate_scenario_grid(position_greeks, config=config, limits=limits)
+    worst_pnl, _ = grid.worst_case()
+
+    return ScenarioGridApiResponse(
+        account_id=account_id,
+        scope=scope,
+        scope_id=scope_id,
+        asof_ts=datetime.now(timezone.utc),
+        spot_shocks_pct=[float(x) for x in config.spot_shocks_pct],
+        iv_shocks_pts=[float(x) for x in config.iv_shocks_pts],
+        time_steps_days=list(config.time_steps_days),
+        pnl=grid.pnl.tolist(),
+        dollar_greeks={dim: matrix.tolist() for dim, matrix in grid.dollar_greeks.items()},
+        worst_pnl=worst_pnl,
+        breaches=[
+            ScenarioGridBreachResponse(
+                spot_shock_pct=float(spot),
+                iv_shock_pts=float(iv),
+                time_step_days=days,
+                breach_dims=dims,
+            )
+            for spot, iv, days, dims in grid.breach_map()
+        ],
+        legs_priced=grid.legs_priced,
+        legs_skipped=grid.legs_skipped,
+    )
+
+
 def _request_to_limit_set(request: GreeksLimitsApiRequest) -> GreeksLimitSet:
     """Convert API request to GreeksLimitSet."""
     return GreeksLimitSet(
@@ -655,6 +818,17 @@ HISTORY_WINDOW_CONFIG = {
     "7d": {"interval_seconds": 3600, "interval_display": "1h"},
 }
 
+# Explicit bucket sizes accepted by GET /history?interval=
+HISTORY_INTERVALS: dict[str, int] = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+
 
 @router.get("/accounts/{account_id}/history", response_model=GreeksHistoryApiResponse)
 async def get_history(
@@ -662,6 +836,7 @@ async def get_history(
     window: str = Query(..., description="Time window: 1h, 4h, 1d, 7d"),
     scope: Literal["ACCOUNT", "STRATEGY"] = Query("ACCOUNT"),
     strategy_id: str | None = Query(None),
+    interval: str | None = Query(None, description="Bucket size override: 1m, 5m, 15m, 1h, ..."),
     db: AsyncSession = Depends(get_session),
 ) -> GreeksHistoryApiResponse:
     """Get historical Greeks data.
@@ -674,18 +849,23 @@ async def get_history(
     - 1d: 5min aggregation (~288 points)
     - 7d: 1h aggregation (~168 points)
 
+    An explicit interval overrides the window default. Bucketed history is
+    served from the coarsest TimescaleDB continuous aggregate (1m/15m/1h)
+    that evenly divides the interval.
+
     Args:
         account_id: Account identifier.
         window: Time window (1h, 4h, 1d, 7d).
         scope: ACCOUNT or STRATEGY.
         strategy_id: Required if scope=STRATEGY.
+        interval: Optional bucket size overriding the window default.
         db: Database session.
 
     Returns:
         GreeksHistoryApiResponse with aggregated history points.
 
     Raises:
-        HTTPException: 400 if invalid window or missing strategy_id.
+        HTTPException: 400 if invalid window/interval or missing strategy_id.
     """
     # Validate window
     if window not in HISTORY_WINDOW_CONFIG:
@@ -701,9 +881,18 @@ async def get_history(
             detail="strategy_id is required when scope=STRATEGY",
         )
 
+    if interval is not None and interval not in HISTORY_INTERVALS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid interval '{interval}'. Valid: {', '.join(HISTORY_INTERVALS)}",
+        )
+
     config = HISTORY_WINDOW_CONFIG[window]
     interval_display = config["interval_display"]
     interval_seconds = config["interval_seconds"]
+    if interval is not None:
+        interval_display = interval
+        interval_seconds = HISTORY_INTERVALS[interval]
 
     # Calculate time range
     from datetime import timedelta
@@ -46,13 +46,18 @@ Usage:
 """
 
 # Models - core data structures and enums
+# Archive - cold storage of closed partitions
+from src.audit.archive import ArchiveSegment, AuditArchive, ChainBoundary
+
 # Config - tier configuration and rules
 from src.audit.config import (
     CHECKSUM_FIELDS,
     MAX_VALUE_SIZE_BYTES,
     REDACTION_RULES,
+    ROOT_CHAIN_KEY,
     TIER_0_EVENTS,
     TIER_1_EVENTS,
+    get_chain_key,
     get_tier,
     get_value_mode,
     is_sync_required,
@@ -75,7 +80,9 @@ from src.audit.factory import (
 
 # Integrity - checksum and chain verification
 from src.audit.integrity import (
+    ChainVerifier,
     compute_checksum,
+    verify_anchor,
     verify_chain,
     verify_checksum,
 )
@@ -84,6 +91,7 @@ from src.audit.models import (
     AuditEvent,
     AuditEventType,
     AuditSeverity,
+    ChainShardStrategy,
     EventSource,
     ResourceType,
     ValueMode,
@@ -93,17 +101,25 @@ from src.audit.models import (
 from src.audit.repository import (
     AuditQueryFilters,
     AuditRepository,
+    ChainVerificationResult,
 )
 
+# Retention - move closed partitions to the archive
+from src.audit.retention import ArchiveReport, archive_audit_logs
+
 # Service - main audit service
-from src.audit.service import AuditService
+from src.audit.service import AuditService, GroupCommitStats
 
 # Setup - initialization
 from src.audit.setup import (
+    get_audit_archive,
     get_audit_service,
     init_audit_service,
 )
 
+# Verification - parallel streaming chain verification
+from src.audit.verification import VerificationReport, verify_chains
+
 __all__ = [
     # Models
     "AuditEventType",
@@ -112,6 +128,7 @@ __all__ = [
     "ResourceType",
     "EventSource",
     "ValueMode",
+    "ChainShardStrategy",
     "AuditEvent",
     # Config
     "TIER_0_EVENTS",
@@ -122,10 +139,14 @@ __all__ = [
     "CHECKSUM_FIELDS",
     "REDACTION_RULES",
     "MAX_VALUE_SIZE_BYTES",
+    "ROOT_CHAIN_KEY",
+    "get_chain_key",
     # Integrity
     "compute_checksum",
     "verify_checksum",
     "verify_chain",
+    "verify_anchor",
+    "ChainVerifier",
     # Diff
     "compute_diff_jsonpatch",
     "redact_sensitive_fields",
@@ -133,8 +154,19 @@ __all__ = [
     # Repository
     "AuditRepository",
     "AuditQueryFilters",
+    "ChainVerificationResult",
+    # Verification
+    "verify_chains",
+    "VerificationReport",
+    # Archive
+    "AuditArchive",
+    "ArchiveSegment",
+    "ChainBoundary",
+    "archive_audit_logs",
+    "ArchiveReport",
     # Service
     "AuditService",
+    "GroupCommitStats",
     # Factory
     "create_audit_event",
     "AuditContext",
@@ -143,4 +175,5 @@ __all__ = [
     # Setup
     "init_audit_service",
     "get_audit_service",
+    "get_audit_archive",
 ]
@@ -0,0 +1,524 @@
+"""Cold archive of closed audit_logs partitions.
+
+Closed UTC days of audit_logs are moved out of the database into compressed,
+column-oriented segment files under an archive root, one per day:
+
+    <root>/manifest.json
+    <root>/audit_logs/2026/02/2026-02-01.json.gz
+
+Keys use forward slashes only and files are never modified after they are
+written, so the root can be a local directory or a synced object-store
+prefix. The manifest lists every segment with the SHA256 of its file and, per
+chain, the boundary checksums of the segment (first prev_checksum and last
+checksum). Those boundaries carry the chain continuity proof across segments
+and into the live table:
+
+    archive = AuditArchive("/var/lib/aq/audit-archive")
+    is_valid, errors = archive.verify()
+    rows = list(archive.iter_rows(chain_key="order"))
+
+Reads check each file against its manifest checksum; a mismatch raises
+ValueError rather than returning tampered rows.
+"""
+
+import gzip
+import hashlib
+import heapq
+import itertools
+import json
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from src.audit.integrity import ChainVerifier
+
+# Bumped when the segment layout changes; readers reject newer formats
+ARCHIVE_FORMAT_VERSION = 1
+
+MANIFEST_NAME = "manifest.json"
+
+# audit_logs columns stored in every segment, in file order
+ARCHIVE_COLUMNS = (
+    "id",
+    "sequence_id",
+    "timestamp",
+    "event_type",
+    "severity",
+    "actor_id",
+    "actor_type",
+    "resource_type",
+    "resource_id",
+    "request_id",
+    "source",
+    "environment",
+    "service",
+    "version",
+    "correlation_id",
+    "value_mode",
+    "old_value",
+    "new_value",
+    "metadata",
+    "checksum",
+    "prev_checksum",
+    "chain_key",
+)
+
+
+@dataclass
+class ChainBoundary:
+    """Where one chain enters and leaves an archived range.
+
+    Attributes:
+        chain_key: The chain
+        first_sequence_id: First event of the chain in the range
+        first_prev_checksum: That event's prev_checksum (links to the range before)
+        last_sequence_id: Last event of the chain in the range
+        last_checksum: That event's checksum (the range after links to it)
+        event_count: Events of the chain in the range
+    """
+
+    chain_key: str
+    first_sequence_id: int
+    first_prev_checksum: str | None
+    last_sequence_id: int
+    last_checksum: str
+    event_count: int
+
+
+@dataclass
+class ArchiveSegment:
+    """Manifest entry for one archived partition.
+
+    Attributes:
+        key: Path of the segment file relative to the archive root
+        start: Inclusive start of the archived time range
+        end: Exclusive end of the archived time range
+        row_count: Events in the segment
+        size_bytes: Compressed file size
+        sha256: Hex digest of the compressed file
+        chains: Boundary checksums per chain key
+    """
+
+    key: str
+    start: datetime
+    end: datetime
+    row_count: int
+    size_bytes: int
+    sha256: str
+    chains: dict[str, ChainBoundary] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the manifest."""
+        return {
+            "key": self.key,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "row_count": self.row_count,
+            "size_bytes": self.size_bytes,
+            "sha256": self.sha256,
+            "chains": {key: asdict(boundary) for key, boundary in self.chains.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ArchiveSegment":
+        """Deserialize a manifest entry."""
+        return cls(
+            key=data["key"],
+            start=datetime.fromisoformat(data["start"]),
+            end=datetime.fromisoformat(data["end"]),
+            row_count=data["row_count"],
+            size_bytes=data["size_bytes"],
+            sha256=data["sha256"],
+            chains={key: ChainBoundary(**value) for key, value in data["chains"].items()},
+        )
+
+
+class SegmentColumns:
+    """One partition's events, accumulated column by column.
+
+    Rows can be added as they stream out of the database; only their column
+    values are kept, and the chain boundaries are tracked on the way.
+
+    Attributes:
+        row_count: Events added so far
+        chains: Boundary checksums per chain key
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty partition."""
+        self._columns: dict[str, list[Any]] = {column: [] for column in ARCHIVE_COLUMNS}
+        self.row_count = 0
+        self.chains: dict[str, ChainBoundary] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "SegmentColumns":
+        """Build a partition from event dicts."""
+        columns = cls()
+        for row in rows:
+            columns.add(row)
+        return columns
+
+    def add(self, row: dict) -> None:
+        """Append an event; rows must be by chain_key then sequence_id."""
+        for column in ARCHIVE_COLUMNS:
+            value = row.get(column)
+            if isinstance(value, UUID):
+                value = str(value)
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            self._columns[column].append(value)
+        self.row_count += 1
+        _extend_boundary(self.chains, row)
+
+    def encode(self) -> bytes:
+        """Encode the columns; similar values compress together."""
+        payload = {
+            "format": ARCHIVE_FORMAT_VERSION,
+            "row_count": self.row_count,
+            "columns": self._columns,
+        }
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+
+class AuditArchive:
+    """Segment files plus manifest under one archive root.
+
+    Args:
+        root: Archive root directory
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """Initialize the archive.
+
+        Args:
+            root: Archive root directory (created on first write)
+        """
+        self._root = Path(root)
+        self._segments: list[ArchiveSegment] | None = None
+        self._manifest_mtime_ns: int | None = None
+
+    @property
+    def segments(self) -> list[ArchiveSegment]:
+        """Archived segments, oldest first.
+
+        Reloaded when the manifest changes on disk, so readers pick up
+        segments written by a separate archiving process.
+        """
+        mtime_ns = self._stat_manifest()
+        if self._segments is None or mtime_ns != self._manifest_mtime_ns:
+            self._segments = self._load_manifest()
+            self._manifest_mtime_ns = mtime_ns
+        return self._segments
+
+    @property
+    def horizon(self) -> datetime | None:
+        """End of the archived range; every unarchived row starts at or after it."""
+        if not self.segments:
+            return None
+        return self.segments[-1].end
+
+    def chain_boundary(self, chain_key: str) -> ChainBoundary | None:
+        """Boundary of a chain across the whole archive.
+
+        Args:
+            chain_key: The chain to look up
+
+        Returns:
+            ChainBoundary spanning every segment of the chain, or None if
+            the chain has no archived events
+        """
+        boundaries = [s.chains[chain_key] for s in self.segments if chain_key in s.chains]
+        if not boundaries:
+            return None
+        return ChainBoundary(
+            chain_key=chain_key,
+            first_sequence_id=boundaries[0].first_sequence_id,
+            first_prev_checksum=boundaries[0].first_prev_checksum,
+            last_sequence_id=boundaries[-1].last_sequence_id,
+            last_checksum=boundaries[-1].last_checksum,
+            event_count=sum(b.event_count for b in boundaries),
+        )
+
+    def write_segment(self, start: datetime, end: datetime, rows: list[dict]) -> ArchiveSegment:
+        """Write one partition and record it in the manifest.
+
+        Segments must be written in time order and must not overlap.
+
+        Args:
+            start: Inclusive start of the partition
+            end: Exclusive end of the partition
+            rows: The partition's events, by chain_key then sequence_id
+
+        Returns:
+            The new manifest entry
+
+        Raises:
+            ValueError: If the range overlaps the archive or rows is empty
+        """
+        return self.write_columns(start, end, SegmentColumns.from_rows(rows))
+
+    def write_columns(
+        self, start: datetime, end: datetime, columns: SegmentColumns
+    ) -> ArchiveSegment:
+        """Write one partition accumulated as SegmentColumns.
+
+        A partition is cut per chain by sequence_id, so it can hold events
+        stamped at or after end that were sequenced before the cut.
+
+        Args:
+            start: Inclusive start of the partition
+            end: Exclusive end of the partition
+            columns: The partition's events
+
+        Returns:
+            The new manifest entry
+
+        Raises:
+            ValueError: If the range overlaps the archive or columns is empty
+        """
+        if not columns.row_count:
+            raise ValueError(f"No rows to archive for {start.isoformat()}")
+        if self.horizon is not None and start < self.horizon:
+            raise ValueError(
+                f"Segment starting {start.isoformat()} overlaps the archive "
+                f"(horizon {self.horizon.isoformat()})"
+            )
+
+        data = gzip.compress(columns.encode(), mtime=0)
+        key = f"audit_logs/{start:%Y}/{start:%m}/{start:%Y-%m-%d}.json.gz"
+        _write_atomic(self._root / key, data)
+
+        segment = ArchiveSegment(
+            key=key,
+            start=start,
+            end=end,
+            row_count=columns.row_count,
+            size_bytes=len(data),
+            sha256=hashlib.sha256(data).hexdigest(),
+            chains=columns.chains,
+        )
+        self.segments.append(segment)
+        self._save_manifest()
+        return segment
+
+    def read_segment(self, segment: ArchiveSegment) -> list[dict]:
+        """Read a segment's events after checking its file checksum.
+
+        Args:
+            segment: Manifest entry to read
+
+        Returns:
+            Event dicts by chain_key then sequence_id
+
+        Raises:
+            ValueError: If the file does not match the manifest
+        """
+        data = (self._root / segment.key).read_bytes()
+        if hashlib.sha256(data).hexdigest() != segment.sha256:
+            raise ValueError(f"Archive segment {segment.key} does not match its manifest checksum")
+        return _decode_columns(gzip.decompress(data))
+
+    def iter_rows(
+        self,
+        chain_key: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[dict]:
+        """Iterate archived events, reading only overlapping segments.
+
+        Args:
+            chain_key: Only events of this chain
+            start: Only events at or after this time
+            end: Only events at or before this time
+
+        Yields:
+            Event dicts, segment by segment in time order; within a segment
+            by chain_key then sequence_id
+        """
+        for segment in self.segments:
+            if chain_key is not None and chain_key not in segment.chains:
+                continue
+            if (start is not None and segment.end <= start) or (
+                end is not None and segment.start > end
+            ):
+                continue
+            for row in self.read_segment(segment):
+                if chain_key is not None and row["chain_key"] != chain_key:
+                    continue
+                if start is not None and row["timestamp"] < start:
+                    continue
+                if end is not None and row["timestamp"] > end:
+                    continue
+                yield row
+
+    def iter_rows_newest_first(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[dict]:
+        """Iterate archived events by (timestamp, sequence_id), newest first.
+
+        Segments are cut by sequence_id, so a segment can hold events stamped
+        past its end, and the first segment of an archiving run can hold
+        late events stamped before its start. Segments are read newest first
+        into a heap together with their older neighbour, and events are
+        released once no remaining segment can sort above them; about two
+        segments are held in memory at a time.
+
+        Args:
+            start: Only events at or after this time
+            end: Only events at or before this time
+
+        Yields:
+            Event dicts, newest first
+        """
+        segments = self.segments
+        heap: list[tuple[float, int, int, dict]] = []
+        order = itertools.count()
+        loaded = len(segments)
+        for i in range(len(segments) - 1, -1, -1):
+            while loaded > max(i - 1, 0):
+                loaded -= 1
+                for row in self.read_segment(segments[loaded]):
+                    timestamp = row["timestamp"]
+                    if (start is None or timestamp >= start) and (end is None or timestamp <= end):
+                        key = (-timestamp.timestamp(), -row["sequence_id"])
+                        heapq.heappush(heap, (*key, next(order), row))
+            floor = segments[i].start if i > 0 else None
+            while heap and (floor is None or heap[0][3]["timestamp"] >= floor):
+                yield heapq.heappop(heap)[3]
+            if start is not None and floor is not None and floor <= start:
+                return
+
+    def verify(self, chain_key: str | None = None) -> tuple[bool, list[str]]:
+        """Verify segment files, boundaries and chains across the archive.
+
+        Checks every segment against its manifest checksum and boundaries,
+        then verifies each chain end to end across segment borders.
+
+        Args:
+            chain_key: Verify only this chain (None for all)
+
+        Returns:
+            Tuple of (is_valid, errors)
+        """
+        errors: list[str] = []
+        verifiers: dict[str, ChainVerifier] = {}
+
+        for segment in self.segments:
+            if chain_key is not None and chain_key not in segment.chains:
+                continue
+            try:
+                rows = self.read_segment(segment)
+            except (OSError, ValueError) as e:
+                errors.append(str(e))
+                continue
+
+            if _chain_boundaries(rows) != segment.chains:
+                errors.append(f"Archive segment {segment.key} does not match its boundaries")
+
+            for key in sorted(segment.chains):
+                if chain_key is not None and key != chain_key:
+                    continue
+                verifier = verifiers.setdefault(key, ChainVerifier())
+                verifier.update(row for row in rows if row["chain_key"] == key)
+
+        for key, verifier in sorted(verifiers.items()):
+            errors.extend(f"Chain '{key}': {error}" for error in verifier.errors)
+
+        return len(errors) == 0, errors
+
+    def _load_manifest(self) -> list[ArchiveSegment]:
+        path = self._root / MANIFEST_NAME
+        if not path.exists():
+            return []
+        manifest = json.loads(path.read_text())
+        if manifest["format"] > ARCHIVE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported audit archive format {manifest['format']}")
+        return [ArchiveSegment.from_dict(entry) for entry in manifest["segments"]]
+
+    def _stat_manifest(self) -> int | None:
+        try:
+            return (self._root / MANIFEST_NAME).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _save_manifest(self) -> None:
+        manifest = {
+            "format": ARCHIVE_FORMAT_VERSION,
+            "segments": [segment.to_dict() for segment in self.segments],
+        }
+        _write_atomic(self._root / MANIFEST_NAME, json.dumps(manifest, indent=2).encode())
+        self._manifest_mtime_ns = self._stat_manifest()
+
+
+def parse_timestamp(value: datetime | str) -> datetime:
+    """Normalize a timestamp column value to an aware datetime.
+
+    Drivers without a native timestamp type (SQLite) return ISO strings.
+
+    Args:
+        value: Timestamp as returned by the driver
+
+    Returns:
+        Timezone-aware datetime (naive values are taken as UTC)
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _decode_columns(data: bytes) -> list[dict]:
+    """Decode a segment payload back into event dicts."""
+    payload = json.loads(data)
+    if payload["format"] > ARCHIVE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported audit archive format {payload['format']}")
+
+    columns = payload["columns"]
+    rows = [
+        {column: columns[column][i] for column in ARCHIVE_COLUMNS}
+        for i in range(payload["row_count"])
+    ]
+    for row in rows:
+        row["timestamp"] = parse_timestamp(row["timestamp"])
+    return rows
+
+
+def _chain_boundaries(rows: Iterable[dict]) -> dict[str, ChainBoundary]:
+    """Boundary checksums per chain for rows ordered by sequence_id per chain."""
+    boundaries: dict[str, ChainBoundary] = {}
+    for row in rows:
+        _extend_boundary(boundaries, row)
+    return boundaries
+
+
+def _extend_boundary(boundaries: dict[str, ChainBoundary], row: dict) -> None:
+    """Extend the boundary of row's chain to include row."""
+    boundary = boundaries.get(row["chain_key"])
+    if boundary is None:
+        boundaries[row["chain_key"]] = ChainBoundary(
+            chain_key=row["chain_key"],
+            first_sequence_id=row["sequence_id"],
+            first_prev_checksum=row["prev_checksum"],
+            last_sequence_id=row["sequence_id"],
+            last_checksum=row["checksum"],
+            event_count=1,
+        )
+    else:
+        boundary.last_sequence_id = row["sequence_id"]
+        boundary.last_checksum = row["checksum"]
+        boundary.event_count += 1
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so readers never see a partial write."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
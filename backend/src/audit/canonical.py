@@ -0,0 +1,31 @@
+"""Canonical JSON encoding of audit values.
+
+Audit values are encoded exactly once, when an event is built, and the
+resulting text is reused everywhere the value is needed as bytes:
+- enforce_size_limit measures it (and hashes it for reference mode)
+- compute_checksum embeds it in the checksum payload
+- AuditRepository binds it for the JSONB column
+
+The canonical form is json.dumps with sorted keys and default separators,
+the form chain checksums have always been computed over, so checksums of
+existing chains are unchanged.
+"""
+
+import json
+from typing import Any
+
+
+def canonical_json(value: Any) -> str | None:
+    """Encode a value in canonical form.
+
+    Output is ASCII-only, so its length is also its UTF-8 size in bytes.
+
+    Args:
+        value: JSON-serializable value (None returns None)
+
+    Returns:
+        Canonical JSON text, or None
+    """
+    if value is None:
+        return None
+    return json.dumps(value, sort_keys=True)
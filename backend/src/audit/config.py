@@ -6,6 +6,7 @@ This module defines the configuration for the audit logging system:
 - Checksum fields for integrity verification
 - Redaction rules for sensitive data protection
 - Size limits for value and metadata storage
+- Chain sharding for spreading writes across hash chains
 
 Tier 0: Critical events requiring synchronous (blocking) write
         These events must be durably persisted before the operation completes.
@@ -14,7 +15,9 @@ Tier 1: Non-critical events suitable for asynchronous (non-blocking) write
         These events can be queued and persisted in the background.
 """
 
-from src.audit.models import AuditEventType, ValueMode
+import zlib
+
+from src.audit.models import AuditEventType, ChainShardStrategy, ResourceType, ValueMode
 
 # =============================================================================
 # TIER CONFIGURATION
@@ -139,6 +142,27 @@ MAX_METADATA_SIZE_BYTES: int = 8192
 """Maximum size in bytes for the metadata field (8 KB)."""
 
 
+# =============================================================================
+# CHAIN SHARDING
+# =============================================================================
+
+DEFAULT_CHAIN_KEY: str = "default"
+"""Chain key used when sharding is disabled."""
+
+ROOT_CHAIN_KEY: str = "root"
+"""Chain key of the root chain holding anchor records.
+
+Each anchor commits the current head (sequence_id, checksum) of every other
+chain, so tampering with any shard is detectable from the root chain alone.
+"""
+
+DEFAULT_CHAIN_SHARD_COUNT: int = 16
+"""Number of chains resource IDs are hashed into (RESOURCE_ID_HASH)."""
+
+DEFAULT_ANCHOR_INTERVAL_SECONDS: float = 60.0
+"""Seconds between anchor records when anchoring is enabled."""
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -180,3 +204,29 @@ def is_sync_required(event_type: AuditEventType) -> bool:
         True if the event is tier 0 (requires sync write), False otherwise.
     """
     return event_type in TIER_0_EVENTS
+
+
+def get_chain_key(
+    resource_type: ResourceType,
+    resource_id: str,
+    strategy: ChainShardStrategy = ChainShardStrategy.NONE,
+    shard_count: int = DEFAULT_CHAIN_SHARD_COUNT,
+) -> str:
+    """Get the hash chain an event belongs to.
+
+    Args:
+        resource_type: Type of the affected resource.
+        resource_id: Identifier of the affected resource.
+        strategy: How events are sharded across chains.
+        shard_count: Number of chains for RESOURCE_ID_HASH.
+
+    Returns:
+        The chain key, e.g. "default", "order" or "shard-07".
+    """
+    if strategy == ChainShardStrategy.RESOURCE_TYPE:
+        return resource_type.value
+    if strategy == ChainShardStrategy.RESOURCE_ID_HASH:
+        # crc32 is stable across processes, unlike hash()
+        shard = zlib.crc32(resource_id.encode()) % shard_count
+        return f"shard-{shard:02d}"
+    return DEFAULT_CHAIN_KEY
@@ -12,13 +12,13 @@ Functions:
     enforce_size_limit: Enforce max size limit, switching to hash reference if exceeded
 """
 
-import copy
 import hashlib
-import json
+from functools import lru_cache
 from typing import Any
 
 import jsonpatch
 
+from src.audit.canonical import canonical_json
 from src.audit.config import MAX_VALUE_SIZE_BYTES, REDACTION_RULES
 from src.audit.models import ValueMode
 
@@ -70,7 +70,7 @@ def _mask_value(value: str) -> str:
     return f"{value[:2]}****{value[-2:]}"
 
 
-def _redact_value(value: Any, sensitive_fields: set[str], key: str) -> Any:
+def _redact_value(value: Any, sensitive_fields: frozenset[str], key: str) -> Any:
     """Recursively redact sensitive fields in a value.
 
     Args:
@@ -96,6 +96,21 @@ def _redact_value(value: Any, sensitive_fields: set[str], key: str) -> Any:
         return value
 
 
+@lru_cache(maxsize=64)
+def _sensitive_fields(resource_type: str) -> frozenset[str]:
+    """Field names to redact for a resource type (its rules plus global rules).
+
+    Args:
+        resource_type: The resource type to look up redaction rules for.
+
+    Returns:
+        Frozen set of sensitive field names.
+    """
+    return frozenset(REDACTION_RULES.get(resource_type, [])) | frozenset(
+        REDACTION_RULES.get("*", [])
+    )
+
+
 def redact_sensitive_fields(data: dict | None, resource_type: str) -> dict | None:
     """Apply redaction rules to mask sensitive fields in data.
 
@@ -113,28 +128,18 @@ def redact_sensitive_fields(data: dict | None, resource_type: str) -> dict | Non
     if data is None:
         return None
 
-    # Build set of sensitive fields to redact
-    sensitive_fields: set[str] = set()
-
-    # Add resource-type-specific rules
-    if resource_type in REDACTION_RULES:
-        sensitive_fields.update(REDACTION_RULES[resource_type])
-
-    # Add global rules
-    if "*" in REDACTION_RULES:
-        sensitive_fields.update(REDACTION_RULES["*"])
-
-    # Deep copy to avoid modifying original
-    result = copy.deepcopy(data)
+    sensitive_fields = _sensitive_fields(resource_type)
 
-    # Redact recursively
-    return {k: _redact_value(v, sensitive_fields, k) for k, v in result.items()}
+    # Redact recursively; every dict and list is rebuilt, so the original
+    # is never modified and no separate deep copy is needed
+    return {k: _redact_value(v, sensitive_fields, k) for k, v in data.items()}
 
 
 def enforce_size_limit(
     value: dict | None,
     resource_type: str,
     resource_id: str,
+    encoded: str | None = None,
 ) -> tuple[dict | None, str | None, ValueMode]:
     """Enforce maximum size limit on audit value, switching to reference if needed.
 
@@ -145,6 +150,7 @@ def enforce_size_limit(
         value: The dict value to check (None is handled gracefully).
         resource_type: The resource type (for context).
         resource_id: The resource ID (for context).
+        encoded: The value's canonical JSON, if already computed.
 
     Returns:
         Tuple of (value, hash, mode):
@@ -155,8 +161,10 @@ def enforce_size_limit(
     if value is None:
         return (None, None, ValueMode.DIFF)
 
-    # Serialize to JSON to check size
-    serialized = json.dumps(value, sort_keys=True).encode("utf-8")
+    # Measure the canonical JSON (ASCII, so characters are bytes)
+    if encoded is None:
+        encoded = canonical_json(value)
+    serialized = encoded.encode("utf-8")
     size = len(serialized)
 
     if size <= MAX_VALUE_SIZE_BYTES:
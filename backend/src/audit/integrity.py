@@ -7,15 +7,19 @@ Functions:
     compute_checksum: Compute SHA256 checksum for an audit event
     verify_checksum: Verify stored checksum matches recomputed value
     verify_chain: Verify integrity of a chain of audit events
+    ChainVerifier: Incremental, resumable verification of one chain
+    verify_anchor: Verify an anchor record against the shard chain heads
 """
 
 import hashlib
 import json
+from collections.abc import Iterable
 from datetime import datetime
 from enum import Enum
 from typing import Any
 from uuid import UUID
 
+from src.audit.canonical import canonical_json
 from src.audit.config import CHECKSUM_FIELDS
 from src.audit.models import AuditEvent
 
@@ -38,7 +42,7 @@ def _serialize_value(value: Any) -> Any:
     if isinstance(value, Enum):
         return value.value
     if isinstance(value, dict):
-        return json.dumps(value, sort_keys=True)
+        return canonical_json(value)
     return value
 
 
@@ -56,21 +60,23 @@ def compute_checksum(event: AuditEvent, sequence_id: int, prev_checksum: str | N
     Returns:
         Hex digest of the SHA256 hash.
     """
-    # Build canonical content dict from CHECKSUM_FIELDS
+    # Build canonical content dict from CHECKSUM_FIELDS, reusing the values'
+    # canonical JSON when the event was built with it
+    encoded = {"old_value": event.old_value_json, "new_value": event.new_value_json}
     content: dict[str, Any] = {}
     for field in CHECKSUM_FIELDS:
-        value = getattr(event, field)
-        content[field] = _serialize_value(value)
+        value = encoded.get(field)
+        content[field] = value if value is not None else _serialize_value(getattr(event, field))
 
     # Add chain fields
     content["sequence_id"] = sequence_id
     content["prev_checksum"] = prev_checksum
 
     # Serialize to JSON with sorted keys for deterministic output
-    canonical_json = json.dumps(content, sort_keys=True)
+    payload = json.dumps(content, sort_keys=True)
 
     # Compute SHA256 hash
-    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
 def _compute_checksum_from_row(event_row: dict, sequence_id: int, prev_checksum: str | None) -> str:
@@ -88,21 +94,22 @@ def _compute_checksum_from_row(event_row: dict, sequence_id: int, prev_checksum:
 
     for field in CHECKSUM_FIELDS:
         value = event_row.get(field)
-        # For dict values (old_value/new_value), serialize with sort_keys
-        if isinstance(value, dict):
-            content[field] = json.dumps(value, sort_keys=True)
-        else:
-            content[field] = value
+        # audit_logs rows store event_id in the "id" column
+        if field == "event_id" and value is None:
+            value = event_row.get("id")
+        # UUIDs, datetimes and dicts as returned by the driver serialize the
+        # same way as in compute_checksum
+        content[field] = _serialize_value(value)
 
     # Add chain fields
     content["sequence_id"] = sequence_id
     content["prev_checksum"] = prev_checksum
 
     # Serialize to JSON with sorted keys for deterministic output
-    canonical_json = json.dumps(content, sort_keys=True)
+    payload = json.dumps(content, sort_keys=True)
 
     # Compute SHA256 hash
-    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
 def verify_checksum(event_row: dict, sequence_id: int, prev_checksum: str | None) -> bool:
@@ -140,54 +147,150 @@ def verify_chain(events: list[dict]) -> tuple[bool, list[str]]:
         is_valid is True if all checks pass, False otherwise.
         list_of_errors contains descriptions of any errors found.
     """
-    if not events:
-        return True, []
+    verifier = ChainVerifier()
+    verifier.update(events)
+    return verifier.is_valid, verifier.errors
 
-    errors: list[str] = []
-    prev_sequence_id: int | None = None
-    prev_checksum: str | None = None
-
-    for i, event in enumerate(events):
-        sequence_id = event.get("sequence_id")
-        stored_checksum = event.get("checksum")
-        stored_prev_checksum = event.get("prev_checksum")
-
-        # Check first event has prev_checksum = None
-        if i == 0:
-            if stored_prev_checksum is not None:
-                errors.append(
-                    f"First event (sequence_id={sequence_id}) should have "
-                    f"prev_checksum=None, got '{stored_prev_checksum}'"
-                )
 
-        # Check sequence_id is monotonically increasing
-        if prev_sequence_id is not None:
-            if sequence_id <= prev_sequence_id:
-                errors.append(
-                    f"Sequence ID not monotonically increasing: "
-                    f"sequence_id={sequence_id} <= prev={prev_sequence_id}"
-                )
+class ChainVerifier:
+    """Incremental verification of one chain, fed page by page.
+
+    Applies the verify_chain checks across page boundaries by carrying the
+    previous event's sequence_id and checksum. Starting from a checkpoint
+    (prev_sequence_id, prev_checksum) resumes a chain mid-way: the first
+    event fed must then link to prev_checksum instead of None.
 
-        # Check prev_checksum matches previous event's checksum
-        if i > 0:
-            if stored_prev_checksum != prev_checksum:
-                errors.append(
-                    f"Chain broken at sequence_id={sequence_id}: "
-                    f"prev_checksum='{stored_prev_checksum}' doesn't match "
-                    f"previous event's checksum='{prev_checksum}'"
+    Attributes:
+        errors: Errors found so far (capped at max_errors)
+        events_verified: Events fed so far
+        events_intact: Events fed up to and including verified_sequence_id
+        verified_sequence_id: Last event through which the chain is intact
+        verified_checksum: Checksum of that event
+    """
+
+    def __init__(
+        self,
+        prev_sequence_id: int | None = None,
+        prev_checksum: str | None = None,
+        max_errors: int = 100,
+    ) -> None:
+        """Initialize the verifier.
+
+        Args:
+            prev_sequence_id: Sequence ID of the last already-verified event
+            prev_checksum: Checksum of the last already-verified event
+            max_errors: Errors kept before further ones are only counted
+        """
+        self._prev_sequence_id = prev_sequence_id
+        self._prev_checksum = prev_checksum
+        self._max_errors = max_errors
+        self.errors: list[str] = []
+        self.error_count = 0
+        self.events_verified = 0
+        self.events_intact = 0
+        self.verified_sequence_id = prev_sequence_id
+        self.verified_checksum = prev_checksum
+
+    @property
+    def is_valid(self) -> bool:
+        """True if no errors have been found."""
+        return self.error_count == 0
+
+    def update(self, events: Iterable[dict]) -> None:
+        """Verify the next events of the chain.
+
+        Args:
+            events: Event dicts continuing the chain, by sequence_id ascending.
+        """
+        for event in events:
+            sequence_id = event.get("sequence_id")
+            stored_checksum = event.get("checksum")
+            stored_prev_checksum = event.get("prev_checksum")
+            errors_before = self.error_count
+
+            if self._prev_sequence_id is None:
+                # Check first event has prev_checksum = None
+                if stored_prev_checksum is not None:
+                    self._error(
+                        f"First event (sequence_id={sequence_id}) should have "
+                        f"prev_checksum=None, got '{stored_prev_checksum}'"
+                    )
+            else:
+                # Check sequence_id is monotonically increasing
+                if sequence_id <= self._prev_sequence_id:
+                    self._error(
+                        f"Sequence ID not monotonically increasing: "
+                        f"sequence_id={sequence_id} <= prev={self._prev_sequence_id}"
+                    )
+
+                # Check prev_checksum matches previous event's checksum
+                if stored_prev_checksum != self._prev_checksum:
+                    self._error(
+                        f"Chain broken at sequence_id={sequence_id}: "
+                        f"prev_checksum='{stored_prev_checksum}' doesn't match "
+                        f"previous event's checksum='{self._prev_checksum}'"
+                    )
+
+            # Verify the event's own checksum
+            computed_checksum = _compute_checksum_from_row(event, sequence_id, stored_prev_checksum)
+            if stored_checksum != computed_checksum:
+                self._error(
+                    f"Invalid checksum at sequence_id={sequence_id}: "
+                    f"stored='{stored_checksum}', computed='{computed_checksum}'"
                 )
 
-        # Verify the event's own checksum
-        computed_checksum = _compute_checksum_from_row(event, sequence_id, stored_prev_checksum)
-        if stored_checksum != computed_checksum:
+            # The verified-through marker stops at the first error
+            if errors_before == 0 and self.error_count == 0:
+                self.verified_sequence_id = sequence_id
+                self.verified_checksum = stored_checksum
+                self.events_intact += 1
+
+            # Update for next event
+            self._prev_sequence_id = sequence_id
+            self._prev_checksum = stored_checksum
+            self.events_verified += 1
+
+    def _error(self, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < self._max_errors:
+            self.errors.append(message)
+
+
+def verify_anchor(anchor: dict, shard_rows: list[dict]) -> tuple[bool, list[str]]:
+    """Verify an anchor record against the shard events it commits to.
+
+    An anchor's new_value holds {"heads": {chain_key: {"sequence_id",
+    "checksum"}}}. Verifies:
+    - The anchor's own stored checksum is valid
+    - Every anchored head exists in its chain with the anchored checksum
+
+    Args:
+        anchor: Anchor event dict from the root chain.
+        shard_rows: Event dicts for the anchored sequence IDs.
+
+    Returns:
+        Tuple of (is_valid, list_of_errors).
+    """
+    errors: list[str] = []
+    sequence_id = anchor.get("sequence_id")
+
+    if not verify_checksum(anchor, sequence_id, anchor.get("prev_checksum")):
+        errors.append(f"Invalid checksum on anchor sequence_id={sequence_id}")
+
+    rows_by_sequence = {row.get("sequence_id"): row for row in shard_rows}
+    heads = (anchor.get("new_value") or {}).get("heads", {})
+    for chain_key, head in sorted(heads.items()):
+        row = rows_by_sequence.get(head["sequence_id"])
+        if row is None or row.get("chain_key") != chain_key:
             errors.append(
-                f"Invalid checksum at sequence_id={sequence_id}: "
-                f"stored='{stored_checksum}', computed='{computed_checksum}'"
+                f"Anchored head of chain '{chain_key}' (sequence_id={head['sequence_id']}) "
+                f"not found"
+            )
+        elif row.get("checksum") != head["checksum"]:
+            errors.append(
+                f"Chain '{chain_key}' diverges from anchor at "
+                f"sequence_id={head['sequence_id']}: anchored='{head['checksum']}', "
+                f"stored='{row.get('checksum')}'"
             )
 
-        # Update for next iteration
-        prev_sequence_id = sequence_id
-        prev_checksum = stored_checksum
-
-    is_valid = len(errors) == 0
-    return is_valid, errors
+    return len(errors) == 0, errors
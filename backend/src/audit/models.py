@@ -7,10 +7,11 @@ This module defines the core data structures for the audit logging system:
 - ResourceType: Types of resources that can be affected by events
 - EventSource: Sources from which events can originate
 - ValueMode: How values are recorded in audit events
+- ChainShardStrategy: How events are assigned to hash chains
 - AuditEvent: Immutable event representing an audit occurrence
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from uuid import UUID
@@ -40,6 +41,7 @@ class AuditEventType(str, Enum):
         SYSTEM_STARTED: The system was started
         SYSTEM_STOPPED: The system was stopped
         HEALTH_CHANGED: Health status changed
+        CHAIN_ANCHORED: Shard chain heads were committed to the root chain
 
     Security events:
         AUTH_LOGIN: User logged in
@@ -69,6 +71,7 @@ class AuditEventType(str, Enum):
     SYSTEM_STARTED = "system_started"
     SYSTEM_STOPPED = "system_stopped"
     HEALTH_CHANGED = "health_changed"
+    CHAIN_ANCHORED = "chain_anchored"
 
     # Security events
     AUTH_LOGIN = "auth_login"
@@ -116,6 +119,7 @@ class ResourceType(str, Enum):
     ACCOUNT: Trading account
     PERMISSION: Access permission
     SESSION: User session
+    AUDIT_CHAIN: Audit hash chain (anchor records)
     """
 
     ORDER = "order"
@@ -126,6 +130,7 @@ class ResourceType(str, Enum):
     ACCOUNT = "account"
     PERMISSION = "permission"
     SESSION = "session"
+    AUDIT_CHAIN = "audit_chain"
 
 
 class EventSource(str, Enum):
@@ -160,6 +165,19 @@ class ValueMode(str, Enum):
     REFERENCE = "reference"
 
 
+class ChainShardStrategy(str, Enum):
+    """How audit events are assigned to hash chains.
+
+    NONE: Every event goes to the single default chain
+    RESOURCE_TYPE: One chain per resource type
+    RESOURCE_ID_HASH: Resource IDs hashed into a fixed number of chains
+    """
+
+    NONE = "none"
+    RESOURCE_TYPE = "resource_type"
+    RESOURCE_ID_HASH = "resource_id_hash"
+
+
 @dataclass(frozen=True)
 class AuditEvent:
     """Immutable event representing an audit occurrence.
@@ -200,6 +218,9 @@ class AuditEvent:
 
         schema_version: Version of the audit event schema
         metadata: Additional arbitrary data
+
+        old_value_json: Canonical JSON of old_value, if already encoded
+        new_value_json: Canonical JSON of new_value, if already encoded
     """
 
     # Core identity (required)
@@ -248,3 +269,8 @@ class AuditEvent:
     # Metadata (optional with defaults)
     schema_version: int = 1
     metadata: dict | None = None
+
+    # Canonical encodings of the values (see src.audit.canonical); derived
+    # from old_value/new_value, so excluded from equality
+    old_value_json: str | None = field(default=None, repr=False, compare=False)
+    new_value_json: str | None = field(default=None, repr=False, compare=False)
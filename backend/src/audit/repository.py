@@ -2,10 +2,26 @@
 
 This module provides the AuditRepository class for database operations:
 - persist_audit_event: Persist an audit event with chain integrity
+- persist_audit_events: Append a batch of events to a chain in one pass
+- commit / rollback: End the session's transaction
+- savepoint: Scope appends so a failure only undoes their own statements
 - get_audit_event: Fetch a single audit event by ID
 - query_audit_logs: Query audit logs with filters and pagination
+- query_audit_page: Fetch one keyset page with an opaque next cursor
+- stream_audit_logs: Stream all matching audit logs (for exports)
 - get_chain_head: Get the current chain head for a chain key
-- verify_chain_integrity: Verify the integrity of an audit chain
+- get_chain_heads: Get the current heads of all shard chains
+- verify_chain_integrity / verify_chain_prefix: Verify the first events of
+  an audit chain
+- verify_chain_streaming: Verify a whole chain page by page, resuming from
+  the last verification checkpoint
+- get_latest_anchor / verify_anchor_integrity: Check shards against the root chain
+- get_oldest_timestamp / get_archive_cuts / stream_chain_range /
+  drop_audit_logs_before: Move closed partitions to the cold archive (see
+  src.audit.retention)
+
+With an AuditArchive attached, query_audit_logs and verify_chain_integrity
+span archived partitions as well as the live table.
 
 The repository implements blockchain-style chain integrity by:
 1. Locking the chain head row FOR UPDATE to prevent concurrent modifications
@@ -13,17 +29,61 @@ The repository implements blockchain-style chain integrity by:
 3. Using database sequences for monotonically increasing sequence IDs
 """
 
-from dataclasses import dataclass
+import base64
+import heapq
+import json
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
 
-from src.audit.integrity import compute_checksum, verify_chain
+from src.audit.archive import AuditArchive, parse_timestamp
+from src.audit.canonical import canonical_json
+from src.audit.config import ROOT_CHAIN_KEY
+from src.audit.integrity import ChainVerifier, compute_checksum, verify_anchor, verify_chain
 from src.audit.models import AuditEvent, AuditEventType, ResourceType
 
+# Rows per multi-row INSERT; 22 bind parameters per row keeps a full batch
+# well under the driver's 32767 parameter limit
+MAX_BATCH_SIZE = 500
+
+# Rows fetched per server-side cursor page during streaming verification
+VERIFY_PAGE_SIZE = 1000
+
+# Rows fetched per server-side cursor page when streaming exports
+EXPORT_PAGE_SIZE = 1000
+
+# audit_logs columns written on append, in INSERT order
+INSERT_COLUMNS = (
+    "id",
+    "sequence_id",
+    "timestamp",
+    "event_type",
+    "severity",
+    "actor_id",
+    "actor_type",
+    "resource_type",
+    "resource_id",
+    "request_id",
+    "source",
+    "environment",
+    "service",
+    "version",
+    "correlation_id",
+    "value_mode",
+    "old_value",
+    "new_value",
+    "metadata",
+    "checksum",
+    "prev_checksum",
+    "chain_key",
+)
+
 
 @dataclass
 class AuditQueryFilters:
@@ -38,6 +98,7 @@ class AuditQueryFilters:
         end_time: Filter events before this time (inclusive)
         offset: Number of records to skip (for pagination)
         limit: Maximum number of records to return
+        cursor: Keyset cursor from a previous page; replaces offset
     """
 
     event_type: AuditEventType | None = None
@@ -48,6 +109,41 @@ class AuditQueryFilters:
     end_time: datetime | None = None
     offset: int = 0
     limit: int = 100
+    cursor: str | None = None
+
+
+@dataclass
+class ChainVerificationResult:
+    """Outcome of one streaming chain verification run.
+
+    Attributes:
+        chain_key: The verified chain
+        is_valid: True if no errors were found in this run
+        errors: Error descriptions (capped; see error_count)
+        error_count: Total errors found
+        events_verified: Events checked in this run
+        resumed_from: Checkpoint sequence_id the run started after, if any
+        verified_sequence_id: Last event through which the chain is intact
+        verified_checksum: Checksum of that event
+        elapsed_seconds: Wall time of the run
+    """
+
+    chain_key: str
+    is_valid: bool = True
+    errors: list[str] = field(default_factory=list)
+    error_count: int = 0
+    events_verified: int = 0
+    resumed_from: int | None = None
+    verified_sequence_id: int | None = None
+    verified_checksum: str | None = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        """Verification throughput for this run."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.events_verified / self.elapsed_seconds
 
 
 class AuditRepository:
@@ -58,15 +154,18 @@ class AuditRepository:
 
     Args:
         session: SQLAlchemy async session for database operations
+        archive: Cold archive of dropped partitions, if any
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, archive: AuditArchive | None = None) -> None:
         """Initialize the repository with an async session.
 
         Args:
             session: SQLAlchemy async session for database operations
+            archive: Cold archive that queries and verification span
         """
         self._session = session
+        self._archive = archive
 
     async def persist_audit_event(
         self,
@@ -131,30 +230,7 @@ class AuditRepository:
 
         await self._session.execute(
             insert_query,
-            {
-                "id": event.event_id,
-                "sequence_id": sequence_id,
-                "timestamp": event.timestamp,
-                "event_type": event.event_type.value,
-                "severity": event.severity.value,
-                "actor_id": event.actor_id,
-                "actor_type": event.actor_type.value,
-                "resource_type": event.resource_type.value,
-                "resource_id": event.resource_id,
-                "request_id": event.request_id,
-                "source": event.source.value,
-                "environment": event.environment,
-                "service": event.service,
-                "version": event.version,
-                "correlation_id": event.correlation_id,
-                "value_mode": event.value_mode.value,
-                "old_value": event.old_value,
-                "new_value": event.new_value,
-                "metadata": event.metadata,
-                "checksum": checksum,
-                "prev_checksum": prev_checksum,
-                "chain_key": chain_key,
-            },
+            _insert_params(event, sequence_id, checksum, prev_checksum, chain_key),
         )
 
         # 5. UPSERT chain head
@@ -178,6 +254,111 @@ class AuditRepository:
 
         return (sequence_id, checksum)
 
+    async def persist_audit_events(
+        self,
+        events: list[AuditEvent],
+        chain_key: str = "default",
+    ) -> list[tuple[int, str]]:
+        """Append a batch of events to one chain.
+
+        Same chain semantics as persist_audit_event, but the chain head is
+        locked once per batch:
+        1. Locks the chain head row FOR UPDATE
+        2. Allocates len(events) sequence IDs in one query
+        3. Computes the chained checksums in order, in memory
+        4. INSERTs the events with one multi-row statement (per MAX_BATCH_SIZE)
+        5. UPSERTs the chain head once with the last checksum
+
+        Args:
+            events: Audit events to persist, in chain order
+            chain_key: The chain key for these events (default: "default")
+
+        Returns:
+            List of (sequence_id, checksum) per event, in input order
+        """
+        if not events:
+            return []
+
+        # 1. Lock chain head FOR UPDATE and get prev_checksum
+        chain_head_query = text("""
+            SELECT chain_key, checksum, sequence_id
+            FROM audit_chain_head
+            WHERE chain_key = :chain_key
+            FOR UPDATE
+        """)
+        result = await self._session.execute(chain_head_query, {"chain_key": chain_key})
+        chain_head = result.fetchone()
+        prev_checksum: str | None = chain_head[1] if chain_head else None
+
+        # 2. Allocate all sequence IDs in one round trip
+        sequence_query = text("SELECT nextval('audit_sequence') FROM generate_series(1, :count)")
+        result = await self._session.execute(sequence_query, {"count": len(events)})
+        sequence_ids = sorted(result.scalars().all())
+
+        # 3. Chain checksums in memory
+        rows: list[dict[str, Any]] = []
+        persisted: list[tuple[int, str]] = []
+        for event, sequence_id in zip(events, sequence_ids, strict=True):
+            checksum = compute_checksum(event, sequence_id, prev_checksum)
+            rows.append(_insert_params(event, sequence_id, checksum, prev_checksum, chain_key))
+            persisted.append((sequence_id, checksum))
+            prev_checksum = checksum
+
+        # 4. Multi-row INSERT into audit_logs
+        for start in range(0, len(rows), MAX_BATCH_SIZE):
+            chunk = rows[start : start + MAX_BATCH_SIZE]
+            params: dict[str, Any] = {}
+            values = []
+            for i, row in enumerate(chunk):
+                values.append("(" + ", ".join(f":{col}_{i}" for col in INSERT_COLUMNS) + ")")
+                params.update({f"{col}_{i}": row[col] for col in INSERT_COLUMNS})
+            await self._session.execute(
+                text(
+                    f"""
+                    INSERT INTO audit_logs ({", ".join(INSERT_COLUMNS)})
+                    VALUES {", ".join(values)}
+                    """  # noqa: S608 — column names are constants, values are bound
+                ),
+                params,
+            )
+
+        # 5. UPSERT chain head with the last event
+        upsert_query = text("""
+            INSERT INTO audit_chain_head (chain_key, checksum, sequence_id, updated_at)
+            VALUES (:chain_key, :checksum, :sequence_id, NOW())
+            ON CONFLICT (chain_key) DO UPDATE SET
+                checksum = EXCLUDED.checksum,
+                sequence_id = EXCLUDED.sequence_id,
+                updated_at = NOW()
+        """)
+        last_sequence_id, last_checksum = persisted[-1]
+        await self._session.execute(
+            upsert_query,
+            {
+                "chain_key": chain_key,
+                "checksum": last_checksum,
+                "sequence_id": last_sequence_id,
+            },
+        )
+
+        return persisted
+
+    async def commit(self) -> None:
+        """Commit the session's transaction, making appended events durable."""
+        await self._session.commit()
+
+    async def rollback(self) -> None:
+        """Roll back the session's transaction."""
+        await self._session.rollback()
+
+    def savepoint(self) -> AsyncSessionTransaction:
+        """Begin a SAVEPOINT, for use as an async context manager.
+
+        An error inside the block rolls back to the savepoint, leaving the
+        enclosing transaction usable for later statements.
+        """
+        return self._session.begin_nested()
+
     async def get_audit_event(self, event_id: UUID) -> dict | None:
         """Fetch a single audit event by ID.
 
@@ -206,46 +387,41 @@ class AuditRepository:
 
         return self._row_to_dict(row)
 
-    async def query_audit_logs(self, filters: AuditQueryFilters) -> list[dict]:
-        """Query audit logs with filters and pagination.
+    async def count_audit_logs(self, filters: AuditQueryFilters) -> int:
+        """Count live audit logs matching the filters.
+
+        Limit, offset and cursor do not affect the count.
 
         Args:
             filters: Filter parameters for the query
 
         Returns:
-            List of dicts containing matching audit events
+            Number of matching events
         """
-        # Build query with dynamic WHERE clauses
-        where_clauses = []
-        params: dict[str, Any] = {}
-
-        if filters.event_type is not None:
-            where_clauses.append("event_type = :event_type")
-            params["event_type"] = filters.event_type.value
-
-        if filters.resource_type is not None:
-            where_clauses.append("resource_type = :resource_type")
-            params["resource_type"] = filters.resource_type.value
+        where_sql, params = _filter_clauses(replace(filters, cursor=None))
+        query = text(f"SELECT COUNT(*) FROM audit_logs {where_sql}")  # noqa: S608 — clauses are constants, values are bound
+        result = await self._session.execute(query, params)
+        return result.scalar() or 0
 
-        if filters.resource_id is not None:
-            where_clauses.append("resource_id = :resource_id")
-            params["resource_id"] = filters.resource_id
+    async def query_audit_logs(self, filters: AuditQueryFilters) -> list[dict]:
+        """Query audit logs with filters and pagination.
 
-        if filters.actor_id is not None:
-            where_clauses.append("actor_id = :actor_id")
-            params["actor_id"] = filters.actor_id
+        Results are ordered newest first by (timestamp, sequence_id). With
+        filters.cursor set, the page starts after the cursor position
+        (keyset pagination) and offset is ignored. Events older than the
+        archive horizon are read from the archive.
 
-        if filters.start_time is not None:
-            where_clauses.append("timestamp >= :start_time")
-            params["start_time"] = filters.start_time
+        Args:
+            filters: Filter parameters for the query
 
-        if filters.end_time is not None:
-            where_clauses.append("timestamp <= :end_time")
-            params["end_time"] = filters.end_time
+        Returns:
+            List of dicts containing matching audit events
+        """
+        horizon = self._archive.horizon if self._archive is not None else None
+        if horizon is not None and (filters.start_time is None or filters.start_time < horizon):
+            return await self._query_spanning_archive(filters, horizon)
 
-        where_sql = ""
-        if where_clauses:
-            where_sql = "WHERE " + " AND ".join(where_clauses)
+        where_sql, params = _filter_clauses(filters)
 
         query = text(f"""
             SELECT
@@ -256,18 +432,126 @@ class AuditRepository:
                 metadata, checksum, prev_checksum, chain_key
             FROM audit_logs
             {where_sql}
-            ORDER BY timestamp DESC
+            ORDER BY timestamp DESC, sequence_id DESC
             LIMIT :limit OFFSET :offset
         """)
 
         params["limit"] = filters.limit
-        params["offset"] = filters.offset
+        params["offset"] = 0 if filters.cursor else filters.offset
 
         result = await self._session.execute(query, params)
         rows = result.fetchall()
 
         return [self._row_to_dict(row) for row in rows]
 
+    async def _query_spanning_archive(
+        self,
+        filters: AuditQueryFilters,
+        horizon: datetime,
+    ) -> list[dict]:
+        """Merge live and archived matches into one newest-first page."""
+        offset = 0 if filters.cursor else filters.offset
+        window = offset + filters.limit
+        where_sql, params = _filter_clauses(filters, since=horizon)
+
+        query = text(f"""
+            SELECT
+                id, sequence_id, timestamp, event_type, severity,
+                actor_id, actor_type, resource_type, resource_id,
+                request_id, source, environment, service, version,
+                correlation_id, value_mode, old_value, new_value,
+                metadata, checksum, prev_checksum, chain_key
+            FROM audit_logs
+            {where_sql}
+            ORDER BY timestamp DESC, sequence_id DESC
+            LIMIT :limit
+        """)  # noqa: S608 — clauses are constants, values are bound
+        params["limit"] = window
+
+        result = await self._session.execute(query, params)
+        live = [self._row_to_dict(row) for row in result.fetchall()]
+        if len(live) == window:
+            # The newest page lies entirely in the live table
+            return live[offset:]
+
+        archived = (
+            row
+            for row in self._archive.iter_rows(
+                start=filters.start_time, end=_archive_end_time(filters)
+            )
+            # Archived rows stamped past the horizon are still live until dropped
+            if row["timestamp"] < horizon and _matches(row, filters)
+        )
+        merged = heapq.nlargest(window - len(live), archived, key=_sort_key)
+        return (live + merged)[offset:]
+
+    async def query_audit_page(self, filters: AuditQueryFilters) -> tuple[list[dict], str | None]:
+        """Fetch one keyset page of audit logs.
+
+        Args:
+            filters: Filter parameters; cursor selects the page
+
+        Returns:
+            Tuple of (events, next_cursor); next_cursor is None on the last page
+        """
+        probe = replace(filters, limit=filters.limit + 1)
+        rows = await self.query_audit_logs(probe)
+        if len(rows) <= filters.limit:
+            return rows, None
+        rows = rows[: filters.limit]
+        return rows, encode_cursor(rows[-1]["timestamp"], rows[-1]["sequence_id"])
+
+    async def stream_audit_logs(
+        self,
+        filters: AuditQueryFilters,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> AsyncIterator[dict]:
+        """Stream every matching audit log through a server-side cursor.
+
+        Ignores limit and offset; memory is bounded by page_size rather
+        than by the result set. With an archive attached, the live events
+        are followed by the archived ones, read a segment at a time.
+
+        Args:
+            filters: Filter parameters (cursor resumes after a position)
+            page_size: Rows fetched per cursor page
+
+        Yields:
+            Event dicts, newest first
+        """
+        horizon = self._archive.horizon if self._archive is not None else None
+        if horizon is not None and filters.start_time is not None and filters.start_time >= horizon:
+            horizon = None
+        where_sql, params = _filter_clauses(filters, since=horizon)
+
+        query = text(f"""
+            SELECT
+                id, sequence_id, timestamp, event_type, severity,
+                actor_id, actor_type, resource_type, resource_id,
+                request_id, source, environment, service, version,
+                correlation_id, value_mode, old_value, new_value,
+                metadata, checksum, prev_checksum, chain_key
+            FROM audit_logs
+            {where_sql}
+            ORDER BY timestamp DESC, sequence_id DESC
+        """).execution_options(yield_per=page_size)  # noqa: S608 — clauses are constants, values are bound
+
+        stream = await self._session.stream(query, params)
+        try:
+            async for row in stream:
+                yield self._row_to_dict(row)
+        finally:
+            await stream.close()
+
+        if horizon is None:
+            return
+        for row in self._archive.iter_rows_newest_first(
+            start=filters.start_time, end=_archive_end_time(filters)
+        ):
+            # Archived rows stamped past the horizon are still live until dropped
+            if row["timestamp"] < horizon and _matches(row, filters):
+                yield row
+
     async def get_chain_head(self, chain_key: str) -> dict | None:
         """Fetch the chain head record for a chain key.
 
@@ -296,6 +580,102 @@ class AuditRepository:
             "updated_at": row[3],
         }
 
+    async def get_chain_heads(self, exclude: str | None = ROOT_CHAIN_KEY) -> list[dict]:
+        """Fetch the heads of all chains.
+
+        Args:
+            exclude: Chain key to leave out (default: the root chain)
+
+        Returns:
+            List of chain head dicts ordered by chain_key
+        """
+        query = text("""
+            SELECT chain_key, checksum, sequence_id, updated_at
+            FROM audit_chain_head
+            WHERE chain_key != :exclude
+            ORDER BY chain_key
+        """)
+
+        result = await self._session.execute(query, {"exclude": exclude or ""})
+        return [
+            {
+                "chain_key": row[0],
+                "checksum": row[1],
+                "sequence_id": row[2],
+                "updated_at": row[3],
+            }
+            for row in result.fetchall()
+        ]
+
+    async def get_latest_anchor(self, root_chain_key: str = ROOT_CHAIN_KEY) -> dict | None:
+        """Fetch the most recent anchor record from the root chain.
+
+        Args:
+            root_chain_key: The root chain key
+
+        Returns:
+            Dict containing the anchor event, or None if never anchored
+        """
+        query = text("""
+            SELECT
+                id, sequence_id, timestamp, event_type, severity,
+                actor_id, actor_type, resource_type, resource_id,
+                request_id, source, environment, service, version,
+                correlation_id, value_mode, old_value, new_value,
+                metadata, checksum, prev_checksum, chain_key
+            FROM audit_logs
+            WHERE chain_key = :chain_key AND event_type = :event_type
+            ORDER BY sequence_id DESC
+            LIMIT 1
+        """)
+
+        result = await self._session.execute(
+            query,
+            {
+                "chain_key": root_chain_key,
+                "event_type": AuditEventType.CHAIN_ANCHORED.value,
+            },
+        )
+        row = result.fetchone()
+
+        if row is None:
+            return None
+
+        return self._row_to_dict(row)
+
+    async def verify_anchor_integrity(self, anchor: dict) -> tuple[bool, list[str]]:
+        """Verify that the shard chains still match an anchor record.
+
+        Fetches the events at every anchored head and checks their chain
+        key and checksum against the anchor.
+
+        Args:
+            anchor: Anchor event dict (see get_latest_anchor)
+
+        Returns:
+            Tuple of (is_valid, errors)
+        """
+        heads = (anchor.get("new_value") or {}).get("heads", {})
+        if not heads:
+            return verify_anchor(anchor, [])
+
+        params = {f"seq_{i}": head["sequence_id"] for i, head in enumerate(heads.values())}
+        query = text(
+            f"""
+            SELECT sequence_id, chain_key, checksum
+            FROM audit_logs
+            WHERE sequence_id IN ({", ".join(f":{name}" for name in params)})
+            """  # noqa: S608 — placeholders are generated, values are bound
+        )
+
+        result = await self._session.execute(query, params)
+        shard_rows = [
+            {"sequence_id": row[0], "chain_key": row[1], "checksum": row[2]}
+            for row in result.fetchall()
+        ]
+
+        return verify_anchor(anchor, shard_rows)
+
     async def verify_chain_integrity(
         self,
         chain_key: str,
@@ -308,6 +688,9 @@ class AuditRepository:
         - Each event's prev_checksum matches previous event's checksum
         - Each event's stored checksum is valid
 
+        With an archive attached, the chain's archived events are verified
+        first and the live events must continue from the last of them.
+
         Args:
             chain_key: The chain key to verify
             limit: Maximum number of events to verify (default: 100)
@@ -316,6 +699,27 @@ class AuditRepository:
             Tuple of (is_valid, errors) where is_valid is True if all
             checks pass, and errors is a list of error descriptions
         """
+        result = await self.verify_chain_prefix(chain_key, limit)
+        return result.is_valid, result.errors
+
+    async def verify_chain_prefix(
+        self,
+        chain_key: str,
+        limit: int = 100,
+    ) -> ChainVerificationResult:
+        """Verify the first events of a chain, archived ones first.
+
+        Unlike verify_chain_streaming, this reads no checkpoint and writes
+        none; it backs verify_chain_integrity.
+
+        Args:
+            chain_key: The chain key to verify
+            limit: Maximum number of events to verify
+
+        Returns:
+            ChainVerificationResult for the verified events
+        """
+        started = time.perf_counter()
         query = text("""
             SELECT
                 id, sequence_id, timestamp, event_type, severity,
@@ -324,21 +728,326 @@ class AuditRepository:
                 correlation_id, value_mode, old_value, new_value,
                 metadata, checksum, prev_checksum, chain_key
             FROM audit_logs
-            WHERE chain_key = :chain_key
+            WHERE chain_key = :chain_key AND sequence_id > :after
             ORDER BY sequence_id ASC
             LIMIT :limit
         """)
 
-        result = await self._session.execute(query, {"chain_key": chain_key, "limit": limit})
-        rows = result.fetchall()
+        if self._archive is None or self._archive.chain_boundary(chain_key) is None:
+            result = await self._session.execute(
+                query, {"chain_key": chain_key, "after": 0, "limit": limit}
+            )
+            events = [self._row_to_dict(row) for row in result.fetchall()]
+            is_valid, errors = verify_chain(events) if events else (True, [])
+            return ChainVerificationResult(
+                chain_key=chain_key,
+                is_valid=is_valid,
+                errors=errors,
+                error_count=len(errors),
+                events_verified=len(events),
+                elapsed_seconds=time.perf_counter() - started,
+            )
+
+        # Archived events first; the live ones must continue from the last
+        verifier = ChainVerifier()
+        after = 0
+        for event in self._archive.iter_rows(chain_key=chain_key):
+            if verifier.events_verified >= limit:
+                break
+            verifier.update([event])
+            after = event["sequence_id"]
+
+        if verifier.events_verified < limit:
+            result = await self._session.execute(
+                query,
+                {
+                    "chain_key": chain_key,
+                    "after": after,
+                    "limit": limit - verifier.events_verified,
+                },
+            )
+            verifier.update(self._row_to_dict(row) for row in result.fetchall())
+
+        return ChainVerificationResult(
+            chain_key=chain_key,
+            is_valid=verifier.is_valid,
+            errors=verifier.errors,
+            error_count=verifier.error_count,
+            events_verified=verifier.events_verified,
+            verified_sequence_id=verifier.verified_sequence_id,
+            verified_checksum=verifier.verified_checksum,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+    async def get_verification_checkpoint(self, chain_key: str) -> dict | None:
+        """Fetch the last verification checkpoint for a chain.
+
+        Args:
+            chain_key: The chain key to look up
+
+        Returns:
+            Dict with sequence_id, checksum, events_verified and verified_at,
+            or None if the chain was never verified
+        """
+        query = text("""
+            SELECT sequence_id, checksum, events_verified, verified_at
+            FROM audit_verification_checkpoint
+            WHERE chain_key = :chain_key
+        """)
 
-        if not rows:
-            return (True, [])
+        result = await self._session.execute(query, {"chain_key": chain_key})
+        row = result.fetchone()
 
-        # Convert rows to dicts for verify_chain
-        events = [self._row_to_dict(row) for row in rows]
+        if row is None:
+            return None
 
-        return verify_chain(events)
+        return {
+            "sequence_id": row[0],
+            "checksum": row[1],
+            "events_verified": row[2],
+            "verified_at": row[3],
+        }
+
+    async def save_verification_checkpoint(
+        self,
+        chain_key: str,
+        sequence_id: int,
+        checksum: str,
+        events_verified: int,
+    ) -> None:
+        """Record that a chain is intact through sequence_id.
+
+        Args:
+            chain_key: The verified chain
+            sequence_id: Last verified event
+            checksum: Checksum of that event
+            events_verified: Total events verified in the chain so far
+        """
+        query = text("""
+            INSERT INTO audit_verification_checkpoint
+                (chain_key, sequence_id, checksum, events_verified, verified_at)
+            VALUES (:chain_key, :sequence_id, :checksum, :events_verified, CURRENT_TIMESTAMP)
+            ON CONFLICT (chain_key) DO UPDATE SET
+                sequence_id = EXCLUDED.sequence_id,
+                checksum = EXCLUDED.checksum,
+                events_verified = EXCLUDED.events_verified,
+                verified_at = EXCLUDED.verified_at
+        """)
+
+        await self._session.execute(
+            query,
+            {
+                "chain_key": chain_key,
+                "sequence_id": sequence_id,
+                "checksum": checksum,
+                "events_verified": events_verified,
+            },
+        )
+
+    async def verify_chain_streaming(
+        self,
+        chain_key: str,
+        page_size: int = VERIFY_PAGE_SIZE,
+        resume: bool = True,
+        max_events: int | None = None,
+    ) -> ChainVerificationResult:
+        """Verify a chain through a server-side cursor, page by page.
+
+        Unlike verify_chain_integrity, memory stays bounded by page_size and
+        the whole chain is covered. With resume, verification starts after
+        the last checkpoint; if the checkpointed event was rewritten since,
+        the checkpoint is discarded and the chain is verified from the start.
+        With an archive attached, the start is the chain's last archived
+        event (archived events are covered by AuditArchive.verify). The
+        checkpoint is advanced to the last event through which the chain
+        is intact. The caller commits.
+
+        Args:
+            chain_key: The chain key to verify
+            page_size: Rows fetched per cursor page
+            resume: Start from the last checkpoint instead of the chain start
+            max_events: Stop after this many events (None for the whole chain)
+
+        Returns:
+            ChainVerificationResult for this run
+        """
+        started = time.perf_counter()
+        checkpoint = await self.get_verification_checkpoint(chain_key) if resume else None
+        archived = self._archive.chain_boundary(chain_key) if self._archive is not None else None
+        prior_events = 0
+        after = 0
+        verifier = ChainVerifier()
+        result = ChainVerificationResult(chain_key=chain_key)
+
+        if archived is not None:
+            prior_events = archived.event_count
+            after = archived.last_sequence_id
+            verifier = ChainVerifier(archived.last_sequence_id, archived.last_checksum)
+            if checkpoint is not None and checkpoint["sequence_id"] <= after:
+                # The checkpointed event has moved to the archive
+                checkpoint = None
+
+        if checkpoint is not None:
+            # A rewritten checkpoint event invalidates everything after it
+            stored = await self._session.execute(
+                text("""
+                    SELECT checksum FROM audit_logs
+                    WHERE chain_key = :chain_key AND sequence_id = :sequence_id
+                """),
+                {"chain_key": chain_key, "sequence_id": checkpoint["sequence_id"]},
+            )
+            if stored.scalar() != checkpoint["checksum"]:
+                checkpoint = None
+
+        if checkpoint is not None:
+            prior_events = checkpoint["events_verified"]
+            after = checkpoint["sequence_id"]
+            result.resumed_from = checkpoint["sequence_id"]
+            verifier = ChainVerifier(checkpoint["sequence_id"], checkpoint["checksum"])
+
+        query = text("""
+            SELECT
+                id, sequence_id, timestamp, event_type, severity,
+                actor_id, actor_type, resource_type, resource_id,
+                request_id, source, environment, service, version,
+                correlation_id, value_mode, old_value, new_value,
+                metadata, checksum, prev_checksum, chain_key
+            FROM audit_logs
+            WHERE chain_key = :chain_key AND sequence_id > :after
+            ORDER BY sequence_id ASC
+        """).execution_options(yield_per=page_size)
+        params = {"chain_key": chain_key, "after": after}
+
+        stream = await self._session.stream(query, params)
+        try:
+            async for page in stream.partitions(page_size):
+                if max_events is not None:
+                    page = page[: max_events - verifier.events_verified]
+                verifier.update(self._row_to_dict(row) for row in page)
+                if max_events is not None and verifier.events_verified >= max_events:
+                    break
+        finally:
+            await stream.close()
+
+        if verifier.verified_sequence_id is not None and verifier.verified_sequence_id != after:
+            await self.save_verification_checkpoint(
+                chain_key,
+                verifier.verified_sequence_id,
+                verifier.verified_checksum,
+                prior_events + verifier.events_intact,
+            )
+
+        result.is_valid = verifier.is_valid
+        result.errors = verifier.errors
+        result.error_count = verifier.error_count
+        result.events_verified = verifier.events_verified
+        result.verified_sequence_id = verifier.verified_sequence_id
+        result.verified_checksum = verifier.verified_checksum
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+
+    async def get_oldest_timestamp(self) -> datetime | None:
+        """Fetch the timestamp of the oldest live audit event.
+
+        Returns:
+            Aware datetime, or None if audit_logs is empty
+        """
+        result = await self._session.execute(text("SELECT MIN(timestamp) FROM audit_logs"))
+        oldest = result.scalar()
+        return parse_timestamp(oldest) if oldest is not None else None
+
+    async def get_archive_cuts(
+        self,
+        end: datetime,
+        start: datetime | None = None,
+    ) -> dict[str, int]:
+        """Find where each chain's partition ends for archiving.
+
+        sequence_id is assigned at persist time, after the event timestamp,
+        so the two orders can differ around a partition boundary. A chain is
+        cut at its last event stamped before end; events before the cut
+        stamped after end still belong to the partition.
+
+        Args:
+            end: Exclusive end of the partition
+            start: Only consider events stamped at or after this time (the
+                partition start, once earlier events are known to be archived)
+
+        Returns:
+            Last sequence_id per chain among live events in [start, end)
+        """
+        where_sql = "WHERE timestamp < :end"
+        params: dict[str, Any] = {"end": end}
+        if start is not None:
+            where_sql += " AND timestamp >= :start"
+            params["start"] = start
+
+        query = text(f"""
+            SELECT chain_key, MAX(sequence_id)
+            FROM audit_logs
+            {where_sql}
+            GROUP BY chain_key
+        """)  # noqa: S608 — clauses are constants, values are bound
+
+        result = await self._session.execute(query, params)
+        return {row[0]: row[1] for row in result.fetchall()}
+
+    async def stream_chain_range(
+        self,
+        chain_key: str,
+        after: int,
+        through: int,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> AsyncIterator[dict]:
+        """Stream a chain's live events between two sequence IDs for archiving.
+
+        Args:
+            chain_key: The chain to read
+            after: Exclusive lower sequence_id bound
+            through: Inclusive upper sequence_id bound
+            page_size: Rows fetched per cursor page
+
+        Yields:
+            Event dicts by sequence_id ascending, with timestamps normalized
+            to aware datetimes
+        """
+        query = text("""
+            SELECT
+                id, sequence_id, timestamp, event_type, severity,
+                actor_id, actor_type, resource_type, resource_id,
+                request_id, source, environment, service, version,
+                correlation_id, value_mode, old_value, new_value,
+                metadata, checksum, prev_checksum, chain_key
+            FROM audit_logs
+            WHERE chain_key = :chain_key AND sequence_id > :after AND sequence_id <= :through
+            ORDER BY sequence_id ASC
+        """).execution_options(yield_per=page_size)
+        params = {"chain_key": chain_key, "after": after, "through": through}
+
+        stream = await self._session.stream(query, params)
+        try:
+            async for row in stream:
+                event = self._row_to_dict(row)
+                event["timestamp"] = parse_timestamp(event["timestamp"])
+                yield event
+        finally:
+            await stream.close()
+
+    async def drop_audit_logs_before(self, cutoff: datetime) -> None:
+        """Remove live events older than cutoff once they are archived.
+
+        On PostgreSQL the hypertable's chunks are dropped whole (cutoff must
+        be chunk aligned, i.e. a UTC midnight); elsewhere rows are deleted.
+        The caller commits.
+
+        Args:
+            cutoff: Exclusive upper bound of the removed range
+        """
+        if self._session.get_bind().dialect.name == "postgresql":
+            query = text("SELECT drop_chunks('audit_logs', older_than => :cutoff)")
+        else:
+            query = text("DELETE FROM audit_logs WHERE timestamp < :cutoff")
+        await self._session.execute(query, {"cutoff": cutoff})
 
     def _row_to_dict(self, row: Any) -> dict:
         """Convert a database row to a dict.
@@ -379,3 +1088,187 @@ class AuditRepository:
             return dict(row._mapping)
         else:
             return {col: row[i] for i, col in enumerate(columns)}
+
+
+def _insert_params(
+    event: AuditEvent,
+    sequence_id: int,
+    checksum: str,
+    prev_checksum: str | None,
+    chain_key: str,
+) -> dict[str, Any]:
+    """Bind parameters for one audit_logs row.
+
+    Args:
+        event: The audit event
+        sequence_id: Sequence ID allocated for the event
+        checksum: The event's chained checksum
+        prev_checksum: Checksum of the previous event in the chain
+        chain_key: The chain the event belongs to
+
+    Returns:
+        Dict keyed by INSERT_COLUMNS; JSON columns are bound as canonical
+        JSON text, reusing the encoding made when the event was built
+    """
+    return {
+        "id": event.event_id,
+        "sequence_id": sequence_id,
+        "timestamp": event.timestamp,
+        "event_type": event.event_type.value,
+        "severity": event.severity.value,
+        "actor_id": event.actor_id,
+        "actor_type": event.actor_type.value,
+        "resource_type": event.resource_type.value,
+        "resource_id": event.resource_id,
+        "request_id": event.request_id,
+        "source": event.source.value,
+        "environment": event.environment,
+        "service": event.service,
+        "version": event.version,
+        "correlation_id": event.correlation_id,
+        "value_mode": event.value_mode.value,
+        "old_value": event.old_value_json or canonical_json(event.old_value),
+        "new_value": event.new_value_json or canonical_json(event.new_value),
+        "metadata": canonical_json(event.metadata),
+        "checksum": checksum,
+        "prev_checksum": prev_checksum,
+        "chain_key": chain_key,
+    }
+
+
+def encode_cursor(timestamp: datetime | str, sequence_id: int) -> str:
+    """Encode a (timestamp, sequence_id) position as an opaque cursor.
+
+    Args:
+        timestamp: Timestamp of the last event on the page
+        sequence_id: Sequence ID of that event
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.isoformat()
+    payload = json.dumps([timestamp, sequence_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (ISO timestamp, sequence_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, sequence_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(timestamp, str) or not isinstance(sequence_id, int):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return timestamp, sequence_id
+
+
+def _filter_clauses(
+    filters: AuditQueryFilters,
+    since: datetime | None = None,
+) -> tuple[str, dict[str, Any]]:
+    """Build the WHERE clause and bind parameters for a query.
+
+    Args:
+        filters: Filter parameters for the query
+        since: Additional inclusive lower time bound (the archive horizon)
+
+    Returns:
+        Tuple of (WHERE clause or "", bind parameters)
+
+    Raises:
+        ValueError: If filters.cursor is malformed
+    """
+    where_clauses = []
+    params: dict[str, Any] = {}
+
+    if filters.event_type is not None:
+        where_clauses.append("event_type = :event_type")
+        params["event_type"] = filters.event_type.value
+
+    if filters.resource_type is not None:
+        where_clauses.append("resource_type = :resource_type")
+        params["resource_type"] = filters.resource_type.value
+
+    if filters.resource_id is not None:
+        where_clauses.append("resource_id = :resource_id")
+        params["resource_id"] = filters.resource_id
+
+    if filters.actor_id is not None:
+        where_clauses.append("actor_id = :actor_id")
+        params["actor_id"] = filters.actor_id
+
+    if filters.start_time is not None:
+        where_clauses.append("timestamp >= :start_time")
+        params["start_time"] = filters.start_time
+
+    if filters.end_time is not None:
+        where_clauses.append("timestamp <= :end_time")
+        params["end_time"] = filters.end_time
+
+    if since is not None:
+        where_clauses.append("timestamp >= :since")
+        params["since"] = since
+
+    if filters.cursor is not None:
+        cursor_timestamp, cursor_sequence_id = decode_cursor(filters.cursor)
+        # Row comparison lets the keyset indexes seek straight to the position
+        where_clauses.append("(timestamp, sequence_id) < (:cursor_timestamp, :cursor_sequence_id)")
+        params["cursor_timestamp"] = datetime.fromisoformat(cursor_timestamp)
+        params["cursor_sequence_id"] = cursor_sequence_id
+
+    where_sql = ""
+    if where_clauses:
+        where_sql = "WHERE " + " AND ".join(where_clauses)
+    return where_sql, params
+
+
+def _matches(row: dict, filters: AuditQueryFilters) -> bool:
+    """Apply the non-time filters and the cursor to an archived event.
+
+    Args:
+        row: Archived event dict
+        filters: Filter parameters for the query
+
+    Returns:
+        True if the event belongs in the result
+    """
+    if filters.event_type is not None and row["event_type"] != filters.event_type.value:
+        return False
+    if filters.resource_type is not None and row["resource_type"] != filters.resource_type.value:
+        return False
+    if filters.resource_id is not None and row["resource_id"] != filters.resource_id:
+        return False
+    if filters.actor_id is not None and row["actor_id"] != filters.actor_id:
+        return False
+    if filters.cursor is not None:
+        cursor_timestamp, cursor_sequence_id = decode_cursor(filters.cursor)
+        position = (datetime.fromisoformat(cursor_timestamp), cursor_sequence_id)
+        if _sort_key(row) >= position:
+            return False
+    return True
+
+
+def _archive_end_time(filters: AuditQueryFilters) -> datetime | None:
+    """Upper time bound for archive reads: end_time, tightened by the cursor."""
+    end_time = filters.end_time
+    if filters.cursor is not None:
+        cursor_timestamp = datetime.fromisoformat(decode_cursor(filters.cursor)[0])
+        end_time = cursor_timestamp if end_time is None else min(end_time, cursor_timestamp)
+    return end_time
+
+
+def _sort_key(row: dict) -> tuple[datetime, int]:
+    """Result ordering key: (timestamp, sequence_id)."""
+    return parse_timestamp(row["timestamp"]), row["sequence_id"]
@@ -0,0 +1,170 @@
+"""Move closed audit_logs partitions to the cold archive.
+
+audit_logs is append-only, so it grows without bound. This job copies each
+closed UTC day older than a cutoff into an AuditArchive segment and then
+drops those partitions from the database:
+
+    archive = get_audit_archive()  # from settings.audit_archive_dir
+    report = await archive_audit_logs(async_session, archive, before=cutoff)
+
+sequence_id is assigned when an event is persisted, after its timestamp, so
+a day is cut per chain at the last sequence_id stamped before midnight: an
+event sequenced before the cut but stamped just after midnight goes with its
+chain into the earlier day. Each chain is streamed and verified against the
+archive's boundary checksums before the day is written, and nothing is
+dropped unless every day up to the cutoff was archived and no unarchived row
+is left before it. Attach the archive to AuditRepository to keep querying and
+verifying across it.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.audit.archive import ArchiveSegment, AuditArchive, SegmentColumns
+from src.audit.integrity import ChainVerifier
+from src.audit.repository import AuditRepository
+
+logger = logging.getLogger(__name__)
+
+# Partition width; matches the audit_logs hypertable chunk interval
+PARTITION_INTERVAL = timedelta(days=1)
+
+
+@dataclass
+class ArchiveReport:
+    """Outcome of one archiving run.
+
+    Attributes:
+        segments: Segments written in this run, oldest first
+        dropped_before: Cutoff live partitions were dropped up to, if any
+        elapsed_seconds: Wall time of the run
+    """
+
+    segments: list[ArchiveSegment] = field(default_factory=list)
+    dropped_before: datetime | None = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_archived(self) -> int:
+        """Events written to the archive in this run."""
+        return sum(segment.row_count for segment in self.segments)
+
+    @property
+    def bytes_written(self) -> int:
+        """Compressed bytes written in this run."""
+        return sum(segment.size_bytes for segment in self.segments)
+
+
+async def archive_audit_logs(
+    session_factory: Callable[[], AsyncSession],
+    archive: AuditArchive,
+    before: datetime,
+    drop: bool = True,
+) -> ArchiveReport:
+    """Archive every closed partition older than a cutoff.
+
+    Args:
+        session_factory: Callable that creates AsyncSession instances
+        archive: Archive to append segments to
+        before: Archive events before this time (rounded down to UTC midnight)
+        drop: Drop the archived partitions from the database
+
+    Returns:
+        ArchiveReport for the run
+
+    Raises:
+        ValueError: If a chain does not continue from its archived boundary;
+            nothing from that day on is archived or dropped
+    """
+    started = time.perf_counter()
+    cutoff = _partition_start(before)
+    report = ArchiveReport()
+
+    async with session_factory() as session:
+        repo = AuditRepository(session)
+
+        day = archive.horizon
+        if day is None:
+            oldest = await repo.get_oldest_timestamp()
+            day = _partition_start(oldest) if oldest is not None else cutoff
+
+        # The first partition also picks up events stamped before it that were
+        # persisted after their own day was archived; later ones are bounded
+        since = None
+        while day < cutoff:
+            end = day + PARTITION_INTERVAL
+            columns = await _collect_partition(repo, archive, day, end, since)
+            if columns.row_count:
+                report.segments.append(archive.write_columns(day, end, columns))
+            since = day = end
+
+        if drop and archive.horizon is not None:
+            if await _fully_archived(repo, archive, archive.horizon):
+                await repo.drop_audit_logs_before(archive.horizon)
+                await session.commit()
+                report.dropped_before = archive.horizon
+
+    report.elapsed_seconds = time.perf_counter() - started
+    logger.info(
+        f"Archived {report.rows_archived} audit events in {len(report.segments)} partitions "
+        f"({report.bytes_written} bytes) in {report.elapsed_seconds:.2f}s"
+    )
+    return report
+
+
+async def _collect_partition(
+    repo: AuditRepository,
+    archive: AuditArchive,
+    day: datetime,
+    end: datetime,
+    since: datetime | None,
+) -> SegmentColumns:
+    """Stream and verify the events of one partition, chain by chain."""
+    columns = SegmentColumns()
+    cuts = await repo.get_archive_cuts(end, start=since)
+    for chain_key, through in sorted(cuts.items()):
+        boundary = archive.chain_boundary(chain_key)
+        if boundary is None:
+            after = 0
+            verifier = ChainVerifier()
+        else:
+            after = boundary.last_sequence_id
+            verifier = ChainVerifier(boundary.last_sequence_id, boundary.last_checksum)
+        if through <= after:
+            continue
+
+        async for row in repo.stream_chain_range(chain_key, after, through):
+            verifier.update([row])
+            columns.add(row)
+        if not verifier.is_valid:
+            raise ValueError(
+                f"Refusing to archive audit partition {day:%Y-%m-%d}: chain "
+                f"'{chain_key}' failed verification: {verifier.errors[0]}"
+            )
+    return columns
+
+
+async def _fully_archived(repo: AuditRepository, archive: AuditArchive, cutoff: datetime) -> bool:
+    """Check that no live row before cutoff is missing from the archive."""
+    for chain_key, through in (await repo.get_archive_cuts(cutoff)).items():
+        boundary = archive.chain_boundary(chain_key)
+        if boundary is None or through > boundary.last_sequence_id:
+            # Stamped before the horizon but persisted after its day was
+            # archived; the next run archives it with its first partition
+            logger.warning(
+                f"Not dropping audit partitions before {cutoff.isoformat()}: chain "
+                f"'{chain_key}' has unarchived events up to sequence_id={through}"
+            )
+            return False
+    return True
+
+
+def _partition_start(value: datetime) -> datetime:
+    """UTC midnight at or before value."""
+    value = value.astimezone(timezone.utc)
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
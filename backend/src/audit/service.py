@@ -8,31 +8,79 @@ Classes:
     AuditService: Main service for logging audit events with tiered routing
 
 The service automatically routes events based on their tier:
-- Tier-0 (critical): Synchronous persist via repository (blocking)
-- Tier-1 (non-critical): Asynchronous queue-based persist (non-blocking)
+- Tier-0 (critical): Group-committed persist; log_critical() returns an
+  awaitable that resolves once the event is committed, and concurrent tier-0
+  events share one transaction
+- Tier-1 (non-critical): Asynchronous queue-based persist (non-blocking);
+  workers drain up to batch_size queued events and hand them to the same
+  group committer
+
+The group committer is the only task writing through the repository's
+session (anchoring takes the same lock), so a failed commit can only roll
+back its own group.
+
+Events are spread over hash chains by chain_strategy so writes to different
+chains do not contend on one chain head lock. With anchoring enabled, the
+heads of all chains are periodically committed into the root chain.
 """
 
 import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
-from src.audit.config import get_tier
-from src.audit.diff import (
-    compute_diff_jsonpatch,
-    enforce_size_limit,
-    redact_sensitive_fields,
+from src.audit.canonical import canonical_json
+from src.audit.config import (
+    DEFAULT_CHAIN_SHARD_COUNT,
+    ROOT_CHAIN_KEY,
+    get_chain_key,
+    get_tier,
 )
+from src.audit.diff import enforce_size_limit, redact_sensitive_fields
 from src.audit.models import (
     ActorType,
     AuditEvent,
     AuditEventType,
     AuditSeverity,
+    ChainShardStrategy,
     EventSource,
     ResourceType,
     ValueMode,
 )
 from src.audit.repository import AuditRepository
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GroupCommitStats:
+    """Counters for the tier-0 group-commit path.
+
+    Attributes:
+        groups: Transactions committed
+        events: Events committed
+        failures: Groups whose commit failed
+        max_group_size: Largest group committed in one transaction
+    """
+
+    groups: int = 0
+    events: int = 0
+    failures: int = 0
+    max_group_size: int = 0
+
+    @property
+    def events_per_group(self) -> float:
+        """Average events committed per transaction."""
+        return self.events / self.groups if self.groups else 0.0
+
+
+def _log_commit_failure(future: "asyncio.Future[UUID]") -> None:
+    """Log (and retrieve) the error of an unawaited tier-0 commit."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Tier-0 audit commit failed: {future.exception()}")
+
 
 class AuditService:
     """Service for logging audit events with tiered write paths.
@@ -41,7 +89,8 @@ class AuditService:
     while automatically routing them to the appropriate persistence path
     based on their tier classification:
 
-    - Tier-0 events (critical): Persisted synchronously for guaranteed durability
+    - Tier-0 events (critical): Group-committed for guaranteed durability;
+      await log_critical() to wait for the commit
     - Tier-1 events (non-critical): Queued for asynchronous persistence
 
     The service handles:
@@ -53,6 +102,10 @@ class AuditService:
     Args:
         repository: AuditRepository instance for database operations
         async_queue: Optional asyncio.Queue for async events (default: internal queue with maxsize=10000)
+        batch_size: Max queued events a worker appends per chain transaction
+        chain_strategy: How events are sharded across hash chains
+        shard_count: Number of chains for RESOURCE_ID_HASH sharding
+        anchor_interval_seconds: Seconds between anchor records (None disables)
 
     Example:
         >>> repo = AuditRepository(session)
@@ -75,6 +128,10 @@ class AuditService:
         self,
         repository: AuditRepository,
         async_queue: asyncio.Queue | None = None,
+        batch_size: int = 100,
+        chain_strategy: ChainShardStrategy = ChainShardStrategy.NONE,
+        shard_count: int = DEFAULT_CHAIN_SHARD_COUNT,
+        anchor_interval_seconds: float | None = None,
     ) -> None:
         """Initialize the AuditService.
 
@@ -82,10 +139,31 @@ class AuditService:
             repository: AuditRepository instance for database operations
             async_queue: Optional asyncio.Queue for async events.
                         If not provided, creates an internal queue with maxsize=10000.
+            batch_size: Max queued events a worker appends per chain transaction,
+                       and max tier-0 events per group commit
+            chain_strategy: How events are sharded across hash chains
+                           (default: NONE, a single "default" chain)
+            shard_count: Number of chains for RESOURCE_ID_HASH sharding
+            anchor_interval_seconds: Seconds between anchor records committing
+                                     all chain heads to the root chain.
+                                     If None, start_workers() does not anchor.
         """
         self._repository = repository
         self._queue = async_queue if async_queue is not None else asyncio.Queue(maxsize=10000)
+        self._batch_size = batch_size
+        self._chain_strategy = chain_strategy
+        self._shard_count = shard_count
+        self._anchor_interval = anchor_interval_seconds
+        self._anchor_task: asyncio.Task | None = None
         self._workers: list[asyncio.Task] = []
+        # Group commit: (event, future) awaiting the next commit
+        self._critical_pending: deque[tuple[AuditEvent, asyncio.Future[UUID]]] = deque()
+        self._critical_wakeup = asyncio.Event()
+        # Serializes use of the repository's session
+        self._session_lock = asyncio.Lock()
+        self._committing = 0
+        self._committer: asyncio.Task | None = None
+        self.commit_stats = GroupCommitStats()
         self._running = False
         self._environment = "production"  # Default, can be configured
         self._service_name = "trading-api"  # Default, can be configured
@@ -115,7 +193,7 @@ class AuditService:
         """Log an audit event with automatic tier-based routing.
 
         Creates an AuditEvent with the provided parameters, applies redaction,
-        computes diffs, enforces size limits, and routes to the appropriate
+        encodes values once, enforces size limits, and routes to the appropriate
         persistence path based on the event's tier classification.
 
         Args:
@@ -141,6 +219,120 @@ class AuditService:
         Returns:
             UUID of the created audit event
         """
+        event = self._build_event(
+            event_type=event_type,
+            actor_id=actor_id,
+            actor_type=actor_type,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            request_id=request_id,
+            source=source,
+            severity=severity,
+            old_value=old_value,
+            new_value=new_value,
+            metadata=metadata,
+            correlation_id=correlation_id,
+            session_id=session_id,
+            trace_id=trace_id,
+            client_ip=client_ip,
+            user_agent=user_agent,
+            actor_display=actor_display,
+            impersonator_id=impersonator_id,
+        )
+
+        # Route based on tier
+        tier = get_tier(event_type)
+        if tier == 0:
+            # Tier-0: Group-committed persist (not awaited here)
+            self._persist_sync(event)
+        else:
+            # Tier-1: Asynchronous queue
+            self._enqueue_async(event)
+
+        return event.event_id
+
+    def log_critical(
+        self,
+        event_type: AuditEventType,
+        actor_id: str,
+        actor_type: ActorType,
+        resource_type: ResourceType,
+        resource_id: str,
+        request_id: str,
+        source: EventSource,
+        severity: AuditSeverity,
+        old_value: dict | None = None,
+        new_value: dict | None = None,
+        metadata: dict | None = None,
+        correlation_id: str | None = None,
+        session_id: str | None = None,
+        trace_id: str | None = None,
+        client_ip: str | None = None,
+        user_agent: str | None = None,
+        actor_display: str | None = None,
+        impersonator_id: str | None = None,
+    ) -> "asyncio.Future[UUID]":
+        """Log an event and return an awaitable for its durable commit.
+
+        Takes the same arguments as log(). Regardless of tier, the event
+        goes through the group-commit path: events submitted while a commit
+        is in flight are appended and committed together in the next
+        transaction, one batch per chain.
+
+        Returns:
+            Future resolving to the event's UUID once it is committed, or
+            raising the error that made the commit fail
+
+        Example:
+            >>> event_id = await service.log_critical(
+            ...     event_type=AuditEventType.ORDER_PLACED,
+            ...     ...
+            ... )
+        """
+        event = self._build_event(
+            event_type=event_type,
+            actor_id=actor_id,
+            actor_type=actor_type,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            request_id=request_id,
+            source=source,
+            severity=severity,
+            old_value=old_value,
+            new_value=new_value,
+            metadata=metadata,
+            correlation_id=correlation_id,
+            session_id=session_id,
+            trace_id=trace_id,
+            client_ip=client_ip,
+            user_agent=user_agent,
+            actor_display=actor_display,
+            impersonator_id=impersonator_id,
+        )
+        return self._submit_critical(event)
+
+    def _build_event(
+        self,
+        event_type: AuditEventType,
+        actor_id: str,
+        actor_type: ActorType,
+        resource_type: ResourceType,
+        resource_id: str,
+        request_id: str,
+        source: EventSource,
+        severity: AuditSeverity,
+        old_value: dict | None = None,
+        new_value: dict | None = None,
+        metadata: dict | None = None,
+        correlation_id: str | None = None,
+        session_id: str | None = None,
+        trace_id: str | None = None,
+        client_ip: str | None = None,
+        user_agent: str | None = None,
+        actor_display: str | None = None,
+        impersonator_id: str | None = None,
+    ) -> AuditEvent:
+        """Create a redacted, size-limited AuditEvent (see log() for args)."""
         event_id = uuid4()
         timestamp = datetime.now(tz=timezone.utc)
 
@@ -151,17 +343,16 @@ class AuditService:
         redacted_old = redact_sensitive_fields(old_value, resource_type_str)
         redacted_new = redact_sensitive_fields(new_value, resource_type_str)
 
-        # Compute diff if both old and new values are provided
-        # Note: diff_result can be used for logging or debugging purposes
-        if redacted_old is not None and redacted_new is not None:
-            _ = compute_diff_jsonpatch(redacted_old, redacted_new)
+        # Encode each value once; the size check, checksum and INSERT reuse it
+        old_json = canonical_json(redacted_old)
+        new_json = canonical_json(redacted_new)
 
         # Enforce size limits
         processed_old, old_hash, old_mode = enforce_size_limit(
-            redacted_old, resource_type_str, resource_id
+            redacted_old, resource_type_str, resource_id, encoded=old_json
         )
         processed_new, new_hash, new_mode = enforce_size_limit(
-            redacted_new, resource_type_str, resource_id
+            redacted_new, resource_type_str, resource_id, encoded=new_json
         )
 
         # Determine value mode (REFERENCE if either exceeded size limit)
@@ -182,8 +373,7 @@ class AuditService:
         if session_id is not None:
             event_metadata = {**(metadata or {}), "session_id": session_id}
 
-        # Create the audit event
-        event = AuditEvent(
+        return AuditEvent(
             event_id=event_id,
             timestamp=timestamp,
             event_type=event_type,
@@ -208,38 +398,162 @@ class AuditService:
             client_ip=client_ip,
             user_agent=user_agent,
             metadata=event_metadata,
+            old_value_json=old_json if processed_old is redacted_old else None,
+            new_value_json=new_json if processed_new is redacted_new else None,
         )
 
-        # Route based on tier
-        tier = get_tier(event_type)
-        if tier == 0:
-            # Tier-0: Synchronous persist
-            self._persist_sync(event)
-        else:
-            # Tier-1: Asynchronous queue
-            self._enqueue_async(event)
-
-        return event_id
-
     def _persist_sync(self, event: AuditEvent) -> None:
-        """Persist an event synchronously (tier-0 direct write).
+        """Persist an event through the tier-0 group-commit path.
 
-        Creates a task to persist the event and waits for completion.
-        This ensures tier-0 events are durably persisted before returning.
+        log() is synchronous, so the commit is not awaited here; a failed
+        commit is logged. Use log_critical() to await durability.
 
         Args:
             event: The audit event to persist
         """
-        # Create and schedule the coroutine
         try:
-            # Verify there's a running event loop before creating task
+            # Verify there's a running event loop before submitting
             asyncio.get_running_loop()
-            # Schedule the persist as a task but don't block
-            asyncio.create_task(self._repository.persist_audit_event(event))
         except RuntimeError:
             # No running event loop - this is likely in a sync context
             # In production, this would be handled differently
-            pass
+            return
+        self._submit_critical(event).add_done_callback(_log_commit_failure)
+
+    def _submit_critical(self, event: AuditEvent) -> "asyncio.Future[UUID]":
+        """Queue an event for the next group commit.
+
+        Args:
+            event: The audit event to persist
+
+        Returns:
+            Future resolved with the event's UUID once committed
+        """
+        return self._submit_group([event])[0]
+
+    def _submit_group(self, events: list[AuditEvent]) -> "list[asyncio.Future[UUID]]":
+        """Queue events, in order, for the next group commit.
+
+        Args:
+            events: Audit events to persist
+
+        Returns:
+            One future per event, resolved with its UUID once committed
+        """
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[UUID]] = []
+        for event in events:
+            future: asyncio.Future[UUID] = loop.create_future()
+            self._critical_pending.append((event, future))
+            futures.append(future)
+        if self._committer is None or self._committer.done():
+            self._committer = asyncio.create_task(self._commit_loop())
+        self._critical_wakeup.set()
+        return futures
+
+    async def _commit_loop(self) -> None:
+        """Group-commit pending events until stop() is called.
+
+        Every pass takes all events queued so far (up to batch_size), appends
+        them one batch per chain and commits once. Events arriving while a
+        commit is in flight wait for the next pass, so the number of
+        transactions grows with commit latency, not with concurrency.
+        """
+        try:
+            while True:
+                await self._critical_wakeup.wait()
+                self._critical_wakeup.clear()
+                while self._critical_pending:
+                    group = []
+                    while self._critical_pending and len(group) < self._batch_size:
+                        group.append(self._critical_pending.popleft())
+                    self._committing = len(group)
+                    try:
+                        await self._commit_group(group)
+                    finally:
+                        self._committing = 0
+        except asyncio.CancelledError:
+            # Nothing will commit the events still waiting; fail their callers
+            stopped = RuntimeError("Audit group committer stopped before commit")
+            while self._critical_pending:
+                _, future = self._critical_pending.popleft()
+                if not future.done():
+                    future.set_exception(stopped)
+
+    async def _commit_group(self, group: list[tuple[AuditEvent, "asyncio.Future[UUID]"]]) -> None:
+        """Append and commit one group, then resolve its futures.
+
+        Each chain is appended through _append_chain, so events that cannot
+        be written are rejected individually and the rest are committed. If
+        the committer is cancelled mid-group (stop()), the transaction is
+        rolled back and the group's futures are rejected before the
+        cancellation propagates.
+
+        Args:
+            group: (event, future) pairs in submission order
+        """
+        chains: dict[str, list[AuditEvent]] = {}
+        for event, _ in group:
+            chains.setdefault(self._chain_key(event), []).append(event)
+
+        failed: dict[UUID, Exception] = {}
+        async with self._session_lock:
+            try:
+                for chain_key, events in chains.items():
+                    for event, error in await self._append_chain(chain_key, events):
+                        failed[event.event_id] = error
+                await self._repository.commit()
+            except asyncio.CancelledError:
+                await self._abort_group(
+                    group, RuntimeError("Audit group committer stopped before commit")
+                )
+                raise
+            except Exception as e:
+                self.commit_stats.failures += 1
+                await self._abort_group(group, e)
+                return
+
+        committed = len(group) - len(failed)
+        self.commit_stats.groups += 1
+        self.commit_stats.events += committed
+        self.commit_stats.max_group_size = max(self.commit_stats.max_group_size, committed)
+        for event, future in group:
+            if future.done():
+                continue
+            if event.event_id in failed:
+                future.set_exception(failed[event.event_id])
+            else:
+                future.set_result(event.event_id)
+
+    async def _abort_group(
+        self, group: list[tuple[AuditEvent, "asyncio.Future[UUID]"]], error: BaseException
+    ) -> None:
+        """Roll back a group's transaction and reject its unresolved futures.
+
+        Args:
+            group: (event, future) pairs of the group
+            error: Exception set on each unresolved future
+        """
+        try:
+            await self._repository.rollback()
+        except Exception as rollback_error:
+            logger.warning(f"Audit group rollback failed: {rollback_error}")
+        for _, future in group:
+            if not future.done():
+                future.set_exception(error)
+
+    def _chain_key(self, event: AuditEvent) -> str:
+        """Get the hash chain an event is appended to.
+
+        Args:
+            event: The audit event
+
+        Returns:
+            The event's chain key under the configured sharding strategy
+        """
+        return get_chain_key(
+            event.resource_type, event.resource_id, self._chain_strategy, self._shard_count
+        )
 
     def _enqueue_async(self, event: AuditEvent) -> None:
         """Enqueue an event for asynchronous persistence (tier-1).
@@ -260,7 +574,8 @@ class AuditService:
         """Start async worker tasks that process the queue.
 
         Creates the specified number of worker tasks that continuously
-        read from the queue and persist events to the database.
+        read from the queue and persist events to the database, plus the
+        anchor task if an anchor interval is configured.
 
         Args:
             num_workers: Number of worker tasks to start (default: 2)
@@ -269,12 +584,15 @@ class AuditService:
         for _ in range(num_workers):
             worker = asyncio.create_task(self._worker_loop())
             self._workers.append(worker)
+        if self._anchor_interval is not None and self._anchor_task is None:
+            self._anchor_task = asyncio.create_task(self._anchor_loop())
 
     async def _worker_loop(self) -> None:
         """Worker loop that processes events from the queue.
 
-        Continuously reads events from the queue and persists them
-        to the database until stop() is called.
+        Waits for an event, drains up to batch_size events already queued,
+        and hands them to the group committer (one batch append per chain)
+        until stop() is called. Events that could not be committed are logged.
         """
         while self._running:
             try:
@@ -284,18 +602,124 @@ class AuditService:
                 except TimeoutError:
                     continue
 
-                # Persist the event
+                batch = [event]
+                while len(batch) < self._batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
                 try:
-                    await self._repository.persist_audit_event(event)
-                except Exception:  # noqa: S110 - Intentionally catching all exceptions to ensure worker continues
-                    # In production, this would use proper logging
-                    # Worker continues processing to avoid queue backup
-                    pass
+                    results = await asyncio.gather(
+                        *self._submit_group(batch), return_exceptions=True
+                    )
+                    for dropped, result in zip(batch, results, strict=True):
+                        if isinstance(result, Exception):
+                            # Worker continues processing to avoid queue backup
+                            logger.error(
+                                f"Dropped queued audit event {dropped.event_id} "
+                                f"({dropped.event_type.value}): {result}"
+                            )
                 finally:
-                    self._queue.task_done()
+                    for _ in batch:
+                        self._queue.task_done()
+
+            except asyncio.CancelledError:
+                break
+
+    async def _append_chain(
+        self, chain_key: str, events: list[AuditEvent]
+    ) -> list[tuple[AuditEvent, Exception]]:
+        """Append events to one chain, isolating events that cannot be written.
+
+        Caller holds the session lock. The batch is appended in a savepoint.
+        If that fails, it is split in
+        half and each half retried the same way, so a bad event costs only
+        itself rather than the whole batch. Chain order is preserved.
+
+        Args:
+            chain_key: Chain to append to
+            events: Events in chain order
 
+        Returns:
+            (event, error) for each event that could not be appended
+        """
+        try:
+            async with self._repository.savepoint():
+                await self._repository.persist_audit_events(events, chain_key=chain_key)
+            return []
+        except Exception as e:
+            if len(events) == 1:
+                return [(events[0], e)]
+        mid = len(events) // 2
+        return await self._append_chain(chain_key, events[:mid]) + await self._append_chain(
+            chain_key, events[mid:]
+        )
+
+    async def anchor_chains(self) -> tuple[int, str] | None:
+        """Commit the current head of every chain into the root chain.
+
+        Appends one CHAIN_ANCHORED event to the root chain whose new_value
+        maps each chain key to its head sequence_id and checksum. The anchor
+        is itself chained, so rewriting any shard after it was anchored is
+        detectable from the root chain.
+
+        Returns:
+            (sequence_id, checksum) of the anchor, or None if there are no
+            chains to anchor
+        """
+        async with self._session_lock:
+            return await self._anchor_chains()
+
+    async def _anchor_chains(self) -> tuple[int, str] | None:
+        """Append and commit the anchor; caller holds the session lock."""
+        heads = await self._repository.get_chain_heads(exclude=ROOT_CHAIN_KEY)
+        if not heads:
+            return None
+
+        event = AuditEvent(
+            event_id=uuid4(),
+            timestamp=datetime.now(tz=timezone.utc),
+            event_type=AuditEventType.CHAIN_ANCHORED,
+            severity=AuditSeverity.INFO,
+            actor_id="audit-anchor",
+            actor_type=ActorType.SYSTEM,
+            resource_type=ResourceType.AUDIT_CHAIN,
+            resource_id=ROOT_CHAIN_KEY,
+            request_id=f"anchor-{uuid4()}",
+            source=EventSource.SYSTEM,
+            environment=self._environment,
+            service=self._service_name,
+            version=self._version,
+            value_mode=ValueMode.SNAPSHOT,
+            new_value={
+                "heads": {
+                    head["chain_key"]: {
+                        "sequence_id": head["sequence_id"],
+                        "checksum": head["checksum"],
+                    }
+                    for head in heads
+                }
+            },
+        )
+        try:
+            anchored = await self._repository.persist_audit_event(event, chain_key=ROOT_CHAIN_KEY)
+            await self._repository.commit()
+        except Exception:
+            await self._repository.rollback()
+            raise
+        return anchored
+
+    async def _anchor_loop(self) -> None:
+        """Anchor all chain heads every anchor interval until stop() is called."""
+        while self._running:
+            try:
+                await asyncio.sleep(self._anchor_interval)
+                await self.anchor_chains()
             except asyncio.CancelledError:
                 break
+            except Exception as e:
+                logger.warning(f"Audit chain anchoring failed: {e}")
 
     async def stop(self) -> None:
         """Gracefully shutdown: stop workers and wait for queue to drain.
@@ -305,16 +729,31 @@ class AuditService:
         """
         self._running = False
 
-        # Wait for queue to drain (with timeout)
+        # Wait for queue to drain (with timeout); workers commit through the
+        # group committer, so it has to stay up until then
         if not self._queue.empty():
             try:
                 await asyncio.wait_for(self._queue.join(), timeout=5.0)
             except TimeoutError:
                 pass
 
+        # Wait for pending commits (with timeout)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 5.0
+        while (self._critical_pending or self._committing) and loop.time() < deadline:
+            await asyncio.sleep(0.01)
+        if self._committer is not None:
+            self._committer.cancel()
+            await asyncio.gather(self._committer, return_exceptions=True)
+            self._committer = None
+
         # Cancel all workers
         for worker in self._workers:
             worker.cancel()
+        if self._anchor_task is not None:
+            self._anchor_task.cancel()
+            await asyncio.gather(self._anchor_task, return_exceptions=True)
+            self._anchor_task = None
 
         # Wait for workers to finish
         if self._workers:
@@ -75,12 +75,15 @@ import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.audit.archive import AuditArchive
 from src.audit.repository import AuditRepository
 from src.audit.service import AuditService
+from src.config import settings
 
 logger = logging.getLogger(__name__)
 
 _audit_service: AuditService | None = None
+_audit_archive: AuditArchive | None = None
 
 
 def init_audit_service(db_session: AsyncSession) -> AuditService:
@@ -99,7 +102,7 @@ def init_audit_service(db_session: AsyncSession) -> AuditService:
     global _audit_service
 
     # Create repository
-    repo = AuditRepository(db_session)
+    repo = AuditRepository(db_session, archive=get_audit_archive())
 
     # Create service
     _audit_service = AuditService(repository=repo)
@@ -116,3 +119,19 @@ def get_audit_service() -> AuditService | None:
         Callers should check for None before using.
     """
     return _audit_service
+
+
+def get_audit_archive() -> AuditArchive | None:
+    """Get the cold archive at settings.audit_archive_dir.
+
+    Pass it to archive_audit_logs and to every AuditRepository that reads
+    audit logs, so queries and verification span the dropped partitions.
+
+    Returns:
+        The shared AuditArchive, or None if no archive directory is set
+    """
+    global _audit_archive
+
+    if _audit_archive is None and settings.audit_archive_dir:
+        _audit_archive = AuditArchive(settings.audit_archive_dir)
+    return _audit_archive
@@ -0,0 +1,109 @@
+"""Parallel streaming verification of audit chains.
+
+This module runs AuditRepository.verify_chain_streaming over many chains at
+once, each on its own session, and reports throughput:
+
+    report = await verify_chains(async_session, concurrency=4)
+    if not report.is_valid:
+        ...
+
+Each chain resumes from its verification checkpoint, so a scheduled run only
+reads events appended since the previous run.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.audit.repository import VERIFY_PAGE_SIZE, AuditRepository, ChainVerificationResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VerificationReport:
+    """Outcome of verifying a set of chains.
+
+    Attributes:
+        results: Per-chain results, in chain key order
+        elapsed_seconds: Wall time of the whole run
+    """
+
+    results: list[ChainVerificationResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def is_valid(self) -> bool:
+        """True if every chain verified without errors."""
+        return all(result.is_valid for result in self.results)
+
+    @property
+    def events_verified(self) -> int:
+        """Events checked across all chains."""
+        return sum(result.events_verified for result in self.results)
+
+    @property
+    def events_per_second(self) -> float:
+        """Aggregate verification throughput."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.events_verified / self.elapsed_seconds
+
+
+async def verify_chains(
+    session_factory: Callable[[], AsyncSession],
+    chain_keys: list[str] | None = None,
+    concurrency: int = 4,
+    page_size: int = VERIFY_PAGE_SIZE,
+    resume: bool = True,
+) -> VerificationReport:
+    """Verify chains in parallel, each streaming from its checkpoint.
+
+    Args:
+        session_factory: Callable that creates AsyncSession instances
+        chain_keys: Chains to verify (None for every chain with a head)
+        concurrency: Max chains verified at the same time
+        page_size: Rows fetched per cursor page
+        resume: Start each chain from its last checkpoint
+
+    Returns:
+        VerificationReport with per-chain results and throughput
+    """
+    started = time.perf_counter()
+
+    if chain_keys is None:
+        async with session_factory() as session:
+            heads = await AuditRepository(session).get_chain_heads(exclude=None)
+        chain_keys = [head["chain_key"] for head in heads]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def verify_one(chain_key: str) -> ChainVerificationResult:
+        async with semaphore, session_factory() as session:
+            result = await AuditRepository(session).verify_chain_streaming(
+                chain_key, page_size=page_size, resume=resume
+            )
+            await session.commit()
+        if not result.is_valid:
+            logger.error(
+                f"Audit chain {chain_key} failed verification with "
+                f"{result.error_count} errors; intact through "
+                f"sequence_id={result.verified_sequence_id}"
+            )
+        return result
+
+    results = await asyncio.gather(*(verify_one(key) for key in sorted(chain_keys)))
+    report = VerificationReport(
+        results=list(results),
+        elapsed_seconds=time.perf_counter() - started,
+    )
+
+    logger.info(
+        f"Verified {report.events_verified} audit events across {len(report.results)} "
+        f"chains in {report.elapsed_seconds:.2f}s ({report.events_per_second:.0f} events/s)"
+    )
+    return report
@@ -14,6 +14,10 @@ class Settings(BaseSettings):
     futu_host: str = "127.0.0.1"
     futu_port: int = 11111
 
+    # Audit
+    # Cold archive root for dropped audit_logs partitions (None: no archive)
+    audit_archive_dir: str | None = None
+
     # App
     debug: bool = True
 
@@ -89,6 +89,27 @@ class PortfolioManager:
             symbol=symbol,
         )
 
+    async def get_expiring_option_positions(
+        self,
+        account_id: str,
+        through: date,
+    ) -> tuple[list[Position], int]:
+        """
+        Get option positions expiring on or before a date.
+
+        Args:
+            account_id: Account identifier
+            through: Last expiry date to include (inclusive)
+
+        Returns:
+            Tuple of (option positions expiring by `through` or missing an
+            expiry, count of option positions expiring later)
+        """
+        return await self._repo.get_expiring_option_positions(
+            account_id=account_id,
+            through=through,
+        )
+
     async def get_position(
         self,
         account_id: str,
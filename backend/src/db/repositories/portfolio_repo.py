@@ -1,8 +1,8 @@
 # backend/src/db/repositories/portfolio_repo.py
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import and_, delete, select
+from sqlalchemy import and_, delete, func, or_, select
 
 from src.db.repositories.base import BaseRepository
 from src.models import Account, AssetType, Position, PositionStatus, Transaction, TransactionAction
@@ -151,6 +151,51 @@ class PortfolioRepository(BaseRepository):
             status=PositionStatus.OPEN,
         )
 
+    async def get_expiring_option_positions(
+        self,
+        account_id: str,
+        through: date,
+    ) -> tuple[list[Position], int]:
+        """Scan an account's option positions for expiry alerts in one query.
+
+        Selects option positions expiring on or before `through` (including
+        already expired ones) or missing an expiry, served by the partial
+        idx_positions_option_expiry index. Options expiring later are only
+        counted, via a scalar subquery left-joined to the scan so an empty
+        window still returns the count.
+
+        Args:
+            account_id: Account identifier
+            through: Last expiry date to return (inclusive)
+
+        Returns:
+            Tuple of (positions ordered by expiry, count of later-expiring options)
+        """
+        is_option = and_(
+            Position.account_id == account_id,
+            Position.asset_type == AssetType.OPTION,
+        )
+        later = (
+            select(func.count().label("later_count"))
+            .select_from(Position)
+            .where(is_option, Position.expiry > through)
+            .subquery()
+        )
+        stmt = (
+            select(Position, later.c.later_count)
+            .select_from(later)
+            .outerjoin(
+                Position,
+                and_(is_option, or_(Position.expiry.is_(None), Position.expiry <= through)),
+            )
+            .order_by(Position.expiry, Position.id)
+        )
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        later_count = rows[0][1] if rows else 0
+        return [row[0] for row in rows if row[0] is not None], later_count
+
     async def update_position(
         self,
         account_id: str,
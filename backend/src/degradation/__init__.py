@@ -14,6 +14,7 @@ from src.degradation.breakers import (
 )
 from src.degradation.cache import (
     CachedData,
+    CacheStats,
     DataCache,
 )
 from src.degradation.config import (
@@ -24,10 +25,13 @@ from src.degradation.config import (
 from src.degradation.db_buffer import (
     BufferEntry,
     DBBuffer,
+    FlushStats,
+    FlushTarget,
 )
 from src.degradation.event_bus import (
     EventBus,
     EventHandler,
+    SubscriberStats,
 )
 from src.degradation.models import (
     MODE_PRIORITY,
@@ -99,6 +103,7 @@ __all__ = [
     "PermissionResult",
     # Protocols
     "EventHandler",
+    "SubscriberStats",
     # Factory functions
     "create_event",
     # Config functions
@@ -120,8 +125,11 @@ __all__ = [
     # DB Buffer
     "BufferEntry",
     "DBBuffer",
+    "FlushStats",
+    "FlushTarget",
     # Cache with staleness
     "CachedData",
+    "CacheStats",
     "DataCache",
     # Component probes
     "HealthSignal",
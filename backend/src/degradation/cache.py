@@ -7,18 +7,47 @@ Key design:
 - Dual timestamps: cached_at_wall (display) + cached_at_mono (logic)
 - Staleness calculation based on monotonic time (not wall clock)
 - is_stale property compares age against configurable threshold
+- Bounded: LRU eviction by entry count and estimated bytes, plus a hard TTL
+  after which even stale data is dropped
+- Stale-while-revalidate: get_or_refresh() serves stale data while a single
+  refresh per key runs in the background
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+import sys
 import time
-from collections.abc import Iterator
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
 from src.degradation.config import DegradationConfig
 
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(data: Any) -> int:
+    """Estimate the memory footprint of cached data.
+
+    Uses json.dumps size (as DBBuffer does), falling back to sys.getsizeof
+    for values that cannot be serialized.
+
+    Args:
+        data: Value to size
+
+    Returns:
+        Estimated size in bytes
+    """
+    try:
+        return len(json.dumps(data, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return sys.getsizeof(data)
+
 
 @dataclass
 class CachedData:
@@ -36,6 +65,7 @@ class CachedData:
     cached_at_wall: datetime  # For display
     cached_at_mono: float  # For stale calculation (time.monotonic())
     stale_threshold_ms: int = 30000
+    size_bytes: int = 0  # Estimated json.dumps size, for the byte bound
 
     @property
     def is_stale(self) -> bool:
@@ -57,12 +87,43 @@ class CachedData:
         return (time.monotonic() - self.cached_at_mono) * 1000
 
 
+@dataclass
+class CacheStats:
+    """DataCache counters.
+
+    Attributes:
+        hits: Lookups that found an entry (fresh or stale)
+        stale_hits: Hits that returned stale data
+        misses: Lookups that found nothing (or an expired entry)
+        evictions: Entries dropped to stay within the entry/byte bounds
+        expirations: Entries dropped for exceeding the TTL
+        refreshes: Loader calls made by get_or_refresh
+        refresh_errors: Background refreshes that raised
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
 class DataCache:
     """Cache manager with staleness tracking.
 
-    Provides a simple key-value cache with built-in staleness detection.
+    Provides a bounded key-value cache with built-in staleness detection.
     All cached values include dual timestamps for both display and
-    staleness calculation purposes.
+    staleness calculation purposes. Least recently used entries are evicted
+    once config.cache_max_entries or config.cache_max_bytes is exceeded, and
+    entries older than config.cache_ttl_ms are dropped on access.
     """
 
     def __init__(self, config: DegradationConfig) -> None:
@@ -72,11 +133,16 @@ class DataCache:
             config: Degradation configuration with cache thresholds.
         """
         self._config = config
-        self._cache: dict[str, CachedData] = {}
+        self._cache: OrderedDict[str, CachedData] = OrderedDict()
+        self._byte_size = 0
+        self._refreshing: dict[str, asyncio.Task[Any]] = {}
+        self.stats = CacheStats()
 
     def set(self, key: str, data: Any, stale_threshold_ms: int | None = None) -> None:
         """Store data with current timestamps.
 
+        Evicts least recently used entries if the cache is over its bounds.
+
         Args:
             key: Cache key for retrieval.
             data: Data to cache (any serializable value).
@@ -89,12 +155,21 @@ class DataCache:
             else self._config.position_cache_stale_ms
         )
 
+        size = estimate_size(data)
+        self._remove(key)
+        if size > self._config.cache_max_bytes:
+            logger.warning(f"Not caching {key}: {size} bytes exceeds cache_max_bytes")
+            return
+
         self._cache[key] = CachedData(
             data=data,
             cached_at_wall=datetime.now(tz=timezone.utc),
             cached_at_mono=time.monotonic(),
             stale_threshold_ms=threshold,
+            size_bytes=size,
         )
+        self._byte_size += size
+        self._evict()
 
     def get(self, key: str) -> CachedData | None:
         """Get cached data if exists.
@@ -103,9 +178,23 @@ class DataCache:
             key: Cache key to retrieve.
 
         Returns:
-            CachedData object if key exists, None otherwise.
+            CachedData object if key exists and is within the TTL, None otherwise.
         """
-        return self._cache.get(key)
+        cached = self._cache.get(key)
+        if cached is not None and cached.age_ms > self._config.cache_ttl_ms:
+            self._remove(key)
+            self.stats.expirations += 1
+            cached = None
+
+        if cached is None:
+            self.stats.misses += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self.stats.hits += 1
+        if cached.is_stale:
+            self.stats.stale_hits += 1
+        return cached
 
     def get_if_fresh(self, key: str) -> tuple[Any, bool]:
         """Get data with freshness indicator.
@@ -117,13 +206,88 @@ class DataCache:
             Tuple of (data, is_stale). If key doesn't exist,
             returns (None, True).
         """
-        cached = self._cache.get(key)
+        cached = self.get(key)
 
         if cached is None:
             return (None, True)
 
         return (cached.data, cached.is_stale)
 
+    async def get_or_refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        stale_threshold_ms: int | None = None,
+    ) -> tuple[Any, bool]:
+        """Get data, refreshing it through loader when stale or missing.
+
+        Stale data is returned immediately while one background refresh per
+        key runs. On a miss, concurrent callers share a single loader call.
+
+        Args:
+            key: Cache key to retrieve.
+            loader: Async callable returning fresh data.
+            stale_threshold_ms: Staleness threshold for the refreshed entry.
+
+        Returns:
+            Tuple of (data, is_stale).
+
+        Raises:
+            Exception: Whatever loader raised, on a miss.
+        """
+        cached = self.get(key)
+        if cached is not None and not cached.is_stale:
+            return (cached.data, False)
+
+        task = self._refreshing.get(key)
+        if task is None:
+            task = asyncio.create_task(self._refresh(key, loader, stale_threshold_ms))
+            self._refreshing[key] = task
+            task.add_done_callback(lambda t: self._refresh_done(key, t))
+
+        if cached is not None:
+            return (cached.data, True)
+        return (await asyncio.shield(task), False)
+
+    async def _refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        stale_threshold_ms: int | None,
+    ) -> Any:
+        """Run loader and cache its result."""
+        self.stats.refreshes += 1
+        try:
+            data = await loader()
+        except Exception as e:
+            self.stats.refresh_errors += 1
+            logger.warning(f"Cache refresh failed for {key}: {e}")
+            raise
+        self.set(key, data, stale_threshold_ms)
+        return data
+
+    def _refresh_done(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Forget a finished refresh; its error was already logged."""
+        self._refreshing.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and its byte estimate."""
+        cached = self._cache.pop(key, None)
+        if cached is not None:
+            self._byte_size -= cached.size_bytes
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within bounds."""
+        while self._cache and (
+            len(self._cache) > self._config.cache_max_entries
+            or self._byte_size > self._config.cache_max_bytes
+        ):
+            _, cached = self._cache.popitem(last=False)
+            self._byte_size -= cached.size_bytes
+            self.stats.evictions += 1
+
     def clear(self, key: str | None = None) -> None:
         """Clear one or all cache entries.
 
@@ -132,8 +296,9 @@ class DataCache:
         """
         if key is None:
             self._cache.clear()
+            self._byte_size = 0
         else:
-            self._cache.pop(key, None)
+            self._remove(key)
 
     def keys(self) -> Iterator[str]:
         """Get all cache keys.
@@ -151,3 +316,12 @@ class DataCache:
             Count of cached entries.
         """
         return len(self._cache)
+
+    @property
+    def byte_size(self) -> int:
+        """Estimated bytes of cached data.
+
+        Returns:
+            Sum of per-entry json.dumps size estimates.
+        """
+        return self._byte_size
@@ -40,15 +40,23 @@ class DegradationConfig:
     db_buffer_max_bytes: int = 10_000_000
     db_buffer_max_seconds: float = 60.0
     db_wal_enabled: bool = True
+    db_wal_segment_max_bytes: int = 4_194_304
+    db_wal_sync_interval_ms: int = 50
+    db_buffer_flush_batch_size: int = 500
 
     # EventBus settings
     event_bus_queue_size: int = 10000
     event_bus_publish_timeout_ms: int = 100
     event_bus_drop_on_full: bool = True
+    event_bus_subscriber_queue_size: int = 1000
+    event_bus_critical_queue_size: int = 100
 
     # Cache staleness thresholds
     position_cache_stale_ms: int = 30000
     market_data_cache_stale_ms: int = 10000
+    cache_max_entries: int = 10_000
+    cache_max_bytes: int = 50_000_000
+    cache_ttl_ms: int = 3_600_000
 
     # Default TTL for component status
     component_status_ttl_seconds: int = 30
@@ -7,8 +7,24 @@ Key features:
 - Idempotent keys for replay deduplication (resource_type:resource_id:seq_no)
 - WAL replay only restores LOCAL state, does NOT trigger external actions
 
+WAL layout:
+- The active segment is written at wal_path through one persistent handle;
+  when it reaches db_wal_segment_max_bytes it is renamed to wal_path.NNNNNN
+  and a new active segment is started
+- Each record is length-prefixed and CRC32-checked; replay streams segments
+  in order and stops a segment at its first torn or corrupt record
+- Records reach the OS on every append; fsync is group-committed at most once
+  per db_wal_sync_interval_ms, and a deadline timer fsyncs records left
+  unsynced when appends stop (as does close())
+- A segment is deleted (or the active one truncated) once every entry in it
+  has been flushed
+
 Usage:
-    buffer = DBBuffer(config=config, wal_path=Path("/var/data/db.wal"))
+    buffer = DBBuffer(
+        config=config,
+        wal_path=Path("/var/data/db.wal"),
+        flush_targets={"order": FlushTarget(table="orders")},
+    )
 
     # Add entries when DB writes fail
     entry = BufferEntry(
@@ -24,21 +40,56 @@ Usage:
 
     # When DB recovers, flush buffer
     flushed = await buffer.flush_to_db(db_session)
+
+Flush:
+- Entries are grouped by resource_type and reduced to the latest entry per
+  resource_id (superseded entries are flushed with it)
+- Each group is written to its flush_targets table with multi-row
+  INSERT ... ON CONFLICT DO UPDATE statements of at most
+  db_buffer_flush_batch_size rows, committed per batch
+- Each committed batch is removed from the buffer and WAL, so a failed flush
+  only leaves the unwritten remainder buffered
+- Entries that can never be written are quarantined (kept in memory and the
+  WAL, no longer retried or counted as remaining) so they do not block the
+  other groups: resource types without a flush target, table or column
+  names that are not plain identifiers, and rows the database rejects
+- Each batch runs in a savepoint; a rejected batch is rolled back to it and
+  split in halves until the rejected resources are isolated
+- flush_stats reports progress and throughput for recovery stage checks
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from collections import Counter
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+from sqlalchemy import text
 
 from src.degradation.config import DegradationConfig
 
 logger = logging.getLogger(__name__)
 
+# Written at the start of every binary WAL segment
+WAL_MAGIC = b"AQWAL\x01\n"
+
+# Record header: payload length, CRC32 of payload, metadata length
+_RECORD_HEADER = struct.Struct(">III")
+
+# Table and column names are interpolated into flush SQL
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
 
 @dataclass
 class BufferEntry:
@@ -80,53 +131,414 @@ class BufferEntry:
         )
 
 
+@dataclass(frozen=True)
+class FlushTarget:
+    """Table that buffered entries of one resource_type are upserted into.
+
+    Each row is the entry's data with key_column defaulting to resource_id.
+
+    Attributes:
+        table: Table name
+        key_column: Unique column used as the ON CONFLICT target
+    """
+
+    table: str
+    key_column: str = "id"
+
+
+@dataclass
+class FlushStats:
+    """Progress of the current (or last) flush.
+
+    Attributes:
+        in_progress: Whether a flush is running
+        flushed: Entries removed from the buffer so far
+        rows_written: Rows upserted after deduplication
+        batches: Batches committed
+        remaining: Entries still buffered (excluding quarantined ones)
+        quarantined: Entries set aside because they can never be written
+        elapsed_seconds: Time spent flushing
+        last_error: Error that stopped the flush, if any
+    """
+
+    in_progress: bool = False
+    flushed: int = 0
+    rows_written: int = 0
+    batches: int = 0
+    remaining: int = 0
+    quarantined: int = 0
+    elapsed_seconds: float = 0.0
+    last_error: str | None = None
+
+    @property
+    def entries_per_second(self) -> float:
+        """Flush throughput in buffered entries per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.flushed / self.elapsed_seconds
+
+    @property
+    def eta_seconds(self) -> float | None:
+        """Estimated time to flush the remaining entries (None if unknown)."""
+        rate = self.entries_per_second
+        if self.remaining == 0:
+            return 0.0
+        if rate <= 0:
+            return None
+        return self.remaining / rate
+
+
+FlushProgressCallback = Callable[[FlushStats], None]
+
+
+class _SegmentedWAL:
+    """Segment-rotated, length-prefixed, CRC-checked write-ahead log.
+
+    A record's payload is the JSON metadata of a BufferEntry followed by its
+    JSON-encoded data, so the data is serialized once for both sizing and
+    logging. Live-entry counts per segment decide when a segment can go.
+
+    File operations are serialized by a lock because the sync deadline
+    timer runs on its own thread.
+    """
+
+    def __init__(self, path: Path, segment_max_bytes: int, sync_interval_seconds: float) -> None:
+        self._path = path
+        self._segment_max_bytes = segment_max_bytes
+        self._sync_interval = sync_interval_seconds
+        self._sealed: dict[int, Path] = {}
+        self._live: Counter[int] = Counter()
+        self._active_id = 0
+        self._active_size = 0
+        self._file: BinaryIO | None = None
+        self._dirty = False
+        self._last_sync = time.monotonic()
+        self._lock = threading.RLock()
+        self._sync_timer: threading.Timer | None = None
+        self.sync_count = 0
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segments on disk, including the active one."""
+        return len(self._sealed) + 1
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self._path.with_name(f"{self._path.name}.{segment_id:06d}")
+
+    def replay(self) -> Iterator[tuple[int, dict[str, Any], bytes]]:
+        """Stream records from sealed segments, then the active segment.
+
+        Callers must retain() every record they keep; sealed segments with
+        nothing retained are deleted once replay finishes. A legacy JSONL
+        WAL at the active path is read and rewritten in the binary format.
+
+        Yields:
+            Tuples of (segment id, metadata dict, data JSON bytes)
+        """
+        prefix = f"{self._path.name}."
+        for path in sorted(self._path.parent.glob(f"{prefix}*")):
+            suffix = path.name[len(prefix) :]
+            if not suffix.isdigit():
+                continue
+            segment_id = int(suffix)
+            self._sealed[segment_id] = path
+            yield from self._read_segment(segment_id, path)
+
+        self._active_id = max(self._sealed, default=-1) + 1
+        legacy: list[tuple[dict[str, Any], bytes]] = []
+        legacy_id = -1
+        valid_end = 0
+        if self._path.exists():
+            with open(self._path, "rb") as f:
+                is_legacy = f.read(len(WAL_MAGIC)) not in (WAL_MAGIC, b"")
+            if is_legacy:
+                legacy = list(self._read_legacy(self._path))
+                legacy_id = self._migrate_legacy(legacy)
+            else:
+                valid_end = yield from self._read_segment(self._active_id, self._path)
+        self._open_active(valid_end)
+
+        for meta, data in legacy:
+            yield legacy_id, meta, data
+
+        for segment_id in [s for s in self._sealed if self._live[s] <= 0]:
+            self._delete_sealed(segment_id)
+
+    def _read_segment(
+        self, segment_id: int, path: Path
+    ) -> Iterator[tuple[int, dict[str, Any], bytes]]:
+        """Read one binary segment record by record.
+
+        Returns:
+            Offset just past the last valid record (0 if the header is bad)
+        """
+        offset = 0
+        try:
+            with open(path, "rb") as f:
+                if f.read(len(WAL_MAGIC)) != WAL_MAGIC:
+                    return 0
+                offset = len(WAL_MAGIC)
+                while True:
+                    header = f.read(_RECORD_HEADER.size)
+                    if not header:
+                        break
+                    if len(header) < _RECORD_HEADER.size:
+                        logger.warning(f"Torn WAL record header in {path.name} at {offset}")
+                        break
+                    length, crc, meta_length = _RECORD_HEADER.unpack(header)
+                    payload = f.read(length)
+                    if len(payload) < length or zlib.crc32(payload) != crc:
+                        logger.warning(f"Torn or corrupt WAL record in {path.name} at {offset}")
+                        break
+                    offset += _RECORD_HEADER.size + length
+                    try:
+                        meta = json.loads(payload[:meta_length])
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"Skipping invalid WAL entry: {e}")
+                        continue
+                    yield segment_id, meta, payload[meta_length:]
+        except OSError as e:
+            logger.error(f"Failed to read WAL segment {path.name}: {e}")
+        return offset
+
+    @staticmethod
+    def _read_legacy(path: Path) -> Iterator[tuple[dict[str, Any], bytes]]:
+        """Read a pre-segmentation JSONL WAL file."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        meta = json.loads(line)
+                        data = meta.pop("data")
+                    except (json.JSONDecodeError, KeyError) as e:
+                        logger.warning(f"Skipping invalid WAL entry: {e}")
+                        continue
+                    yield meta, json.dumps(data).encode("utf-8")
+        except OSError as e:
+            logger.error(f"Failed to read WAL: {e}")
+
+    def _migrate_legacy(self, records: list[tuple[dict[str, Any], bytes]]) -> int:
+        """Rewrite legacy records as a sealed segment, then remove the old file.
+
+        The new segment is fsynced before the JSONL file is deleted, so a crash
+        mid-migration leaves at least one complete copy on disk.
+
+        Returns:
+            Id of the sealed segment holding the records
+        """
+        segment_id = self._active_id
+        path = self._segment_path(segment_id)
+        with open(path, "wb") as f:
+            f.write(WAL_MAGIC)
+            for meta, data in records:
+                f.write(self._encode_record(json.dumps(meta).encode("utf-8"), data))
+            f.flush()
+            os.fsync(f.fileno())
+        self._sealed[segment_id] = path
+        self._path.unlink()
+        self._active_id += 1
+        return segment_id
+
+    @staticmethod
+    def _encode_record(meta: bytes, data: bytes) -> bytes:
+        payload = meta + data
+        return _RECORD_HEADER.pack(len(payload), zlib.crc32(payload), len(meta)) + payload
+
+    def _open_active(self, valid_end: int = 0) -> None:
+        """Open the active segment, dropping anything after valid_end."""
+        self._file = open(self._path, "ab")
+        self._file.truncate(valid_end)
+        self._active_size = valid_end
+
+    def retain(self, segment_id: int) -> None:
+        """Count a replayed record as live in its segment."""
+        self._live[segment_id] += 1
+
+    def append(self, meta: bytes, data: bytes) -> int:
+        """Append one record and group-commit it.
+
+        Args:
+            meta: JSON-encoded entry metadata
+            data: JSON-encoded entry data
+
+        Returns:
+            Id of the segment the record was written to
+        """
+        with self._lock:
+            if self._file is None:
+                self._open_active(self._active_size)
+            assert self._file is not None
+
+            record = self._encode_record(meta, data)
+            if self._active_size == 0:
+                record = WAL_MAGIC + record
+            self._file.write(record)
+            self._file.flush()
+            self._active_size += len(record)
+
+            segment_id = self._active_id
+            self._live[segment_id] += 1
+            self._dirty = True
+            since_sync = time.monotonic() - self._last_sync
+            if since_sync >= self._sync_interval:
+                self.sync()
+            elif self._sync_timer is None:
+                self._sync_timer = threading.Timer(
+                    self._sync_interval - since_sync, self._sync_on_deadline
+                )
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+            if self._active_size >= self._segment_max_bytes:
+                self._rotate()
+            return segment_id
+
+    def _sync_on_deadline(self) -> None:
+        """Timer callback: fsync records the group commit has not covered."""
+        with self._lock:
+            self._sync_timer = None
+            try:
+                self.sync()
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to sync WAL: {e}")
+
+    def sync(self) -> None:
+        """fsync the active segment if anything was written since the last sync."""
+        with self._lock:
+            if self._file is None or not self._dirty:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._dirty = False
+            self._last_sync = time.monotonic()
+            self.sync_count += 1
+
+    def _rotate(self) -> None:
+        """Seal the active segment and start a new one."""
+        assert self._file is not None
+        self.sync()
+        self._file.close()
+        sealed = self._segment_path(self._active_id)
+        self._path.rename(sealed)
+        self._sealed[self._active_id] = sealed
+        self._active_id += 1
+        self._open_active()
+
+    def release(self, segment_id: int, count: int) -> None:
+        """Mark flushed records; drop the segment once none are live.
+
+        Args:
+            segment_id: Segment the records were written to
+            count: Number of records flushed
+        """
+        with self._lock:
+            self._live[segment_id] -= count
+            if self._live[segment_id] > 0:
+                return
+            del self._live[segment_id]
+            if segment_id in self._sealed:
+                self._delete_sealed(segment_id)
+            elif segment_id == self._active_id and self._file is not None:
+                self._file.truncate(0)
+                self._active_size = 0
+                self._dirty = True
+
+    def _delete_sealed(self, segment_id: int) -> None:
+        path = self._sealed.pop(segment_id)
+        self._live.pop(segment_id, None)
+        path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Cancel the sync deadline, fsync and close the active segment."""
+        with self._lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if self._file is None:
+                return
+            self.sync()
+            self._file.close()
+            self._file = None
+
+
 class DBBuffer:
     """Buffer for database writes with WAL persistence.
 
     This buffer stores database writes that failed during degraded mode.
     It provides:
     - Memory explosion protection using json.dumps size for byte calculation
-    - WAL persistence for crash recovery
+    - Segmented, group-committed WAL persistence for crash recovery
     - Idempotent key deduplication
 
     Attributes:
         config: Degradation configuration with buffer limits
-        wal_path: Path to WAL file (None to disable WAL)
+        wal_path: Path to the active WAL segment (None to disable WAL)
     """
 
     def __init__(
         self,
         config: DegradationConfig,
         wal_path: Path | None = None,
+        flush_targets: dict[str, FlushTarget] | None = None,
     ) -> None:
         """Initialize the DB buffer.
 
         Args:
             config: Degradation configuration with buffer limits
-            wal_path: Path to WAL file (None to disable WAL)
+            wal_path: Path to the active WAL segment (None to disable WAL)
+            flush_targets: Table per resource_type; entries of unmapped
+                types are quarantined on flush
         """
         self._config = config
         self._wal_path = wal_path
-
-        # In-memory storage
-        self._entries: list[BufferEntry] = []
-        self._idempotent_keys: set[str] = set()
+        self._flush_targets = flush_targets or {}
+        self._flush_stats = FlushStats()
+
+        # In-memory storage, keyed by idempotent_key in arrival order
+        self._entries: dict[str, BufferEntry] = {}
+        # Entries flush can never write; kept for operators
+        self._quarantined: dict[str, BufferEntry] = {}
+        self._entry_bytes: dict[str, int] = {}
         self._byte_count: int = 0
 
+        # idempotent_key -> WAL segment holding the entry
+        self._wal_segments: dict[str, int] = {}
+        self._wal: _SegmentedWAL | None = None
+
         # Restore from WAL if exists
         if wal_path is not None:
+            self._wal = _SegmentedWAL(
+                wal_path,
+                segment_max_bytes=config.db_wal_segment_max_bytes,
+                sync_interval_seconds=config.db_wal_sync_interval_ms / 1000,
+            )
             self._restore_from_wal()
 
     @property
     def entry_count(self) -> int:
-        """Number of entries in the buffer."""
-        return len(self._entries)
+        """Number of entries in the buffer, including quarantined ones."""
+        return len(self._entries) + len(self._quarantined)
+
+    @property
+    def quarantined_entries(self) -> list[BufferEntry]:
+        """Entries set aside by flush because they can never be written."""
+        return list(self._quarantined.values())
 
     @property
     def byte_count(self) -> int:
         """Total bytes of buffered data (json.dumps serialized size)."""
         return self._byte_count
 
+    @property
+    def flush_stats(self) -> FlushStats:
+        """Progress and throughput of the current or last flush."""
+        if not self._flush_stats.in_progress:
+            self._flush_stats.remaining = len(self._entries)
+            self._flush_stats.quarantined = len(self._quarantined)
+        return self._flush_stats
+
     @property
     def is_full(self) -> bool:
         """Check if buffer is at capacity.
@@ -139,13 +551,14 @@ class DBBuffer:
     @property
     def _entry_count(self) -> int:
         """Internal entry count property for is_full check."""
-        return len(self._entries)
+        return len(self._entries) + len(self._quarantined)
 
     def add(self, entry: BufferEntry) -> bool:
         """Add entry to buffer.
 
         Returns False if buffer is full (max_entries or max_bytes exceeded).
-        Uses json.dumps serialization for byte calculation.
+        Uses json.dumps serialization for byte calculation; the same bytes
+        are written to the WAL.
 
         Args:
             entry: The BufferEntry to add
@@ -154,13 +567,13 @@ class DBBuffer:
             True if entry was added, False if buffer is full
         """
         # Check for duplicate idempotent key
-        if entry.idempotent_key in self._idempotent_keys:
+        if entry.idempotent_key in self._entries or entry.idempotent_key in self._quarantined:
             logger.debug(f"Duplicate idempotent key: {entry.idempotent_key}")
             return True  # Already have this entry, consider it a success
 
         # Calculate entry size using json.dumps
-        serialized = json.dumps(entry.data)
-        entry_bytes = len(serialized.encode("utf-8"))
+        serialized = json.dumps(entry.data).encode("utf-8")
+        entry_bytes = len(serialized)
 
         # Check max_entries limit
         if self._entry_count >= self._config.db_buffer_max_entries:
@@ -176,12 +589,12 @@ class DBBuffer:
             return False
 
         # Add to buffer
-        self._entries.append(entry)
-        self._idempotent_keys.add(entry.idempotent_key)
+        self._entries[entry.idempotent_key] = entry
+        self._entry_bytes[entry.idempotent_key] = entry_bytes
         self._byte_count += entry_bytes
 
         # Write to WAL
-        self._write_wal(entry)
+        self._write_wal(entry, serialized)
 
         logger.debug(
             f"Added entry to buffer: {entry.idempotent_key}, "
@@ -190,11 +603,25 @@ class DBBuffer:
 
         return True
 
-    async def flush_to_db(self, db_session: Any) -> int:
-        """Flush buffer to database.
+    async def flush_to_db(
+        self,
+        db_session: Any,
+        progress: FlushProgressCallback | None = None,
+    ) -> int:
+        """Flush buffer to database with batched multi-row upserts.
+
+        Entries are grouped by resource_type and deduplicated to the latest
+        entry per resource_id. Each batch is committed, then removed from the
+        buffer and WAL. Groups without a flush target and resources with
+        invalid identifiers are quarantined up front; resources the database
+        rejects are rolled back to the batch's savepoint and quarantined, and
+        the flush continues with the rest. If a commit or savepoint fails the
+        session is rolled back and the remaining entries stay buffered for
+        the next flush.
 
         Args:
-            db_session: Database session for writing
+            db_session: Async database session for writing
+            progress: Called with flush_stats after each committed batch
 
         Returns:
             Count of entries flushed
@@ -202,71 +629,233 @@ class DBBuffer:
         if not self._entries:
             return 0
 
-        flushed_count = len(self._entries)
+        stats = FlushStats(
+            in_progress=True, remaining=len(self._entries), quarantined=len(self._quarantined)
+        )
+        self._flush_stats = stats
+        started = time.monotonic()
+        batch_size = self._config.db_buffer_flush_batch_size
 
-        # TODO: Implement actual database write logic
-        # For now, we just clear the buffer
-        # In production, this would:
-        # 1. Group entries by resource_type
-        # 2. Batch write to appropriate tables
-        # 3. Handle partial failures
+        logger.info(f"Flushing {stats.remaining} entries to database")
 
-        logger.info(f"Flushing {flushed_count} entries to database")
+        # resource_type -> resource_id -> entries, oldest first
+        groups: dict[str, dict[str, list[BufferEntry]]] = {}
+        for entry in self._entries.values():
+            groups.setdefault(entry.resource_type, {}).setdefault(entry.resource_id, []).append(
+                entry
+            )
 
-        # Clear buffer
-        self._entries.clear()
-        self._idempotent_keys.clear()
-        self._byte_count = 0
+        try:
+            for resource_type, resources in groups.items():
+                target = self._flush_targets.get(resource_type)
+                if target is None:
+                    self._quarantine(
+                        list(resources.values()), f"no flush target for {resource_type!r}"
+                    )
+                    versions = []
+                else:
+                    versions = self._quarantine_invalid(target, list(resources.values()))
+                stats.remaining = len(self._entries)
+                stats.quarantined = len(self._quarantined)
+                for start in range(0, len(versions), batch_size):
+                    written = await self._flush_batch(
+                        db_session, target, versions[start : start + batch_size]
+                    )
+                    await db_session.commit()
+                    stats.quarantined = len(self._quarantined)
+                    if not written:
+                        stats.remaining = len(self._entries)
+                        continue
 
-        # Clear WAL
-        self._clear_wal()
+                    done = [entry for v in written for entry in v]
+                    self._remove(done)
+                    stats.flushed += len(done)
+                    stats.rows_written += len(written)
+                    stats.batches += 1
+                    stats.remaining = len(self._entries)
+                    stats.elapsed_seconds = time.monotonic() - started
+                    if progress is not None:
+                        progress(stats)
+        except Exception as e:
+            await db_session.rollback()
+            stats.last_error = str(e)
+            logger.error(
+                f"DB buffer flush stopped after {stats.flushed} entries, "
+                f"{len(self._entries)} remain buffered: {e}"
+            )
+        finally:
+            stats.in_progress = False
+            stats.remaining = len(self._entries)
+            stats.quarantined = len(self._quarantined)
+            stats.elapsed_seconds = time.monotonic() - started
+
+        logger.info(
+            f"Flushed {stats.flushed} entries as {stats.rows_written} rows in "
+            f"{stats.batches} batches ({stats.entries_per_second:.0f} entries/s)"
+        )
+        return stats.flushed
 
-        return flushed_count
+    def _quarantine_invalid(
+        self, target: FlushTarget, versions: list[list[BufferEntry]]
+    ) -> list[list[BufferEntry]]:
+        """Set aside resources whose table or column names cannot be written.
 
-    def _write_wal(self, entry: BufferEntry) -> None:
-        """Write entry to WAL file.
+        Args:
+            target: Table and conflict column for the group
+            versions: Entries per resource_id, oldest first
 
-        Each entry is written as a single JSON line (JSONL format).
+        Returns:
+            The versions that can be flushed
+        """
+        if not all(_IDENTIFIER.match(name) for name in (target.table, target.key_column)):
+            bad, good = versions, []
+        else:
+            bad, good = [], []
+            for v in versions:
+                valid = all(_IDENTIFIER.match(column) for column in v[-1].data)
+                (good if valid else bad).append(v)
+
+        self._quarantine(bad, f"invalid table or column name for {target.table!r}")
+        return good
+
+    async def _flush_batch(
+        self, db_session: Any, target: FlushTarget, batch: list[list[BufferEntry]]
+    ) -> list[list[BufferEntry]]:
+        """Upsert a batch in a savepoint, isolating resources the database rejects.
+
+        A rejected batch is rolled back to its savepoint and retried in
+        halves; a single rejected resource is quarantined. Errors starting
+        or rolling back the savepoint (the connection is gone) propagate.
 
         Args:
-            entry: The entry to write
+            db_session: Async database session
+            target: Table and conflict column for the group
+            batch: Entries per resource_id, oldest first
+
+        Returns:
+            The versions written (the caller commits)
         """
-        if self._wal_path is None:
+        savepoint = await db_session.begin_nested()
+        try:
+            await self._upsert(db_session, target, [v[-1] for v in batch])
+        except Exception as e:
+            await savepoint.rollback()
+            if len(batch) == 1:
+                self._quarantine(batch, f"rejected by {target.table!r}: {e}")
+                return []
+            mid = len(batch) // 2
+            first = await self._flush_batch(db_session, target, batch[:mid])
+            return first + await self._flush_batch(db_session, target, batch[mid:])
+        await savepoint.commit()
+        return batch
+
+    def _quarantine(self, versions: list[list[BufferEntry]], reason: str) -> None:
+        """Move resources out of the flushable entries.
+
+        Args:
+            versions: Entries per resource_id, oldest first
+            reason: Why they can never be written (logged)
+        """
+        for v in versions:
+            for entry in v:
+                del self._entries[entry.idempotent_key]
+                self._quarantined[entry.idempotent_key] = entry
+            logger.error(
+                f"Quarantined {len(v)} buffered {v[-1].resource_type} entries for "
+                f"{v[-1].resource_id}: {reason}"
+            )
+
+    @staticmethod
+    async def _upsert(db_session: Any, target: FlushTarget, entries: list[BufferEntry]) -> None:
+        """Write entries with one multi-row upsert per column set.
+
+        Args:
+            db_session: Async database session
+            target: Table and conflict column
+            entries: Latest entry per resource_id
+        """
+        by_columns: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for entry in entries:
+            row = {target.key_column: entry.resource_id, **entry.data}
+            by_columns.setdefault(tuple(sorted(row)), []).append(row)
+
+        for columns, rows in by_columns.items():
+            for name in (target.table, *columns):
+                if not _IDENTIFIER.match(name):
+                    raise ValueError(f"Invalid identifier in buffered write: {name!r}")
+
+            params: dict[str, Any] = {}
+            values = []
+            for i, row in enumerate(rows):
+                placeholders = []
+                for j, column in enumerate(columns):
+                    params[f"r{i}_{j}"] = row[column]
+                    placeholders.append(f":r{i}_{j}")
+                values.append(f"({', '.join(placeholders)})")
+
+            updates = ", ".join(f"{c} = excluded.{c}" for c in columns if c != target.key_column)
+            action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+            await db_session.execute(
+                text(
+                    f"""
+                    INSERT INTO {target.table} ({", ".join(columns)})
+                    VALUES {", ".join(values)}
+                    ON CONFLICT ({target.key_column}) {action}
+                    """  # noqa: S608 — identifiers validated above, values are bound
+                ),
+                params,
+            )
+
+    def _remove(self, entries: list[BufferEntry]) -> None:
+        """Drop flushed entries from memory and release their WAL records."""
+        for entry in entries:
+            del self._entries[entry.idempotent_key]
+            self._byte_count -= self._entry_bytes.pop(entry.idempotent_key)
+        self._release_wal(entries)
+
+    def sync_wal(self) -> None:
+        """fsync WAL records not yet covered by a group commit.
+
+        Not needed for durability (the WAL fsyncs on its own deadline within
+        db_wal_sync_interval_ms); use it to force a sync point early.
+        """
+        if self._wal is None:
             return
+        try:
+            self._wal.sync()
+        except OSError as e:
+            logger.error(f"Failed to sync WAL: {e}")
 
+    def close(self) -> None:
+        """fsync and close the WAL."""
+        if self._wal is None:
+            return
         try:
-            with open(self._wal_path, "a", encoding="utf-8") as f:
-                line = json.dumps(entry.to_dict())
-                f.write(line + "\n")
+            self._wal.close()
         except OSError as e:
-            logger.error(f"Failed to write WAL: {e}")
+            logger.error(f"Failed to close WAL: {e}")
 
-    def _read_wal(self) -> list[BufferEntry]:
-        """Read entries from WAL file.
+    def _write_wal(self, entry: BufferEntry, serialized: bytes) -> None:
+        """Append entry to the WAL.
 
-        Returns:
-            List of BufferEntry objects from WAL
+        Args:
+            entry: The entry to write
+            serialized: json.dumps of entry.data, already encoded
         """
-        if self._wal_path is None or not self._wal_path.exists():
-            return []
+        if self._wal is None:
+            return
 
-        entries: list[BufferEntry] = []
+        meta = {
+            "resource_type": entry.resource_type,
+            "resource_id": entry.resource_id,
+            "timestamp": entry.timestamp.isoformat(),
+            "idempotent_key": entry.idempotent_key,
+        }
         try:
-            with open(self._wal_path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        data = json.loads(line)
-                        entry = BufferEntry.from_dict(data)
-                        entries.append(entry)
-                    except (json.JSONDecodeError, KeyError) as e:
-                        logger.warning(f"Skipping invalid WAL entry: {e}")
+            segment_id = self._wal.append(json.dumps(meta).encode("utf-8"), serialized)
+            self._wal_segments[entry.idempotent_key] = segment_id
         except OSError as e:
-            logger.error(f"Failed to read WAL: {e}")
-
-        return entries
+            logger.error(f"Failed to write WAL: {e}")
 
     def _restore_from_wal(self) -> None:
         """Restore buffer state from WAL.
@@ -274,34 +863,52 @@ class DBBuffer:
         This only restores LOCAL state - it does NOT trigger any external actions.
         Duplicate idempotent keys are deduplicated.
         """
-        entries = self._read_wal()
+        assert self._wal is not None
 
-        for entry in entries:
-            # Skip duplicates
-            if entry.idempotent_key in self._idempotent_keys:
-                continue
-
-            # Calculate bytes
-            serialized = json.dumps(entry.data)
-            entry_bytes = len(serialized.encode("utf-8"))
-
-            # Add to buffer (skip limit checks during restore)
-            self._entries.append(entry)
-            self._idempotent_keys.add(entry.idempotent_key)
-            self._byte_count += entry_bytes
+        replayed = 0
+        try:
+            for segment_id, meta, serialized in self._wal.replay():
+                replayed += 1
+                try:
+                    entry = BufferEntry.from_dict({**meta, "data": json.loads(serialized)})
+                except (json.JSONDecodeError, KeyError, ValueError) as e:
+                    logger.warning(f"Skipping invalid WAL entry: {e}")
+                    continue
+
+                # Skip duplicates
+                if entry.idempotent_key in self._entries:
+                    continue
+
+                # Add to buffer (skip limit checks during restore)
+                self._entries[entry.idempotent_key] = entry
+                self._entry_bytes[entry.idempotent_key] = len(serialized)
+                self._byte_count += len(serialized)
+                self._wal_segments[entry.idempotent_key] = segment_id
+                self._wal.retain(segment_id)
+        except OSError as e:
+            logger.error(f"Failed to restore WAL: {e}")
 
-        if entries:
+        if replayed:
             logger.info(
-                f"Restored {len(self._entries)} entries from WAL " f"({self._byte_count} bytes)"
+                f"Restored {len(self._entries)} entries from WAL ({self._byte_count} bytes)"
             )
 
-    def _clear_wal(self) -> None:
-        """Clear the WAL file after successful flush."""
-        if self._wal_path is None:
+    def _release_wal(self, entries: list[BufferEntry]) -> None:
+        """Release flushed entries from their WAL segments.
+
+        Args:
+            entries: Entries that were written to the database
+        """
+        if self._wal is None:
             return
 
+        segments = Counter(
+            self._wal_segments.pop(e.idempotent_key)
+            for e in entries
+            if e.idempotent_key in self._wal_segments
+        )
         try:
-            with open(self._wal_path, "w", encoding="utf-8") as f:
-                f.truncate(0)
+            for segment_id, count in segments.items():
+                self._wal.release(segment_id, count)
         except OSError as e:
-            logger.error(f"Failed to clear WAL: {e}")
+            logger.error(f"Failed to release WAL segments: {e}")
@@ -4,6 +4,10 @@ CRITICAL: publish() must NEVER block. It uses put_nowait().
 - Non-critical events are dropped when the queue is full (drop_count incremented)
 - Critical events (in MUST_DELIVER_EVENTS) trigger _local_emergency_degrade() when dropped
 - Fallback log written when events are dropped
+
+Dispatch fans out to one bounded queue and task per subscriber, so a slow
+subscriber only backs up its own queue. Each subscriber queue has two lanes:
+critical events are handled before any queued non-critical backlog.
 """
 
 from __future__ import annotations
@@ -11,7 +15,10 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
+from collections import deque
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
@@ -33,6 +40,47 @@ class EventHandler(Protocol):
 EmergencyCallback = Callable[[SystemEvent], None]
 
 
+@dataclass
+class SubscriberStats:
+    """Dispatch metrics for one subscriber.
+
+    Attributes:
+        name: Subscriber name
+        delivered: Events passed to the handler
+        errors: Handler calls that raised
+        dropped: Non-critical events dropped because the subscriber's queue was full
+        critical_dropped: Critical events dropped (each triggers emergency degrade)
+        backlog: Events waiting in the subscriber's queue
+        last_lag_seconds: Event creation to handler call, for the latest event
+        max_lag_seconds: Largest lag seen
+    """
+
+    name: str
+    delivered: int = 0
+    errors: int = 0
+    dropped: int = 0
+    critical_dropped: int = 0
+    backlog: int = 0
+    last_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+
+
+class _Subscription:
+    """One subscriber with its priority lanes and dispatch task."""
+
+    def __init__(self, handler: EventHandler, name: str) -> None:
+        self.handler = handler
+        self.critical: deque[SystemEvent] = deque()
+        self.normal: deque[SystemEvent] = deque()
+        self.wakeup = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+        self.stats = SubscriberStats(name=name)
+
+    @property
+    def backlog(self) -> int:
+        return len(self.critical) + len(self.normal)
+
+
 class EventBus:
     """Non-blocking event bus for system events.
 
@@ -43,7 +91,9 @@ class EventBus:
     - Non-critical events are silently dropped when queue is full
     - Critical events trigger local emergency degradation when dropped
     - All dropped events are written to fallback log
-    - Subscribers are notified asynchronously via a dispatch task
+    - A fan-out task copies each event to every subscriber's queue; each
+      subscriber is notified by its own dispatch task
+    - Critical events skip ahead of a subscriber's non-critical backlog
 
     Attributes:
         drop_count: Number of events dropped due to queue full
@@ -65,7 +115,7 @@ class EventBus:
         """
         self._config = config
         self._queue: asyncio.Queue[SystemEvent] = asyncio.Queue(maxsize=config.event_bus_queue_size)
-        self._subscribers: list[EventHandler] = []
+        self._subscriptions: list[_Subscription] = []
         self._drop_count = 0
         self._fallback_log_path = fallback_log_path
         self._emergency_callback: EmergencyCallback | None = None
@@ -85,13 +135,23 @@ class EventBus:
     @property
     def subscriber_count(self) -> int:
         """Number of registered subscribers."""
-        return len(self._subscribers)
+        return len(self._subscriptions)
 
     @property
     def is_running(self) -> bool:
         """Whether the dispatch task is running."""
         return self._running
 
+    def subscriber_stats(self) -> list[SubscriberStats]:
+        """Per-subscriber lag, drop, and delivery metrics.
+
+        Returns:
+            One SubscriberStats per subscriber, in subscription order
+        """
+        for sub in self._subscriptions:
+            sub.stats.backlog = sub.backlog
+        return [sub.stats for sub in self._subscriptions]
+
     async def publish(self, event: SystemEvent) -> bool:
         """Non-blocking publish. MUST use put_nowait.
 
@@ -116,16 +176,22 @@ class EventBus:
 
             return False
 
-    def subscribe(self, handler: EventHandler) -> None:
+    def subscribe(self, handler: EventHandler, name: str | None = None) -> None:
         """Register a handler to receive events.
 
-        Handlers are called asynchronously when events are dispatched.
-        Errors in handlers are logged but do not stop the bus.
+        Handlers are called asynchronously when events are dispatched, each
+        from its own task. Errors in handlers are logged but do not stop the bus.
 
         Args:
             handler: Async callable that accepts a SystemEvent
+            name: Name used in metrics and logs (default: handler's qualified name)
         """
-        self._subscribers.append(handler)
+        if name is None:
+            name = getattr(handler, "__qualname__", None) or type(handler).__name__
+        sub = _Subscription(handler, name)
+        self._subscriptions.append(sub)
+        if self._running:
+            sub.task = asyncio.create_task(self._subscriber_loop(sub))
 
     def set_emergency_callback(self, callback: EmergencyCallback) -> None:
         """Set the callback for local emergency degradation.
@@ -141,20 +207,22 @@ class EventBus:
     async def start(self) -> None:
         """Start the dispatch loop.
 
-        Creates an asyncio task that continuously reads from the queue
-        and notifies subscribers. Safe to call multiple times.
+        Creates the fan-out task and one dispatch task per subscriber.
+        Safe to call multiple times.
         """
         if self._running:
             return
 
         self._running = True
         self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+        for sub in self._subscriptions:
+            sub.task = asyncio.create_task(self._subscriber_loop(sub))
         logger.info("EventBus started")
 
     async def stop(self) -> None:
         """Stop the dispatch loop.
 
-        Cancels the dispatch task and waits for it to complete.
+        Cancels the fan-out and subscriber tasks and waits for them to complete.
         Safe to call multiple times.
         """
         if not self._running:
@@ -162,18 +230,20 @@ class EventBus:
 
         self._running = False
 
+        tasks = [sub.task for sub in self._subscriptions if sub.task is not None]
         if self._dispatch_task is not None:
-            self._dispatch_task.cancel()
-            try:
-                await self._dispatch_task
-            except asyncio.CancelledError:
-                pass
-            self._dispatch_task = None
+            tasks.append(self._dispatch_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatch_task = None
+        for sub in self._subscriptions:
+            sub.task = None
 
         logger.info("EventBus stopped")
 
     async def _dispatch_loop(self) -> None:
-        """Internal dispatch loop that reads from queue and notifies subscribers."""
+        """Internal fan-out loop that copies queued events to subscriber queues."""
         while self._running:
             try:
                 # Wait for an event with timeout to allow checking _running flag
@@ -182,8 +252,7 @@ class EventBus:
                 except TimeoutError:
                     continue
 
-                # Notify all subscribers
-                await self._notify_subscribers(event)
+                self._fan_out(event)
                 self._queue.task_done()
 
             except asyncio.CancelledError:
@@ -191,20 +260,54 @@ class EventBus:
             except Exception as e:
                 logger.exception(f"Error in dispatch loop: {e}")
 
-    async def _notify_subscribers(self, event: SystemEvent) -> None:
-        """Notify all subscribers of an event.
-
-        Errors in individual handlers are logged but do not prevent
-        other handlers from receiving the event.
+    def _fan_out(self, event: SystemEvent) -> None:
+        """Queue an event for every subscriber without waiting on any of them.
 
         Args:
             event: The event to dispatch to subscribers
         """
-        for handler in self._subscribers:
-            try:
-                await handler(event)
-            except Exception as e:
-                logger.exception(f"Error in event handler: {e}")
+        critical = event.is_critical()
+        for sub in self._subscriptions:
+            if critical:
+                lane, limit = sub.critical, self._config.event_bus_critical_queue_size
+            else:
+                lane, limit = sub.normal, self._config.event_bus_subscriber_queue_size
+
+            if len(lane) >= limit:
+                self._write_fallback_log(f"SubscriberQueueFull:{sub.stats.name}", event)
+                if critical:
+                    sub.stats.critical_dropped += 1
+                    self._local_emergency_degrade(event)
+                else:
+                    sub.stats.dropped += 1
+                continue
+
+            lane.append(event)
+            sub.wakeup.set()
+
+    async def _subscriber_loop(self, sub: _Subscription) -> None:
+        """Deliver one subscriber's queued events, critical lane first.
+
+        Errors in the handler are logged and counted; they do not stop
+        delivery of later events.
+
+        Args:
+            sub: The subscription to drain
+        """
+        while True:
+            await sub.wakeup.wait()
+            sub.wakeup.clear()
+            while sub.critical or sub.normal:
+                event = sub.critical.popleft() if sub.critical else sub.normal.popleft()
+                lag = time.monotonic() - event.event_time_mono
+                sub.stats.last_lag_seconds = lag
+                sub.stats.max_lag_seconds = max(sub.stats.max_lag_seconds, lag)
+                try:
+                    await sub.handler(event)
+                except Exception as e:
+                    sub.stats.errors += 1
+                    logger.exception(f"Error in event handler {sub.stats.name}: {e}")
+                sub.stats.delivered += 1
 
     def _local_emergency_degrade(self, event: SystemEvent) -> None:
         """Trigger local emergency degradation for critical events.
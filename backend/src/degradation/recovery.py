@@ -10,6 +10,8 @@ Key design:
 - Idempotent: new recovery replaces/cancels existing via run_id
 - Stage checks: each stage must pass before progressing
 - Abort: falls back to SAFE_MODE on failure
+- READY waits for the DB buffer backlog (if any) to be flushed, starting
+  the flush itself when given a session factory
 """
 
 from __future__ import annotations
@@ -17,6 +19,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
@@ -33,6 +36,9 @@ from src.degradation.models import (
 )
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.degradation.db_buffer import DBBuffer
     from src.degradation.state_service import SystemStateService
 
 logger = logging.getLogger(__name__)
@@ -64,15 +70,24 @@ class RecoveryOrchestrator:
         self,
         config: DegradationConfig,
         state_service: SystemStateService,
+        db_buffer: DBBuffer | None = None,
+        db_session_factory: Callable[[], AsyncSession] | None = None,
     ) -> None:
         """Initialize RecoveryOrchestrator.
 
         Args:
             config: Degradation configuration
             state_service: SystemStateService for mode transitions
+            db_buffer: Buffer of writes made while the DB was down; READY
+                does not pass until it is flushed
+            db_session_factory: Callable that creates AsyncSession instances;
+                when set, READY starts a background flush of the backlog
         """
         self._config = config
         self._state_service = state_service
+        self._db_buffer = db_buffer
+        self._db_session_factory = db_session_factory
+        self._flush_task: asyncio.Task[None] | None = None
         self._current_run_id: str | None = None
         self._current_stage: RecoveryStage | None = None
         self._trigger: RecoveryTrigger | None = None
@@ -244,7 +259,7 @@ class RecoveryOrchestrator:
         - CONNECT_BROKER: Check broker connection
         - CATCHUP_MARKETDATA: Check market data is fresh
         - VERIFY_RISK: Check risk engine responds
-        - READY: All checks pass for recovery_stable_seconds
+        - READY: DB buffer flushed and all checks pass for recovery_stable_seconds
 
         Args:
             stage: The stage to check
@@ -262,7 +277,7 @@ class RecoveryOrchestrator:
         elif stage == RecoveryStage.VERIFY_RISK:
             return await self._check_risk_engine()
         elif stage == RecoveryStage.READY:
-            return await self._check_ready_stable()
+            return self._check_db_buffer_drained() and await self._check_ready_stable()
 
         return False
 
@@ -302,6 +317,47 @@ class RecoveryOrchestrator:
         logger.debug("Checking risk engine... (simulated pass)")
         return True
 
+    def _check_db_buffer_drained(self) -> bool:
+        """Check that writes buffered during the outage have been flushed.
+
+        Returns:
+            True if there is no DB buffer or it is empty
+        """
+        if self._db_buffer is None:
+            return True
+
+        stats = self._db_buffer.flush_stats
+        if stats.remaining == 0:
+            return True
+
+        self._start_db_buffer_flush()
+        eta = f"{stats.eta_seconds:.1f}s" if stats.eta_seconds is not None else "unknown"
+        logger.info(
+            f"DB buffer not drained: remaining={stats.remaining}, "
+            f"flushing={stats.in_progress}, rate={stats.entries_per_second:.0f}/s, "
+            f"eta={eta}, last_error={stats.last_error}"
+        )
+        return False
+
+    def _start_db_buffer_flush(self) -> None:
+        """Flush the DB buffer in the background unless a flush is running."""
+        if self._db_buffer is None or self._db_session_factory is None:
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        if self._db_buffer.flush_stats.in_progress:
+            return
+        self._flush_task = asyncio.create_task(self._flush_db_buffer())
+
+    async def _flush_db_buffer(self) -> None:
+        """Run one DB buffer flush with a fresh session."""
+        assert self._db_buffer is not None and self._db_session_factory is not None
+        try:
+            async with self._db_session_factory() as session:
+                await self._db_buffer.flush_to_db(session)
+        except Exception as e:
+            logger.error(f"DB buffer flush during recovery failed: {e}")
+
     async def _check_ready_stable(self) -> bool:
         """Check all systems stable for required duration.
 
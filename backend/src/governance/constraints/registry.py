@@ -2,7 +2,8 @@
 
 This module provides the ConstraintRegistry class for storing, querying,
 and managing Constraint objects in memory. It supports lazy loading and
-reloading from disk via a ConstraintLoader.
+reloading from disk via a ConstraintLoader. Symbol and strategy lookups go
+through an index compiled on first query and rebuilt after any change.
 
 Classes:
     DuplicateConstraintError: Raised when registering a constraint with duplicate ID
@@ -19,7 +20,9 @@ Example:
 
 from __future__ import annotations
 
+import heapq
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from src.governance.constraints.models import Constraint
@@ -29,6 +32,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Compiled lookup index: (constraints applying to every target, constraints by target)
+_Index = tuple[list[Constraint], dict[str, list[Constraint]]]
+
 
 class DuplicateConstraintError(Exception):
     """Raised when attempting to register a constraint with a duplicate ID.
@@ -58,12 +64,17 @@ class ConstraintRegistry:
     lazy loading and reloading from disk via an optional ConstraintLoader.
 
     The registry tracks constraints efficiently by maintaining a dictionary
-    indexed by constraint ID.
+    indexed by constraint ID, plus symbol and strategy indexes compiled on
+    first query. Every change bumps version, which drops the indexes and
+    tells consumers such as ConstraintResolver to discard derived results.
 
     Attributes:
         _constraints: Internal dict storing constraints by ID.
         _loader: Optional loader for loading/reloading from disk.
         _loaded: Flag indicating whether constraints have been loaded.
+        _version: Change counter, bumped on every register/unregister/load.
+        _symbol_index: Compiled (wildcard, by_symbol) index, None when stale.
+        _strategy_index: Compiled (wildcard, by_strategy) index, None when stale.
 
     Example:
         >>> registry = ConstraintRegistry()
@@ -84,6 +95,57 @@ class ConstraintRegistry:
         self._constraints: dict[str, Constraint] = {}
         self._loader = loader
         self._loaded = False
+        self._version = 0
+        self._symbol_index: _Index | None = None
+        self._strategy_index: _Index | None = None
+
+    @property
+    def version(self) -> int:
+        """Change counter for the registered constraints.
+
+        Bumped on every register, unregister, load and reload. Triggers lazy
+        loading if a loader is configured.
+
+        Returns:
+            The current version.
+        """
+        self._ensure_loaded()
+        return self._version
+
+    def _changed(self) -> None:
+        """Record a change: bump the version and drop the compiled indexes."""
+        self._version += 1
+        self._symbol_index = None
+        self._strategy_index = None
+
+    def _compile(self, targets: Callable[[Constraint], list[str]]) -> _Index:
+        """Compile a lookup index over one applies_to dimension.
+
+        Constraints with an empty target list apply to everything and go in
+        the wildcard list; the rest are merged with the wildcard list under
+        each of their targets. All lists keep registration order.
+
+        Args:
+            targets: Returns a constraint's symbols or strategies.
+
+        Returns:
+            Tuple of (wildcard constraints, constraints by target).
+        """
+        position = {constraint_id: i for i, constraint_id in enumerate(self._constraints)}
+        wildcard: list[Constraint] = []
+        specific: dict[str, list[Constraint]] = {}
+        for constraint in self._constraints.values():
+            constraint_targets = targets(constraint)
+            if not constraint_targets:
+                wildcard.append(constraint)
+            for target in dict.fromkeys(constraint_targets):
+                specific.setdefault(target, []).append(constraint)
+
+        index = {
+            target: list(heapq.merge(wildcard, matches, key=lambda c: position[c.id]))
+            for target, matches in specific.items()
+        }
+        return wildcard, index
 
     def _ensure_loaded(self) -> None:
         """Ensure constraints are loaded (lazy loading).
@@ -114,6 +176,7 @@ class ConstraintRegistry:
             self._constraints[constraint.id] = constraint
             logger.debug(f"Loaded constraint: {constraint.id}")
 
+        self._changed()
         logger.info(f"Loaded {len(self._constraints)} constraints from loader")
 
     def get(self, constraint_id: str) -> Constraint | None:
@@ -157,11 +220,10 @@ class ConstraintRegistry:
             List of constraints that apply to the symbol.
         """
         self._ensure_loaded()
-        return [
-            c
-            for c in self._constraints.values()
-            if not c.applies_to.symbols or symbol in c.applies_to.symbols
-        ]
+        if self._symbol_index is None:
+            self._symbol_index = self._compile(lambda c: c.applies_to.symbols)
+        wildcard, by_symbol = self._symbol_index
+        return list(by_symbol.get(symbol, wildcard))
 
     def filter_by_strategy(self, strategy_id: str) -> list[Constraint]:
         """Filter constraints that apply to a strategy.
@@ -179,11 +241,10 @@ class ConstraintRegistry:
             List of constraints that apply to the strategy.
         """
         self._ensure_loaded()
-        return [
-            c
-            for c in self._constraints.values()
-            if not c.applies_to.strategies or strategy_id in c.applies_to.strategies
-        ]
+        if self._strategy_index is None:
+            self._strategy_index = self._compile(lambda c: c.applies_to.strategies)
+        wildcard, by_strategy = self._strategy_index
+        return list(by_strategy.get(strategy_id, wildcard))
 
     def register(self, constraint: Constraint) -> None:
         """Register a constraint.
@@ -207,6 +268,7 @@ class ConstraintRegistry:
         if constraint.id in self._constraints:
             raise DuplicateConstraintError(constraint.id)
         self._constraints[constraint.id] = constraint
+        self._changed()
         logger.debug(f"Registered constraint: {constraint.id}")
 
     def unregister(self, constraint_id: str) -> bool:
@@ -221,6 +283,7 @@ class ConstraintRegistry:
         self._ensure_loaded()
         if constraint_id in self._constraints:
             del self._constraints[constraint_id]
+            self._changed()
             logger.debug(f"Unregistered constraint: {constraint_id}")
             return True
         return False
@@ -243,6 +306,7 @@ class ConstraintRegistry:
 
         # Clear existing constraints
         self._constraints.clear()
+        self._changed()
 
         # Load all constraints from loader and check for duplicates
         constraints = self._loader.load_all_constraints()
@@ -2,6 +2,7 @@
 
 This module provides the ConstraintResolver class that evaluates all constraints
 against a symbol, checks activation conditions, and produces merged effective values.
+Results are memoized per symbol until either registry's version changes.
 
 Classes:
     ConstraintResolver: Resolves and merges constraints for a symbol
@@ -71,6 +72,15 @@ class ConstraintResolver:
         5. Merge guardrails using most restrictive values (minimum for caps)
         6. Generate deterministic version hash from constraint IDs
 
+    Memoization:
+        Resolved results and constraint activation outcomes are cached for
+        the current (constraint registry version, hypothesis registry
+        version). Any register, unregister or reload on either registry
+        bumps its version and the caches are dropped on the next call;
+        invalidate() drops them explicitly. Audit events are logged when a
+        symbol is actually resolved, not on memoized hits. Memoized results
+        are shared and must not be mutated.
+
     Attributes:
         constraint_registry: Registry for querying constraints by symbol.
         hypothesis_registry: Registry for checking hypothesis statuses.
@@ -107,6 +117,32 @@ class ConstraintResolver:
         self.cache = cache
         self.audit_store = audit_store
 
+        # Memoized results, valid for _memo_version
+        self._memo_version: tuple[int, int] | None = None
+        self._resolved: dict[str, ResolvedConstraints] = {}
+        self._activation: dict[str, bool] = {}
+
+    def _sync_memo(self) -> None:
+        """Drop memoized results if either registry changed since they were built."""
+        version = (self.constraint_registry.version, self.hypothesis_registry.version)
+        if version != self._memo_version:
+            self._resolved.clear()
+            self._activation.clear()
+            self._memo_version = version
+
+    def invalidate(self) -> None:
+        """Drop all memoized resolutions and activation outcomes."""
+        self._resolved.clear()
+        self._activation.clear()
+        self._memo_version = None
+
+    def _is_active(self, constraint: Constraint) -> bool:
+        """Memoized _is_constraint_active for the current registry versions."""
+        active = self._activation.get(constraint.id)
+        if active is None:
+            active = self._activation[constraint.id] = self._is_constraint_active(constraint)
+        return active
+
     def _is_constraint_active(self, constraint: Constraint) -> bool:
         """Check if a constraint's activation conditions are met.
 
@@ -338,7 +374,9 @@ class ConstraintResolver:
         """Resolve all constraints for a symbol.
 
         Evaluates all constraints applicable to the symbol, checks activation
-        conditions, and produces merged effective values.
+        conditions, and produces merged effective values. Returns the
+        memoized result when neither registry has changed since the symbol
+        was last resolved.
 
         Args:
             symbol: The stock symbol to resolve constraints for.
@@ -346,11 +384,16 @@ class ConstraintResolver:
         Returns:
             ResolvedConstraints with merged effective values.
         """
+        self._sync_memo()
+        memoized = self._resolved.get(symbol)
+        if memoized is not None:
+            return memoized
+
         # Get all constraints applicable to this symbol
         applicable_constraints = self.constraint_registry.filter_by_symbol(symbol)
 
         # Filter to only active constraints
-        active_constraints = [c for c in applicable_constraints if self._is_constraint_active(c)]
+        active_constraints = [c for c in applicable_constraints if self._is_active(c)]
 
         # Sort by priority (ascending - lower number = higher priority)
         active_constraints.sort(key=lambda c: (c.priority, c.id))
@@ -422,6 +465,7 @@ class ConstraintResolver:
         # Log audit events if audit store is configured
         self._log_audit_events(symbol, active_constraints, result)
 
+        self._resolved[symbol] = result
         return result
 
     def _log_audit_events(
@@ -495,7 +539,8 @@ class ConstraintResolver:
     async def resolve_async(self, symbol: str) -> ResolvedConstraints:
         """Resolve all constraints for a symbol with cache support.
 
-        Async version that checks cache first and caches the result.
+        Async version that checks the memoized results, then the cache, and
+        caches the result.
 
         Args:
             symbol: The stock symbol to resolve constraints for.
@@ -503,6 +548,11 @@ class ConstraintResolver:
         Returns:
             ResolvedConstraints with merged effective values.
         """
+        self._sync_memo()
+        memoized = self._resolved.get(symbol)
+        if memoized is not None:
+            return memoized
+
         # Try cache first if available
         if self.cache is not None:
             cached = await self.cache.get(self.CACHE_NAMESPACE, symbol, ResolvedConstraints)
@@ -523,9 +573,12 @@ class ConstraintResolver:
     async def invalidate_cache(self, symbol: str) -> None:
         """Invalidate cached constraints for a symbol.
 
+        Also drops the memoized result for the symbol.
+
         Args:
             symbol: The symbol to invalidate cache for.
         """
+        self._resolved.pop(symbol, None)
         if self.cache is None:
             return
 
@@ -535,9 +588,12 @@ class ConstraintResolver:
     async def invalidate_all_cache(self) -> int:
         """Invalidate all cached resolved constraints.
 
+        Also drops all memoized results (see invalidate()).
+
         Returns:
             Count of deleted cache entries.
         """
+        self.invalidate()
         if self.cache is None:
             return 0
 
@@ -64,6 +64,7 @@ class HypothesisRegistry:
     Attributes:
         _hypotheses: Internal dict storing hypotheses by ID.
         _loader: Optional loader for reloading from disk.
+        _version: Change counter, bumped on every register/unregister/reload.
 
     Example:
         >>> registry = HypothesisRegistry()
@@ -83,6 +84,20 @@ class HypothesisRegistry:
         """
         self._hypotheses: dict[str, Hypothesis] = {}
         self._loader = loader
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Change counter, bumped on every register, unregister and reload.
+
+        Consumers that cache results derived from hypothesis statuses (such
+        as ConstraintResolver) compare it to know when to recompute; status
+        changes must therefore go through the registry.
+
+        Returns:
+            The current version.
+        """
+        return self._version
 
     def get(self, hypothesis_id: str) -> Hypothesis | None:
         """Get hypothesis by ID.
@@ -141,6 +156,7 @@ class HypothesisRegistry:
         if hypothesis.id in self._hypotheses:
             raise DuplicateHypothesisError(hypothesis.id)
         self._hypotheses[hypothesis.id] = hypothesis
+        self._version += 1
         logger.debug(f"Registered hypothesis: {hypothesis.id}")
 
     def unregister(self, hypothesis_id: str) -> bool:
@@ -154,6 +170,7 @@ class HypothesisRegistry:
         """
         if hypothesis_id in self._hypotheses:
             del self._hypotheses[hypothesis_id]
+            self._version += 1
             logger.debug(f"Unregistered hypothesis: {hypothesis_id}")
             return True
         return False
@@ -175,6 +192,7 @@ class HypothesisRegistry:
 
         # Clear existing hypotheses
         self._hypotheses.clear()
+        self._version += 1
 
         # Load all hypotheses from loader and check for duplicates
         hypotheses = self._loader.load_all_hypotheses()
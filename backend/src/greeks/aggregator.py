@@ -1,14 +1,18 @@
 """Greeks Aggregator for portfolio and strategy level aggregation.
 
 This module provides the GreeksAggregator class that aggregates position-level
-Greeks to account or strategy level with O(N) single-pass accumulation.
+Greeks to account or strategy level with O(N) single-pass accumulation, and the
+StatefulGreeksAggregator that keeps those aggregates current under per-position
+add/remove/replace deltas.
 
 High-risk thresholds for missing positions:
     - GAMMA_HIGH_RISK_THRESHOLD: 1000 - positions with gamma above this are high-risk
     - VEGA_HIGH_RISK_THRESHOLD: 2000 - positions with vega above this are high-risk
 """
 
-from collections import defaultdict
+import heapq
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
@@ -44,6 +48,14 @@ class ContributorInfo:
 GAMMA_HIGH_RISK_THRESHOLD: Decimal = Decimal("1000")
 VEGA_HIGH_RISK_THRESHOLD: Decimal = Decimal("2000")
 
+# PositionGreeks field ranked for each Greek metric
+METRIC_FIELD_MAP: dict[RiskMetric, str] = {
+    RiskMetric.DELTA: "dollar_delta",
+    RiskMetric.GAMMA: "gamma_dollar",
+    RiskMetric.VEGA: "vega_per_1pct",
+    RiskMetric.THETA: "theta_per_day",
+}
+
 
 @dataclass
 class _Accumulator:
@@ -130,6 +142,75 @@ class _Accumulator:
             ):
                 self.high_risk_missing_positions.append(pg.position_id)
 
+    def remove(self, pg: PositionGreeks) -> None:
+        """Reverse a previous add() of the same PositionGreeks.
+
+        Timestamp bounds are not reversible here; StatefulGreeksAggregator
+        tracks them separately.
+
+        Args:
+            pg: The PositionGreeks previously accumulated.
+        """
+        self.total_legs_count -= 1
+        self.total_notional -= pg.notional
+
+        if pg.quality_warnings:
+            self.warning_positions.remove(pg.position_id)
+
+        if pg.valid:
+            self.dollar_delta -= pg.dollar_delta
+            self.gamma_dollar -= pg.gamma_dollar
+            self.gamma_pnl_1pct -= pg.gamma_pnl_1pct
+            self.vega_per_1pct -= pg.vega_per_1pct
+            self.theta_per_day -= pg.theta_per_day
+            self.valid_legs_count -= 1
+            self.valid_notional -= pg.notional
+        else:
+            self.missing_positions.remove(pg.position_id)
+            if pg.position_id in self.high_risk_missing_positions:
+                self.high_risk_missing_positions.remove(pg.position_id)
+
+    def to_aggregated(
+        self,
+        scope: Literal["ACCOUNT", "STRATEGY"],
+        scope_id: str,
+    ) -> AggregatedGreeks:
+        """Build AggregatedGreeks from the accumulated state.
+
+        Args:
+            scope: Either "ACCOUNT" or "STRATEGY".
+            scope_id: Identifier for the scope (account ID or strategy ID).
+
+        Returns:
+            AggregatedGreeks with accumulated values and quality metrics.
+        """
+        result = AggregatedGreeks(
+            scope=scope,
+            scope_id=scope_id,
+            strategy_id=scope_id if scope == "STRATEGY" else None,
+            dollar_delta=self.dollar_delta,
+            gamma_dollar=self.gamma_dollar,
+            gamma_pnl_1pct=self.gamma_pnl_1pct,
+            vega_per_1pct=self.vega_per_1pct,
+            theta_per_day=self.theta_per_day,
+            valid_legs_count=self.valid_legs_count,
+            total_legs_count=self.total_legs_count,
+            valid_notional=self.valid_notional,
+            total_notional=self.total_notional,
+            missing_positions=list(self.missing_positions),
+            has_high_risk_missing_legs=len(self.high_risk_missing_positions) > 0,
+            warning_legs_count=len(self.warning_positions),
+            has_positions=self.total_legs_count > 0,
+        )
+
+        # Set timestamps if we have positions
+        if self.as_of_ts_min is not None:
+            result.as_of_ts = self.as_of_ts_min
+            result.as_of_ts_min = self.as_of_ts_min
+            result.as_of_ts_max = self.as_of_ts_max
+
+        return result
+
 
 class GreeksAggregator:
     """Aggregates position-level Greeks to account or strategy level.
@@ -159,33 +240,7 @@ class GreeksAggregator:
         for pg in positions:
             acc.add(pg)
 
-        # Build result
-        result = AggregatedGreeks(
-            scope=scope,
-            scope_id=scope_id,
-            strategy_id=scope_id if scope == "STRATEGY" else None,
-            dollar_delta=acc.dollar_delta,
-            gamma_dollar=acc.gamma_dollar,
-            gamma_pnl_1pct=acc.gamma_pnl_1pct,
-            vega_per_1pct=acc.vega_per_1pct,
-            theta_per_day=acc.theta_per_day,
-            valid_legs_count=acc.valid_legs_count,
-            total_legs_count=acc.total_legs_count,
-            valid_notional=acc.valid_notional,
-            total_notional=acc.total_notional,
-            missing_positions=acc.missing_positions,
-            has_high_risk_missing_legs=len(acc.high_risk_missing_positions) > 0,
-            warning_legs_count=len(acc.warning_positions),
-            has_positions=acc.total_legs_count > 0,
-        )
-
-        # Set timestamps if we have positions
-        if acc.as_of_ts_min is not None:
-            result.as_of_ts = acc.as_of_ts_min
-            result.as_of_ts_min = acc.as_of_ts_min
-            result.as_of_ts_max = acc.as_of_ts_max
-
-        return result
+        return acc.to_aggregated(scope, scope_id)
 
     def aggregate_by_strategy(
         self,
@@ -299,39 +354,357 @@ class GreeksAggregator:
         if not metric.is_greek:
             return []
 
-        # Map metric to the appropriate field
-        metric_field_map = {
-            RiskMetric.DELTA: "dollar_delta",
-            RiskMetric.GAMMA: "gamma_dollar",
-            RiskMetric.VEGA: "vega_per_1pct",
-            RiskMetric.THETA: "theta_per_day",
+        field_name = METRIC_FIELD_MAP.get(metric)
+        if field_name is None:
+            return []
+
+        # Select the top N by absolute contribution without sorting the whole book
+        top = heapq.nlargest(
+            top_n,
+            (pg for pg in positions if pg.valid),
+            key=lambda pg: abs(getattr(pg, field_name)),
+        )
+
+        return _build_contributors(top, metric, field_name)
+
+
+def _build_contributors(
+    ranked: list[PositionGreeks],
+    metric: RiskMetric,
+    field_name: str,
+) -> list[ContributorInfo]:
+    """Build ranked ContributorInfo from positions sorted by contribution."""
+    result: list[ContributorInfo] = []
+    for rank, pg in enumerate(ranked, start=1):
+        contribution_signed = getattr(pg, field_name)
+        result.append(
+            ContributorInfo(
+                position=pg,
+                metric=metric,
+                rank=rank,
+                contribution_abs=abs(contribution_signed),
+                contribution_signed=contribution_signed,
+            )
+        )
+    return result
+
+
+class _TopKHeap:
+    """Bounded min-heap of the largest |contribution| positions for one metric.
+
+    Holds up to `capacity` (2K) members so that members leaving or shrinking
+    do not immediately force a rebuild. Invariant while clean: members are
+    exactly the largest len(members) valid positions in the book, so every
+    non-member is <= the heap floor. `complete` means every valid position
+    is a member.
+
+    Heap entries are (abs_value, position_id); an entry is live only while
+    members[position_id] still equals its value, so replaced values are
+    dropped lazily. If fewer than K members remain and the book holds more,
+    the heap is marked dirty and rebuilt from the book on the next read.
+    """
+
+    def __init__(self, k: int, field_name: str):
+        self._k = k
+        self._capacity = 2 * k
+        self._field = field_name
+        self._heap: list[tuple[Decimal, int]] = []
+        self._members: dict[int, Decimal] = {}
+        self._complete = True
+        self._dirty = False
+
+    def _value(self, pg: PositionGreeks) -> Decimal:
+        return abs(getattr(pg, self._field))
+
+    def _floor(self) -> tuple[Decimal, int] | None:
+        """Smallest live entry, dropping stale ones from the heap top."""
+        while self._heap:
+            value, pid = self._heap[0]
+            if self._members.get(pid) == value:
+                return value, pid
+            heapq.heappop(self._heap)
+        return None
+
+    def _push(self, pid: int, value: Decimal) -> None:
+        self._members[pid] = value
+        heapq.heappush(self._heap, (value, pid))
+        # Bound stale-entry growth
+        if len(self._heap) > 4 * self._capacity:
+            self._heap = [(v, p) for p, v in self._members.items()]
+            heapq.heapify(self._heap)
+
+    def _evict_overflow(self) -> None:
+        while len(self._members) > self._capacity:
+            floor = self._floor()
+            if floor is None:
+                break
+            heapq.heappop(self._heap)
+            del self._members[floor[1]]
+            self._complete = False
+
+    def _drop_member(self, pid: int) -> None:
+        del self._members[pid]
+        if not self._complete and len(self._members) < self._k:
+            self._dirty = True
+
+    def update(self, old: PositionGreeks | None, new: PositionGreeks | None) -> None:
+        """Apply one position change (add: old=None, remove: new=None)."""
+        if self._dirty:
+            return
+
+        pid = (new or old).position_id  # type: ignore[union-attr]
+        new_value = self._value(new) if new is not None and new.valid else None
+
+        if pid in self._members:
+            if new_value is None:
+                self._drop_member(pid)
+                return
+            floor = self._floor()
+            if self._complete or (floor is not None and new_value >= floor[0]):
+                # Still at or above every non-member
+                self._push(pid, new_value)
+            else:
+                self._drop_member(pid)
+            return
+
+        if new_value is None:
+            return
+        floor = self._floor()
+        if self._complete or floor is None or new_value > floor[0]:
+            self._push(pid, new_value)
+            self._evict_overflow()
+
+    def top(self, positions: dict[int, PositionGreeks]) -> list[int]:
+        """Position IDs of the top K, largest first."""
+        if self._dirty:
+            ranked = heapq.nlargest(
+                self._capacity + 1,
+                (pg for pg in positions.values() if pg.valid),
+                key=self._value,
+            )
+            self._complete = len(ranked) <= self._capacity
+            self._members = {pg.position_id: self._value(pg) for pg in ranked[: self._capacity]}
+            self._heap = [(v, p) for p, v in self._members.items()]
+            heapq.heapify(self._heap)
+            self._dirty = False
+        ranked_ids = heapq.nlargest(self._k, self._members, key=self._members.__getitem__)
+        return ranked_ids
+
+    def reset(self) -> None:
+        self._heap.clear()
+        self._members.clear()
+        self._complete = True
+        self._dirty = False
+
+
+@dataclass
+class _ScopeState:
+    """Accumulator plus reversible timestamp tracking for one scope."""
+
+    acc: _Accumulator = field(default_factory=_Accumulator)
+    timestamps: Counter[datetime] = field(default_factory=Counter)
+
+    def add(self, pg: PositionGreeks) -> None:
+        self.acc.add(pg)
+        self.timestamps[pg.as_of_ts] += 1
+
+    def remove(self, pg: PositionGreeks, added_ts: datetime) -> None:
+        self.acc.remove(pg)
+        self.timestamps[added_ts] -= 1
+        if self.timestamps[added_ts] <= 0:
+            del self.timestamps[added_ts]
+
+    def to_aggregated(
+        self,
+        scope: Literal["ACCOUNT", "STRATEGY"],
+        scope_id: str,
+        as_of_ts: datetime | None,
+    ) -> AggregatedGreeks:
+        if as_of_ts is not None and self.acc.total_legs_count > 0:
+            self.acc.as_of_ts_min = self.acc.as_of_ts_max = as_of_ts
+        elif self.timestamps:
+            self.acc.as_of_ts_min = min(self.timestamps)
+            self.acc.as_of_ts_max = max(self.timestamps)
+        else:
+            self.acc.as_of_ts_min = self.acc.as_of_ts_max = None
+        return self.acc.to_aggregated(scope, scope_id)
+
+
+def _strategy_key(pg: PositionGreeks) -> str:
+    return pg.strategy_id if pg.strategy_id is not None else "_unassigned_"
+
+
+class StatefulGreeksAggregator:
+    """Keeps account and per-strategy aggregates current under position deltas.
+
+    Unlike GreeksAggregator, which re-aggregates the whole book on every call,
+    this holds the last PositionGreeks per position and applies add/remove/
+    replace as subtract-old/add-new on the account and strategy accumulators.
+    Top contributors per Greek metric are kept in bounded heaps (capacity
+    2 x top_k), so an update touching k legs costs O(k log K) regardless of
+    book size; the book is only rescanned when a heap drains below top_k.
+
+    Usage:
+        agg = StatefulGreeksAggregator("ACC001")
+        agg.apply(upserts=changed_position_greeks, removals=closed_position_ids)
+        account, strategies = agg.snapshot()
+        top_delta = agg.get_top_contributors(RiskMetric.DELTA, top_n=5)
+    """
+
+    def __init__(self, account_id: str, top_k: int = 10):
+        """Initialize an empty aggregator.
+
+        Args:
+            account_id: The account identifier.
+            top_k: Number of top contributors tracked per metric.
+        """
+        self._account_id = account_id
+        self._top_k = top_k
+        self._positions: dict[int, PositionGreeks] = {}
+        # as_of_ts at insert time; callers may restamp held objects later
+        self._added_ts: dict[int, datetime] = {}
+        self._account = _ScopeState()
+        self._strategies: dict[str, _ScopeState] = {}
+        self._heaps: dict[RiskMetric, _TopKHeap] = {
+            metric: _TopKHeap(top_k, field_name) for metric, field_name in METRIC_FIELD_MAP.items()
         }
 
-        field_name = metric_field_map.get(metric)
+    def __len__(self) -> int:
+        """Number of positions held."""
+        return len(self._positions)
+
+    def __contains__(self, position_id: int) -> bool:
+        return position_id in self._positions
+
+    def get(self, position_id: int) -> PositionGreeks | None:
+        """Get the current PositionGreeks for a position."""
+        return self._positions.get(position_id)
+
+    def _detach(self, old: PositionGreeks) -> None:
+        """Subtract a held position from the scope accumulators."""
+        added_ts = self._added_ts.pop(old.position_id)
+        self._account.remove(old, added_ts)
+        key = _strategy_key(old)
+        strategy = self._strategies[key]
+        strategy.remove(old, added_ts)
+        if strategy.acc.total_legs_count == 0:
+            del self._strategies[key]
+
+    def _attach(self, pg: PositionGreeks) -> None:
+        """Add a position to the scope accumulators."""
+        self._positions[pg.position_id] = pg
+        self._added_ts[pg.position_id] = pg.as_of_ts
+        self._account.add(pg)
+        self._strategies.setdefault(_strategy_key(pg), _ScopeState()).add(pg)
+
+    def upsert(self, pg: PositionGreeks) -> None:
+        """Add a position, or replace its previous Greeks.
+
+        Args:
+            pg: The new PositionGreeks.
+        """
+        old = self._positions.get(pg.position_id)
+        if old is not None:
+            self._detach(old)
+        self._attach(pg)
+        for heap in self._heaps.values():
+            heap.update(old, pg)
+
+    def remove(self, position_id: int) -> PositionGreeks | None:
+        """Remove a position.
+
+        Args:
+            position_id: The position to remove.
+
+        Returns:
+            The removed PositionGreeks, or None if not held.
+        """
+        old = self._positions.pop(position_id, None)
+        if old is None:
+            return None
+        self._detach(old)
+        for heap in self._heaps.values():
+            heap.update(old, None)
+        return old
+
+    def apply(
+        self,
+        upserts: Iterable[PositionGreeks] = (),
+        removals: Iterable[int] = (),
+    ) -> None:
+        """Apply a batch of position deltas in one pass.
+
+        Args:
+            upserts: New or replaced PositionGreeks.
+            removals: Position IDs that left the book.
+        """
+        for position_id in removals:
+            self.remove(position_id)
+        for pg in upserts:
+            self.upsert(pg)
+
+    def reset(self, positions: list[PositionGreeks]) -> None:
+        """Replace all held positions.
+
+        Args:
+            positions: The full set of PositionGreeks.
+        """
+        self._positions.clear()
+        self._added_ts.clear()
+        self._account = _ScopeState()
+        self._strategies.clear()
+        for heap in self._heaps.values():
+            heap.reset()
+        self.apply(upserts=positions)
+
+    def get_top_contributors(
+        self,
+        metric: RiskMetric,
+        top_n: int = 10,
+    ) -> list[ContributorInfo]:
+        """Get top N positions by absolute contribution to a metric.
+
+        Served from the bounded heap when top_n <= top_k; larger requests
+        fall back to a full selection over the held positions.
+
+        Args:
+            metric: The RiskMetric to rank by.
+            top_n: Number of top positions to return.
+
+        Returns:
+            List of ContributorInfo sorted by absolute value descending.
+            Empty for non-Greek metrics.
+        """
+        field_name = METRIC_FIELD_MAP.get(metric)
         if field_name is None:
             return []
 
-        # Filter valid positions and extract (position, contribution_signed) tuples
-        contributions: list[tuple[PositionGreeks, Decimal]] = []
-        for pg in positions:
-            if pg.valid:
-                contribution = getattr(pg, field_name)
-                contributions.append((pg, contribution))
-
-        # Sort by absolute value of contribution descending
-        contributions.sort(key=lambda x: abs(x[1]), reverse=True)
-
-        # Build ContributorInfo list with ranks
-        result: list[ContributorInfo] = []
-        for rank, (pg, contribution_signed) in enumerate(contributions[:top_n], start=1):
-            result.append(
-                ContributorInfo(
-                    position=pg,
-                    metric=metric,
-                    rank=rank,
-                    contribution_abs=abs(contribution_signed),
-                    contribution_signed=contribution_signed,
-                )
+        if top_n > self._top_k:
+            return GreeksAggregator().get_top_contributors(
+                list(self._positions.values()), metric, top_n
             )
 
-        return result
+        ranked = [self._positions[pid] for pid in self._heaps[metric].top(self._positions)]
+        return _build_contributors(ranked[:top_n], metric, field_name)
+
+    def snapshot(
+        self,
+        as_of_ts: datetime | None = None,
+    ) -> tuple[AggregatedGreeks, dict[str, AggregatedGreeks]]:
+        """Build account and per-strategy AggregatedGreeks.
+
+        Args:
+            as_of_ts: If given, every held leg is known to be current as of
+                this time and it is used for the timestamp bounds; otherwise
+                bounds come from the legs' own as_of_ts.
+
+        Returns:
+            Tuple of (account_total, strategy_dict), same shape as
+            GreeksAggregator.aggregate_by_strategy.
+        """
+        account_total = self._account.to_aggregated("ACCOUNT", self._account_id, as_of_ts)
+        strategy_dict = {
+            strategy_id: state.to_aggregated("STRATEGY", strategy_id, as_of_ts)
+            for strategy_id, state in self._strategies.items()
+        }
+        return account_total, strategy_dict
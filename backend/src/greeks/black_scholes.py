@@ -13,12 +13,19 @@ Formulas:
     Vega = S φ(d1) √T / 100  (per 1% IV change)
     Call Theta = -S φ(d1) σ / (2√T) - r K e^(-rT) N(d2)
     Put Theta = -S φ(d1) σ / (2√T) + r K e^(-rT) N(-d2)
+
+Two entry points are provided:
+    - calculate_bs_greeks: scalar Decimal path for a single option
+    - calculate_bs_greeks_batch: NumPy path pricing whole books in one pass
 """
 
 import math
 from dataclasses import dataclass
 from decimal import Decimal
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 # Constants
 DAYS_PER_YEAR = 365
 
@@ -128,3 +135,182 @@ def calculate_bs_greeks(
         vega=Decimal(str(round(vega, 6))),
         theta=Decimal(str(round(theta, 6))),
     )
+
+
+@dataclass
+class BSBatchResult:
+    """Result of a vectorized Black-Scholes calculation.
+
+    All arrays share the broadcast shape of the inputs and hold per-share
+    float64 values (before multiplier scaling). Units match BSGreeksResult.
+
+    Attributes:
+        price: Option theoretical value
+        delta: Option delta (-1 to 1)
+        gamma: Option gamma
+        vega: Option vega per 1% IV change
+        theta: Option theta per day (negative = decay)
+    """
+
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+    theta: np.ndarray
+
+
+# Hart (1968) rational approximation coefficients, accurate to double precision.
+# NumPy has no vectorized erf, and scipy is not a dependency.
+_HART_P = (
+    0.0352624965998911,
+    0.700383064443688,
+    6.37396220353165,
+    33.912866078383,
+    112.079291497871,
+    221.213596169931,
+    220.206867912376,
+)
+_HART_Q = (
+    0.0883883476483184,
+    1.75566716318264,
+    16.064177579207,
+    86.7807322029461,
+    296.564248779674,
+    637.333633378831,
+    793.826512519948,
+    440.413735824752,
+)
+_SQRT_2PI = math.sqrt(2 * math.pi)
+
+
+def norm_cdf_array(x: np.ndarray) -> np.ndarray:
+    """Vectorized standard normal CDF.
+
+    Args:
+        x: Input array
+
+    Returns:
+        N(x) element-wise
+    """
+    x = np.asarray(x, dtype=np.float64)
+    ax = np.abs(x)
+    exponential = np.exp(-0.5 * ax * ax)
+
+    # Central region: rational polynomial (Horner, in place)
+    num = _HART_P[0] * ax
+    num += _HART_P[1]
+    for coef in _HART_P[2:]:
+        num *= ax
+        num += coef
+    den = _HART_Q[0] * ax
+    den += _HART_Q[1]
+    for coef in _HART_Q[2:]:
+        den *= ax
+        den += coef
+    lower = exponential * num
+    lower /= den
+
+    # Tail region: continued fraction, only evaluated where needed
+    far = ax >= 7.07106781186547
+    if far.any():
+        ax_far = ax[far]
+        frac = ax_far + 0.65
+        for k in (4.0, 3.0, 2.0, 1.0):
+            frac = ax_far + k / frac
+        lower[far] = exponential[far] / frac / _SQRT_2PI
+        lower[ax > 37.0] = 0.0
+
+    return np.where(x > 0, 1.0 - lower, lower)
+
+
+def norm_pdf_array(x: np.ndarray) -> np.ndarray:
+    """Vectorized standard normal PDF."""
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def calculate_bs_greeks_batch(
+    spot: ArrayLike,
+    strike: ArrayLike,
+    time_to_expiry_years: ArrayLike,
+    risk_free_rate: ArrayLike,
+    volatility: ArrayLike,
+    is_call: ArrayLike,
+) -> BSBatchResult:
+    """Calculate Black-Scholes price and Greeks for many options at once.
+
+    Inputs are broadcast against each other, so scalars (e.g. a single
+    risk-free rate) can be mixed with per-leg arrays.
+
+    Rows with invalid inputs (T <= 0, σ <= 0, S <= 0 or K <= 0) get zero
+    Greeks, matching calculate_bs_greeks, and their intrinsic value as price.
+
+    Args:
+        spot: Underlying prices
+        strike: Option strike prices
+        time_to_expiry_years: Times to expiration in years
+        risk_free_rate: Risk-free rates (decimal, e.g., 0.05 = 5%)
+        volatility: Implied volatilities (decimal, e.g., 0.20 = 20%)
+        is_call: True for calls, False for puts
+
+    Returns:
+        BSBatchResult with price, delta, gamma, vega, theta arrays
+    """
+    S, K, T, r, sigma, call = np.broadcast_arrays(
+        np.asarray(spot, dtype=np.float64),
+        np.asarray(strike, dtype=np.float64),
+        np.asarray(time_to_expiry_years, dtype=np.float64),
+        np.asarray(risk_free_rate, dtype=np.float64),
+        np.asarray(volatility, dtype=np.float64),
+        np.asarray(is_call, dtype=bool),
+    )
+
+    valid = (T > 0) & (sigma > 0) & (S > 0) & (K > 0)
+    all_valid = bool(valid.all())
+
+    if all_valid:
+        S_, K_, T_, sigma_ = S, K, T, sigma
+    else:
+        # Substitute harmless values in invalid rows so the math stays finite;
+        # those rows are overwritten below.
+        S_ = np.where(valid, S, 1.0)
+        K_ = np.where(valid, K, 1.0)
+        T_ = np.where(valid, T, 1.0)
+        sigma_ = np.where(valid, sigma, 1.0)
+
+    sqrt_T = np.sqrt(T_)
+    sigma_sqrt_T = sigma_ * sqrt_T
+
+    d1 = (np.log(S_ / K_) + (r + 0.5 * sigma_ * sigma_) * T_) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
+
+    N_d1 = norm_cdf_array(d1)
+    N_d2 = norm_cdf_array(d2)
+    phi_d1 = norm_pdf_array(d1)
+    discount = np.exp(-r * T_)
+
+    call_price = S_ * N_d1 - K_ * discount * N_d2
+    # Put via parity: P = C - S + K e^(-rT)
+    put_price = call_price - S_ + K_ * discount
+    price = np.where(call, call_price, put_price)
+
+    delta = np.where(call, N_d1, N_d1 - 1.0)
+    gamma = phi_d1 / (S_ * sigma_sqrt_T)
+    vega = S_ * phi_d1 * sqrt_T / 100
+
+    decay = -S_ * phi_d1 * sigma_ / (2 * sqrt_T)
+    carry = r * K_ * discount
+    theta = np.where(call, decay - carry * N_d2, decay + carry * (1.0 - N_d2)) / DAYS_PER_YEAR
+
+    if all_valid:
+        return BSBatchResult(price=price, delta=delta, gamma=gamma, vega=vega, theta=theta)
+
+    intrinsic = np.where(call, np.maximum(S - K, 0.0), np.maximum(K - S, 0.0))
+    intrinsic = np.where((S > 0) & (K > 0), intrinsic, 0.0)
+
+    return BSBatchResult(
+        price=np.where(valid, price, intrinsic),
+        delta=np.where(valid, delta, 0.0),
+        gamma=np.where(valid, gamma, 0.0),
+        vega=np.where(valid, vega, 0.0),
+        theta=np.where(valid, theta, 0.0),
+    )
@@ -15,12 +15,14 @@ Functions:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Protocol
 
+from src.greeks.iv_cache import IVLookup
 from src.greeks.models import GreeksDataSource, GreeksModel, PositionGreeks
 
 if TYPE_CHECKING:
@@ -155,9 +157,55 @@ class FutuGreeksProvider:
         # For now, use a simple prefix approach
         return f"US.{symbol}"
 
+    def _futu_symbols(
+        self, positions: list[PositionInfo]
+    ) -> tuple[dict[str, PositionInfo], list[str]]:
+        """Map positions to Futu option and underlying symbols."""
+        symbol_map: dict[str, PositionInfo] = {}
+        for pos in positions:
+            symbol_map[self._symbol_to_futu(pos.symbol, pos.underlying_symbol)] = pos
+        unique_underlyings = list({f"US.{p.underlying_symbol}" for p in positions})
+        return symbol_map, unique_underlyings
+
+    def _to_raw_greeks(
+        self,
+        symbol_map: dict[str, PositionInfo],
+        underlying_prices: dict[str, Decimal],
+        futu_greeks: dict[str, Any],
+    ) -> dict[int, RawGreeks]:
+        """Convert Futu Greeks to RawGreeks keyed by position_id."""
+        result: dict[int, RawGreeks] = {}
+        for futu_sym, greeks in futu_greeks.items():
+            if futu_sym not in symbol_map:
+                continue
+
+            pos = symbol_map[futu_sym]
+
+            # Get underlying price (prefer from underlying quote, fallback to option data)
+            underlying_key = f"US.{pos.underlying_symbol}"
+            underlying_price = underlying_prices.get(underlying_key, greeks.underlying_price)
+
+            if underlying_price <= 0:
+                logger.warning(f"Invalid underlying price for {pos.symbol}, skipping")
+                continue
+
+            result[pos.position_id] = RawGreeks(
+                delta=greeks.delta,
+                gamma=greeks.gamma,
+                vega=greeks.vega,
+                theta=greeks.theta,
+                implied_vol=greeks.implied_volatility,
+                underlying_price=underlying_price,
+            )
+
+        return result
+
     def fetch_greeks(self, positions: list[PositionInfo]) -> dict[int, RawGreeks]:
         """Fetch Greeks from Futu OpenD API.
 
+        In shared mode, requests go through CoalescingFutuClient, so
+        concurrent callers share batched OpenD calls and cached results.
+
         Args:
             positions: List of PositionInfo to fetch Greeks for.
 
@@ -170,9 +218,9 @@ class FutuGreeksProvider:
 
         try:
             if self._use_shared:
-                from src.greeks.futu_client import SharedFutuClient
+                from src.greeks.futu_client import CoalescingFutuClient
 
-                client = SharedFutuClient.get_instance()
+                client = CoalescingFutuClient.get_instance()
             else:
                 from src.greeks.futu_client import FutuGreeksClient
 
@@ -183,48 +231,15 @@ class FutuGreeksProvider:
             return {}
 
         try:
-            # Build symbol mapping: futu_symbol -> position
-            symbol_map: dict[str, PositionInfo] = {}
-            futu_symbols: list[str] = []
-
-            for pos in positions:
-                futu_sym = self._symbol_to_futu(pos.symbol, pos.underlying_symbol)
-                symbol_map[futu_sym] = pos
-                futu_symbols.append(futu_sym)
+            symbol_map, unique_underlyings = self._futu_symbols(positions)
 
             # Fetch underlying prices for dollar Greeks conversion
-            unique_underlyings = list({f"US.{p.underlying_symbol}" for p in positions})
             underlying_prices = client.get_underlying_price(unique_underlyings)
 
             # Fetch option Greeks
-            futu_greeks = client.get_option_greeks(futu_symbols)
-
-            # Convert to RawGreeks
-            result: dict[int, RawGreeks] = {}
-            for futu_sym, greeks in futu_greeks.items():
-                if futu_sym not in symbol_map:
-                    continue
-
-                pos = symbol_map[futu_sym]
-
-                # Get underlying price (prefer from underlying quote, fallback to option data)
-                underlying_key = f"US.{pos.underlying_symbol}"
-                underlying_price = underlying_prices.get(underlying_key, greeks.underlying_price)
-
-                if underlying_price <= 0:
-                    logger.warning(f"Invalid underlying price for {pos.symbol}, skipping")
-                    continue
-
-                result[pos.position_id] = RawGreeks(
-                    delta=greeks.delta,
-                    gamma=greeks.gamma,
-                    vega=greeks.vega,
-                    theta=greeks.theta,
-                    implied_vol=greeks.implied_volatility,
-                    underlying_price=underlying_price,
-                )
+            futu_greeks = client.get_option_greeks(list(symbol_map))
 
-            return result
+            return self._to_raw_greeks(symbol_map, underlying_prices, futu_greeks)
 
         except Exception as e:
             logger.warning(f"Error fetching Greeks from Futu: {e}")
@@ -237,6 +252,38 @@ class FutuGreeksProvider:
                 except Exception as close_err:
                     logger.debug(f"Error closing Futu client: {close_err}")
 
+    async def fetch_greeks_async(self, positions: list[PositionInfo]) -> dict[int, RawGreeks]:
+        """Fetch Greeks from Futu OpenD without blocking the event loop.
+
+        Underlying prices and option Greeks are requested concurrently.
+        Non-shared mode runs the blocking fetch in a worker thread.
+
+        Args:
+            positions: List of PositionInfo to fetch Greeks for.
+
+        Returns:
+            Dict mapping position_id to RawGreeks.
+            Positions without valid Greeks are excluded.
+        """
+        if not positions:
+            return {}
+        if not self._use_shared:
+            return await asyncio.to_thread(self.fetch_greeks, positions)
+
+        from src.greeks.futu_client import CoalescingFutuClient
+
+        try:
+            client = CoalescingFutuClient.get_instance()
+            symbol_map, unique_underlyings = self._futu_symbols(positions)
+            underlying_prices, futu_greeks = await asyncio.gather(
+                client.get_underlying_price_async(unique_underlyings),
+                client.get_option_greeks_async(list(symbol_map)),
+            )
+            return self._to_raw_greeks(symbol_map, underlying_prices, futu_greeks)
+        except Exception as e:
+            logger.warning(f"Error fetching Greeks from Futu: {e}")
+            return {}
+
 
 class ModelGreeksProvider:
     """Calculates Greeks using Black-Scholes model.
@@ -267,6 +314,7 @@ class ModelGreeksProvider:
         self._default_iv = default_iv
         self._risk_free_rate = risk_free_rate
         self._underlying_prices: dict[str, Decimal] = {}
+        self._implied_vols: dict[str, Decimal] = {}
 
     @property
     def source(self) -> GreeksDataSource:
@@ -281,6 +329,18 @@ class ModelGreeksProvider:
         """
         self._underlying_prices = prices
 
+    def set_implied_vols(self, ivs: dict[str, Decimal]) -> None:
+        """Set per-option implied vols for calculation.
+
+        Callers with option quotes can fill these from LocalIVSolver, which
+        nothing in the service runs on its own. Options without an entry use
+        the default IV.
+
+        Args:
+            ivs: Dict mapping option symbol to implied vol
+        """
+        self._implied_vols = ivs
+
     def _get_underlying_price(self, symbol: str) -> Decimal | None:
         """Get underlying price.
 
@@ -324,18 +384,78 @@ class ModelGreeksProvider:
     def fetch_greeks(self, positions: list[PositionInfo]) -> dict[int, RawGreeks]:
         """Calculate Greeks using Black-Scholes model.
 
+        Uses IVs set via set_implied_vols(); the IV cache is only consulted
+        on the async path (fetch_greeks_async).
+
         Args:
             positions: List of PositionInfo to calculate Greeks for.
 
         Returns:
             Dict mapping position_id to RawGreeks.
         """
-        from src.greeks.black_scholes import calculate_bs_greeks
+        return self._price(positions, self._implied_vols)
+
+    async def fetch_greeks_async(self, positions: list[PositionInfo]) -> dict[int, RawGreeks]:
+        """Calculate Greeks, looking up missing IVs in the IV cache first.
+
+        Options without an IV from set_implied_vols() are resolved in one
+        batch through IVCacheManager.get_or_default_many (cached option IV,
+        then surface, underlying average and default IV).
+
+        Args:
+            positions: List of PositionInfo to calculate Greeks for.
+
+        Returns:
+            Dict mapping position_id to RawGreeks.
+        """
+        if self._iv_cache is None:
+            return self.fetch_greeks(positions)
+
+        ivs = dict(self._implied_vols)
+        lookups = {
+            pos.symbol: IVLookup(
+                symbol=pos.symbol,
+                underlying_symbol=pos.underlying_symbol,
+                strike=pos.strike,
+                expiry=pos.expiry,
+                underlying_price=self._get_underlying_price(pos.underlying_symbol),
+            )
+            for pos in positions
+            if pos.symbol not in ivs
+        }
+        if lookups:
+            ivs.update(
+                await self._iv_cache.get_or_default_many(
+                    list(lookups.values()), default_iv=self._default_iv
+                )
+            )
+        return self._price(positions, ivs)
+
+    def _price(
+        self, positions: list[PositionInfo], implied_vols: dict[str, Decimal]
+    ) -> dict[int, RawGreeks]:
+        """Price positions in a single vectorized Black-Scholes call.
+
+        Args:
+            positions: Positions to price
+            implied_vols: Per-option IVs; missing options use the default IV
+
+        Returns:
+            Dict mapping position_id to RawGreeks.
+        """
+        from src.greeks.black_scholes import calculate_bs_greeks_batch
 
         if not positions:
             return {}
 
-        result: dict[int, RawGreeks] = {}
+        priced: list[PositionInfo] = []
+        spots: list[Decimal] = []
+        ivs: list[Decimal] = []
+        spot_arr: list[float] = []
+        strike_arr: list[float] = []
+        time_arr: list[float] = []
+        iv_arr: list[float] = []
+        call_arr: list[bool] = []
 
         for pos in positions:
             # Get underlying price
@@ -346,8 +466,8 @@ class ModelGreeksProvider:
                 )
                 continue
 
-            # Get IV (use default for now, IV cache integration later)
-            iv = self._default_iv
+            # Get IV (set or cached IV first, then default)
+            iv = implied_vols.get(pos.symbol) or self._default_iv
 
             # Calculate time to expiry
             try:
@@ -357,28 +477,47 @@ class ModelGreeksProvider:
                 logger.warning(f"Invalid expiry {pos.expiry} for {pos.symbol}: {e}")
                 continue
 
-            # Calculate Greeks
-            try:
-                bs_result = calculate_bs_greeks(
-                    spot=underlying_price,
-                    strike=pos.strike,
-                    time_to_expiry_years=time_years,
-                    risk_free_rate=self._risk_free_rate,
-                    volatility=iv,
-                    is_call=(pos.option_type == "call"),
-                )
+            priced.append(pos)
+            spots.append(underlying_price)
+            ivs.append(iv)
+            spot_arr.append(float(underlying_price))
+            strike_arr.append(float(pos.strike))
+            time_arr.append(float(time_years))
+            iv_arr.append(float(iv))
+            call_arr.append(pos.option_type == "call")
 
-                result[pos.position_id] = RawGreeks(
-                    delta=bs_result.delta,
-                    gamma=bs_result.gamma,
-                    vega=bs_result.vega,
-                    theta=bs_result.theta,
-                    implied_vol=iv,
-                    underlying_price=underlying_price,
-                )
-            except Exception as e:
-                logger.warning(f"Error calculating BS Greeks for {pos.symbol}: {e}")
-                continue
+        if not priced:
+            return {}
+
+        try:
+            bs = calculate_bs_greeks_batch(
+                spot=spot_arr,
+                strike=strike_arr,
+                time_to_expiry_years=time_arr,
+                risk_free_rate=float(self._risk_free_rate),
+                volatility=iv_arr,
+                is_call=call_arr,
+            )
+        except Exception as e:
+            logger.warning(f"Error calculating batch BS Greeks: {e}")
+            return {}
+
+        # Same rounding as calculate_bs_greeks
+        deltas = bs.delta.round(6).tolist()
+        gammas = bs.gamma.round(8).tolist()
+        vegas = bs.vega.round(6).tolist()
+        thetas = bs.theta.round(6).tolist()
+
+        result: dict[int, RawGreeks] = {}
+        for i, pos in enumerate(priced):
+            result[pos.position_id] = RawGreeks(
+                delta=Decimal(str(deltas[i])),
+                gamma=Decimal(str(gammas[i])),
+                vega=Decimal(str(vegas[i])),
+                theta=Decimal(str(thetas[i])),
+                implied_vol=ivs[i],
+                underlying_price=spots[i],
+            )
 
         return result
 
@@ -441,6 +580,7 @@ def convert_to_dollar_greeks(
         source=source,
         model=model,
         valid=True,
+        implied_vol=raw.implied_vol,
     )
 
 
@@ -505,6 +645,23 @@ class GreeksCalculator:
         self._primary: GreeksProvider = primary_provider or FutuGreeksProvider()
         self._fallback: GreeksProvider | None = fallback_provider
 
+    @staticmethod
+    def _convert(
+        positions: list[PositionInfo],
+        raw_greeks: dict[int, RawGreeks],
+        source: GreeksDataSource,
+        results: list[PositionGreeks],
+    ) -> list[PositionInfo]:
+        """Append dollar Greeks for covered positions; return the rest."""
+        missing_positions: list[PositionInfo] = []
+        for position in positions:
+            if position.position_id in raw_greeks:
+                raw = raw_greeks[position.position_id]
+                results.append(convert_to_dollar_greeks(position, raw, source))
+            else:
+                missing_positions.append(position)
+        return missing_positions
+
     def calculate(self, positions: list[PositionInfo]) -> list[PositionGreeks]:
         """Calculate Greeks for all positions.
 
@@ -525,32 +682,14 @@ class GreeksCalculator:
 
         # Step 1: Fetch from primary provider
         primary_greeks = self._primary.fetch_greeks(positions)
-
-        # Track which positions still need Greeks
-        missing_positions: list[PositionInfo] = []
-        for position in positions:
-            if position.position_id in primary_greeks:
-                # Convert to dollar Greeks
-                raw = primary_greeks[position.position_id]
-                result = convert_to_dollar_greeks(position, raw, self._primary.source)
-                results.append(result)
-            else:
-                missing_positions.append(position)
+        missing_positions = self._convert(positions, primary_greeks, self._primary.source, results)
 
         # Step 2: Try fallback for missing positions
         if missing_positions and self._fallback is not None:
             fallback_greeks = self._fallback.fetch_greeks(missing_positions)
-            remaining_missing: list[PositionInfo] = []
-
-            for position in missing_positions:
-                if position.position_id in fallback_greeks:
-                    raw = fallback_greeks[position.position_id]
-                    result = convert_to_dollar_greeks(position, raw, self._fallback.source)
-                    results.append(result)
-                else:
-                    remaining_missing.append(position)
-
-            missing_positions = remaining_missing
+            missing_positions = self._convert(
+                missing_positions, fallback_greeks, self._fallback.source, results
+            )
 
         # Step 3: Mark remaining positions as invalid
         for position in missing_positions:
@@ -559,6 +698,47 @@ class GreeksCalculator:
 
         return results
 
+    @staticmethod
+    async def _fetch_async(
+        provider: GreeksProvider, positions: list[PositionInfo]
+    ) -> dict[int, RawGreeks]:
+        """Fetch through the provider's async path, or in a worker thread."""
+        fetch_async = getattr(provider, "fetch_greeks_async", None)
+        if fetch_async is not None:
+            return await fetch_async(positions)
+        return await asyncio.to_thread(provider.fetch_greeks, positions)
+
+    async def calculate_async(self, positions: list[PositionInfo]) -> list[PositionGreeks]:
+        """Calculate Greeks for all positions without blocking the event loop.
+
+        Same steps as calculate(); provider I/O is awaited (or offloaded to a
+        thread) instead of running on the caller's thread.
+
+        Args:
+            positions: List of PositionInfo to calculate Greeks for.
+
+        Returns:
+            List of PositionGreeks with calculated values.
+        """
+        if not positions:
+            return []
+
+        results: list[PositionGreeks] = []
+
+        primary_greeks = await self._fetch_async(self._primary, positions)
+        missing_positions = self._convert(positions, primary_greeks, self._primary.source, results)
+
+        if missing_positions and self._fallback is not None:
+            fallback_greeks = await self._fetch_async(self._fallback, missing_positions)
+            missing_positions = self._convert(
+                missing_positions, fallback_greeks, self._fallback.source, results
+            )
+
+        for position in missing_positions:
+            results.append(_create_invalid_position_greeks(position, self._primary.source))
+
+        return results
+
     def calculate_single(self, position: PositionInfo) -> PositionGreeks:
         """Calculate Greeks for a single position.
 
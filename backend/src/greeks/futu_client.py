@@ -12,12 +12,16 @@ Connection management:
 Threading:
     - moomoo SDK callbacks run on separate threads
     - Use asyncio.run_coroutine_threadsafe for async bridging
+    - CoalescingFutuClient runs OpenD calls on a dedicated thread pool,
+      batching concurrent lookups and caching results briefly
 """
 
 import asyncio
 import logging
 import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from decimal import Decimal
@@ -187,14 +191,12 @@ class FutuGreeksClient:
             # Subscribe to option quotes
             ret, err = quote_ctx.subscribe(symbols, [SubType.QUOTE])
             if ret != RET_OK:
-                logger.warning(f"Failed to subscribe to symbols: {err}")
-                return {}
+                raise FutuAPIError(f"Failed to subscribe to symbols: {err}")
 
             # Fetch quotes
             ret, data = quote_ctx.get_stock_quote(symbols)
             if ret != RET_OK:
-                logger.warning(f"Failed to get stock quote: {data}")
-                return {}
+                raise FutuAPIError(f"Failed to get stock quote: {data}")
 
             # Parse Greeks from quote data
             result: dict[str, FutuOptionGreeks] = {}
@@ -256,13 +258,11 @@ class FutuGreeksClient:
             # Subscribe and fetch quotes
             ret, err = quote_ctx.subscribe(symbols, [SubType.QUOTE])
             if ret != RET_OK:
-                logger.warning(f"Failed to subscribe to symbols: {err}")
-                return {}
+                raise FutuAPIError(f"Failed to subscribe to symbols: {err}")
 
             ret, data = quote_ctx.get_stock_quote(symbols)
             if ret != RET_OK:
-                logger.warning(f"Failed to get stock quote: {data}")
-                return {}
+                raise FutuAPIError(f"Failed to get stock quote: {data}")
 
             result: dict[str, Decimal] = {}
             for _, row in data.iterrows():
@@ -429,15 +429,20 @@ class SharedFutuClient:
         self,
         symbols: list[str],
         max_retries: int = DEFAULT_MAX_RETRIES,
+        raise_errors: bool = False,
     ) -> dict[str, FutuOptionGreeks]:
         """Fetch option Greeks with automatic retry.
 
         Args:
             symbols: List of option symbols.
             max_retries: Maximum retry attempts on transient failures.
+            raise_errors: Raise instead of returning {} once retries are spent.
 
         Returns:
             Dict mapping symbol to FutuOptionGreeks.
+
+        Raises:
+            FutuClientError: If raise_errors is set and the fetch failed.
         """
         last_error: Exception | None = None
 
@@ -462,21 +467,28 @@ class SharedFutuClient:
                 break
 
         logger.warning(f"Failed to get option Greeks after {max_retries} attempts: {last_error}")
+        if raise_errors:
+            raise FutuClientError(f"Failed to get option Greeks: {last_error}") from last_error
         return {}
 
     def get_underlying_price(
         self,
         symbols: list[str],
         max_retries: int = DEFAULT_MAX_RETRIES,
+        raise_errors: bool = False,
     ) -> dict[str, Decimal]:
         """Fetch underlying prices with automatic retry.
 
         Args:
             symbols: List of underlying symbols.
             max_retries: Maximum retry attempts.
+            raise_errors: Raise instead of returning {} once retries are spent.
 
         Returns:
             Dict mapping symbol to price.
+
+        Raises:
+            FutuClientError: If raise_errors is set and the fetch failed.
         """
         last_error: Exception | None = None
 
@@ -502,6 +514,8 @@ class SharedFutuClient:
         logger.warning(
             f"Failed to get underlying prices after {max_retries} attempts: {last_error}"
         )
+        if raise_errors:
+            raise FutuClientError(f"Failed to get underlying prices: {last_error}") from last_error
         return {}
 
     def close(self) -> None:
@@ -524,3 +538,310 @@ class SharedFutuClient:
             if cls._instance:
                 cls._instance.close()
                 cls._instance = None
+
+
+# Coalescing defaults: requests arriving within the window share one OpenD
+# call, and results are reused for about one monitor cycle
+DEFAULT_COALESCE_WINDOW = 0.005  # seconds
+DEFAULT_CACHE_TTL = 2.0  # seconds
+DEFAULT_EXECUTOR_WORKERS = 2
+
+
+@dataclass
+class CoalescerStats:
+    """Request coalescing counters.
+
+    Attributes:
+        requests: Symbols requested by callers
+        cache_hits: Symbols served from the result cache
+        shared_inflight: Symbols joined to an OpenD call already pending
+        batches: OpenD calls made
+        symbols_fetched: Symbols sent to OpenD across all batches
+    """
+
+    requests: int = 0
+    cache_hits: int = 0
+    shared_inflight: int = 0
+    batches: int = 0
+    symbols_fetched: int = 0
+
+
+class _SymbolBatcher:
+    """Merges concurrent per-symbol lookups into batched fetches.
+
+    Thread-safe. Symbols not cached or already in flight are queued; the first
+    queued symbol schedules a batch on the executor, which waits out the
+    coalescing window and fetches everything queued by then in one call.
+    Symbols missing from a result are cached as None, so a position without
+    Greeks is not re-requested every call within the TTL; a fetch that raises
+    resolves its symbols to None without caching them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Callable[[list[str]], dict[str, Any]],
+        executor: ThreadPoolExecutor,
+        window: float,
+        ttl: float,
+        stats: CoalescerStats,
+    ):
+        self._name = name
+        self._fetch = fetch
+        self._executor = executor
+        self._window = window
+        self._ttl = ttl
+        self._stats = stats
+        self._lock = threading.Lock()
+        # symbol -> (expires_at, value or None)
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._inflight: dict[str, Future] = {}
+        self._pending: list[str] = []
+        self._closed = False
+
+    def submit(self, symbols: list[str]) -> tuple[dict[str, Any], dict[str, Future]]:
+        """Resolve symbols from cache, or attach them to a pending batch.
+
+        Args:
+            symbols: Symbols to look up
+
+        Returns:
+            Tuple of (cached values, futures for symbols being fetched)
+
+        Raises:
+            FutuClientError: If the batcher has been closed
+        """
+        cached: dict[str, Any] = {}
+        waiting: dict[str, Future] = {}
+        now = time.monotonic()
+        with self._lock:
+            if self._closed:
+                raise FutuClientError("Futu client is closed")
+            for symbol in dict.fromkeys(symbols):
+                self._stats.requests += 1
+                entry = self._cache.get(symbol)
+                if entry is not None and entry[0] > now:
+                    self._stats.cache_hits += 1
+                    cached[symbol] = entry[1]
+                    continue
+                future = self._inflight.get(symbol)
+                if future is not None:
+                    self._stats.shared_inflight += 1
+                else:
+                    future = Future()
+                    self._inflight[symbol] = future
+                    self._pending.append(symbol)
+                    if len(self._pending) == 1:
+                        self._executor.submit(self._run_batch)
+                waiting[symbol] = future
+        return cached, waiting
+
+    def _run_batch(self) -> None:
+        """Fetch every symbol queued during the coalescing window."""
+        if self._window > 0:
+            time.sleep(self._window)
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            values = self._fetch(batch)
+            failed = False
+        except Exception as e:
+            logger.warning(f"Batched Futu {self._name} fetch failed: {e}")
+            values = {}
+            failed = True
+
+        expires_at = time.monotonic() + self._ttl
+        with self._lock:
+            self._stats.batches += 1
+            self._stats.symbols_fetched += len(batch)
+            futures = [(self._inflight.pop(symbol), values.get(symbol)) for symbol in batch]
+            # Failed fetches are not cached, so the next call retries
+            if not failed:
+                for symbol in batch:
+                    self._cache[symbol] = (expires_at, values.get(symbol))
+        for future, value in futures:
+            future.set_result(value)
+
+    def invalidate(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Refuse new lookups; batches already scheduled still run."""
+        with self._lock:
+            self._closed = True
+
+    def fail_pending(self) -> None:
+        """Fail lookups whose batch will never run (after executor shutdown)."""
+        with self._lock:
+            futures = list(self._inflight.values())
+            self._inflight.clear()
+            self._pending = []
+        for future in futures:
+            future.set_exception(FutuClientError("Futu client is closed"))
+
+
+class CoalescingFutuClient:
+    """Coalescing, caching facade over SharedFutuClient.
+
+    OpenD calls run on a dedicated thread pool, never on the caller's thread
+    or the event loop. Concurrent lookups for overlapping symbols within a
+    short window are merged into one batched OpenD request, and results are
+    cached briefly so repeated lookups within one monitor cycle are served
+    without going back to OpenD.
+
+    Both blocking (for worker threads) and awaitable methods are provided;
+    they share the same batches and cache.
+
+    Usage:
+        client = CoalescingFutuClient.get_instance()
+        greeks = await client.get_option_greeks_async(symbols)
+
+    Attributes:
+        stats: Coalescing counters across both greeks and price lookups
+    """
+
+    _instance: "CoalescingFutuClient | None" = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        client: SharedFutuClient | None = None,
+        coalesce_window_seconds: float = DEFAULT_COALESCE_WINDOW,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL,
+        max_workers: int = DEFAULT_EXECUTOR_WORKERS,
+    ):
+        """Initialize the facade.
+
+        Args:
+            client: Client to delegate to (default: SharedFutuClient.get_instance()
+                at call time, so reconfiguration is picked up)
+            coalesce_window_seconds: Time to wait for more symbols before fetching
+            cache_ttl_seconds: How long fetched results are reused
+            max_workers: Threads in the dedicated OpenD pool
+        """
+        self._client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="futu-opend"
+        )
+        self.stats = CoalescerStats()
+        self._greeks = _SymbolBatcher(
+            "greeks",
+            lambda symbols: self._shared().get_option_greeks(symbols, raise_errors=True),
+            self._executor,
+            coalesce_window_seconds,
+            cache_ttl_seconds,
+            self.stats,
+        )
+        self._prices = _SymbolBatcher(
+            "price",
+            lambda symbols: self._shared().get_underlying_price(symbols, raise_errors=True),
+            self._executor,
+            coalesce_window_seconds,
+            cache_ttl_seconds,
+            self.stats,
+        )
+
+    @classmethod
+    def get_instance(cls) -> "CoalescingFutuClient":
+        """Get the shared facade instance.
+
+        Returns:
+            CoalescingFutuClient instance.
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _shared(self) -> SharedFutuClient:
+        return self._client or SharedFutuClient.get_instance()
+
+    @staticmethod
+    def _collect(cached: dict[str, Any], waiting: dict[str, Future]) -> dict[str, Any]:
+        values = dict(cached)
+        for symbol, future in waiting.items():
+            values[symbol] = future.result()
+        return {symbol: value for symbol, value in values.items() if value is not None}
+
+    @staticmethod
+    async def _collect_async(cached: dict[str, Any], waiting: dict[str, Future]) -> dict[str, Any]:
+        values = dict(cached)
+        if waiting:
+            results = await asyncio.gather(*(asyncio.wrap_future(f) for f in waiting.values()))
+            values.update(zip(waiting, results, strict=True))
+        return {symbol: value for symbol, value in values.items() if value is not None}
+
+    def get_option_greeks(self, symbols: list[str]) -> dict[str, FutuOptionGreeks]:
+        """Fetch option Greeks, blocking the calling thread.
+
+        Args:
+            symbols: List of option symbols.
+
+        Returns:
+            Dict mapping symbol to FutuOptionGreeks (symbols without data omitted).
+        """
+        return self._collect(*self._greeks.submit(symbols))
+
+    def get_underlying_price(self, symbols: list[str]) -> dict[str, Decimal]:
+        """Fetch underlying prices, blocking the calling thread.
+
+        Args:
+            symbols: List of underlying symbols.
+
+        Returns:
+            Dict mapping symbol to price (symbols without data omitted).
+        """
+        return self._collect(*self._prices.submit(symbols))
+
+    async def get_option_greeks_async(self, symbols: list[str]) -> dict[str, FutuOptionGreeks]:
+        """Fetch option Greeks without blocking the event loop.
+
+        Args:
+            symbols: List of option symbols.
+
+        Returns:
+            Dict mapping symbol to FutuOptionGreeks (symbols without data omitted).
+        """
+        return await self._collect_async(*self._greeks.submit(symbols))
+
+    async def get_underlying_price_async(self, symbols: list[str]) -> dict[str, Decimal]:
+        """Fetch underlying prices without blocking the event loop.
+
+        Args:
+            symbols: List of underlying symbols.
+
+        Returns:
+            Dict mapping symbol to price (symbols without data omitted).
+        """
+        return await self._collect_async(*self._prices.submit(symbols))
+
+    def invalidate(self) -> None:
+        """Drop all cached results (e.g. at the start of a new monitor cycle)."""
+        self._greeks.invalidate()
+        self._prices.invalidate()
+
+    def close(self) -> None:
+        """Stop the OpenD thread pool after in-flight batches finish.
+
+        Later lookups raise FutuClientError, and any lookup left without a
+        batch is failed rather than left waiting forever.
+        """
+        for batcher in (self._greeks, self._prices):
+            batcher.close()
+        self._executor.shutdown(wait=True)
+        for batcher in (self._greeks, self._prices):
+            batcher.fail_pending()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Shutdown the shared facade instance."""
+        with cls._lock:
+            if cls._instance:
+                cls._instance.close()
+                cls._instance = None
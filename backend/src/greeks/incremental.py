@@ -0,0 +1,322 @@
+"""Incremental Greeks recompute driven by underlying moves.
+
+GreeksMonitor normally recalculates every position each cycle. On large books
+most underlyings have not moved between cycles, so most of those provider calls
+return the same numbers. IncrementalGreeksCalculator wraps a GreeksCalculator
+and only sends a position to the providers when one of its inputs moved beyond
+tolerance:
+
+    - Underlying price: relative change vs. the price at last recompute
+    - Implied vol: absolute change vs. the IV at last recompute (if supplied)
+    - Time bucket: wall clock crossed into a new bucket (captures theta decay)
+    - Position terms: quantity/strike/expiry/type/multiplier changed
+    - Last result was invalid, or no current price is available
+
+All other positions reuse their cached PositionGreeks.
+
+Classes:
+    - RecomputeTolerance: Thresholds that trigger a recompute
+    - IncrementalStats: Per-cycle recompute/reuse counters
+    - IncrementalResult: Output of one incremental cycle
+    - IncrementalGreeksCalculator: Caching wrapper around GreeksCalculator
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from src.greeks.calculator import GreeksCalculator, PositionInfo
+from src.greeks.models import PositionGreeks
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RecomputeTolerance:
+    """Thresholds that trigger a position recompute.
+
+    Attributes:
+        underlying_price_pct: Relative underlying move (0.001 = 0.1%)
+        implied_vol_abs: Absolute IV move (0.005 = 0.5 vol points)
+        time_bucket_seconds: Recompute everything once per bucket
+    """
+
+    underlying_price_pct: Decimal = Decimal("0.001")
+    implied_vol_abs: Decimal = Decimal("0.005")
+    time_bucket_seconds: int = 900
+
+
+@dataclass
+class IncrementalStats:
+    """Per-cycle recompute/reuse counters.
+
+    Attributes:
+        recomputed: Positions sent to the providers this cycle
+        reused: Positions served from cache this cycle
+        removed: Cached positions dropped (no longer in the book)
+        calculator_calls: GreeksCalculator.calculate invocations this cycle
+    """
+
+    recomputed: int = 0
+    reused: int = 0
+    removed: int = 0
+    calculator_calls: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of positions served from cache."""
+        total = self.recomputed + self.reused
+        if total == 0:
+            return 0.0
+        return self.reused / total
+
+
+@dataclass
+class IncrementalResult:
+    """Output of one incremental cycle.
+
+    Attributes:
+        greeks: PositionGreeks for every input position, in input order
+        recomputed: The subset freshly calculated this cycle
+        removed: Position IDs dropped since the previous cycle
+        as_of_ts: Cycle timestamp; every returned leg is current as of it
+        stats: Recompute/reuse counters
+    """
+
+    greeks: list[PositionGreeks]
+    recomputed: list[PositionGreeks]
+    removed: list[int]
+    as_of_ts: datetime
+    stats: IncrementalStats = field(default_factory=IncrementalStats)
+
+
+@dataclass
+class _CachedLeg:
+    """Cached Greeks plus the inputs they were computed from."""
+
+    terms: tuple
+    greeks: PositionGreeks
+    underlying_price: Decimal
+    implied_vol: Decimal | None
+    time_bucket: int
+
+
+def _terms(position: PositionInfo) -> tuple:
+    """Position fields that, if changed, invalidate cached Greeks."""
+    return (
+        position.symbol,
+        position.quantity,
+        position.multiplier,
+        position.option_type,
+        position.strike,
+        position.expiry,
+    )
+
+
+class IncrementalGreeksCalculator:
+    """Recomputes only positions whose inputs moved beyond tolerance.
+
+    Usage:
+        incremental = IncrementalGreeksCalculator(GreeksCalculator())
+        result = incremental.calculate(positions, underlying_prices, implied_vols)
+        aggregator.upsert(...) for result.recomputed, remove(...) for result.removed
+    """
+
+    def __init__(
+        self,
+        calculator: GreeksCalculator,
+        tolerance: RecomputeTolerance | None = None,
+    ):
+        """Initialize the incremental calculator.
+
+        Args:
+            calculator: Underlying calculator used for recomputes
+            tolerance: Recompute thresholds (defaults if not provided)
+        """
+        self._calculator = calculator
+        self._tolerance = tolerance or RecomputeTolerance()
+        self._cache: dict[int, _CachedLeg] = {}
+
+    def __len__(self) -> int:
+        """Number of cached positions."""
+        return len(self._cache)
+
+    def invalidate(self, position_id: int | None = None) -> None:
+        """Force a recompute on the next cycle.
+
+        Args:
+            position_id: Position to invalidate, or None for all
+        """
+        if position_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(position_id, None)
+
+    def _time_bucket(self, now: datetime) -> int:
+        return int(now.timestamp()) // self._tolerance.time_bucket_seconds
+
+    def _is_current(
+        self,
+        cached: _CachedLeg,
+        position: PositionInfo,
+        price: Decimal | None,
+        iv: Decimal | None,
+        bucket: int,
+    ) -> bool:
+        """Check whether cached Greeks can be reused."""
+        if not cached.greeks.valid or cached.time_bucket != bucket:
+            return False
+        if cached.terms != _terms(position):
+            return False
+        if price is None or cached.underlying_price <= 0:
+            return False
+        move = abs(price - cached.underlying_price) / cached.underlying_price
+        if move > self._tolerance.underlying_price_pct:
+            return False
+        if iv is not None:
+            if cached.implied_vol is None:
+                return False
+            if abs(iv - cached.implied_vol) > self._tolerance.implied_vol_abs:
+                return False
+        return True
+
+    def _partition(
+        self,
+        positions: list[PositionInfo],
+        prices: dict[str, Decimal],
+        ivs: dict[str, Decimal],
+        now: datetime,
+        bucket: int,
+        stats: IncrementalStats,
+    ) -> tuple[list[PositionInfo], list[int]]:
+        """Drop closed positions and split the book into reusable and stale."""
+        # Drop positions that left the book
+        live_ids = {p.position_id for p in positions}
+        removed = [pid for pid in self._cache if pid not in live_ids]
+        for pid in removed:
+            del self._cache[pid]
+        stats.removed = len(removed)
+
+        # Partition into reusable and stale
+        to_compute: list[PositionInfo] = []
+        for position in positions:
+            cached = self._cache.get(position.position_id)
+            if cached is not None and self._is_current(
+                cached,
+                position,
+                prices.get(position.underlying_symbol),
+                ivs.get(position.symbol),
+                bucket,
+            ):
+                # Inputs verified unchanged this cycle
+                cached.greeks.as_of_ts = now
+                stats.reused += 1
+            else:
+                to_compute.append(position)
+        return to_compute, removed
+
+    def _finish(
+        self,
+        positions: list[PositionInfo],
+        to_compute: list[PositionInfo],
+        recomputed: list[PositionGreeks],
+        removed: list[int],
+        prices: dict[str, Decimal],
+        ivs: dict[str, Decimal],
+        now: datetime,
+        bucket: int,
+        stats: IncrementalStats,
+    ) -> IncrementalResult:
+        """Cache recomputed Greeks and build the cycle result."""
+        if to_compute:
+            stats.calculator_calls = 1
+            by_id = {p.position_id: p for p in to_compute}
+            for pg in recomputed:
+                position = by_id[pg.position_id]
+                pg.as_of_ts = now
+                self._cache[pg.position_id] = _CachedLeg(
+                    terms=_terms(position),
+                    greeks=pg,
+                    underlying_price=prices.get(position.underlying_symbol, pg.underlying_price),
+                    implied_vol=ivs.get(position.symbol),
+                    time_bucket=bucket,
+                )
+        stats.recomputed = len(to_compute)
+
+        logger.debug(
+            f"Incremental Greeks: {stats.recomputed} recomputed, "
+            f"{stats.reused} reused, {stats.removed} removed"
+        )
+
+        return IncrementalResult(
+            greeks=[self._cache[p.position_id].greeks for p in positions],
+            recomputed=recomputed,
+            removed=removed,
+            as_of_ts=now,
+            stats=stats,
+        )
+
+    def calculate(
+        self,
+        positions: list[PositionInfo],
+        underlying_prices: dict[str, Decimal] | None = None,
+        implied_vols: dict[str, Decimal] | None = None,
+        now: datetime | None = None,
+    ) -> IncrementalResult:
+        """Calculate Greeks, reusing cached results where inputs are unchanged.
+
+        Args:
+            positions: Full set of positions in the book
+            underlying_prices: Current underlying prices by underlying symbol.
+                Positions whose underlying has no price are always recomputed.
+            implied_vols: Current IVs by option symbol (optional)
+            now: Cycle timestamp (default: now)
+
+        Returns:
+            IncrementalResult with Greeks for every position
+        """
+        now = now or datetime.now(timezone.utc)
+        bucket = self._time_bucket(now)
+        prices = underlying_prices or {}
+        ivs = implied_vols or {}
+        stats = IncrementalStats()
+
+        to_compute, removed = self._partition(positions, prices, ivs, now, bucket, stats)
+        # Recompute stale positions in one calculator call
+        recomputed = self._calculator.calculate(to_compute) if to_compute else []
+        return self._finish(
+            positions, to_compute, recomputed, removed, prices, ivs, now, bucket, stats
+        )
+
+    async def calculate_async(
+        self,
+        positions: list[PositionInfo],
+        underlying_prices: dict[str, Decimal] | None = None,
+        implied_vols: dict[str, Decimal] | None = None,
+        now: datetime | None = None,
+    ) -> IncrementalResult:
+        """Like calculate(), but awaits the calculator's non-blocking path.
+
+        Args:
+            positions: Full set of positions in the book
+            underlying_prices: Current underlying prices by underlying symbol
+            implied_vols: Current IVs by option symbol (optional)
+            now: Cycle timestamp (default: now)
+
+        Returns:
+            IncrementalResult with Greeks for every position
+        """
+        now = now or datetime.now(timezone.utc)
+        bucket = self._time_bucket(now)
+        prices = underlying_prices or {}
+        ivs = implied_vols or {}
+        stats = IncrementalStats()
+
+        to_compute, removed = self._partition(positions, prices, ivs, now, bucket, stats)
+        recomputed = await self._calculator.calculate_async(to_compute) if to_compute else []
+        return self._finish(
+            positions, to_compute, recomputed, removed, prices, ivs, now, bucket, stats
+        )
@@ -6,8 +6,9 @@ Provides fallback IV for Black-Scholes model calculations.
 Cache Keys:
     - iv:{symbol} - Per-option IV cache
     - iv:underlying:{symbol} - Per-underlying average IV
+    - iv:surface:{symbol} - Per-underlying IV surface (see IVSurface)
 
-TTL: 1 hour for individual options, 4 hours for underlying averages
+TTL: 1 hour for individual options, 4 hours for underlying averages and surfaces
 """
 
 import json
@@ -15,13 +16,43 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Protocol
+from typing import Any, Protocol
+
+from redis.exceptions import WatchError
+
+from src.greeks.iv_surface import IVSurface
 
 logger = logging.getLogger(__name__)
 
 # Cache TTL settings
 OPTION_IV_TTL_SECONDS = 3600  # 1 hour
 UNDERLYING_IV_TTL_SECONDS = 14400  # 4 hours
+SURFACE_TTL_SECONDS = UNDERLYING_IV_TTL_SECONDS
+
+# Optimistic-lock attempts for a surface merge before giving up
+SURFACE_UPDATE_RETRIES = 5
+
+
+class RedisPipeline(Protocol):
+    """Protocol for an async Redis pipeline.
+
+    Commands are buffered until execute(), except between watch() and
+    multi(), where they run immediately.
+    """
+
+    async def __aenter__(self) -> "RedisPipeline": ...
+
+    async def __aexit__(self, *exc_info: object) -> None: ...
+
+    async def watch(self, *keys: str) -> None: ...
+
+    async def mget(self, keys: list[str]) -> list[str | None]: ...
+
+    def multi(self) -> None: ...
+
+    def set(self, key: str, value: str, ex: int | None = None) -> Any: ...
+
+    async def execute(self) -> list[Any]: ...
 
 
 class RedisClient(Protocol):
@@ -31,6 +62,10 @@ class RedisClient(Protocol):
 
     async def set(self, key: str, value: str, ex: int | None = None) -> None: ...
 
+    async def mget(self, keys: list[str]) -> list[str | None]: ...
+
+    def pipeline(self, transaction: bool = True) -> RedisPipeline: ...
+
 
 @dataclass
 class IVCacheEntry:
@@ -42,6 +77,8 @@ class IVCacheEntry:
         underlying_price: Underlying spot price at cache time
         underlying_symbol: Underlying symbol (optional)
         as_of_ts: Timestamp of the IV data
+        strike: Option strike (optional, needed for the IV surface)
+        expiry: Expiration date as ISO string (optional, needed for the IV surface)
     """
 
     symbol: str
@@ -49,6 +86,8 @@ class IVCacheEntry:
     underlying_price: Decimal
     as_of_ts: datetime
     underlying_symbol: str | None = None
+    strike: Decimal | None = None
+    expiry: str | None = None
 
     def is_stale(self, max_age_seconds: int = OPTION_IV_TTL_SECONDS) -> bool:
         """Check if entry is stale."""
@@ -64,6 +103,9 @@ class IVCacheEntry:
             "underlying_symbol": self.underlying_symbol,
             "as_of_ts": self.as_of_ts.isoformat(),
         }
+        if self.strike is not None and self.expiry is not None:
+            data["strike"] = str(self.strike)
+            data["expiry"] = self.expiry
         return json.dumps(data)
 
     @classmethod
@@ -76,9 +118,30 @@ class IVCacheEntry:
             underlying_price=Decimal(data["underlying_price"]),
             underlying_symbol=data.get("underlying_symbol"),
             as_of_ts=datetime.fromisoformat(data["as_of_ts"]),
+            strike=Decimal(data["strike"]) if "strike" in data else None,
+            expiry=data.get("expiry"),
         )
 
 
+@dataclass
+class IVLookup:
+    """An option whose IV is resolved by IVCacheManager.get_or_default_many.
+
+    Attributes:
+        symbol: Option symbol
+        underlying_symbol: Underlying symbol
+        strike: Option strike, enables surface lookup
+        expiry: Option expiry as ISO string, enables surface lookup
+        underlying_price: Current spot for surface moneyness (optional)
+    """
+
+    symbol: str
+    underlying_symbol: str
+    strike: Decimal | None = None
+    expiry: str | None = None
+    underlying_price: Decimal | None = None
+
+
 class IVCacheManager:
     """Manages IV cache in Redis.
 
@@ -110,6 +173,10 @@ class IVCacheManager:
         """Generate Redis key for underlying average IV."""
         return f"iv:underlying:{symbol}"
 
+    def _surface_key(self, symbol: str) -> str:
+        """Generate Redis key for underlying IV surface."""
+        return f"iv:surface:{symbol}"
+
     async def get(self, symbol: str) -> IVCacheEntry | None:
         """Get cached IV for an option.
 
@@ -135,39 +202,164 @@ class IVCacheManager:
             entry: IV cache entry to store
         """
         try:
-            await self._redis.set(
-                self._option_key(entry.symbol),
-                entry.to_json(),
-                ex=OPTION_IV_TTL_SECONDS,
-            )
-
-            # Also update underlying average if we have the underlying symbol
-            if entry.underlying_symbol:
-                await self._update_underlying_iv(entry)
+            for key, value, ttl in self._option_writes(entry):
+                await self._redis.set(key, value, ex=ttl)
         except Exception as e:
             logger.warning(f"Error writing IV cache for {entry.symbol}: {e}")
+        await self._update_surfaces([entry])
+
+    async def set_many(self, entries: list[IVCacheEntry]) -> None:
+        """Cache IVs for a batch of options.
 
-    async def _update_underlying_iv(self, entry: IVCacheEntry) -> None:
-        """Update underlying-level IV cache.
+        Used to publish a whole chain of locally solved IVs at once. The
+        per-option keys go out in one pipelined round trip, and each
+        affected surface is merged once per batch.
 
-        Simple approach: just use the latest option IV as a proxy.
-        A more sophisticated approach would track multiple options
-        and compute a weighted average.
+        Args:
+            entries: IV cache entries to store
         """
+        if not entries:
+            return
         try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for entry in entries:
+                    for key, value, ttl in self._option_writes(entry):
+                        pipe.set(key, value, ex=ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Error writing IV cache batch of {len(entries)}: {e}")
+        await self._update_surfaces(entries)
+
+    def _option_writes(self, entry: IVCacheEntry) -> list[tuple[str, str, int]]:
+        """(key, value, TTL) writes for the per-option key and underlying proxy.
+
+        Simple approach for the underlying: just use the latest option IV
+        as a proxy. A more sophisticated approach would track multiple
+        options and compute a weighted average.
+        """
+        writes = [(self._option_key(entry.symbol), entry.to_json(), OPTION_IV_TTL_SECONDS)]
+        if entry.underlying_symbol:
             underlying_entry = IVCacheEntry(
                 symbol=entry.underlying_symbol,
                 implied_vol=entry.implied_vol,
                 underlying_price=entry.underlying_price,
                 as_of_ts=entry.as_of_ts,
             )
-            await self._redis.set(
-                self._underlying_key(entry.underlying_symbol),
-                underlying_entry.to_json(),
-                ex=UNDERLYING_IV_TTL_SECONDS,
+            writes.append(
+                (
+                    self._underlying_key(entry.underlying_symbol),
+                    underlying_entry.to_json(),
+                    UNDERLYING_IV_TTL_SECONDS,
+                )
+            )
+        return writes
+
+    async def _update_surfaces(self, entries: list[IVCacheEntry]) -> None:
+        """Merge entries carrying strike/expiry into their underlying surfaces.
+
+        The read-merge-write runs under WATCH/MULTI, so a concurrent writer
+        to the same surfaces makes this attempt retry instead of being
+        overwritten.
+        """
+        by_underlying: dict[str, list[IVCacheEntry]] = {}
+        for entry in entries:
+            if entry.underlying_symbol and entry.strike is not None and entry.expiry:
+                by_underlying.setdefault(entry.underlying_symbol, []).append(entry)
+        if not by_underlying:
+            return
+
+        underlyings = list(by_underlying)
+        keys = [self._surface_key(s) for s in underlyings]
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                for _ in range(SURFACE_UPDATE_RETRIES):
+                    try:
+                        await pipe.watch(*keys)
+                        raw = await pipe.mget(keys)
+                        surfaces = self._decode_surfaces(underlyings, raw, include_stale=True)
+                        today = datetime.now(timezone.utc).date()
+                        pipe.multi()
+                        for underlying, group in by_underlying.items():
+                            surface = surfaces.get(underlying) or IVSurface(underlying)
+                            surface.prune_expired(today)
+                            for entry in group:
+                                surface.add_point(
+                                    strike=entry.strike,  # type: ignore[arg-type]
+                                    expiry=entry.expiry,  # type: ignore[arg-type]
+                                    implied_vol=entry.implied_vol,
+                                    underlying_price=entry.underlying_price,
+                                    as_of_ts=entry.as_of_ts,
+                                )
+                            pipe.set(
+                                self._surface_key(underlying),
+                                surface.to_json(),
+                                ex=SURFACE_TTL_SECONDS,
+                            )
+                        await pipe.execute()
+                        return
+                    except WatchError:
+                        continue
+            logger.warning(
+                f"IV surfaces for {underlyings} kept changing; "
+                f"update dropped after {SURFACE_UPDATE_RETRIES} attempts"
             )
         except Exception as e:
-            logger.warning(f"Error updating underlying IV: {e}")
+            logger.warning(f"Error updating IV surfaces: {e}")
+
+    async def get_surface(self, underlying_symbol: str) -> IVSurface | None:
+        """Get the cached IV surface for an underlying.
+
+        Args:
+            underlying_symbol: Underlying symbol (e.g., "AAPL")
+
+        Returns:
+            IVSurface if cached and fresh, None otherwise
+        """
+        surfaces = await self.get_surfaces([underlying_symbol])
+        return surfaces.get(underlying_symbol)
+
+    async def get_surfaces(
+        self,
+        underlying_symbols: list[str],
+        include_stale: bool = False,
+    ) -> dict[str, IVSurface]:
+        """Load IV surfaces for many underlyings in one round trip.
+
+        Args:
+            underlying_symbols: Underlying symbols to load
+            include_stale: Also return surfaces older than the surface TTL
+
+        Returns:
+            Dict mapping underlying symbol to IVSurface (missing ones omitted)
+        """
+        if not underlying_symbols:
+            return {}
+        try:
+            raw = await self._redis.mget([self._surface_key(s) for s in underlying_symbols])
+        except Exception as e:
+            logger.warning(f"Error reading IV surfaces: {e}")
+            return {}
+        return self._decode_surfaces(underlying_symbols, raw, include_stale)
+
+    def _decode_surfaces(
+        self,
+        underlying_symbols: list[str],
+        raw: list[str | None],
+        include_stale: bool,
+    ) -> dict[str, IVSurface]:
+        """Parse mget results into surfaces, skipping missing and corrupt ones."""
+        surfaces: dict[str, IVSurface] = {}
+        for symbol, data in zip(underlying_symbols, raw, strict=True):
+            if data is None:
+                continue
+            try:
+                surface = IVSurface.from_json(data)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Corrupt IV surface for {symbol}: {e}")
+                continue
+            if include_stale or not surface.is_stale(SURFACE_TTL_SECONDS):
+                surfaces[symbol] = surface
+        return surfaces
 
     async def get_underlying_iv(self, underlying_symbol: str) -> Decimal | None:
         """Get cached average IV for an underlying.
@@ -195,18 +387,25 @@ class IVCacheManager:
         symbol: str,
         underlying_symbol: str,
         default_iv: Decimal = Decimal("0.30"),
+        strike: Decimal | None = None,
+        expiry: str | None = None,
+        underlying_price: Decimal | None = None,
     ) -> Decimal:
         """Get IV with fallback chain.
 
         Tries in order:
         1. Specific option IV cache
-        2. Underlying average IV cache
-        3. Default IV
+        2. Underlying IV surface, interpolated (needs strike and expiry)
+        3. Underlying average IV cache
+        4. Default IV
 
         Args:
             symbol: Option symbol
             underlying_symbol: Underlying symbol
             default_iv: Default IV if nothing cached
+            strike: Option strike, enables surface lookup
+            expiry: Option expiry as ISO string, enables surface lookup
+            underlying_price: Current spot for surface moneyness (optional)
 
         Returns:
             Best available IV estimate
@@ -216,6 +415,16 @@ class IVCacheManager:
         if entry and not entry.is_stale():
             return entry.implied_vol
 
+        # Try surface interpolation
+        if strike is not None and expiry:
+            surface = await self.get_surface(underlying_symbol)
+            if surface is not None:
+                iv = surface.interpolate(
+                    strike, expiry, underlying_price, datetime.now(timezone.utc).date()
+                )
+                if iv is not None:
+                    return iv
+
         # Try underlying cache
         underlying_iv = await self.get_underlying_iv(underlying_symbol)
         if underlying_iv is not None:
@@ -224,3 +433,82 @@ class IVCacheManager:
         # Fall back to default
         logger.debug(f"Using default IV {default_iv} for {symbol}")
         return default_iv
+
+    async def get_or_default_many(
+        self,
+        lookups: list[IVLookup],
+        default_iv: Decimal = Decimal("0.30"),
+    ) -> dict[str, Decimal]:
+        """Resolve IVs for many options with the get_or_default fallback chain.
+
+        Option IVs, surfaces and underlying averages are each loaded with a
+        single mget (only for options still unresolved) and surfaces are
+        interpolated in memory.
+
+        Args:
+            lookups: Options to resolve
+            default_iv: Default IV if nothing cached
+
+        Returns:
+            Dict mapping option symbol to its best available IV estimate
+        """
+        ivs: dict[str, Decimal] = {}
+        if not lookups:
+            return ivs
+
+        entries = await self._mget_entries([self._option_key(lk.symbol) for lk in lookups])
+        for lookup, entry in zip(lookups, entries, strict=True):
+            if entry is not None and not entry.is_stale():
+                ivs[lookup.symbol] = entry.implied_vol
+
+        pending = [lk for lk in lookups if lk.symbol not in ivs]
+        on_surface = [lk for lk in pending if lk.strike is not None and lk.expiry]
+        if on_surface:
+            surfaces = await self.get_surfaces(sorted({lk.underlying_symbol for lk in on_surface}))
+            today = datetime.now(timezone.utc).date()
+            for lookup in on_surface:
+                surface = surfaces.get(lookup.underlying_symbol)
+                if surface is None:
+                    continue
+                iv = surface.interpolate(
+                    lookup.strike,  # type: ignore[arg-type]
+                    lookup.expiry,  # type: ignore[arg-type]
+                    lookup.underlying_price,
+                    today,
+                )
+                if iv is not None:
+                    ivs[lookup.symbol] = iv
+
+        pending = [lk for lk in pending if lk.symbol not in ivs]
+        if pending:
+            underlyings = sorted({lk.underlying_symbol for lk in pending})
+            entries = await self._mget_entries([self._underlying_key(s) for s in underlyings])
+            underlying_ivs = {
+                symbol: entry.implied_vol
+                for symbol, entry in zip(underlyings, entries, strict=True)
+                if entry is not None and not entry.is_stale(UNDERLYING_IV_TTL_SECONDS)
+            }
+            for lookup in pending:
+                iv = underlying_ivs.get(lookup.underlying_symbol)
+                if iv is None:
+                    logger.debug(f"Using default IV {default_iv} for {lookup.symbol}")
+                    iv = default_iv
+                ivs[lookup.symbol] = iv
+        return ivs
+
+    async def _mget_entries(self, keys: list[str]) -> list[IVCacheEntry | None]:
+        """Load cache entries in one round trip; unreadable ones come back as None."""
+        try:
+            raw = await self._redis.mget(keys)
+        except Exception as e:
+            logger.warning(f"Error reading IV cache: {e}")
+            return [None] * len(keys)
+
+        entries: list[IVCacheEntry | None] = []
+        for key, data in zip(keys, raw, strict=True):
+            try:
+                entries.append(IVCacheEntry.from_json(data) if data is not None else None)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Corrupt IV cache entry {key}: {e}")
+                entries.append(None)
+        return entries
@@ -0,0 +1,424 @@
+"""Local implied volatility solver.
+
+Inverts Black-Scholes from option mid prices so fallback Greeks can use
+current IVs when Futu is unavailable, instead of stale cache entries or a
+flat default.
+
+This is a library: no quote feed in the service calls it yet. A caller
+holding option quotes runs LocalIVSolver.solve_and_cache to publish the
+solved IVs to IVCacheManager, where the model fallback reads them.
+
+The solver works on whole chains at once: every leg takes a safeguarded
+Newton step per iteration, and any leg whose Newton step would leave its
+current [low, high] bracket (or whose vega is too small to trust) takes a
+bisection step instead. The bracket always contains the root, so the
+iteration converges for every price within no-arbitrage bounds.
+
+Classes:
+    - OptionQuote: Option market quote used as solver input
+    - IVSolverDiagnostics: Convergence statistics for one solve
+    - IVSolveResult: Solved IV arrays plus diagnostics
+    - LocalIVSolver: Solves quote chains and feeds IVCacheManager
+
+Functions:
+    - solve_implied_vol_batch: Vectorized IV inversion over arrays
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from src.greeks.black_scholes import DAYS_PER_YEAR, calculate_bs_greeks_batch
+from src.greeks.iv_cache import IVCacheEntry
+
+if TYPE_CHECKING:
+    from src.greeks.iv_cache import IVCacheManager
+
+logger = logging.getLogger(__name__)
+
+# Solver defaults
+DEFAULT_TOLERANCE = 1e-6  # Absolute price error
+DEFAULT_MAX_ITERATIONS = 100
+VOL_LOWER_BOUND = 1e-4
+VOL_UPPER_BOUND = 5.0
+MIN_VEGA = 1e-8  # Raw vega (per 1.00 vol) below which Newton is not trusted
+
+
+@dataclass
+class IVSolverDiagnostics:
+    """Convergence statistics for one solve.
+
+    Attributes:
+        total: Number of legs submitted
+        converged: Legs whose price error is within tolerance
+        newton_only: Converged legs that never needed a bisection step
+        bisection_fallback: Converged legs that took at least one bisection step
+        rejected: Legs rejected up front (price outside no-arbitrage bounds)
+        not_converged: Valid legs still outside tolerance at max iterations
+        iterations: Iterations run (max over legs)
+        max_abs_error: Largest absolute price error among converged legs
+        elapsed_ms: Wall time of the solve in milliseconds
+    """
+
+    total: int = 0
+    converged: int = 0
+    newton_only: int = 0
+    bisection_fallback: int = 0
+    rejected: int = 0
+    not_converged: int = 0
+    iterations: int = 0
+    max_abs_error: float = 0.0
+    elapsed_ms: float = 0.0
+
+    @property
+    def convergence_rate(self) -> float:
+        """Fraction of submitted legs that converged."""
+        if self.total == 0:
+            return 1.0
+        return self.converged / self.total
+
+
+@dataclass
+class IVSolveResult:
+    """Result of a vectorized IV solve.
+
+    Attributes:
+        implied_vol: Solved IVs (NaN where not converged or rejected)
+        converged: Boolean mask of converged legs
+        iterations: Iterations taken per leg
+        abs_error: Absolute price error per leg at the final IV
+        diagnostics: Aggregate convergence statistics
+    """
+
+    implied_vol: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+    abs_error: np.ndarray
+    diagnostics: IVSolverDiagnostics
+
+
+def _bs_price_and_vega(
+    S: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    sigma: np.ndarray,
+    call: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Price and raw vega (per 1.00 vol change)."""
+    bs = calculate_bs_greeks_batch(S, K, T, r, sigma, call)
+    return bs.price, bs.vega * 100
+
+
+def solve_implied_vol_batch(
+    price: ArrayLike,
+    spot: ArrayLike,
+    strike: ArrayLike,
+    time_to_expiry_years: ArrayLike,
+    risk_free_rate: ArrayLike,
+    is_call: ArrayLike,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+) -> IVSolveResult:
+    """Solve Black-Scholes implied volatility for many options at once.
+
+    Args:
+        price: Observed option prices (e.g. mid)
+        spot: Underlying prices
+        strike: Strike prices
+        time_to_expiry_years: Times to expiration in years
+        risk_free_rate: Risk-free rates (decimal)
+        is_call: True for calls, False for puts
+        tolerance: Absolute price error at which a leg counts as converged
+        max_iterations: Iteration cap
+
+    Returns:
+        IVSolveResult with per-leg IVs and diagnostics
+    """
+    started = time.perf_counter()
+
+    P, S, K, T, r, call = (
+        np.array(a, copy=True)
+        for a in np.broadcast_arrays(
+            np.asarray(price, dtype=np.float64),
+            np.asarray(spot, dtype=np.float64),
+            np.asarray(strike, dtype=np.float64),
+            np.asarray(time_to_expiry_years, dtype=np.float64),
+            np.asarray(risk_free_rate, dtype=np.float64),
+            np.asarray(is_call, dtype=bool),
+        )
+    )
+    P, S, K, T, r, call = (a.ravel() for a in (P, S, K, T, r, call))
+    n = P.size
+
+    # No-arbitrage bounds: intrinsic (on the forward) <= price < upper bound
+    discounted_K = K * np.exp(-r * T)
+    lower_bound = np.where(
+        call, np.maximum(S - discounted_K, 0.0), np.maximum(discounted_K - S, 0.0)
+    )
+    upper_bound = np.where(call, S, discounted_K)
+    valid = np.isfinite(P) & (S > 0) & (K > 0) & (T > 0) & (P > lower_bound) & (P < upper_bound)
+
+    # Manaster-Koehler starting point, clipped into the search bracket
+    with np.errstate(divide="ignore", invalid="ignore"):
+        seed = np.sqrt(np.abs(np.log(S / K) + r * T) * 2.0 / T)
+    seed = np.where(np.isfinite(seed) & (seed > 0.01), seed, 0.3)
+
+    sigma = np.clip(seed, VOL_LOWER_BOUND, VOL_UPPER_BOUND)
+    low = np.full(n, VOL_LOWER_BOUND)
+    high = np.full(n, VOL_UPPER_BOUND)
+    iterations = np.zeros(n, dtype=np.int64)
+    abs_error = np.full(n, np.inf)
+    bisected = np.zeros(n, dtype=bool)
+    done = ~valid
+
+    iteration = 0
+    while iteration < max_iterations:
+        active = np.flatnonzero(~done)
+        if active.size == 0:
+            break
+        iteration += 1
+
+        s = sigma[active]
+        model_price, vega = _bs_price_and_vega(
+            S[active], K[active], T[active], r[active], s, call[active]
+        )
+        diff = model_price - P[active]
+        abs_error[active] = np.abs(diff)
+
+        hit = np.abs(diff) < tolerance
+        done[active[hit]] = True
+        iterations[active] = iteration
+
+        # Price is increasing in vol, so the sign of diff tightens the bracket
+        lo = np.where(diff < 0, s, low[active])
+        hi = np.where(diff > 0, s, high[active])
+        low[active] = lo
+        high[active] = hi
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = s - diff / vega
+        use_newton = (vega > MIN_VEGA) & (newton > lo) & (newton < hi)
+        step = np.where(use_newton, newton, 0.5 * (lo + hi))
+
+        pending = ~hit
+        sigma[active[pending]] = step[pending]
+        bisected[active[pending & ~use_newton]] = True
+
+    converged = valid & (abs_error < tolerance)
+    implied_vol = np.where(converged, sigma, np.nan)
+
+    diagnostics = IVSolverDiagnostics(
+        total=n,
+        converged=int(converged.sum()),
+        newton_only=int((converged & ~bisected).sum()),
+        bisection_fallback=int((converged & bisected).sum()),
+        rejected=int((~valid).sum()),
+        not_converged=int((valid & ~converged).sum()),
+        iterations=iteration,
+        max_abs_error=float(abs_error[converged].max()) if converged.any() else 0.0,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+    )
+
+    return IVSolveResult(
+        implied_vol=implied_vol,
+        converged=converged,
+        iterations=iterations,
+        abs_error=abs_error,
+        diagnostics=diagnostics,
+    )
+
+
+@dataclass
+class OptionQuote:
+    """Option market quote used as solver input.
+
+    Attributes:
+        symbol: Option symbol (e.g., "AAPL240119C00150000")
+        underlying_symbol: Underlying symbol (e.g., "AAPL")
+        option_type: "call" or "put"
+        strike: Option strike price
+        expiry: Expiration date as ISO string (e.g., "2024-01-19")
+        bid: Best bid
+        ask: Best ask
+        underlying_price: Underlying spot price
+    """
+
+    symbol: str
+    underlying_symbol: str
+    option_type: str  # "call" or "put"
+    strike: Decimal
+    expiry: str  # ISO date
+    bid: Decimal
+    ask: Decimal
+    underlying_price: Decimal
+
+    @property
+    def mid(self) -> Decimal | None:
+        """Mid price, or None for a crossed or one-sided quote."""
+        if self.bid <= 0 or self.ask <= 0 or self.ask < self.bid:
+            return None
+        return (self.bid + self.ask) / 2
+
+
+@dataclass
+class ChainSolveReport:
+    """IVs solved for a quote chain.
+
+    Attributes:
+        entries: Cache entries for converged legs
+        unsolved: Symbols that were skipped or did not converge
+        diagnostics: Solver convergence statistics
+    """
+
+    entries: list[IVCacheEntry] = field(default_factory=list)
+    unsolved: list[str] = field(default_factory=list)
+    diagnostics: IVSolverDiagnostics = field(default_factory=IVSolverDiagnostics)
+
+
+class LocalIVSolver:
+    """Solves implied volatility for quote chains and feeds IVCacheManager.
+
+    Usage:
+        solver = LocalIVSolver(iv_cache, risk_free_rate=Decimal("0.05"))
+        report = await solver.solve_and_cache(quotes)
+        logger.info(report.diagnostics)
+    """
+
+    def __init__(
+        self,
+        iv_cache: IVCacheManager | None = None,
+        risk_free_rate: Decimal = Decimal("0.05"),
+        tolerance: float = DEFAULT_TOLERANCE,
+        max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    ):
+        """Initialize the solver.
+
+        Args:
+            iv_cache: IV cache manager that solved IVs are written to
+            risk_free_rate: Risk-free rate (0.05 = 5%)
+            tolerance: Absolute price error for convergence
+            max_iterations: Iteration cap per solve
+        """
+        self._iv_cache = iv_cache
+        self._risk_free_rate = risk_free_rate
+        self._tolerance = tolerance
+        self._max_iterations = max_iterations
+
+    def _time_to_expiry_years(self, expiry: str, today: date) -> float:
+        """Calendar-day time to expiry, floored like ModelGreeksProvider."""
+        days = (date.fromisoformat(expiry) - today).days
+        if days <= 0:
+            return 0.001
+        return days / DAYS_PER_YEAR
+
+    def solve_chain(
+        self,
+        quotes: list[OptionQuote],
+        as_of: datetime | None = None,
+    ) -> ChainSolveReport:
+        """Solve IVs for a chain of quotes from their mid prices.
+
+        Args:
+            quotes: Option quotes (may span several underlyings)
+            as_of: Timestamp recorded on the cache entries (default: now)
+
+        Returns:
+            ChainSolveReport with cache entries and diagnostics
+        """
+        as_of = as_of or datetime.now(timezone.utc)
+        today = as_of.date()
+
+        usable: list[OptionQuote] = []
+        mids: list[float] = []
+        unsolved: list[str] = []
+        times: list[float] = []
+
+        for quote in quotes:
+            mid = quote.mid
+            if mid is None or quote.underlying_price <= 0:
+                unsolved.append(quote.symbol)
+                continue
+            try:
+                t = self._time_to_expiry_years(quote.expiry, today)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Invalid expiry {quote.expiry} for {quote.symbol}: {e}")
+                unsolved.append(quote.symbol)
+                continue
+            usable.append(quote)
+            mids.append(float(mid))
+            times.append(t)
+
+        if not usable:
+            return ChainSolveReport(
+                unsolved=unsolved,
+                diagnostics=IVSolverDiagnostics(rejected=len(unsolved), total=len(unsolved)),
+            )
+
+        result = solve_implied_vol_batch(
+            price=mids,
+            spot=[float(q.underlying_price) for q in usable],
+            strike=[float(q.strike) for q in usable],
+            time_to_expiry_years=times,
+            risk_free_rate=float(self._risk_free_rate),
+            is_call=[q.option_type == "call" for q in usable],
+            tolerance=self._tolerance,
+            max_iterations=self._max_iterations,
+        )
+
+        entries: list[IVCacheEntry] = []
+        ivs = result.implied_vol.round(6).tolist()
+        for quote, converged, iv in zip(usable, result.converged.tolist(), ivs, strict=True):
+            if not converged:
+                unsolved.append(quote.symbol)
+                continue
+            entries.append(
+                IVCacheEntry(
+                    symbol=quote.symbol,
+                    implied_vol=Decimal(str(iv)),
+                    underlying_price=quote.underlying_price,
+                    underlying_symbol=quote.underlying_symbol,
+                    as_of_ts=as_of,
+                    strike=quote.strike,
+                    expiry=quote.expiry,
+                )
+            )
+
+        diagnostics = result.diagnostics
+        skipped = len(quotes) - len(usable)
+        diagnostics.total += skipped
+        diagnostics.rejected += skipped
+
+        if diagnostics.not_converged:
+            logger.warning(
+                f"IV solver: {diagnostics.not_converged}/{diagnostics.total} legs did not converge"
+            )
+
+        return ChainSolveReport(entries=entries, unsolved=unsolved, diagnostics=diagnostics)
+
+    async def solve_and_cache(
+        self,
+        quotes: list[OptionQuote],
+        as_of: datetime | None = None,
+    ) -> ChainSolveReport:
+        """Solve IVs for a chain and write converged legs to the IV cache.
+
+        Args:
+            quotes: Option quotes
+            as_of: Timestamp recorded on the cache entries (default: now)
+
+        Returns:
+            ChainSolveReport with cache entries and diagnostics
+        """
+        report = self.solve_chain(quotes, as_of=as_of)
+        if self._iv_cache is not None and report.entries:
+            await self._iv_cache.set_many(report.entries)
+        return report
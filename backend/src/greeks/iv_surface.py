@@ -0,0 +1,208 @@
+"""Per-underlying implied volatility surface.
+
+Holds a sparse moneyness (K/S) × expiry grid of IVs for one underlying,
+built incrementally from cached option IVs, and answers IV queries for
+any strike/expiry by interpolation.
+
+Interpolation:
+    - Across moneyness: linear within an expiry, flat beyond the wings
+    - Across expiries: linear in total variance (σ²T), flat beyond the ends
+
+Serialized compactly as JSON arrays for Redis storage:
+    {"u": "AAPL", "s": 150.0, "ts": "...", "g": {"2024-01-19": [[m...], [iv...]]}}
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+# Moneyness grid resolution (1% of spot); nearby strikes share a cell
+MONEYNESS_STEP = 0.01
+DAYS_PER_YEAR = 365
+
+
+def _moneyness_bucket(strike: float, underlying_price: float) -> float:
+    """Snap K/S onto the grid."""
+    return round(round(strike / underlying_price / MONEYNESS_STEP) * MONEYNESS_STEP, 4)
+
+
+def _years_to(expiry: str, today: date) -> float:
+    """Calendar-day time to expiry, floored at one day."""
+    days = (date.fromisoformat(expiry) - today).days
+    return max(days, 1) / DAYS_PER_YEAR
+
+
+def _interp_smile(moneyness: list[float], ivs: list[float], m: float) -> float:
+    """Linear interpolation across moneyness, flat beyond the wings."""
+    if m <= moneyness[0]:
+        return ivs[0]
+    if m >= moneyness[-1]:
+        return ivs[-1]
+    i = bisect.bisect_right(moneyness, m)
+    m0, m1 = moneyness[i - 1], moneyness[i]
+    w = (m - m0) / (m1 - m0)
+    return ivs[i - 1] + w * (ivs[i] - ivs[i - 1])
+
+
+class IVSurface:
+    """Sparse IV grid for one underlying.
+
+    Usage:
+        surface = IVSurface("AAPL")
+        surface.add_point(strike, expiry, iv, underlying_price, as_of_ts)
+        iv = surface.interpolate(strike, expiry)
+
+    Attributes:
+        underlying_symbol: Underlying symbol
+        underlying_price: Spot at the most recent update
+        as_of_ts: Timestamp of the most recent update
+    """
+
+    def __init__(
+        self,
+        underlying_symbol: str,
+        underlying_price: float = 0.0,
+        as_of_ts: datetime | None = None,
+    ):
+        """Initialize an empty surface.
+
+        Args:
+            underlying_symbol: Underlying symbol (e.g., "AAPL")
+            underlying_price: Spot at the most recent update
+            as_of_ts: Timestamp of the most recent update
+        """
+        self.underlying_symbol = underlying_symbol
+        self.underlying_price = underlying_price
+        self.as_of_ts = as_of_ts or datetime.now(timezone.utc)
+        # expiry (ISO) -> {moneyness bucket: iv}
+        self._grid: dict[str, dict[float, float]] = {}
+
+    def __len__(self) -> int:
+        """Number of populated grid cells."""
+        return sum(len(smile) for smile in self._grid.values())
+
+    @property
+    def expiries(self) -> list[str]:
+        """Populated expiries, sorted."""
+        return sorted(self._grid)
+
+    def add_point(
+        self,
+        strike: Decimal,
+        expiry: str,
+        implied_vol: Decimal,
+        underlying_price: Decimal,
+        as_of_ts: datetime,
+    ) -> None:
+        """Add or overwrite one grid cell.
+
+        Args:
+            strike: Option strike price
+            expiry: Expiration date as ISO string
+            implied_vol: Option implied vol
+            underlying_price: Spot when the IV was observed
+            as_of_ts: Timestamp of the IV observation
+        """
+        spot = float(underlying_price)
+        iv = float(implied_vol)
+        if spot <= 0 or iv <= 0 or strike <= 0:
+            return
+
+        m = _moneyness_bucket(float(strike), spot)
+        self._grid.setdefault(expiry, {})[m] = iv
+
+        if as_of_ts >= self.as_of_ts or self.underlying_price <= 0:
+            self.as_of_ts = as_of_ts
+            self.underlying_price = spot
+
+    def prune_expired(self, today: date) -> None:
+        """Drop expiries on or before today."""
+        for expiry in [e for e in self._grid if date.fromisoformat(e) <= today]:
+            del self._grid[expiry]
+
+    def is_stale(self, max_age_seconds: int) -> bool:
+        """Check if the surface has not been updated recently."""
+        age = (datetime.now(timezone.utc) - self.as_of_ts).total_seconds()
+        return age > max_age_seconds
+
+    def interpolate(
+        self,
+        strike: Decimal,
+        expiry: str,
+        underlying_price: Decimal | None = None,
+        today: date | None = None,
+    ) -> Decimal | None:
+        """Interpolate IV for a strike/expiry.
+
+        Args:
+            strike: Option strike price
+            expiry: Expiration date as ISO string
+            underlying_price: Current spot (default: spot at last update)
+            today: Valuation date (default: today in UTC, as surfaces are pruned)
+
+        Returns:
+            Interpolated IV, or None if the surface is empty
+        """
+        today = today or datetime.now(timezone.utc).date()
+        live = [e for e in self.expiries if date.fromisoformat(e) > today]
+        if not live:
+            return None
+
+        spot = float(underlying_price) if underlying_price else self.underlying_price
+        if spot <= 0 or strike <= 0:
+            return None
+        m = float(strike) / spot
+
+        def smile_iv(e: str) -> float:
+            points = sorted(self._grid[e].items())
+            return _interp_smile([p[0] for p in points], [p[1] for p in points], m)
+
+        if expiry in self._grid and expiry in live:
+            iv = smile_iv(expiry)
+        else:
+            t = _years_to(expiry, today)
+            times = [_years_to(e, today) for e in live]
+            if t <= times[0]:
+                iv = smile_iv(live[0])
+            elif t >= times[-1]:
+                iv = smile_iv(live[-1])
+            else:
+                i = bisect.bisect_right(times, t)
+                t0, t1 = times[i - 1], times[i]
+                w0 = smile_iv(live[i - 1]) ** 2 * t0
+                w1 = smile_iv(live[i]) ** 2 * t1
+                total_var = w0 + (t - t0) / (t1 - t0) * (w1 - w0)
+                iv = math.sqrt(max(total_var, 0.0) / t)
+
+        return Decimal(str(round(iv, 6)))
+
+    def to_json(self) -> str:
+        """Serialize to compact JSON."""
+        grid = {}
+        for expiry, smile in self._grid.items():
+            points = sorted(smile.items())
+            grid[expiry] = [[p[0] for p in points], [round(p[1], 6) for p in points]]
+        data = {
+            "u": self.underlying_symbol,
+            "s": self.underlying_price,
+            "ts": self.as_of_ts.isoformat(),
+            "g": grid,
+        }
+        return json.dumps(data, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, json_str: str) -> IVSurface:
+        """Deserialize from compact JSON."""
+        data = json.loads(json_str)
+        surface = cls(
+            underlying_symbol=data["u"],
+            underlying_price=data["s"],
+            as_of_ts=datetime.fromisoformat(data["ts"]),
+        )
+        for expiry, (moneyness, ivs) in data["g"].items():
+            surface._grid[expiry] = dict(zip(moneyness, ivs, strict=True))
+        return surface
@@ -224,6 +224,7 @@ class PositionGreeks:
         staleness_seconds: How stale the data is in seconds
         as_of_ts: Timestamp when Greeks were calculated/fetched
         strategy_id: Optional strategy this position belongs to
+        implied_vol: Implied volatility used/reported by the provider (optional)
     """
 
     # Position identification
@@ -265,6 +266,9 @@ class PositionGreeks:
     # Strategy assignment
     strategy_id: str | None = None
 
+    # Volatility input (for full-revaluation scenarios)
+    implied_vol: Decimal | None = None
+
     @property
     def notional(self) -> Decimal:
         """Compute notional value of the position.
@@ -20,11 +20,22 @@ from decimal import Decimal
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.greeks.aggregator import GreeksAggregator
+from src.greeks.aggregator import (
+    METRIC_FIELD_MAP,
+    ContributorInfo,
+    GreeksAggregator,
+    StatefulGreeksAggregator,
+)
 from src.greeks.alerts import AlertEngine, GreeksAlert
 from src.greeks.calculator import GreeksCalculator, PositionInfo
-from src.greeks.models import AggregatedGreeks, GreeksLimitsConfig
+from src.greeks.incremental import (
+    IncrementalGreeksCalculator,
+    IncrementalStats,
+    RecomputeTolerance,
+)
+from src.greeks.models import AggregatedGreeks, GreeksLimitsConfig, PositionGreeks, RiskMetric
 from src.greeks.repository import GreeksRepository
+from src.greeks.scenario_grid import ScenarioGridConfig, ScenarioGridResult, calculate_scenario_grid
 from src.greeks.websocket import greeks_ws_manager
 from src.models.position import AssetType, Position, PositionStatus
 
@@ -41,12 +52,16 @@ class MonitorResult:
         strategy_greeks: Dict mapping strategy_id to aggregated Greeks
         alerts: List of generated alerts
         snapshot_saved: Whether the snapshot was persisted to database
+        incremental_stats: Recompute/reuse counters (incremental mode only)
+        scenario_grid: Full-revaluation scenario grid (if configured)
     """
 
     account_greeks: AggregatedGreeks
     strategy_greeks: dict[str, AggregatedGreeks]
     alerts: list[GreeksAlert]
     snapshot_saved: bool
+    incremental_stats: IncrementalStats | None = None
+    scenario_grid: ScenarioGridResult | None = None
 
 
 class GreeksMonitor:
@@ -58,6 +73,14 @@ class GreeksMonitor:
     - AlertEngine: Detects threshold breaches
     - Repository: Persists snapshots and alerts
 
+    In incremental mode, positions are only recalculated when their
+    underlying price, IV or time bucket moved beyond tolerance; cached
+    PositionGreeks are reused otherwise and the account/strategy aggregates
+    are updated by deltas for the recomputed legs only.
+
+    If a scenario grid config is given, every cycle also fully reprices the
+    book across the grid and checks projected Greeks against hard limits.
+
     Attributes:
         _account_id: Account identifier
         _config: Greeks limits configuration
@@ -66,6 +89,8 @@ class GreeksMonitor:
         _alert_engine: Alert engine instance
         _repository: Optional repository for persistence
         _current_greeks: Most recent calculated account Greeks
+        _incremental: Incremental calculator (None unless incremental mode)
+        _state: Delta-maintained aggregates (None unless incremental mode)
     """
 
     def __init__(
@@ -76,6 +101,9 @@ class GreeksMonitor:
         aggregator: GreeksAggregator,
         alert_engine: AlertEngine,
         repository: GreeksRepository | None = None,
+        incremental: bool = False,
+        recompute_tolerance: RecomputeTolerance | None = None,
+        scenario_config: ScenarioGridConfig | None = None,
     ):
         """Initialize the GreeksMonitor.
 
@@ -86,6 +114,9 @@ class GreeksMonitor:
             aggregator: GreeksAggregator for portfolio/strategy aggregation
             alert_engine: AlertEngine for threshold breach detection
             repository: Optional GreeksRepository for persistence
+            incremental: Enable incremental recompute mode
+            recompute_tolerance: Recompute thresholds for incremental mode
+            scenario_config: Scenario grid axes; enables the grid each cycle
         """
         self._account_id = account_id
         self._config = limits_config
@@ -94,11 +125,47 @@ class GreeksMonitor:
         self._alert_engine = alert_engine
         self._repository = repository
         self._current_greeks: AggregatedGreeks | None = None
+        self._incremental: IncrementalGreeksCalculator | None = None
+        self._state: StatefulGreeksAggregator | None = None
+        self._scenario_config = scenario_config
+        if incremental:
+            self._incremental = IncrementalGreeksCalculator(calculator, recompute_tolerance)
+            self._state = StatefulGreeksAggregator(account_id)
+
+    async def _calculate_incremental(
+        self,
+        positions: list[PositionInfo],
+        underlying_prices: dict[str, Decimal] | None,
+        implied_vols: dict[str, Decimal] | None,
+    ) -> tuple[
+        list[PositionGreeks], AggregatedGreeks, dict[str, AggregatedGreeks], IncrementalStats
+    ]:
+        """Recompute moved positions and apply them to the running aggregates."""
+        assert self._incremental is not None and self._state is not None
+
+        result = await self._incremental.calculate_async(positions, underlying_prices, implied_vols)
+        self._state.apply(upserts=result.recomputed, removals=result.removed)
+
+        account_greeks, strategy_greeks = self._state.snapshot(as_of_ts=result.as_of_ts)
+        return result.greeks, account_greeks, strategy_greeks, result.stats
+
+    def _scenario_limits(self) -> dict[str, Decimal]:
+        """Hard limits by dollar Greek field for scenario breach detection."""
+        return {
+            field_name: self._config.thresholds[metric].hard_threshold
+            for metric, field_name in METRIC_FIELD_MAP.items()
+            if metric in self._config.thresholds
+        }
 
-    async def check(self, positions: list[PositionInfo]) -> MonitorResult:
+    async def check(
+        self,
+        positions: list[PositionInfo],
+        underlying_prices: dict[str, Decimal] | None = None,
+        implied_vols: dict[str, Decimal] | None = None,
+    ) -> MonitorResult:
         """Run a full monitoring cycle.
 
-        1. Calculate Greeks for all positions
+        1. Calculate Greeks for all positions (only moved ones in incremental mode)
         2. Aggregate to account and strategy levels
         3. Get prev_greeks from repository for ROC
         4. Check for alerts
@@ -107,21 +174,44 @@ class GreeksMonitor:
 
         Args:
             positions: List of PositionInfo to monitor
+            underlying_prices: Current underlying prices, used by incremental
+                mode to detect moves (positions without a price are recomputed)
+            implied_vols: Current IVs by option symbol for incremental mode
 
         Returns:
             MonitorResult with all data
         """
-        # Step 1: Calculate Greeks for all positions
-        position_greeks = self._calculator.calculate(positions)
-
-        # Step 2: Aggregate to account and strategy levels
-        account_greeks, strategy_greeks = self._aggregator.aggregate_by_strategy(
-            position_greeks, self._account_id
-        )
+        incremental_stats: IncrementalStats | None = None
+        if self._incremental is not None:
+            # Steps 1-2: Recompute moved positions, update aggregates by delta
+            (
+                position_greeks,
+                account_greeks,
+                strategy_greeks,
+                incremental_stats,
+            ) = await self._calculate_incremental(positions, underlying_prices, implied_vols)
+        else:
+            # Step 1: Calculate Greeks for all positions
+            position_greeks = await self._calculator.calculate_async(positions)
+
+            # Step 2: Aggregate to account and strategy levels
+            account_greeks, strategy_greeks = self._aggregator.aggregate_by_strategy(
+                position_greeks, self._account_id
+            )
 
         # Cache the current Greeks
         self._current_greeks = account_greeks
 
+        # Full-revaluation scenario grid over the same legs
+        scenario_grid: ScenarioGridResult | None = None
+        if self._scenario_config is not None:
+            scenario_grid = calculate_scenario_grid(
+                position_greeks,
+                config=self._scenario_config,
+                limits=self._scenario_limits(),
+                implied_vols=implied_vols,
+            )
+
         # Step 3: Get prev_greeks from repository for ROC detection
         prev_greeks: AggregatedGreeks | None = None
         if self._repository is not None:
@@ -204,6 +294,8 @@ class GreeksMonitor:
             strategy_greeks=strategy_greeks,
             alerts=alerts,
             snapshot_saved=snapshot_saved,
+            incremental_stats=incremental_stats,
+            scenario_grid=scenario_grid,
         )
 
     def get_current_greeks(self) -> AggregatedGreeks | None:
@@ -214,6 +306,24 @@ class GreeksMonitor:
         """
         return self._current_greeks
 
+    def get_top_contributors(
+        self,
+        metric: RiskMetric,
+        top_n: int = 10,
+    ) -> list[ContributorInfo]:
+        """Get top contributors from the last cycle (incremental mode only).
+
+        Args:
+            metric: The RiskMetric to rank by
+            top_n: Number of top positions to return
+
+        Returns:
+            List of ContributorInfo, or empty list outside incremental mode
+        """
+        if self._state is None:
+            return []
+        return self._state.get_top_contributors(metric, top_n)
+
 
 async def load_positions_from_db(session: AsyncSession, account_id: str) -> list[PositionInfo]:
     """Load open positions from database and convert to PositionInfo.
@@ -292,6 +402,9 @@ def create_greeks_monitor(
     account_id: str,
     session: AsyncSession | None = None,
     config: GreeksLimitsConfig | None = None,
+    incremental: bool = False,
+    recompute_tolerance: RecomputeTolerance | None = None,
+    scenario_config: ScenarioGridConfig | None = None,
 ) -> GreeksMonitor:
     """Factory to create a fully configured GreeksMonitor.
 
@@ -302,6 +415,9 @@ def create_greeks_monitor(
         account_id: Account identifier
         session: Optional SQLAlchemy session for persistence
         config: Optional GreeksLimitsConfig (uses default if not provided)
+        incremental: Enable incremental recompute mode
+        recompute_tolerance: Recompute thresholds for incremental mode
+        scenario_config: Scenario grid axes; enables the grid each cycle
 
     Returns:
         Fully configured GreeksMonitor instance
@@ -326,4 +442,7 @@ def create_greeks_monitor(
         aggregator=aggregator,
         alert_engine=alert_engine,
         repository=repository,
+        incremental=incremental,
+        recompute_tolerance=recompute_tolerance,
+        scenario_config=scenario_config,
     )
@@ -5,19 +5,42 @@ related to Greeks snapshots and alerts.
 
 Classes:
     - GreeksRepository: Repository for persisting and retrieving Greeks data
+
+Functions:
+    - select_history_aggregate: Pick the continuous aggregate for a history interval
 """
 
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import Row, column, func, select, table, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import TableClause
 
 from src.greeks.alerts import GreeksAlert
 from src.greeks.models import AggregatedGreeks
 from src.greeks.v2_models import GreeksHistoryPoint
 from src.models.greeks import GreeksAlertRecord, GreeksSnapshot
 
+# Continuous aggregates over greeks_snapshots (migration 019), by bucket width
+HISTORY_AGGREGATES: dict[int, str] = {
+    60: "greeks_snapshots_1m",
+    900: "greeks_snapshots_15m",
+    3600: "greeks_snapshots_1h",
+}
+
+# Columns needed for history points; avoids materializing ORM objects
+_HISTORY_COLUMNS = (
+    GreeksSnapshot.as_of_ts,
+    GreeksSnapshot.dollar_delta,
+    GreeksSnapshot.gamma_dollar,
+    GreeksSnapshot.vega_per_1pct,
+    GreeksSnapshot.theta_per_day,
+    GreeksSnapshot.coverage_pct,
+)
+
 
 class GreeksRepository:
     """Repository for persisting and retrieving Greeks data.
@@ -264,6 +287,11 @@ class GreeksRepository:
 
         V2 Feature: GET /history support with time-bucket aggregation.
 
+        On TimescaleDB, buckets are computed in SQL with time_bucket, reading
+        from the coarsest continuous aggregate that evenly divides the
+        interval (see select_history_aggregate). Other databases fall back to
+        bucketing raw rows in Python.
+
         Args:
             scope: The scope type ("ACCOUNT" or "STRATEGY")
             scope_id: The scope identifier (account ID or strategy ID)
@@ -276,9 +304,13 @@ class GreeksRepository:
         Returns:
             List of GreeksHistoryPoint ordered by timestamp ascending
         """
+        if interval_seconds is not None and self._dialect_name() == "postgresql":
+            return await self._get_history_bucketed(
+                scope, scope_id, start_ts, end_ts, interval_seconds
+            )
 
         stmt = (
-            select(GreeksSnapshot)
+            select(*_HISTORY_COLUMNS)
             .where(
                 GreeksSnapshot.scope == scope,
                 GreeksSnapshot.scope_id == scope_id,
@@ -289,94 +321,210 @@ class GreeksRepository:
         )
 
         result = await self._session.execute(stmt)
-        snapshots = list(result.scalars().all())
+        rows = result.all()
 
-        if not snapshots:
+        if not rows:
             return []
 
         # If no interval, return raw data
         if interval_seconds is None:
             return [
                 GreeksHistoryPoint(
-                    ts=snapshot.as_of_ts,
-                    dollar_delta=snapshot.dollar_delta,
-                    gamma_dollar=snapshot.gamma_dollar,
-                    vega_per_1pct=snapshot.vega_per_1pct,
-                    theta_per_day=snapshot.theta_per_day,
-                    coverage_pct=snapshot.coverage_pct,
+                    ts=row.as_of_ts,
+                    dollar_delta=row.dollar_delta,
+                    gamma_dollar=row.gamma_dollar,
+                    vega_per_1pct=row.vega_per_1pct,
+                    theta_per_day=row.theta_per_day,
+                    coverage_pct=row.coverage_pct,
                     point_count=1,
                 )
-                for snapshot in snapshots
+                for row in rows
             ]
 
         # Aggregate into time buckets
-        return self._aggregate_snapshots(snapshots, interval_seconds)
+        return self._aggregate_snapshots(rows, interval_seconds)
 
-    def _aggregate_snapshots(
-        self, snapshots: list[GreeksSnapshot], interval_seconds: int
+    def _dialect_name(self) -> str:
+        """Name of the database dialect behind the session."""
+        return self._session.get_bind().dialect.name
+
+    async def _get_history_bucketed(
+        self,
+        scope: str,
+        scope_id: str,
+        start_ts: datetime,
+        end_ts: datetime,
+        interval_seconds: int,
     ) -> list[GreeksHistoryPoint]:
-        """Aggregate snapshots into time buckets.
+        """Bucket history in SQL with time_bucket.
 
-        Groups snapshots by time bucket and calculates AVG for all Greek values.
+        Reads the coarsest continuous aggregate that evenly divides the
+        interval and rolls its sums up; if none fits, buckets the raw
+        hypertable directly.
 
         Args:
-            snapshots: List of snapshots to aggregate (must be non-empty)
+            scope: The scope type ("ACCOUNT" or "STRATEGY")
+            scope_id: The scope identifier (account ID or strategy ID)
+            start_ts: Start of time range (inclusive)
+            end_ts: End of time range (inclusive)
             interval_seconds: Bucket size in seconds
 
         Returns:
             List of aggregated GreeksHistoryPoint ordered by timestamp
         """
-        from collections import defaultdict
-        from decimal import Decimal
-
-        # Group snapshots by bucket
-        buckets: dict[datetime, list[GreeksSnapshot]] = defaultdict(list)
-
-        for snapshot in snapshots:
-            # Calculate bucket start time
-            ts = snapshot.as_of_ts
-            bucket_ts = ts.replace(
-                second=(ts.second // interval_seconds) * interval_seconds
-                if interval_seconds < 60
-                else 0,
-                microsecond=0,
+        width = timedelta(seconds=interval_seconds)
+        aggregate = select_history_aggregate(interval_seconds)
+
+        if aggregate is not None:
+            view = _aggregate_view(aggregate)
+            bucket = func.time_bucket(width, view.c.bucket).label("ts")
+            count = func.sum(view.c.point_count)
+            stmt = (
+                select(
+                    bucket,
+                    (func.sum(view.c.sum_dollar_delta) / count).label("dollar_delta"),
+                    (func.sum(view.c.sum_gamma_dollar) / count).label("gamma_dollar"),
+                    (func.sum(view.c.sum_vega_per_1pct) / count).label("vega_per_1pct"),
+                    (func.sum(view.c.sum_theta_per_day) / count).label("theta_per_day"),
+                    (func.sum(view.c.sum_coverage_pct) / count).label("coverage_pct"),
+                    count.label("point_count"),
+                )
+                .where(
+                    view.c.scope == scope,
+                    view.c.scope_id == scope_id,
+                    view.c.bucket >= start_ts,
+                    view.c.bucket <= end_ts,
+                )
+                .group_by(bucket)
+                .order_by(bucket)
+            )
+        else:
+            bucket = func.time_bucket(width, GreeksSnapshot.as_of_ts).label("ts")
+            stmt = (
+                select(
+                    bucket,
+                    func.avg(GreeksSnapshot.dollar_delta).label("dollar_delta"),
+                    func.avg(GreeksSnapshot.gamma_dollar).label("gamma_dollar"),
+                    func.avg(GreeksSnapshot.vega_per_1pct).label("vega_per_1pct"),
+                    func.avg(GreeksSnapshot.theta_per_day).label("theta_per_day"),
+                    func.avg(GreeksSnapshot.coverage_pct).label("coverage_pct"),
+                    func.count().label("point_count"),
+                )
+                .where(
+                    GreeksSnapshot.scope == scope,
+                    GreeksSnapshot.scope_id == scope_id,
+                    GreeksSnapshot.as_of_ts >= start_ts,
+                    GreeksSnapshot.as_of_ts <= end_ts,
+                )
+                .group_by(bucket)
+                .order_by(bucket)
+            )
+
+        result = await self._session.execute(stmt)
+        return [
+            GreeksHistoryPoint(
+                ts=row.ts,
+                dollar_delta=Decimal(row.dollar_delta),
+                gamma_dollar=Decimal(row.gamma_dollar),
+                vega_per_1pct=Decimal(row.vega_per_1pct),
+                theta_per_day=Decimal(row.theta_per_day),
+                coverage_pct=Decimal(row.coverage_pct),
+                point_count=int(row.point_count),
             )
-            # For intervals >= 1 minute, also bucket by minute
-            if interval_seconds >= 60:
-                minutes_per_bucket = interval_seconds // 60
-                bucket_minute = (ts.minute // minutes_per_bucket) * minutes_per_bucket
-                bucket_ts = bucket_ts.replace(minute=bucket_minute)
-            # For intervals >= 1 hour, also bucket by hour
-            if interval_seconds >= 3600:
-                hours_per_bucket = interval_seconds // 3600
-                bucket_hour = (ts.hour // hours_per_bucket) * hours_per_bucket
-                bucket_ts = bucket_ts.replace(hour=bucket_hour, minute=0)
-
-            buckets[bucket_ts].append(snapshot)
-
-        # Aggregate each bucket
-        points = []
-        for bucket_ts in sorted(buckets.keys()):
-            bucket_snapshots = buckets[bucket_ts]
-            count = len(bucket_snapshots)
-
-            # Calculate averages
-            avg_dollar_delta = sum(s.dollar_delta for s in bucket_snapshots) / count
-            avg_gamma_dollar = sum(s.gamma_dollar for s in bucket_snapshots) / count
-            avg_vega_per_1pct = sum(s.vega_per_1pct for s in bucket_snapshots) / count
-            avg_theta_per_day = sum(s.theta_per_day for s in bucket_snapshots) / count
-            avg_coverage_pct = sum(s.coverage_pct for s in bucket_snapshots) / count
+            for row in result.all()
+        ]
+
+    def _aggregate_snapshots(
+        self, rows: Sequence[Row], interval_seconds: int
+    ) -> list[GreeksHistoryPoint]:
+        """Aggregate snapshot rows into time buckets (non-TimescaleDB fallback).
+
+        Buckets are aligned to the Unix epoch, matching time_bucket.
+
+        Args:
+            rows: Snapshot rows ordered by as_of_ts (must be non-empty)
+            interval_seconds: Bucket size in seconds
 
+        Returns:
+            List of aggregated GreeksHistoryPoint ordered by timestamp
+        """
+        points: list[GreeksHistoryPoint] = []
+        current_bucket: datetime | None = None
+        sums: list[Decimal] = []
+        count = 0
+
+        def flush() -> None:
+            assert current_bucket is not None
+            dollar_delta, gamma_dollar, vega, theta, coverage = (s / count for s in sums)
             points.append(
                 GreeksHistoryPoint(
-                    ts=bucket_ts,
-                    dollar_delta=Decimal(str(avg_dollar_delta)),
-                    gamma_dollar=Decimal(str(avg_gamma_dollar)),
-                    vega_per_1pct=Decimal(str(avg_vega_per_1pct)),
-                    theta_per_day=Decimal(str(avg_theta_per_day)),
-                    coverage_pct=Decimal(str(avg_coverage_pct)),
+                    ts=current_bucket,
+                    dollar_delta=dollar_delta,
+                    gamma_dollar=gamma_dollar,
+                    vega_per_1pct=vega,
+                    theta_per_day=theta,
+                    coverage_pct=coverage,
                     point_count=count,
                 )
             )
 
+        # Rows arrive ordered, so each bucket is one contiguous run
+        for row in rows:
+            bucket_ts = _bucket_start(row.as_of_ts, interval_seconds)
+            if bucket_ts != current_bucket:
+                if current_bucket is not None:
+                    flush()
+                current_bucket = bucket_ts
+                sums = [Decimal("0")] * 5
+                count = 0
+            sums[0] += row.dollar_delta
+            sums[1] += row.gamma_dollar
+            sums[2] += row.vega_per_1pct
+            sums[3] += row.theta_per_day
+            sums[4] += row.coverage_pct
+            count += 1
+        flush()
+
         return points
+
+
+def select_history_aggregate(interval_seconds: int) -> int | None:
+    """Pick the coarsest continuous aggregate that serves an interval.
+
+    An aggregate fits if its bucket width evenly divides the interval, so
+    every requested bucket is an exact union of aggregate buckets.
+
+    Args:
+        interval_seconds: Requested bucket size in seconds
+
+    Returns:
+        Aggregate bucket width in seconds, or None to bucket raw snapshots
+    """
+    for width in sorted(HISTORY_AGGREGATES, reverse=True):
+        if width <= interval_seconds and interval_seconds % width == 0:
+            return width
+    return None
+
+
+def _aggregate_view(width: int) -> TableClause:
+    """Lightweight table construct for a continuous aggregate view."""
+    return table(
+        HISTORY_AGGREGATES[width],
+        column("scope"),
+        column("scope_id"),
+        column("bucket"),
+        column("point_count"),
+        column("sum_dollar_delta"),
+        column("sum_gamma_dollar"),
+        column("sum_vega_per_1pct"),
+        column("sum_theta_per_day"),
+        column("sum_coverage_pct"),
+    )
+
+
+def _bucket_start(ts: datetime, interval_seconds: int) -> datetime:
+    """Epoch-aligned bucket start for a timestamp (naive values are UTC)."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    epoch = int(ts.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % interval_seconds, tz=timezone.utc)
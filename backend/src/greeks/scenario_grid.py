@@ -0,0 +1,278 @@
+"""Full-revaluation scenario grid for Greeks monitoring.
+
+The Taylor approximation in scenario.py (delta + gamma) misstates P&L for
+short-dated options and large moves. This module reprices every leg with
+Black-Scholes across a grid of:
+
+    spot shocks (%) × IV shocks (vol points) × time steps (days)
+
+in a single vectorized pass, and returns the P&L matrix, the projected
+dollar Greeks per scenario, and a breach map against hard limits.
+
+Conventions match convert_to_dollar_greeks:
+    - dollar_delta = delta × qty × multiplier × S
+    - gamma_dollar = gamma × qty × multiplier × S²
+    - vega_per_1pct = vega × qty × multiplier
+    - theta_per_day = theta × qty × multiplier
+"""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+
+from src.greeks.black_scholes import DAYS_PER_YEAR, calculate_bs_greeks_batch
+from src.greeks.models import PositionGreeks
+
+# Minimum time to expiry for live legs, same floor as ModelGreeksProvider
+MIN_TIME_TO_EXPIRY_YEARS = 0.001
+MIN_SHOCKED_IV = 0.01
+# Elements priced per batch call; keeps intermediates in cache on large books
+CHUNK_ELEMENTS = 16384
+
+GRID_DIMS = ("dollar_delta", "gamma_dollar", "vega_per_1pct", "theta_per_day")
+
+
+def _default_spot_shocks() -> list[Decimal]:
+    return [Decimal(x) for x in ("-10", "-5", "-3", "-2", "-1", "0", "1", "2", "3", "5", "10")]
+
+
+def _default_iv_shocks() -> list[Decimal]:
+    return [Decimal(x) for x in ("-5", "0", "5")]
+
+
+def _default_time_steps() -> list[int]:
+    return [0, 1]
+
+
+@dataclass
+class ScenarioGridConfig:
+    """Scenario grid axes.
+
+    Attributes:
+        spot_shocks_pct: Underlying price shocks in percent (1 = +1%)
+        iv_shocks_pts: Absolute IV shocks in vol points (5 = +5 vol = +0.05)
+        time_steps_days: Calendar days rolled forward (0 = now)
+        default_iv: IV for legs without one (decimal)
+        risk_free_rate: Risk-free rate (decimal)
+    """
+
+    spot_shocks_pct: list[Decimal] = field(default_factory=_default_spot_shocks)
+    iv_shocks_pts: list[Decimal] = field(default_factory=_default_iv_shocks)
+    time_steps_days: list[int] = field(default_factory=_default_time_steps)
+    default_iv: Decimal = Decimal("0.30")
+    risk_free_rate: Decimal = Decimal("0.05")
+
+    @property
+    def scenario_count(self) -> int:
+        """Number of grid points."""
+        return len(self.spot_shocks_pct) * len(self.iv_shocks_pts) * len(self.time_steps_days)
+
+
+@dataclass
+class ScenarioGridResult:
+    """Full-revaluation scenario grid result.
+
+    All matrices have shape (spot shocks, IV shocks, time steps).
+
+    Attributes:
+        config: Grid axes used
+        pnl: Total P&L vs. current value per scenario ($)
+        dollar_greeks: Projected dollar Greeks per scenario, by GRID_DIMS name
+        breaches: Per-dimension boolean matrices, True where |value| > hard limit
+        legs_priced: Number of legs included
+        legs_skipped: Invalid legs excluded (no price/expiry)
+    """
+
+    config: ScenarioGridConfig
+    pnl: np.ndarray
+    dollar_greeks: dict[str, np.ndarray]
+    breaches: dict[str, np.ndarray]
+    legs_priced: int
+    legs_skipped: int
+
+    @property
+    def breach_any(self) -> np.ndarray:
+        """Boolean matrix, True where any dimension breaches."""
+        result = np.zeros(self.pnl.shape, dtype=bool)
+        for mask in self.breaches.values():
+            result |= mask
+        return result
+
+    def worst_case(self) -> tuple[float, tuple[Decimal, Decimal, int]]:
+        """Largest loss and the scenario (spot %, IV pts, days) producing it."""
+        i, j, k = np.unravel_index(int(np.argmin(self.pnl)), self.pnl.shape)
+        return float(self.pnl[i, j, k]), (
+            self.config.spot_shocks_pct[i],
+            self.config.iv_shocks_pts[j],
+            self.config.time_steps_days[k],
+        )
+
+    def breach_map(self) -> list[tuple[Decimal, Decimal, int, list[str]]]:
+        """Scenarios with at least one breach, as (spot %, IV pts, days, dims)."""
+        result = []
+        for i, j, k in itertools.product(*(range(n) for n in self.pnl.shape)):
+            dims = [dim for dim, mask in self.breaches.items() if mask[i, j, k]]
+            if dims:
+                result.append(
+                    (
+                        self.config.spot_shocks_pct[i],
+                        self.config.iv_shocks_pts[j],
+                        self.config.time_steps_days[k],
+                        dims,
+                    )
+                )
+        return result
+
+
+def calculate_scenario_grid(
+    positions: list[PositionGreeks],
+    config: ScenarioGridConfig | None = None,
+    limits: dict[str, Decimal] | None = None,
+    implied_vols: dict[str, Decimal] | None = None,
+    today: date | None = None,
+) -> ScenarioGridResult:
+    """Fully reprice every leg across the scenario grid.
+
+    IV per leg: implied_vols[symbol], else PositionGreeks.implied_vol, else
+    config.default_iv.
+
+    Args:
+        positions: Position Greeks (invalid legs are skipped)
+        config: Grid axes (defaults if not provided)
+        limits: Hard limits by GRID_DIMS name for breach detection
+        implied_vols: Optional IV overrides by option symbol
+        today: Valuation date (default: today)
+
+    Returns:
+        ScenarioGridResult with P&L matrix and breach map
+    """
+    config = config or ScenarioGridConfig()
+    limits = limits or {}
+    implied_vols = implied_vols or {}
+    today = today or date.today()
+    shape = (
+        len(config.spot_shocks_pct),
+        len(config.iv_shocks_pts),
+        len(config.time_steps_days),
+    )
+
+    spot: list[float] = []
+    strike: list[float] = []
+    years: list[float] = []
+    iv: list[float] = []
+    is_call: list[bool] = []
+    weight: list[float] = []
+    skipped = 0
+    days_by_expiry: dict[str, int | None] = {}
+
+    for pg in positions:
+        if not pg.valid or pg.underlying_price <= 0:
+            skipped += 1
+            continue
+        if pg.expiry not in days_by_expiry:
+            try:
+                days_by_expiry[pg.expiry] = (date.fromisoformat(pg.expiry) - today).days
+            except (ValueError, TypeError):
+                days_by_expiry[pg.expiry] = None
+        days = days_by_expiry[pg.expiry]
+        if days is None:
+            skipped += 1
+            continue
+        leg_iv = implied_vols.get(pg.symbol) or pg.implied_vol or config.default_iv
+        spot.append(float(pg.underlying_price))
+        strike.append(float(pg.strike))
+        years.append(max(days / DAYS_PER_YEAR, MIN_TIME_TO_EXPIRY_YEARS))
+        iv.append(float(leg_iv))
+        is_call.append(pg.option_type == "call")
+        weight.append(float(pg.quantity * pg.multiplier))
+
+    if not spot:
+        zeros = np.zeros(shape)
+        return ScenarioGridResult(
+            config=config,
+            pnl=zeros,
+            dollar_greeks={dim: zeros.copy() for dim in GRID_DIMS},
+            breaches={dim: np.zeros(shape, dtype=bool) for dim in limits if dim in GRID_DIMS},
+            legs_priced=0,
+            legs_skipped=skipped,
+        )
+
+    S = np.asarray(spot)
+    K = np.asarray(strike)
+    T = np.asarray(years)
+    sigma = np.asarray(iv)
+    call = np.asarray(is_call)
+    w = np.asarray(weight)
+    r = float(config.risk_free_rate)
+
+    base_price = calculate_bs_greeks_batch(S, K, T, r, sigma, call).price
+
+    # Scenario axes flattened to (m, 1) so every leg broadcasts along axis 1
+    spot_grid, iv_grid, day_grid = np.meshgrid(
+        np.asarray([float(x) / 100 for x in config.spot_shocks_pct]),
+        np.asarray([float(x) / 100 for x in config.iv_shocks_pts]),
+        np.asarray([d / DAYS_PER_YEAR for d in config.time_steps_days], dtype=np.float64),
+        indexing="ij",
+    )
+    spot_mult = 1.0 + spot_grid.reshape(-1, 1)
+    iv_shift = iv_grid.reshape(-1, 1)
+    time_roll = day_grid.reshape(-1, 1)
+
+    m = spot_mult.shape[0]
+    pnl = np.empty(m)
+    delta_sum = np.empty(m)
+    gamma_sum = np.empty(m)
+    vega_sum = np.empty(m)
+    theta_sum = np.empty(m)
+    w_S = w * S
+    w_S2 = w_S * S
+    base_value = float(base_price @ w)
+
+    # Price in blocks of scenarios so the temporaries stay cache-sized
+    rows = max(1, CHUNK_ELEMENTS // len(S))
+    for start in range(0, m, rows):
+        block = slice(start, start + rows)
+        rolled = T - time_roll[block]
+        shocked = calculate_bs_greeks_batch(
+            S * spot_mult[block],
+            K,
+            np.maximum(rolled, 0.0),  # legs rolled past expiry value at intrinsic
+            r,
+            np.maximum(sigma + iv_shift[block], MIN_SHOCKED_IV),
+            call,
+        )
+        # Weighted sums over legs as matrix-vector products
+        pnl[block] = shocked.price @ w - base_value
+        delta_sum[block] = shocked.delta @ w_S
+        gamma_sum[block] = shocked.gamma @ w_S2
+        vega_sum[block] = shocked.vega @ w
+        theta_sum[block] = shocked.theta @ w
+
+    # S_s = S × spot_mult, so the spot factors come out per scenario
+    mult = spot_mult[:, 0]
+    pnl = pnl.reshape(shape)
+    dollar_greeks = {
+        "dollar_delta": (mult * delta_sum).reshape(shape),
+        "gamma_dollar": (mult * mult * gamma_sum).reshape(shape),
+        "vega_per_1pct": vega_sum.reshape(shape),
+        "theta_per_day": theta_sum.reshape(shape),
+    }
+    breaches = {
+        dim: np.abs(dollar_greeks[dim]) > float(limit)
+        for dim, limit in limits.items()
+        if dim in dollar_greeks
+    }
+
+    return ScenarioGridResult(
+        config=config,
+        pnl=pnl,
+        dollar_greeks=dollar_greeks,
+        breaches=breaches,
+        legs_priced=len(spot),
+        legs_skipped=skipped,
+    )
@@ -1,10 +1,24 @@
 """WebSocket manager for real-time Greeks updates.
 
 Manages WebSocket connections and broadcasts Greeks updates to connected clients.
+
+Broadcasts never wait on clients. Each update is serialized once and handed to
+a per-connection sender task through a bounded queue:
+
+    - A new connection first receives a full snapshot (type "greeks_update")
+    - Later updates are delta frames (type "greeks_delta") with only the
+      fields that changed since the previous update
+    - If a connection's queue fills up, its pending Greeks frames are dropped
+      and replaced by a single latest-wins snapshot (degraded mode)
+    - A connection that keeps degrading, overflows on alerts, or stalls on a
+      single send is disconnected
 """
 
 import asyncio
+import json
 import logging
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
@@ -12,6 +26,112 @@ from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# WebSocket close code for a server-side slow consumer drop ("try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+def _dumps(message: dict[str, Any]) -> str:
+    """Serialize a frame the same way Starlette's send_json does."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _diff(
+    old: dict[str, Any], new: dict[str, Any], path: tuple[str, ...] = ()
+) -> tuple[dict[str, Any], list[list[str]]]:
+    """Compute changed fields and removed key paths between two nested dicts.
+
+    Args:
+        old: Previous state
+        new: Current state
+        path: Key path prefix (for recursion)
+
+    Returns:
+        Tuple of (changed fields as a nested dict, removed key paths)
+    """
+    changed: dict[str, Any] = {}
+    removed: list[list[str]] = []
+    for key, value in new.items():
+        previous = old.get(key)
+        if isinstance(value, dict) and isinstance(previous, dict):
+            sub_changed, sub_removed = _diff(previous, value, (*path, key))
+            if sub_changed:
+                changed[key] = sub_changed
+            removed.extend(sub_removed)
+        elif key not in old or previous != value:
+            changed[key] = value
+    for key in old:
+        if key not in new:
+            removed.append([*path, key])
+    return changed, removed
+
+
+@dataclass
+class BroadcastStats:
+    """Broadcast counters across all connections.
+
+    Attributes:
+        updates: Greeks updates broadcast
+        frames_queued: Frames handed to connection queues
+        frames_sent: Frames written to sockets
+        frames_dropped: Greeks frames dropped from full queues
+        resyncs: Times a connection fell back to a snapshot
+        slow_disconnects: Connections dropped as slow consumers
+    """
+
+    updates: int = 0
+    frames_queued: int = 0
+    frames_sent: int = 0
+    frames_dropped: int = 0
+    resyncs: int = 0
+    slow_disconnects: int = 0
+
+
+@dataclass
+class _AccountStream:
+    """Latest broadcast state for one account."""
+
+    state: dict[str, Any]
+    seq: int
+    timestamp: str
+    snapshot_text: str | None = None
+
+    def snapshot(self, account_id: str) -> str:
+        """Full-state frame for the current seq, serialized at most once."""
+        if self.snapshot_text is None:
+            self.snapshot_text = _dumps(
+                {
+                    "type": "greeks_update",
+                    "account_id": account_id,
+                    "timestamp": self.timestamp,
+                    "seq": self.seq,
+                    "data": self.state,
+                }
+            )
+        return self.snapshot_text
+
+
+class _ClientConnection:
+    """One WebSocket client with its bounded send queue and sender task."""
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        # (kind, text) with kind "greeks" or "alert"
+        self.frames: deque[tuple[str, str]] = deque()
+        # Latest-wins snapshot; set on connect and while degraded
+        self.pending_snapshot: str | None = None
+        self.resyncs = 0
+        self.sending = False
+        self.wakeup = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    @property
+    def backlog(self) -> int:
+        return len(self.frames) + (self.pending_snapshot is not None)
+
+    @property
+    def idle(self) -> bool:
+        return not self.sending and not self.backlog
+
 
 class GreeksWebSocketManager:
     """Manages WebSocket connections for Greeks updates.
@@ -30,27 +150,50 @@ class GreeksWebSocketManager:
         except WebSocketDisconnect:
             await manager.disconnect(account_id, websocket)
 
-        # In monitor loop
+        # In monitor loop (returns without waiting on clients)
         await manager.broadcast_greeks_update(account_id, greeks_data)
     """
 
-    def __init__(self):
-        """Initialize the WebSocket manager."""
-        # account_id -> list of WebSocket connections
-        self._connections: dict[str, list[WebSocket]] = {}
+    def __init__(
+        self,
+        max_queue_size: int = 32,
+        max_resyncs: int = 5,
+        send_timeout_seconds: float = 5.0,
+    ):
+        """Initialize the WebSocket manager.
+
+        Args:
+            max_queue_size: Frames buffered per connection before degrading
+            max_resyncs: Consecutive degradations before disconnecting
+            send_timeout_seconds: Max time for a single socket send
+        """
+        # account_id -> {websocket: connection}
+        self._connections: dict[str, dict[WebSocket, _ClientConnection]] = {}
+        self._streams: dict[str, _AccountStream] = {}
         self._lock = asyncio.Lock()
+        self._max_queue_size = max_queue_size
+        self._max_resyncs = max_resyncs
+        self._send_timeout = send_timeout_seconds
+        self.stats = BroadcastStats()
+        self._background: set[asyncio.Task] = set()
 
     async def connect(self, account_id: str, websocket: WebSocket) -> None:
         """Register a new WebSocket connection.
 
+        The client is queued the latest snapshot, if any, before deltas.
+
         Args:
             account_id: Account identifier
             websocket: WebSocket connection
         """
         async with self._lock:
-            if account_id not in self._connections:
-                self._connections[account_id] = []
-            self._connections[account_id].append(websocket)
+            conn = _ClientConnection(websocket)
+            stream = self._streams.get(account_id)
+            if stream is not None:
+                conn.pending_snapshot = stream.snapshot(account_id)
+                conn.wakeup.set()
+            conn.task = asyncio.create_task(self._sender(account_id, conn))
+            self._connections.setdefault(account_id, {})[websocket] = conn
             logger.info(f"WebSocket connected for account {account_id}")
 
     async def disconnect(self, account_id: str, websocket: WebSocket) -> None:
@@ -61,17 +204,20 @@ class GreeksWebSocketManager:
             websocket: WebSocket connection to remove
         """
         async with self._lock:
-            if account_id in self._connections:
-                try:
-                    self._connections[account_id].remove(websocket)
-                except ValueError:
-                    pass  # Already removed
+            conns = self._connections.get(account_id)
+            if conns is None:
+                return
+            conn = conns.pop(websocket, None)
 
-                # Clean up empty lists
-                if not self._connections[account_id]:
-                    del self._connections[account_id]
+            # Clean up empty accounts
+            if not conns:
+                del self._connections[account_id]
 
-                logger.info(f"WebSocket disconnected for account {account_id}")
+        if conn is None:
+            return  # Already removed
+        if conn.task is not None and conn.task is not asyncio.current_task():
+            conn.task.cancel()
+        logger.info(f"WebSocket disconnected for account {account_id}")
 
     async def broadcast_greeks_update(
         self,
@@ -80,36 +226,51 @@ class GreeksWebSocketManager:
     ) -> None:
         """Broadcast Greeks update to all connected clients for an account.
 
+        Serializes one delta frame against the previous update and queues it
+        on every connection; does not wait for any send.
+
         Args:
             account_id: Account identifier
             data: Greeks data to broadcast
         """
-        if account_id not in self._connections:
+        timestamp = datetime.now(timezone.utc).isoformat()
+        previous = self._streams.get(account_id)
+        stream = _AccountStream(
+            state=data,
+            seq=previous.seq + 1 if previous else 1,
+            timestamp=timestamp,
+        )
+        self._streams[account_id] = stream
+        self.stats.updates += 1
+
+        conns = self._connections.get(account_id)
+        if not conns:
             return
 
-        message = {
-            "type": "greeks_update",
-            "account_id": account_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "data": data,
-        }
-
-        # Get connections snapshot to avoid modification during iteration
-        async with self._lock:
-            connections = list(self._connections.get(account_id, []))
-
-        # Broadcast to all connections
-        disconnected = []
-        for websocket in connections:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.warning(f"Error sending to WebSocket: {e}")
-                disconnected.append(websocket)
-
-        # Clean up disconnected clients
-        for websocket in disconnected:
-            await self.disconnect(account_id, websocket)
+        delta_text: str | None = None
+        if previous is not None:
+            changed, removed = _diff(previous.state, data)
+            delta_text = _dumps(
+                {
+                    "type": "greeks_delta",
+                    "account_id": account_id,
+                    "timestamp": timestamp,
+                    "seq": stream.seq,
+                    "data": changed,
+                    "removed": removed,
+                }
+            )
+
+        for conn in list(conns.values()):
+            if conn.pending_snapshot is not None or delta_text is None:
+                # Not in sync with the previous update: latest snapshot wins
+                conn.pending_snapshot = stream.snapshot(account_id)
+            elif conn.backlog >= self._max_queue_size:
+                self._degrade(account_id, conn, stream)
+            else:
+                conn.frames.append(("greeks", delta_text))
+                self.stats.frames_queued += 1
+            conn.wakeup.set()
 
     async def broadcast_alert(
         self,
@@ -118,32 +279,114 @@ class GreeksWebSocketManager:
     ) -> None:
         """Broadcast a new alert to all connected clients.
 
+        Alerts are never dropped; a client whose queue is full of alerts is
+        disconnected as a slow consumer.
+
         Args:
             account_id: Account identifier
             alert: Alert data to broadcast
         """
-        if account_id not in self._connections:
+        conns = self._connections.get(account_id)
+        if not conns:
             return
 
-        message = {
-            "type": "greeks_alert",
-            "account_id": account_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "alert": alert,
-        }
+        text = _dumps(
+            {
+                "type": "greeks_alert",
+                "account_id": account_id,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "alert": alert,
+            }
+        )
+
+        for websocket, conn in list(conns.items()):
+            if conn.backlog >= self._max_queue_size:
+                self._drop_greeks_frames(conn)
+            if conn.backlog >= self._max_queue_size:
+                await self._drop_slow_consumer(account_id, websocket, "alert queue full")
+                continue
+            conn.frames.append(("alert", text))
+            self.stats.frames_queued += 1
+            conn.wakeup.set()
+
+    def _drop_greeks_frames(self, conn: _ClientConnection) -> int:
+        """Remove queued Greeks frames, keeping alerts in order."""
+        kept = deque(frame for frame in conn.frames if frame[0] != "greeks")
+        dropped = len(conn.frames) - len(kept)
+        conn.frames = kept
+        self.stats.frames_dropped += dropped
+        return dropped
+
+    def _degrade(self, account_id: str, conn: _ClientConnection, stream: _AccountStream) -> None:
+        """Replace a full queue's Greeks frames with the latest snapshot."""
+        self._drop_greeks_frames(conn)
+        conn.pending_snapshot = stream.snapshot(account_id)
+        conn.resyncs += 1
+        self.stats.resyncs += 1
+        if conn.resyncs > self._max_resyncs:
+            task = asyncio.create_task(
+                self._drop_slow_consumer(account_id, conn.websocket, "repeated resyncs")
+            )
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def _drop_slow_consumer(self, account_id: str, websocket: WebSocket, reason: str) -> None:
+        """Disconnect a client that cannot keep up."""
+        logger.warning(f"Dropping slow WebSocket consumer for account {account_id}: {reason}")
+        self.stats.slow_disconnects += 1
+        await self.disconnect(account_id, websocket)
+        try:
+            await websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception as e:
+            logger.debug(f"WebSocket already closed: {e}")
 
-        async with self._lock:
-            connections = list(self._connections.get(account_id, []))
+    async def _sender(self, account_id: str, conn: _ClientConnection) -> None:
+        """Drain one connection's queue to its socket."""
+        try:
+            while True:
+                await conn.wakeup.wait()
+                conn.wakeup.clear()
+                while conn.backlog:
+                    if conn.pending_snapshot is not None:
+                        text = conn.pending_snapshot
+                        conn.pending_snapshot = None
+                    else:
+                        _, text = conn.frames.popleft()
+                    conn.sending = True
+                    await asyncio.wait_for(conn.websocket.send_text(text), self._send_timeout)
+                    conn.sending = False
+                    self.stats.frames_sent += 1
+                conn.resyncs = 0
+        except asyncio.CancelledError:
+            raise
+        except TimeoutError:
+            await self._drop_slow_consumer(account_id, conn.websocket, "send timed out")
+        except Exception as e:
+            logger.warning(f"Error sending to WebSocket: {e}")
+            await self.disconnect(account_id, conn.websocket)
+
+    async def flush(self, account_id: str | None = None, timeout: float = 1.0) -> bool:
+        """Wait until queued frames have been sent.
 
-        disconnected = []
-        for websocket in connections:
-            try:
-                await websocket.send_json(message)
-            except Exception:
-                disconnected.append(websocket)
+        Args:
+            account_id: Account to wait for, or None for all
+            timeout: Max seconds to wait
 
-        for websocket in disconnected:
-            await self.disconnect(account_id, websocket)
+        Returns:
+            True if all queues drained within the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            if account_id is None:
+                conns = [c for group in self._connections.values() for c in group.values()]
+            else:
+                conns = list(self._connections.get(account_id, {}).values())
+            if all(c.idle for c in conns):
+                return True
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(0.001)
 
     def get_connection_count(self, account_id: str) -> int:
         """Get number of connected clients for an account.
@@ -154,7 +397,7 @@ class GreeksWebSocketManager:
         Returns:
             Number of connected WebSocket clients
         """
-        return len(self._connections.get(account_id, []))
+        return len(self._connections.get(account_id, {}))
 
 
 # Global instance for use across the application
@@ -1,22 +1,22 @@
 """Expiration checker for option positions.
 
 This module implements the ExpirationChecker class that:
-1. Scans option positions for upcoming expirations
+1. Scans option positions for upcoming expirations (filtered in SQL)
 2. Creates alerts for each applicable threshold
-3. Uses dedupe_key for idempotent alert creation
+3. Uses dedupe_key for idempotent alert creation, in one bulk write per run
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
+from typing import Any
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
 from src.alerts.factory import create_alert
-from src.alerts.models import AlertType
+from src.alerts.models import AlertEvent, AlertType
 from src.alerts.repository import AlertRepository
 from src.core.portfolio import PortfolioManager
-from src.models.position import AssetType
 from src.options.metrics import (
     alerts_created_total,
     alerts_deduped_total,
@@ -24,7 +24,11 @@ from src.options.metrics import (
     check_errors_total,
     expiration_check_runs_total,
 )
-from src.options.thresholds import ExpirationThreshold, get_applicable_thresholds
+from src.options.thresholds import (
+    MAX_THRESHOLD_DAYS,
+    ExpirationThreshold,
+    get_applicable_thresholds,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +37,7 @@ class ExpirationChecker:
     """Checks option positions for upcoming expirations and creates alerts.
 
     Responsibilities:
-    1. Scan all option positions for an account
+    1. Scan option positions expiring within the largest threshold
     2. Calculate days to expiry (DTE) using market timezone
     3. Create alerts for each applicable threshold
     4. Rely on dedupe_key for idempotent writes
@@ -82,18 +86,27 @@ class ExpirationChecker:
         }
 
         try:
-            # Get all positions and filter to options
-            positions = await self.portfolio.get_positions(account_id=account_id)
-            option_positions = [p for p in positions if p.asset_type == AssetType.OPTION]
-
             # Calculate "today" in market timezone
             today = datetime.now(self.market_tz).date()
+
+            # Only options expiring within the largest threshold come back;
+            # later ones are counted in SQL
+            positions, not_expiring_count = await self.portfolio.get_expiring_option_positions(
+                account_id=account_id,
+                through=today + timedelta(days=MAX_THRESHOLD_DAYS),
+            )
+            stats["positions_checked"] += not_expiring_count
+            stats["positions_not_expiring_soon"] += not_expiring_count
             logger.info(
-                f"run_id={run_id} checking {len(option_positions)} option positions "
-                f"relative to {today} ({self.market_tz})"
+                f"run_id={run_id} checking {len(positions)} option positions "
+                f"relative to {today} ({self.market_tz}), "
+                f"{not_expiring_count} expire later"
             )
 
-            for pos in option_positions:
+            # Build alerts for all positions, then persist them in one bulk write
+            pending: list[tuple[Any, ExpirationThreshold, int, AlertEvent]] = []
+
+            for pos in positions:
                 stats["positions_checked"] += 1
 
                 try:
@@ -121,8 +134,7 @@ class ExpirationChecker:
                     if not thresholds:
                         stats["positions_not_expiring_soon"] += 1
                         logger.debug(
-                            f"run_id={run_id} position {pos.id} "
-                            f"DTE={days_to_expiry} out of scope"
+                            f"run_id={run_id} position {pos.id} DTE={days_to_expiry} out of scope"
                         )
                         continue
 
@@ -137,26 +149,7 @@ class ExpirationChecker:
                                 days_to_expiry=days_to_expiry,
                                 account_id=account_id,
                             )
-
-                            # Idempotent write (dedupe_key handles duplicates)
-                            is_new, alert_id = await self.alert_repo.persist_alert(alert)
-
-                            if is_new:
-                                stats["alerts_created"] += 1
-                                alerts_created_total.inc()
-                                logger.info(
-                                    f"run_id={run_id} created alert: "
-                                    f"position_id={pos.id} symbol={pos.symbol} "
-                                    f"DTE={days_to_expiry} threshold={threshold.days}d "
-                                    f"alert_id={alert_id}"
-                                )
-                            else:
-                                stats["alerts_deduplicated"] += 1
-                                alerts_deduped_total.inc()
-                                logger.debug(
-                                    f"run_id={run_id} alert deduplicated: "
-                                    f"position_id={pos.id} threshold={threshold.days}d"
-                                )
+                            pending.append((pos, threshold, days_to_expiry, alert))
 
                         except Exception as e:
                             error_msg = (
@@ -173,6 +166,8 @@ class ExpirationChecker:
                     stats["errors"].append(error_msg)
                     check_errors_total.labels(error_type="position_processing").inc()
 
+            await self._persist_alerts(run_id, pending, stats)
+
             logger.info(
                 f"run_id={run_id} check complete: "
                 f"{stats['positions_checked']} checked, "
@@ -189,6 +184,68 @@ class ExpirationChecker:
             expiration_check_runs_total.labels(status="failed").inc()
             raise
 
+    async def _persist_alerts(
+        self,
+        run_id: str,
+        pending: list[tuple[Any, ExpirationThreshold, int, AlertEvent]],
+        stats: dict,
+    ) -> None:
+        """Persist built alerts with one idempotent bulk write and update stats.
+
+        If the bulk write fails, alerts are retried one at a time so a single
+        bad alert does not block the rest.
+
+        Args:
+            run_id: Check run identifier for logging
+            pending: (position, threshold, DTE, alert) for each alert to write
+            stats: Run statistics to update in place
+        """
+        if not pending:
+            return
+
+        try:
+            # Idempotent write (dedupe_key handles duplicates)
+            outcomes: list[tuple[bool, Any] | None] = list(
+                await self.alert_repo.persist_alerts([item[3] for item in pending])
+            )
+        except Exception as e:
+            # Fall back to one write per alert so a bad row only fails itself
+            logger.warning(f"run_id={run_id} bulk alert write failed, retrying per alert: {e}")
+            outcomes = []
+            for pos, threshold, _, alert in pending:
+                try:
+                    outcomes.append(await self.alert_repo.persist_alert(alert))
+                except Exception as alert_error:
+                    error_msg = (
+                        f"Failed to create alert for position_id={pos.id} "
+                        f"threshold={threshold.days}d: {alert_error}"
+                    )
+                    logger.error(f"run_id={run_id} {error_msg}", exc_info=True)
+                    stats["errors"].append(error_msg)
+                    check_errors_total.labels(error_type="alert_creation").inc()
+                    outcomes.append(None)
+
+        for (pos, threshold, days_to_expiry, _), outcome in zip(pending, outcomes, strict=True):
+            if outcome is None:
+                continue
+            is_new, alert_id = outcome
+            if is_new:
+                stats["alerts_created"] += 1
+                alerts_created_total.inc()
+                logger.info(
+                    f"run_id={run_id} created alert: "
+                    f"position_id={pos.id} symbol={pos.symbol} "
+                    f"DTE={days_to_expiry} threshold={threshold.days}d "
+                    f"alert_id={alert_id}"
+                )
+            else:
+                stats["alerts_deduplicated"] += 1
+                alerts_deduped_total.inc()
+                logger.debug(
+                    f"run_id={run_id} alert deduplicated: "
+                    f"position_id={pos.id} threshold={threshold.days}d"
+                )
+
     def _create_expiration_alert(
         self,
         position,
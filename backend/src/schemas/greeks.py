@@ -135,6 +135,40 @@ class ScenarioShockApiResponse(BaseModel):
     scenarios: dict[str, ScenarioResultResponse]
 
 
+class ScenarioGridBreachResponse(BaseModel):
+    """Grid point where at least one dimension breaches its hard limit."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    spot_shock_pct: float
+    iv_shock_pts: float
+    time_step_days: int
+    breach_dims: list[str]
+
+
+class ScenarioGridApiResponse(BaseModel):
+    """Response for GET /scenario/grid endpoint.
+
+    Matrices are nested lists indexed [spot shock][IV shock][time step].
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    account_id: str
+    scope: Literal["ACCOUNT", "STRATEGY"]
+    scope_id: str | None
+    asof_ts: datetime
+    spot_shocks_pct: list[float]
+    iv_shocks_pts: list[float]
+    time_steps_days: list[int]
+    pnl: list[list[list[float]]]
+    dollar_greeks: dict[str, list[list[list[float]]]]
+    worst_pnl: float
+    breaches: list[ScenarioGridBreachResponse]
+    legs_priced: int
+    legs_skipped: int
+
+
 # =============================================================================
 # V2 Schemas: Limits API
 # =============================================================================
@@ -0,0 +1,63 @@
+"""Tests for the per-destination delivery circuit breaker."""
+
+from unittest.mock import patch
+
+from src.alerts.breaker import DestinationBreaker
+
+
+class TestDestinationBreaker:
+    """Tests for DestinationBreaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = DestinationBreaker(failure_threshold=3)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.is_open
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        breaker = DestinationBreaker(failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert not breaker.is_open
+
+    def test_half_open_lets_one_probe_through(self):
+        breaker = DestinationBreaker(failure_threshold=1, reset_seconds=60.0)
+
+        with patch("src.alerts.breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("src.alerts.breaker.time.monotonic", return_value=161.0):
+            assert breaker.allow()
+            assert not breaker.allow()
+
+            # Failed probe reopens for another reset period
+            breaker.record_failure()
+            assert not breaker.allow()
+
+        with patch("src.alerts.breaker.time.monotonic", return_value=222.0):
+            assert breaker.allow()
+            breaker.record_success()
+
+        assert not breaker.is_open
+        assert breaker.allow()
+
+    def test_released_probe_can_be_retried(self):
+        breaker = DestinationBreaker(failure_threshold=1, reset_seconds=60.0)
+
+        with patch("src.alerts.breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+            assert breaker.seconds_until_probe() == 60.0
+        with patch("src.alerts.breaker.time.monotonic", return_value=161.0):
+            assert breaker.allow()
+            breaker.release_probe()
+
+            assert breaker.is_open
+            assert breaker.seconds_until_probe() == 0.0
+            assert breaker.allow()
@@ -506,3 +506,32 @@ class TestWebhookChannel:
             mock_client_class.assert_called_once()
             call_kwargs = mock_client_class.call_args.kwargs
             assert call_kwargs["timeout"] == 15.0
+
+    @pytest.mark.asyncio
+    async def test_webhook_channel_reuses_pooled_client(self):
+        """WebhookChannel should reuse one keep-alive client until closed."""
+        from src.alerts.channels import WebhookChannel
+
+        channel = WebhookChannel()
+        alert = _create_test_alert()
+
+        mock_response = AsyncMock()
+        mock_response.status_code = 200
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("src.alerts.channels.httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_response
+            mock_client_class.return_value = mock_client
+
+            await channel.send(alert, "https://hooks.slack.com/a")
+            await channel.send(alert, "https://hooks.slack.com/b")
+
+            mock_client_class.assert_called_once()
+            assert mock_client.post.call_count == 2
+
+            await channel.aclose()
+            mock_client.aclose.assert_awaited_once()
+
+            await channel.send(alert, "https://hooks.slack.com/a")
+            assert mock_client_class.call_count == 2
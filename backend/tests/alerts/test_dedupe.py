@@ -0,0 +1,76 @@
+"""Tests for the in-process alert dedupe cache."""
+
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from src.alerts.dedupe import DedupeCache
+
+
+class TestDedupeCache:
+    """Tests for DedupeCache lookups, expiry and eviction."""
+
+    @pytest.mark.asyncio
+    async def test_hit_after_put_counts_suppressed(self):
+        cache = DedupeCache()
+        alert_id = uuid4()
+
+        assert await cache.get("fp:1") is None
+        await cache.put("fp:1", alert_id)
+        assert await cache.get("fp:1") == alert_id
+        assert await cache.get("fp:1") == alert_id
+
+        assert (cache.hits, cache.misses) == (2, 1)
+        assert cache.hit_rate == pytest.approx(2 / 3)
+        assert cache.drain_suppressed() == {"fp:1": 2}
+        assert cache.drain_suppressed() == {}
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(self):
+        cache = DedupeCache(ttl_seconds=60)
+
+        with patch("src.alerts.dedupe.time.monotonic", return_value=100.0):
+            await cache.put("fp:1", uuid4())
+        with patch("src.alerts.dedupe.time.monotonic", return_value=161.0):
+            assert await cache.get("fp:1") is None
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        cache = DedupeCache(max_entries=2)
+        await cache.put("a", uuid4())
+        await cache.put("b", uuid4())
+        await cache.get("a")
+
+        await cache.put("c", uuid4())
+
+        assert len(cache) == 2
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+
+    @pytest.mark.asyncio
+    async def test_shared_through_redis_setnx(self):
+        redis = AsyncMock()
+        alert_id = uuid4()
+        redis.get = AsyncMock(return_value=str(alert_id).encode())
+        cache = DedupeCache(ttl_seconds=600, redis=redis)
+
+        # Another process already persisted the key
+        assert await cache.get("fp:1") == alert_id
+        redis.get.assert_awaited_once_with("alerts:dedupe:fp:1")
+
+        await cache.put("fp:2", alert_id)
+        redis.set.assert_awaited_once_with("alerts:dedupe:fp:2", str(alert_id), nx=True, ex=600)
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_fall_back_to_miss(self):
+        redis = AsyncMock()
+        redis.get = AsyncMock(side_effect=RedisConnectionError("down"))
+        redis.set = AsyncMock(side_effect=RedisConnectionError("down"))
+        cache = DedupeCache(redis=redis)
+
+        assert await cache.get("fp:1") is None
+        await cache.put("fp:1", uuid4())
+        assert await cache.get("fp:1") is not None
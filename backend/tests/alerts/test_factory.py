@@ -6,8 +6,10 @@ from uuid import UUID, uuid4
 import pytest
 from src.alerts.factory import (
     COOLDOWN_WINDOW_MINUTES,
+    DIGEST_MAX_LINES,
     compute_dedupe_key,
     create_alert,
+    create_digest_alert,
     validate_alert,
 )
 from src.alerts.models import (
@@ -354,6 +356,51 @@ class TestComputeDedupeKey:
             assert ":recovery:" in key or f":{my_id}" in key
 
 
+class TestCreateDigestAlert:
+    """Tests for create_digest_alert function."""
+
+    def test_digest_takes_most_severe_type_and_latest_timestamp(self):
+        earlier = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        later = earlier + timedelta(minutes=1)
+        alerts = [
+            create_alert(
+                type=AlertType.ORDER_FILLED,
+                severity=Severity.SEV3,
+                summary="Filled",
+                timestamp=later,
+            ),
+            create_alert(
+                type=AlertType.ORDER_REJECTED,
+                severity=Severity.SEV2,
+                summary="Rejected",
+                timestamp=earlier,
+            ),
+        ]
+
+        digest = create_digest_alert(alerts)
+
+        assert digest.type == AlertType.ORDER_REJECTED
+        assert digest.severity == Severity.SEV2
+        assert digest.event_timestamp == later
+        assert digest.details["alert_count"] == 2
+
+    def test_digest_caps_distinct_lines(self):
+        alerts = [
+            create_alert(
+                type=AlertType.ORDER_REJECTED,
+                severity=Severity.SEV2,
+                summary=f"Rejected {i}",
+                symbol=f"SYM{i}",
+            )
+            for i in range(DIGEST_MAX_LINES + 3)
+        ]
+
+        digest = create_digest_alert(alerts)
+
+        assert f"{DIGEST_MAX_LINES:02d}" in digest.details
+        assert digest.details["more"] == "3 more distinct alerts"
+
+
 class TestValidateAlert:
     """Tests for validate_alert function."""
 
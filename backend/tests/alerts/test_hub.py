@@ -1,6 +1,7 @@
 """Tests for NotificationHub with async queue and retry."""
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -122,6 +123,34 @@ class TestNotificationHubStartStop:
         # Should not raise
         await hub.stop()
 
+    @pytest.mark.asyncio
+    async def test_stop_records_pending_sev1_retries_as_failed(self):
+        """stop() persists ALERT_DELIVERY_FAILED for SEV1 retries still queued."""
+        from src.alerts.hub import STOPPED_ERROR, NotificationHub
+
+        mock_repo = AsyncMock()
+        mock_repo.record_delivery_attempt = AsyncMock(return_value=uuid4())
+        mock_repo.persist_alert = AsyncMock(return_value=(True, uuid4()))
+
+        mock_channel = AsyncMock(spec=NotificationChannel)
+        mock_channel.send = AsyncMock(return_value=DeliveryResult(success=False, error_message="x"))
+
+        hub = NotificationHub(
+            repository=mock_repo, channels={"webhook": mock_channel}, retry_base_delay=30.0
+        )
+        alert = create_alert(type=AlertType.ORDER_REJECTED, severity=Severity.SEV1, summary="A")
+
+        await hub.start(num_workers=1)
+        await hub._deliver_with_retry(alert, mock_channel, "webhook", "http://hook")
+        assert len(hub._retry_queue) == 1
+        await hub.stop()
+
+        assert hub._retry_queue == []
+        [failure_alert] = mock_repo.persist_alert.call_args.args
+        assert failure_alert.type == AlertType.ALERT_DELIVERY_FAILED
+        assert failure_alert.details["original_alert_id"] == str(alert.alert_id)
+        assert failure_alert.details["error"] == STOPPED_ERROR
+
 
 class TestEnqueue:
     """Tests for NotificationHub.enqueue()."""
@@ -213,11 +242,25 @@ class TestEnqueue:
 
 
 class TestDeliverWithRetry:
-    """Tests for _deliver_with_retry exponential backoff."""
+    """Tests for _deliver_with_retry and the retry delay queue."""
+
+    def test_exponential_backoff_delays(self):
+        """Retry delays follow exponential backoff: 1s, 2s, 4s, 8s."""
+        from src.alerts.hub import NotificationHub
+
+        hub = NotificationHub(
+            repository=AsyncMock(),
+            channels={},
+            max_retries=5,
+            retry_base_delay=1.0,
+            retry_multiplier=2.0,
+        )
+
+        assert [hub.retry_delay(attempt) for attempt in range(2, 6)] == [1.0, 2.0, 4.0, 8.0]
 
     @pytest.mark.asyncio
-    async def test_exponential_backoff_delays(self):
-        """Retry delays follow exponential backoff: 1s, 2s, 4s, 8s, 16s."""
+    async def test_failed_attempt_is_queued_not_slept(self):
+        """A failed attempt returns at once, leaving its retry on the delay queue."""
         from src.alerts.hub import NotificationHub
 
         mock_repo = AsyncMock()
@@ -225,23 +268,13 @@ class TestDeliverWithRetry:
         mock_repo.update_delivery_status = AsyncMock()
 
         mock_channel = AsyncMock(spec=NotificationChannel)
-        # Fail first 4 attempts, succeed on 5th
-        mock_channel.send = AsyncMock(
-            side_effect=[
-                DeliveryResult(success=False, error_message="fail 1"),
-                DeliveryResult(success=False, error_message="fail 2"),
-                DeliveryResult(success=False, error_message="fail 3"),
-                DeliveryResult(success=False, error_message="fail 4"),
-                DeliveryResult(success=True, response_code=200),
-            ]
-        )
+        mock_channel.send = AsyncMock(return_value=DeliveryResult(success=False, error_message="x"))
 
         hub = NotificationHub(
             repository=mock_repo,
             channels={"webhook": mock_channel},
             max_retries=5,
-            retry_base_delay=1.0,
-            retry_multiplier=2.0,
+            retry_base_delay=30.0,
         )
 
         alert = create_alert(
@@ -250,26 +283,20 @@ class TestDeliverWithRetry:
             summary="Test",
         )
 
-        sleep_calls = []
-        original_sleep = asyncio.sleep
-
-        async def mock_sleep(delay):
-            sleep_calls.append(delay)
-            # Actually sleep a tiny bit to not break async
-            await original_sleep(0.001)
-
-        with patch("asyncio.sleep", mock_sleep):
-            result = await hub._deliver_with_retry(
-                alert, mock_channel, "webhook", "http://example.com"
-            )
+        result = await asyncio.wait_for(
+            hub._deliver_with_retry(alert, mock_channel, "webhook", "http://example.com"),
+            timeout=1.0,
+        )
 
-        assert result is True
-        # Should have slept 4 times (before retries 2, 3, 4, 5)
-        assert sleep_calls == [1.0, 2.0, 4.0, 8.0]
+        assert result is False
+        [(due, _, queued, channel_type, destination, attempt)] = hub._retry_queue
+        assert queued is alert
+        assert (channel_type, destination, attempt) == ("webhook", "http://example.com", 2)
+        assert due == pytest.approx(time.monotonic() + 30.0, abs=1.0)
 
     @pytest.mark.asyncio
     async def test_records_each_attempt_in_repository(self):
-        """Each delivery attempt is recorded in the repository."""
+        """Each delivery attempt, including queued retries, is recorded."""
         from src.alerts.hub import NotificationHub
 
         mock_repo = AsyncMock()
@@ -299,7 +326,10 @@ class TestDeliverWithRetry:
             summary="Test",
         )
 
+        await hub.start(num_workers=1)
         await hub._deliver_with_retry(alert, mock_channel, "webhook", "http://example.com")
+        await asyncio.sleep(0.1)
+        await hub.stop()
 
         # Should have recorded 3 attempts
         assert mock_repo.record_delivery_attempt.call_count == 3
@@ -338,11 +368,12 @@ class TestDeliverWithRetry:
         )
 
         with patch.object(hub, "_handle_delivery_failure", new_callable=AsyncMock) as mock_handle:
-            result = await hub._deliver_with_retry(
-                alert, mock_channel, "webhook", "http://example.com"
-            )
+            await hub.start(num_workers=1)
+            await hub._deliver_with_retry(alert, mock_channel, "webhook", "http://example.com")
+            await asyncio.sleep(0.1)
+            await hub.stop()
 
-        assert result is False
+        assert mock_channel.send.call_count == 3
         mock_handle.assert_called_once()
         call_args = mock_handle.call_args
         assert call_args.args[0] is alert
@@ -350,6 +381,217 @@ class TestDeliverWithRetry:
         assert "always fails" in str(call_args.args[2])
 
 
+class TestCircuitBreaker:
+    """Tests for per-destination circuit breaking in the hub."""
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_destination(self):
+        """Once a destination's breaker opens, deliveries skip it without sending."""
+        from src.alerts.hub import CIRCUIT_OPEN_ERROR, NotificationHub
+
+        mock_repo = AsyncMock()
+        mock_repo.record_delivery_attempt = AsyncMock(return_value=uuid4())
+        mock_repo.update_delivery_status = AsyncMock()
+        mock_repo.record_delivery_attempts = AsyncMock(return_value=[uuid4()])
+
+        mock_channel = AsyncMock(spec=NotificationChannel)
+        mock_channel.send = AsyncMock(
+            return_value=DeliveryResult(success=False, error_message="connection refused")
+        )
+
+        hub = NotificationHub(
+            repository=mock_repo,
+            channels={"webhook": mock_channel},
+            max_retries=1,
+            breaker_failure_threshold=2,
+        )
+
+        alerts = [
+            create_alert(type=AlertType.ORDER_REJECTED, severity=Severity.SEV2, summary=f"A{i}")
+            for i in range(3)
+        ]
+        for alert in alerts:
+            await hub._deliver_with_retry(alert, mock_channel, "webhook", "http://dead")
+
+        assert mock_channel.send.call_count == 2
+        [skipped] = mock_repo.record_delivery_attempts.call_args.args[0]
+        assert skipped["alert_id"] == alerts[2].alert_id
+        assert skipped["error_message"] == CIRCUIT_OPEN_ERROR
+
+        # Other destinations are unaffected
+        await hub._deliver_with_retry(alerts[2], mock_channel, "webhook", "http://other")
+        assert mock_channel.send.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_probe_is_released_when_recording_fails(self):
+        """A probe whose delivery record raises does not hold the breaker forever."""
+        from src.alerts.hub import NotificationHub
+
+        mock_repo = AsyncMock()
+        mock_repo.record_delivery_attempt = AsyncMock(side_effect=ConnectionError("db down"))
+        mock_repo.update_delivery_status = AsyncMock()
+
+        mock_channel = AsyncMock(spec=NotificationChannel)
+        mock_channel.send = AsyncMock(return_value=DeliveryResult(success=True))
+
+        hub = NotificationHub(repository=mock_repo, channels={"webhook": mock_channel})
+        breaker = hub._breaker_for("webhook", "http://flaky")
+        breaker.opened_mono = time.monotonic() - breaker.reset_seconds
+        alert = create_alert(type=AlertType.ORDER_REJECTED, severity=Severity.SEV2, summary="A")
+
+        with pytest.raises(ConnectionError):
+            await hub._deliver_with_retry(alert, mock_channel, "webhook", "http://flaky")
+        assert not breaker.probing
+
+        # Once the database recovers, the next attempt probes and closes the breaker
+        mock_repo.record_delivery_attempt = AsyncMock(return_value=uuid4())
+        assert await hub._deliver_with_retry(alert, mock_channel, "webhook", "http://flaky")
+        assert not breaker.is_open
+
+    @pytest.mark.asyncio
+    async def test_sev1_waits_for_open_breaker(self):
+        """A SEV1 alert that meets an open breaker is retried once it resets."""
+        from src.alerts.hub import NotificationHub
+
+        mock_repo = AsyncMock()
+        mock_repo.record_delivery_attempt = AsyncMock(return_value=uuid4())
+        mock_repo.update_delivery_status = AsyncMock()
+        mock_repo.record_delivery_attempts = AsyncMock(return_value=[uuid4()])
+
+        mock_channel = AsyncMock(spec=NotificationChannel)
+        mock_channel.send = AsyncMock(return_value=DeliveryResult(success=True))
+
+        hub = NotificationHub(
+            repository=mock_repo,
+            channels={"webhook": mock_channel},
+            retry_base_delay=0.01,
+            breaker_reset_seconds=0.05,
+        )
+        breaker = hub._breaker_for("webhook", "http://flaky")
+        breaker.opened_mono = time.monotonic()
+        alert = create_alert(type=AlertType.ORDER_REJECTED, severity=Severity.SEV1, summary="A")
+
+        with patch.object(hub, "_handle_delivery_failure", new_callable=AsyncMock) as mock_handle:
+            await hub.start(num_workers=1)
+            await hub._deliver_with_retry(alert, mock_channel, "webhook", "http://flaky")
+            assert mock_channel.send.call_count == 0
+            await asyncio.sleep(0.15)
+            await hub.stop()
+
+        mock_handle.assert_not_called()
+        mock_channel.send.assert_called_once_with(alert, "http://flaky")
+        assert not breaker.is_open
+
+
+class TestConcurrentDelivery:
+    """Tests for concurrent per-destination delivery."""
+
+    @pytest.mark.asyncio
+    async def test_destinations_delivered_concurrently(self):
+        """A slow destination does not delay the others."""
+        from src.alerts.hub import NotificationHub
+
+        mock_repo = AsyncMock()
+        mock_repo.record_delivery_attempt = AsyncMock(return_value=uuid4())
+        mock_repo.update_delivery_status = AsyncMock()
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_send(alert, destination):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return DeliveryResult(success=True, response_code=200)
+
+        mock_channel = AsyncMock(spec=NotificationChannel)
+        mock_channel.send = AsyncMock(side_effect=slow_send)
+
+        hub = NotificationHub(repository=mock_repo, channels={"webhook": mock_channel})
+
+        alert = create_alert(type=AlertType.ORDER_REJECTED, severity=Severity.SEV2, summary="T")
+        destinations = [("webhook", f"http://hook{i}.example.com") for i in range(3)]
+
+        with patch("src.alerts.hub.get_destinations_for_alert", return_value=destinations):
+            await hub._deliver_alert(alert)
+
+        assert mock_channel.send.call_count == 3
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_shared_repository_writes_are_serialized(self):
+        """Concurrent deliveries never use the shared repository's session at once."""
+        from src.alerts.hub import NotificationHub
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_write(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return uuid4()
+
+        mock_repo = AsyncMock()
+        mock_repo.record_delivery_attempt = AsyncMock(side_effect=slow_write)
+        mock_repo.update_delivery_status = AsyncMock(side_effect=slow_write)
+
+        mock_channel = AsyncMock(spec=NotificationChannel)
+        mock_channel.send = AsyncMock(return_value=DeliveryResult(success=True, response_code=200))
+
+        hub = NotificationHub(repository=mock_repo, channels={"webhook": mock_channel})
+
+        alert = create_alert(type=AlertType.ORDER_REJECTED, severity=Severity.SEV2, summary="T")
+        destinations = [("webhook", f"http://hook{i}.example.com") for i in range(3)]
+
+        with patch("src.alerts.hub.get_destinations_for_alert", return_value=destinations):
+            await hub._deliver_alert(alert)
+
+        assert mock_repo.update_delivery_status.call_count == 3
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_session_factory_gives_each_write_its_own_session(self):
+        """With a session factory, delivery writes skip the shared repository."""
+        from src.alerts.hub import NotificationHub
+
+        shared_repo = AsyncMock()
+        session_repo = AsyncMock()
+        session_repo.record_delivery_attempt = AsyncMock(return_value=uuid4())
+        session = MagicMock()
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        mock_channel = AsyncMock(spec=NotificationChannel)
+        mock_channel.send = AsyncMock(return_value=DeliveryResult(success=True, response_code=200))
+
+        hub = NotificationHub(
+            repository=shared_repo,
+            channels={"webhook": mock_channel},
+            session_factory=session_factory,
+        )
+
+        alert = create_alert(type=AlertType.ORDER_REJECTED, severity=Severity.SEV2, summary="T")
+        destinations = [("webhook", f"http://hook{i}.example.com") for i in range(2)]
+
+        with (
+            patch("src.alerts.hub.get_destinations_for_alert", return_value=destinations),
+            patch("src.alerts.hub.AlertRepository", return_value=session_repo) as repo_class,
+        ):
+            await hub._deliver_alert(alert)
+
+        # One pending record and one status update per destination
+        assert session_factory.call_count == 4
+        repo_class.assert_called_with(session)
+        assert session_repo.update_delivery_status.call_count == 2
+        shared_repo.record_delivery_attempt.assert_not_called()
+
+
 class TestHandleDeliveryFailure:
     """Tests for _handle_delivery_failure behavior."""
 
@@ -679,3 +921,133 @@ class TestSev1NeverDropped:
 
         assert result is True
         mock_channel.send.assert_called_once()
+
+
+class TestDigestCoalescing:
+    """Tests for per-destination digest coalescing of non-SEV1 alerts."""
+
+    @staticmethod
+    def make_hub(mock_channel, window=0.05):
+        from src.alerts.hub import NotificationHub
+
+        mock_repo = AsyncMock()
+        mock_repo.record_delivery_attempt = AsyncMock(return_value=uuid4())
+        mock_repo.update_delivery_status = AsyncMock()
+        mock_repo.record_delivery_attempts = AsyncMock(return_value=[])
+
+        hub = NotificationHub(
+            repository=mock_repo,
+            channels={"webhook": mock_channel},
+            max_retries=2,
+            retry_base_delay=0.001,
+            digest_window_seconds=window,
+        )
+        return hub, mock_repo
+
+    @pytest.mark.asyncio
+    async def test_non_sev1_alerts_coalesced_into_one_digest(self):
+        """Alerts within the window go out as one message per destination."""
+        mock_channel = AsyncMock(spec=NotificationChannel)
+        mock_channel.send = AsyncMock(return_value=DeliveryResult(success=True, response_code=200))
+        hub, mock_repo = self.make_hub(mock_channel)
+
+        alerts = [
+            create_alert(type=AlertType.ORDER_REJECTED, severity=Severity.SEV2, summary="Rejected")
+            for _ in range(3)
+        ]
+        alerts.append(
+            create_alert(type=AlertType.ORDER_FILLED, severity=Severity.SEV3, summary="Filled")
+        )
+
+        with patch(
+            "src.alerts.hub.get_destinations_for_alert",
+            return_value=[("webhook", "http://hook")],
+        ):
+            for alert in alerts:
+                await hub._deliver_alert(alert)
+            mock_channel.send.assert_not_called()
+            await asyncio.sleep(0.1)
+
+        mock_channel.send.assert_called_once()
+        digest, destination = mock_channel.send.call_args.args
+        assert destination == "http://hook"
+        assert digest.severity == Severity.SEV2
+        assert digest.summary == "4 alerts (2 distinct): Rejected"
+        assert digest.details["01"] == "3x Rejected"
+        assert digest.details["02"] == "1x Filled"
+
+        # One batched write covering every alert, no per-attempt writes
+        mock_repo.record_delivery_attempt.assert_not_called()
+        mock_repo.record_delivery_attempts.assert_called_once()
+        attempts = mock_repo.record_delivery_attempts.call_args.args[0]
+        assert [a["alert_id"] for a in attempts] == [a.alert_id for a in alerts]
+        assert {a["status"] for a in attempts} == {"sent"}
+
+    @pytest.mark.asyncio
+    async def test_sev1_bypasses_digest(self):
+        """SEV1 alerts are delivered immediately even with a digest window."""
+        mock_channel = AsyncMock(spec=NotificationChannel)
+        mock_channel.send = AsyncMock(return_value=DeliveryResult(success=True, response_code=200))
+        hub, mock_repo = self.make_hub(mock_channel, window=60.0)
+
+        alert = create_alert(
+            type=AlertType.KILL_SWITCH_ACTIVATED,
+            severity=Severity.SEV1,
+            summary="Critical",
+        )
+
+        with patch(
+            "src.alerts.hub.get_destinations_for_alert",
+            return_value=[("webhook", "http://hook")],
+        ):
+            await hub._deliver_alert(alert)
+
+        mock_channel.send.assert_called_once_with(alert, "http://hook")
+        mock_repo.record_delivery_attempt.assert_called_once()
+        assert hub._digests == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_digest_records_every_attempt_in_one_batch(self):
+        """Each retry is recorded per alert, written once after delivery ends."""
+        mock_channel = AsyncMock(spec=NotificationChannel)
+        mock_channel.send = AsyncMock(
+            return_value=DeliveryResult(success=False, error_message="503")
+        )
+        hub, mock_repo = self.make_hub(mock_channel)
+
+        alerts = [
+            create_alert(type=AlertType.ORDER_REJECTED, severity=Severity.SEV2, summary=f"R{i}")
+            for i in range(2)
+        ]
+
+        delivered = await hub._deliver_digest(alerts, mock_channel, "webhook", "http://hook")
+
+        assert delivered is False
+        assert mock_channel.send.call_count == 2
+        attempts = mock_repo.record_delivery_attempts.call_args.args[0]
+        assert [(a["attempt_number"], a["status"]) for a in attempts] == [
+            (1, "failed"),
+            (1, "failed"),
+            (2, "failed"),
+            (2, "failed"),
+        ]
+        assert attempts[0]["error_message"] == "503"
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_digests(self):
+        """stop() delivers pending digests instead of waiting out the window."""
+        mock_channel = AsyncMock(spec=NotificationChannel)
+        mock_channel.send = AsyncMock(return_value=DeliveryResult(success=True, response_code=200))
+        hub, _ = self.make_hub(mock_channel, window=60.0)
+
+        alert = create_alert(type=AlertType.ORDER_FILLED, severity=Severity.SEV3, summary="Filled")
+
+        with patch(
+            "src.alerts.hub.get_destinations_for_alert",
+            return_value=[("webhook", "http://hook")],
+        ):
+            await hub._deliver_alert(alert)
+            await asyncio.wait_for(hub.stop(), timeout=1.0)
+
+        # A lone alert is sent as-is rather than wrapped in a digest
+        mock_channel.send.assert_called_once_with(alert, "http://hook")
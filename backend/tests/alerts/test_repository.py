@@ -12,6 +12,7 @@ import pytest_asyncio
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from src.alerts.dedupe import DedupeCache
 from src.alerts.factory import create_alert
 from src.alerts.models import AlertType, Severity
 from src.alerts.repository import AlertRepository
@@ -155,7 +156,7 @@ class TestPersistAlert:
             alert = create_alert(
                 type=AlertType.ORDER_REJECTED,
                 severity=Severity.SEV2,
-                summary=f"Rejection #{i+1}",
+                summary=f"Rejection #{i + 1}",
                 timestamp=ts,
                 account_id="acc123",
                 symbol="AAPL",
@@ -241,6 +242,138 @@ class TestPersistAlert:
         assert is_new2 is True
 
 
+class TestPersistAlerts:
+    """Tests for persist_alerts bulk method."""
+
+    @staticmethod
+    def _rejection(symbol: str, summary: str = "Order rejected"):
+        return create_alert(
+            type=AlertType.ORDER_REJECTED,
+            severity=Severity.SEV2,
+            summary=summary,
+            timestamp=datetime(2026, 1, 25, 12, 0, 0, tzinfo=timezone.utc),
+            account_id="acc123",
+            symbol=symbol,
+        )
+
+    @pytest.mark.asyncio
+    async def test_persist_alerts_empty_batch(self, alert_db_session):
+        repo = AlertRepository(alert_db_session)
+
+        assert await repo.persist_alerts([]) == []
+
+    @pytest.mark.asyncio
+    async def test_persist_alerts_inserts_new_and_reports_existing(self, alert_db_session):
+        """Outcomes match persist_alert() semantics, in input order."""
+        repo = AlertRepository(alert_db_session)
+        existing = self._rejection("AAPL", "First rejection")
+        await repo.persist_alert(existing)
+
+        new_alert = self._rejection("MSFT")
+        duplicate = self._rejection("AAPL", "Second rejection")
+        outcomes = await repo.persist_alerts([new_alert, duplicate])
+
+        assert outcomes == [(True, new_alert.alert_id), (False, existing.alert_id)]
+        result = await alert_db_session.execute(
+            text("SELECT entity_symbol, suppressed_count FROM alerts ORDER BY entity_symbol")
+        )
+        assert result.fetchall() == [("AAPL", 1), ("MSFT", 0)]
+
+    @pytest.mark.asyncio
+    async def test_persist_alerts_in_batch_duplicate(self, alert_db_session):
+        """A repeated dedupe_key within the batch is written once."""
+        repo = AlertRepository(alert_db_session)
+        first = self._rejection("AAPL", "First")
+        second = self._rejection("AAPL", "Second")
+
+        outcomes = await repo.persist_alerts([first, second])
+
+        assert outcomes == [(True, first.alert_id), (False, first.alert_id)]
+        result = await alert_db_session.execute(text("SELECT COUNT(*) FROM alerts"))
+        assert result.scalar() == 1
+
+    @pytest.mark.asyncio
+    async def test_persist_alerts_spans_insert_chunks(self, alert_db_session, monkeypatch):
+        monkeypatch.setattr("src.alerts.repository.BULK_INSERT_CHUNK", 2)
+        repo = AlertRepository(alert_db_session)
+        alerts = [self._rejection(f"SYM{i}") for i in range(5)]
+
+        outcomes = await repo.persist_alerts(alerts)
+
+        assert outcomes == [(True, alert.alert_id) for alert in alerts]
+        result = await alert_db_session.execute(text("SELECT COUNT(*) FROM alerts"))
+        assert result.scalar() == 5
+
+
+class TestDedupeCacheIntegration:
+    """Tests for persist_alert/persist_alerts with a DedupeCache."""
+
+    @staticmethod
+    def _rejection(summary: str = "Order rejected"):
+        return create_alert(
+            type=AlertType.ORDER_REJECTED,
+            severity=Severity.SEV2,
+            summary=summary,
+            timestamp=datetime(2026, 1, 25, 12, 0, 0, tzinfo=timezone.utc),
+            symbol="AAPL",
+        )
+
+    @staticmethod
+    async def _suppressed_count(session) -> int:
+        result = await session.execute(text("SELECT suppressed_count FROM alerts"))
+        return result.scalar()
+
+    @pytest.mark.asyncio
+    async def test_cached_duplicate_skips_database(self, alert_db_session):
+        """Repeats are answered from the cache; counts are flushed in bulk."""
+        cache = DedupeCache()
+        repo = AlertRepository(alert_db_session, dedupe_cache=cache)
+        first = self._rejection("First")
+        await repo.persist_alert(first)
+
+        outcomes = [await repo.persist_alert(self._rejection(f"Repeat {i}")) for i in range(3)]
+
+        assert outcomes == [(False, first.alert_id)] * 3
+        assert cache.hits == 3
+        assert await self._suppressed_count(alert_db_session) == 0
+
+        assert await repo.flush_suppressed_counts() == 1
+        assert await self._suppressed_count(alert_db_session) == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_still_deduplicated_by_index(self, alert_db_session):
+        """A cold cache falls through to the dedupe index."""
+        first = self._rejection("First")
+        await AlertRepository(alert_db_session).persist_alert(first)
+
+        repo = AlertRepository(alert_db_session, dedupe_cache=DedupeCache())
+        outcome = await repo.persist_alert(self._rejection("Second"))
+
+        assert outcome == (False, first.alert_id)
+        assert repo.dedupe_cache.misses == 1
+        assert await self._suppressed_count(alert_db_session) == 1
+
+    @pytest.mark.asyncio
+    async def test_persist_alerts_writes_only_misses(self, alert_db_session):
+        cache = DedupeCache()
+        repo = AlertRepository(alert_db_session, dedupe_cache=cache)
+        first = self._rejection("First")
+        await repo.persist_alert(first)
+
+        new_alert = create_alert(
+            type=AlertType.ORDER_REJECTED, severity=Severity.SEV2, summary="Other"
+        )
+        outcomes = await repo.persist_alerts([self._rejection("Repeat"), new_alert])
+
+        assert outcomes == [(False, first.alert_id), (True, new_alert.alert_id)]
+        # The cached repeat's count was flushed alongside the write
+        assert cache.drain_suppressed() == {}
+        result = await alert_db_session.execute(
+            text("SELECT summary, suppressed_count FROM alerts ORDER BY summary")
+        )
+        assert result.fetchall() == [("First", 1), ("Other", 0)]
+
+
 class TestGetAlert:
     """Tests for get_alert method."""
 
@@ -341,6 +474,53 @@ class TestRecordDeliveryAttempt:
         assert row[5] == "pending"  # status
 
 
+class TestRecordDeliveryAttempts:
+    """Tests for record_delivery_attempts bulk method."""
+
+    @pytest.mark.asyncio
+    async def test_record_delivery_attempts_empty_batch(self, alert_db_session):
+        repo = AlertRepository(alert_db_session)
+
+        assert await repo.record_delivery_attempts([]) == []
+
+    @pytest.mark.asyncio
+    async def test_record_delivery_attempts_stores_outcomes(self, alert_db_session, monkeypatch):
+        """Each attempt is stored with its final status, across insert chunks."""
+        monkeypatch.setattr("src.alerts.repository.BULK_INSERT_CHUNK", 2)
+        repo = AlertRepository(alert_db_session)
+
+        alerts = [
+            create_alert(type=AlertType.ORDER_REJECTED, severity=Severity.SEV2, summary=f"R{i}")
+            for i in range(3)
+        ]
+        await repo.persist_alerts(alerts)
+
+        attempts = [
+            {
+                "alert_id": alert.alert_id,
+                "channel": "webhook",
+                "destination_key": "https://hooks.example.com/alert",
+                "attempt_number": 1,
+                "status": "sent",
+                "response_code": 200,
+            }
+            for alert in alerts
+        ]
+        attempts[2].update(status="failed", response_code=None, error_message="timeout")
+
+        delivery_ids = await repo.record_delivery_attempts(attempts)
+
+        assert len(delivery_ids) == 3
+        sent = await repo.get_delivery(delivery_ids[0])
+        failed = await repo.get_delivery(delivery_ids[2])
+        assert sent["status"] == "sent"
+        assert sent["response_code"] == 200
+        assert sent["sent_at"] is not None
+        assert failed["status"] == "failed"
+        assert failed["error_message"] == "timeout"
+        assert failed["sent_at"] is None
+
+
 class TestUpdateDeliveryStatus:
     """Tests for update_delivery_status method."""
 
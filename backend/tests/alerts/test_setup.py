@@ -66,7 +66,9 @@ class TestInitAlertService:
 
             await init_alert_service(mock_session)
 
-            mock_repo_class.assert_called_once_with(mock_session)
+            mock_repo_class.assert_called_once()
+            assert mock_repo_class.call_args.args == (mock_session,)
+            assert mock_repo_class.call_args.kwargs["dedupe_cache"].redis is None
 
         # Clean up
         src.alerts.setup._alert_service = None
@@ -202,10 +204,14 @@ class TestInitAlertService:
 
             from src.alerts.setup import init_alert_service
 
-            await init_alert_service(mock_session)
+            session_factory = MagicMock()
+            await init_alert_service(mock_session, session_factory=session_factory)
 
             mock_hub_class.assert_called_once_with(
-                repository=mock_repo, channels={"webhook": mock_webhook}
+                repository=mock_repo,
+                channels={"webhook": mock_webhook},
+                digest_window_seconds=30.0,
+                session_factory=session_factory,
             )
 
         # Clean up
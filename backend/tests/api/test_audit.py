@@ -143,7 +143,8 @@ async def insert_test_audit_log(
         {
             "id": event_id,
             "sequence_id": sequence_id,
-            "timestamp": timestamp.isoformat(),
+            # Bound as a datetime, the same way the repository binds filters
+            "timestamp": timestamp,
             "event_type": event_type,
             "severity": severity,
             "actor_id": actor_id,
@@ -383,6 +384,95 @@ class TestListAuditLogs:
         assert response.status_code == 422  # Validation error
 
 
+class TestKeysetPagination:
+    """Tests for cursor pagination on GET /api/audit."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_walks_every_log_once(self, audit_client, audit_db_session):
+        """Cursors page through ties on timestamp without skips or repeats."""
+        base = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        for i in range(7):
+            # Pairs of events share a timestamp; sequence_id breaks the tie
+            await insert_test_audit_log(
+                audit_db_session,
+                sequence_id=i + 1,
+                timestamp=base + timedelta(seconds=i // 2),
+            )
+
+        seen: list[int] = []
+        response = await audit_client.get("/api/audit?limit=3")
+        data = response.json()
+        assert data["total"] == 7
+        while True:
+            seen.extend(log["sequence_id"] for log in data["logs"])
+            if data["next_cursor"] is None:
+                break
+            response = await audit_client.get(f"/api/audit?limit=3&cursor={data['next_cursor']}")
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] is None
+
+        assert seen == [7, 6, 5, 4, 3, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_cursor_combines_with_filters(self, audit_client, audit_db_session):
+        for i in range(6):
+            await insert_test_audit_log(
+                audit_db_session,
+                sequence_id=i + 1,
+                actor_id="user-a" if i % 2 else "user-b",
+                timestamp=datetime(2026, 2, 1, tzinfo=timezone.utc) + timedelta(seconds=i),
+            )
+
+        first = (await audit_client.get("/api/audit?actor_id=user-a&limit=2")).json()
+        second = (
+            await audit_client.get(
+                f"/api/audit?actor_id=user-a&limit=2&cursor={first['next_cursor']}"
+            )
+        ).json()
+
+        assert [log["sequence_id"] for log in first["logs"]] == [6, 4]
+        assert [log["sequence_id"] for log in second["logs"]] == [2]
+        assert second["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_returns_400(self, audit_client):
+        response = await audit_client.get("/api/audit?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+
+
+class TestExportAuditLogs:
+    """Tests for GET /api/audit/export NDJSON streaming."""
+
+    @pytest.mark.asyncio
+    async def test_export_streams_ndjson(self, audit_client, audit_db_session):
+        import json
+
+        for i in range(5):
+            await insert_test_audit_log(
+                audit_db_session,
+                sequence_id=i + 1,
+                event_type="order_placed" if i < 3 else "config_updated",
+                timestamp=datetime(2026, 2, 1, tzinfo=timezone.utc) + timedelta(seconds=i),
+            )
+
+        response = await audit_client.get("/api/audit/export?event_type=order_placed")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["sequence_id"] for line in lines] == [3, 2, 1]
+        assert all(line["event_type"] == "order_placed" for line in lines)
+
+    @pytest.mark.asyncio
+    async def test_export_empty(self, audit_client):
+        response = await audit_client.get("/api/audit/export")
+
+        assert response.status_code == 200
+        assert response.text == ""
+
+
 class TestGetAuditEvent:
     """Tests for GET /api/audit/{event_id} endpoint."""
 
@@ -2,6 +2,7 @@
 
 Tests cover:
 - GET /api/greeks/accounts/{account_id}/scenario
+- GET /api/greeks/accounts/{account_id}/scenario/grid
 - PUT /api/greeks/accounts/{account_id}/limits
 - GET /api/greeks/accounts/{account_id}/history
 """
@@ -12,7 +13,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
-from src.greeks.models import AggregatedGreeks
+from src.greeks.models import AggregatedGreeks, GreeksDataSource, GreeksModel, PositionGreeks
 
 
 def _make_aggregated_greeks(
@@ -41,6 +42,33 @@ def _make_aggregated_greeks(
     )
 
 
+def _make_position_greeks(
+    position_id: int = 1,
+    quantity: int = 10,
+    strategy_id: str | None = None,
+) -> PositionGreeks:
+    """Factory for PositionGreeks on a long-dated ATM call."""
+    return PositionGreeks(
+        position_id=position_id,
+        symbol=f"AAPL_C{position_id}",
+        underlying_symbol="AAPL",
+        quantity=quantity,
+        multiplier=100,
+        underlying_price=Decimal("150"),
+        option_type="call",
+        strike=Decimal("150"),
+        expiry="2099-01-16",
+        dollar_delta=Decimal("0"),
+        gamma_dollar=Decimal("0"),
+        gamma_pnl_1pct=Decimal("0"),
+        vega_per_1pct=Decimal("0"),
+        theta_per_day=Decimal("0"),
+        source=GreeksDataSource.MODEL,
+        model=GreeksModel.BS,
+        strategy_id=strategy_id,
+    )
+
+
 class TestScenarioEndpoint:
     """Tests for GET /api/greeks/accounts/{account_id}/scenario."""
 
@@ -62,8 +90,8 @@ class TestScenarioEndpoint:
             # Setup mocks
             mock_load.return_value = [MagicMock()]  # Has positions
 
-            mock_calc = MagicMock()
-            mock_calc.calculate.return_value = [MagicMock()]
+            mock_calc = MagicMock(calculate_async=AsyncMock())
+            mock_calc.calculate_async.return_value = [MagicMock()]
             mock_calc_cls.return_value = mock_calc
 
             mock_agg = MagicMock()
@@ -92,8 +120,8 @@ class TestScenarioEndpoint:
         ):
             mock_load.return_value = [MagicMock()]
 
-            mock_calc = MagicMock()
-            mock_calc.calculate.return_value = [MagicMock()]
+            mock_calc = MagicMock(calculate_async=AsyncMock())
+            mock_calc.calculate_async.return_value = [MagicMock()]
             mock_calc_cls.return_value = mock_calc
 
             mock_agg = MagicMock()
@@ -118,8 +146,8 @@ class TestScenarioEndpoint:
         ):
             mock_load.return_value = [MagicMock()]
 
-            mock_calc = MagicMock()
-            mock_calc.calculate.return_value = [MagicMock()]
+            mock_calc = MagicMock(calculate_async=AsyncMock())
+            mock_calc.calculate_async.return_value = [MagicMock()]
             mock_calc_cls.return_value = mock_calc
 
             mock_agg = MagicMock()
@@ -166,8 +194,8 @@ class TestScenarioEndpoint:
         ):
             mock_load.return_value = [MagicMock()]
 
-            mock_calc = MagicMock()
-            mock_calc.calculate.return_value = [MagicMock()]
+            mock_calc = MagicMock(calculate_async=AsyncMock())
+            mock_calc.calculate_async.return_value = [MagicMock()]
             mock_calc_cls.return_value = mock_calc
 
             mock_agg = MagicMock()
@@ -230,8 +258,8 @@ class TestScenarioEndpoint:
         ):
             mock_load.return_value = [MagicMock()]
 
-            mock_calc = MagicMock()
-            mock_calc.calculate.return_value = [MagicMock()]
+            mock_calc = MagicMock(calculate_async=AsyncMock())
+            mock_calc.calculate_async.return_value = [MagicMock()]
             mock_calc_cls.return_value = mock_calc
 
             mock_agg = MagicMock()
@@ -257,6 +285,164 @@ class TestScenarioEndpoint:
             assert "dollar_delta" in scenario["breach_dims"]
 
 
+class TestScenarioGridEndpoint:
+    """Tests for GET /api/greeks/accounts/{account_id}/scenario/grid."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client with mocked dependencies."""
+        from src.main import app
+
+        return TestClient(app)
+
+    @pytest.fixture(autouse=True)
+    def reset_limits_store(self):
+        """Reset the limits store before each test."""
+        import src.greeks.limits_store as limits_module
+
+        limits_module._limits_store = None
+        yield
+        limits_module._limits_store = None
+
+    @pytest.mark.asyncio
+    async def test_grid_returns_matrix_for_requested_axes(self, client):
+        """GET /scenario/grid returns a spot × IV × time P&L matrix."""
+        with (
+            patch("src.api.greeks.load_positions_from_db") as mock_load,
+            patch("src.api.greeks.GreeksCalculator") as mock_calc_cls,
+        ):
+            mock_load.return_value = [MagicMock()]
+            mock_calc = MagicMock(calculate_async=AsyncMock())
+            mock_calc.calculate_async.return_value = [_make_position_greeks()]
+            mock_calc_cls.return_value = mock_calc
+
+            response = client.get(
+                "/api/greeks/accounts/acc_001/scenario/grid"
+                "?spot_shocks=-5,0,5&iv_shocks=0,5&time_steps=0"
+            )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["spot_shocks_pct"] == [-5.0, 0.0, 5.0]
+            assert data["iv_shocks_pts"] == [0.0, 5.0]
+            assert data["time_steps_days"] == [0]
+            assert len(data["pnl"]) == 3
+            assert len(data["pnl"][0]) == 2
+            assert len(data["pnl"][0][0]) == 1
+            assert data["pnl"][1][0][0] == pytest.approx(0.0, abs=1e-6)
+            assert data["pnl"][2][0][0] > 0 > data["pnl"][0][0][0]
+            assert data["worst_pnl"] == data["pnl"][0][0][0]
+            assert set(data["dollar_greeks"]) == {
+                "dollar_delta",
+                "gamma_dollar",
+                "vega_per_1pct",
+                "theta_per_day",
+            }
+            assert data["legs_priced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_grid_breaches_use_account_limits(self, client):
+        """GET /scenario/grid flags grid points beyond the account hard limits."""
+        client.put(
+            "/api/greeks/accounts/acc_001/limits",
+            json={
+                "limits": {
+                    "dollar_delta": {"warn": 10000, "crit": 20000, "hard": 30000},
+                    "gamma_dollar": {"warn": 1e9, "crit": 2e9, "hard": 3e9},
+                    "vega_per_1pct": {"warn": 1e9, "crit": 2e9, "hard": 3e9},
+                    "theta_per_day": {"warn": 1e9, "crit": 2e9, "hard": 3e9},
+                }
+            },
+            headers={"X-User-ID": "test_user"},
+        )
+
+        with (
+            patch("src.api.greeks.load_positions_from_db") as mock_load,
+            patch("src.api.greeks.GreeksCalculator") as mock_calc_cls,
+        ):
+            mock_load.return_value = [MagicMock()]
+            mock_calc = MagicMock(calculate_async=AsyncMock())
+            # 10 long ATM calls on a $150 underlying: dollar delta well above 30000
+            mock_calc.calculate_async.return_value = [_make_position_greeks(quantity=10)]
+            mock_calc_cls.return_value = mock_calc
+
+            response = client.get(
+                "/api/greeks/accounts/acc_001/scenario/grid?spot_shocks=0&iv_shocks=0&time_steps=0"
+            )
+
+            assert response.status_code == 200
+            breaches = response.json()["breaches"]
+            assert len(breaches) == 1
+            assert breaches[0]["breach_dims"] == ["dollar_delta"]
+
+    @pytest.mark.asyncio
+    async def test_grid_strategy_scope_filters_legs(self, client):
+        """GET /scenario/grid?scope=STRATEGY prices only that strategy's legs."""
+        with (
+            patch("src.api.greeks.load_positions_from_db") as mock_load,
+            patch("src.api.greeks.GreeksCalculator") as mock_calc_cls,
+        ):
+            mock_load.return_value = [MagicMock()]
+            mock_calc = MagicMock(calculate_async=AsyncMock())
+            mock_calc.calculate_async.return_value = [
+                _make_position_greeks(1, strategy_id="wheel"),
+                _make_position_greeks(2, strategy_id="other"),
+            ]
+            mock_calc_cls.return_value = mock_calc
+
+            response = client.get(
+                "/api/greeks/accounts/acc_001/scenario/grid?scope=STRATEGY&strategy_id=wheel"
+            )
+            assert response.status_code == 200
+            assert response.json()["scope_id"] == "wheel"
+            assert response.json()["legs_priced"] == 1
+
+            response = client.get(
+                "/api/greeks/accounts/acc_001/scenario/grid?scope=STRATEGY&strategy_id=missing"
+            )
+            assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_grid_requires_strategy_id_for_strategy_scope(self, client):
+        """GET /scenario/grid?scope=STRATEGY without strategy_id returns 400."""
+        response = client.get("/api/greeks/accounts/acc_001/scenario/grid?scope=STRATEGY")
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "time_steps=nan",
+            "time_steps=inf",
+            "time_steps=1.5",
+            "time_steps=-1",
+            "time_steps=1e999999999",
+            "spot_shocks=nan",
+            "spot_shocks=-100",
+            "spot_shocks=5,abc",
+            "iv_shocks=-Infinity",
+            "spot_shocks=" + ",".join(["1"] * 26),
+        ],
+    )
+    def test_grid_rejects_invalid_axes(self, client, query):
+        """GET /scenario/grid returns 400 for malformed, non-finite or oversized axes."""
+        with patch("src.api.greeks.load_positions_from_db") as mock_load:
+            response = client.get(f"/api/greeks/accounts/acc_001/scenario/grid?{query}")
+
+            assert response.status_code == 400
+            mock_load.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_grid_no_positions(self, client):
+        """GET /scenario/grid with no positions returns 404."""
+        with patch("src.api.greeks.load_positions_from_db") as mock_load:
+            mock_load.return_value = []
+
+            response = client.get("/api/greeks/accounts/acc_001/scenario/grid")
+
+            assert response.status_code == 404
+
+
 class TestLimitsEndpoint:
     """Tests for PUT /api/greeks/accounts/{account_id}/limits."""
 
@@ -437,6 +623,27 @@ class TestHistoryEndpoint:
 
         assert response.status_code == 400
 
+    @pytest.mark.asyncio
+    async def test_history_endpoint_interval_override(self, client):
+        """GET /history?interval= overrides the window's default bucket size."""
+        with patch("src.api.greeks.GreeksRepository") as mock_repo_cls:
+            mock_repo = MagicMock()
+            mock_repo.get_history = AsyncMock(return_value=[])
+            mock_repo_cls.return_value = mock_repo
+
+            response = client.get("/api/greeks/accounts/acc_001/history?window=7d&interval=15m")
+
+            assert response.status_code == 200
+            assert response.json()["interval"] == "15m"
+            assert mock_repo.get_history.call_args.kwargs["interval_seconds"] == 900
+
+    @pytest.mark.asyncio
+    async def test_history_endpoint_invalid_interval(self, client):
+        """GET /history rejects unknown intervals."""
+        response = client.get("/api/greeks/accounts/acc_001/history?window=1d&interval=7s")
+
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_history_endpoint_scope_strategy_requires_id(self, client):
         """GET /history with scope=STRATEGY requires strategy_id."""
@@ -0,0 +1,399 @@
+"""Tests for the cold audit archive and the partition archiving job."""
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.audit.archive import AuditArchive
+from src.audit.integrity import compute_checksum
+from src.audit.models import (
+    ActorType,
+    AuditEvent,
+    AuditEventType,
+    AuditSeverity,
+    EventSource,
+    ResourceType,
+)
+from src.audit.repository import AuditQueryFilters, AuditRepository, encode_cursor
+from src.audit.retention import archive_audit_logs
+
+DAY_1 = datetime(2026, 2, 1, tzinfo=timezone.utc)
+DAY_2 = DAY_1 + timedelta(days=1)
+DAY_3 = DAY_1 + timedelta(days=2)
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    """File-backed SQLite with audit_logs and verification checkpoints."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'audit.db'}")
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("""
+            CREATE TABLE audit_logs (
+                id TEXT PRIMARY KEY,
+                sequence_id INTEGER NOT NULL,
+                timestamp TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                severity TEXT NOT NULL,
+                actor_id TEXT NOT NULL,
+                actor_type TEXT NOT NULL,
+                resource_type TEXT NOT NULL,
+                resource_id TEXT NOT NULL,
+                request_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                environment TEXT NOT NULL,
+                service TEXT NOT NULL,
+                version TEXT NOT NULL,
+                correlation_id TEXT,
+                value_mode TEXT NOT NULL,
+                old_value TEXT,
+                new_value TEXT,
+                metadata TEXT,
+                checksum TEXT NOT NULL,
+                prev_checksum TEXT,
+                chain_key TEXT NOT NULL
+            )
+        """)
+        )
+        await conn.execute(
+            text("""
+            CREATE TABLE audit_verification_checkpoint (
+                chain_key TEXT PRIMARY KEY,
+                sequence_id INTEGER NOT NULL,
+                checksum TEXT NOT NULL,
+                events_verified INTEGER NOT NULL,
+                verified_at TEXT NOT NULL
+            )
+        """)
+        )
+
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+async def append_events(
+    factory,
+    chain_key: str,
+    events: list[tuple[int, datetime]],
+    archived_checksum: str | None = None,
+) -> None:
+    """Insert a correctly chained run of (sequence_id, timestamp) events.
+
+    archived_checksum continues the chain when its live events were dropped.
+    """
+    async with factory() as session:
+        result = await session.execute(
+            text("""
+                SELECT checksum FROM audit_logs
+                WHERE chain_key = :chain_key ORDER BY sequence_id DESC LIMIT 1
+            """),
+            {"chain_key": chain_key},
+        )
+        prev_checksum = result.scalar() or archived_checksum
+        for sequence_id, timestamp in events:
+            event = AuditEvent(
+                event_id=uuid4(),
+                timestamp=timestamp,
+                event_type=AuditEventType.ORDER_PLACED,
+                severity=AuditSeverity.INFO,
+                actor_id="user-123",
+                actor_type=ActorType.USER,
+                resource_type=ResourceType.ORDER,
+                resource_id=f"order-{sequence_id}",
+                request_id="req-789",
+                source=EventSource.WEB,
+                environment="production",
+                service="trading-api",
+                version="1.0.0",
+            )
+            checksum = compute_checksum(event, sequence_id, prev_checksum)
+            await session.execute(
+                text("""
+                    INSERT INTO audit_logs VALUES (
+                        :id, :sequence_id, :timestamp, 'order_placed', 'info',
+                        'user-123', 'user', 'order', :resource_id, 'req-789', 'web',
+                        'production', 'trading-api', '1.0.0', NULL, 'diff',
+                        NULL, NULL, NULL, :checksum, :prev_checksum, :chain_key
+                    )
+                """),
+                {
+                    "id": str(event.event_id),
+                    "sequence_id": sequence_id,
+                    "timestamp": timestamp.isoformat(),
+                    "resource_id": event.resource_id,
+                    "checksum": checksum,
+                    "prev_checksum": prev_checksum,
+                    "chain_key": chain_key,
+                },
+            )
+            prev_checksum = checksum
+        await session.commit()
+
+
+async def seed_three_days(factory) -> None:
+    """Two chains interleaved over three days (day 3 stays live)."""
+    await append_events(
+        factory,
+        "order",
+        [(1, DAY_1 + timedelta(hours=1)), (3, DAY_2 + timedelta(hours=1)), (5, DAY_3)],
+    )
+    await append_events(
+        factory,
+        "config",
+        [(2, DAY_1 + timedelta(hours=2)), (4, DAY_2 + timedelta(hours=2))],
+    )
+    await append_events(factory, "config", [(6, DAY_3 + timedelta(hours=1))])
+
+
+async def live_sequence_ids(factory) -> list[int]:
+    async with factory() as session:
+        result = await session.execute(text("SELECT sequence_id FROM audit_logs ORDER BY 1"))
+        return [row[0] for row in result.fetchall()]
+
+
+class TestAuditArchive:
+    """Tests for AuditArchive segment files and manifest."""
+
+    def test_segment_round_trip_and_manifest_reload(self, tmp_path):
+        rows = [
+            {
+                "id": "a",
+                "sequence_id": 1,
+                "timestamp": DAY_1,
+                "chain_key": "order",
+                "checksum": "c1",
+                "prev_checksum": None,
+                "new_value": {"qty": 10},
+            },
+            {
+                "id": "b",
+                "sequence_id": 2,
+                "timestamp": DAY_1 + timedelta(hours=1),
+                "chain_key": "order",
+                "checksum": "c2",
+                "prev_checksum": "c1",
+            },
+        ]
+        archive = AuditArchive(tmp_path)
+        reader = AuditArchive(tmp_path)
+        assert reader.horizon is None
+        segment = archive.write_segment(DAY_1, DAY_2, rows)
+
+        assert segment.key == "audit_logs/2026/02/2026-02-01.json.gz"
+        assert segment.chains["order"].first_prev_checksum is None
+        assert segment.chains["order"].last_checksum == "c2"
+
+        # Stored column by column
+        payload = json.loads(gzip.decompress((tmp_path / segment.key).read_bytes()))
+        assert payload["columns"]["sequence_id"] == [1, 2]
+
+        reopened = AuditArchive(tmp_path)
+        assert reopened.horizon == DAY_2
+        # An open archive picks up segments written by another process
+        assert reader.horizon == DAY_2
+        read = reopened.read_segment(reopened.segments[0])
+        assert read[0]["timestamp"] == DAY_1
+        assert read[0]["new_value"] == {"qty": 10}
+
+    def test_tampered_segment_is_rejected(self, tmp_path):
+        archive = AuditArchive(tmp_path)
+        segment = archive.write_segment(
+            DAY_1,
+            DAY_2,
+            [
+                {
+                    "sequence_id": 1,
+                    "timestamp": DAY_1,
+                    "chain_key": "order",
+                    "checksum": "c1",
+                    "prev_checksum": None,
+                }
+            ],
+        )
+        path = tmp_path / segment.key
+        path.write_bytes(path.read_bytes() + b"\0")
+
+        with pytest.raises(ValueError, match="manifest checksum"):
+            archive.read_segment(segment)
+        is_valid, errors = archive.verify()
+        assert not is_valid
+
+    def test_overlapping_segment_is_rejected(self, tmp_path):
+        row = {
+            "sequence_id": 1,
+            "timestamp": DAY_1,
+            "chain_key": "order",
+            "checksum": "c1",
+            "prev_checksum": None,
+        }
+        archive = AuditArchive(tmp_path)
+        archive.write_segment(DAY_1, DAY_2, [row])
+
+        with pytest.raises(ValueError, match="overlaps"):
+            archive.write_segment(DAY_1, DAY_2, [row])
+
+
+class TestArchiveAuditLogs:
+    """Tests for archive_audit_logs against SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_archives_closed_days_and_drops_them(self, session_factory, tmp_path):
+        await seed_three_days(session_factory)
+        archive = AuditArchive(tmp_path / "archive")
+
+        report = await archive_audit_logs(
+            session_factory, archive, before=DAY_3 + timedelta(hours=5)
+        )
+
+        assert [s.start for s in report.segments] == [DAY_1, DAY_2]
+        assert report.rows_archived == 4
+        assert report.dropped_before == DAY_3
+        assert await live_sequence_ids(session_factory) == [5, 6]
+
+        # Boundary checksums link day 2 back to day 1
+        day_1, day_2 = archive.segments
+        assert day_2.chains["order"].first_prev_checksum == day_1.chains["order"].last_checksum
+        assert archive.verify() == (True, [])
+
+        # A second run has nothing left to archive
+        rerun = await archive_audit_logs(session_factory, archive, before=DAY_3)
+        assert rerun.segments == []
+
+    @pytest.mark.asyncio
+    async def test_verify_chain_integrity_spans_archive(self, session_factory, tmp_path):
+        await seed_three_days(session_factory)
+        archive = AuditArchive(tmp_path / "archive")
+        await archive_audit_logs(session_factory, archive, before=DAY_3)
+
+        async with session_factory() as session:
+            repo = AuditRepository(session, archive=archive)
+            assert await repo.verify_chain_integrity("order") == (True, [])
+            streamed = await repo.verify_chain_streaming("order")
+
+            # Without the archive the live chain no longer starts at None
+            is_valid, errors = await AuditRepository(session).verify_chain_integrity("order")
+
+        assert streamed.is_valid
+        assert streamed.events_verified == 1
+        assert not is_valid
+        assert "First event (sequence_id=5)" in errors[0]
+
+    @pytest.mark.asyncio
+    async def test_queries_span_archive(self, session_factory, tmp_path):
+        await seed_three_days(session_factory)
+        archive = AuditArchive(tmp_path / "archive")
+        await archive_audit_logs(session_factory, archive, before=DAY_3)
+
+        async with session_factory() as session:
+            repo = AuditRepository(session, archive=archive)
+            everything = await repo.query_audit_logs(AuditQueryFilters())
+            page = await repo.query_audit_logs(AuditQueryFilters(offset=1, limit=2))
+            after_cursor = await repo.query_audit_logs(
+                AuditQueryFilters(cursor=encode_cursor(DAY_2 + timedelta(hours=2), 4))
+            )
+            one_resource = await repo.query_audit_logs(AuditQueryFilters(resource_id="order-3"))
+            streamed = [row async for row in repo.stream_audit_logs(AuditQueryFilters())]
+
+        assert [row["sequence_id"] for row in everything] == [6, 5, 4, 3, 2, 1]
+        assert [row["sequence_id"] for row in streamed] == [6, 5, 4, 3, 2, 1]
+        assert [row["sequence_id"] for row in page] == [5, 4]
+        assert [row["sequence_id"] for row in after_cursor] == [3, 2, 1]
+        assert [row["sequence_id"] for row in one_resource] == [3]
+
+    @pytest.mark.asyncio
+    async def test_broken_chain_is_not_archived_or_dropped(self, session_factory, tmp_path):
+        await seed_three_days(session_factory)
+        async with session_factory() as session:
+            await session.execute(
+                text("UPDATE audit_logs SET resource_id = 'forged' WHERE sequence_id = 3")
+            )
+            await session.commit()
+        archive = AuditArchive(tmp_path / "archive")
+
+        with pytest.raises(ValueError, match="2026-02-02"):
+            await archive_audit_logs(session_factory, archive, before=DAY_3)
+
+        # Day 1 is archived but nothing is dropped
+        assert [s.start for s in archive.segments] == [DAY_1]
+        assert await live_sequence_ids(session_factory) == [1, 2, 3, 4, 5, 6]
+
+    @pytest.mark.asyncio
+    async def test_partition_is_cut_by_sequence_not_timestamp(self, session_factory, tmp_path):
+        # seq 2 was stamped after midnight but persisted before seq 3
+        await append_events(
+            session_factory,
+            "order",
+            [
+                (1, DAY_1 + timedelta(hours=1)),
+                (2, DAY_2 + timedelta(seconds=1)),
+                (3, DAY_2 - timedelta(milliseconds=100)),
+                (4, DAY_2 + timedelta(hours=2)),
+            ],
+        )
+        archive = AuditArchive(tmp_path / "archive")
+
+        report = await archive_audit_logs(session_factory, archive, before=DAY_2)
+
+        assert report.segments[0].chains["order"].last_sequence_id == 3
+        assert report.dropped_before == DAY_2
+        # seq 2 stays live until its own day's chunk is dropped
+        assert await live_sequence_ids(session_factory) == [2, 4]
+
+        async with session_factory() as session:
+            repo = AuditRepository(session, archive=archive)
+            everything = await repo.query_audit_logs(AuditQueryFilters())
+            exported = [row async for row in repo.stream_audit_logs(AuditQueryFilters())]
+            streamed = await repo.verify_chain_streaming("order")
+        assert [row["sequence_id"] for row in everything] == [4, 2, 3, 1]
+        assert [row["sequence_id"] for row in exported] == [4, 2, 3, 1]
+        assert streamed.is_valid
+
+        # The next day continues after seq 3 and skips the archived seq 2
+        rerun = await archive_audit_logs(session_factory, archive, before=DAY_3)
+        assert [s.chains["order"].first_sequence_id for s in rerun.segments] == [4]
+        assert await live_sequence_ids(session_factory) == []
+        assert archive.verify() == (True, [])
+
+        # seq 2 sits in day 1's segment but sorts into day 2
+        async with session_factory() as session:
+            repo = AuditRepository(session, archive=archive)
+            exported = [row async for row in repo.stream_audit_logs(AuditQueryFilters())]
+        assert [row["sequence_id"] for row in exported] == [4, 2, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_unarchived_rows_block_the_drop(self, session_factory, tmp_path):
+        await append_events(session_factory, "order", [(1, DAY_1 + timedelta(hours=1))])
+        archive = AuditArchive(tmp_path / "archive")
+        await archive_audit_logs(session_factory, archive, before=DAY_2)
+
+        # Stamped on day 1 but persisted after day 1 was archived
+        await append_events(
+            session_factory,
+            "order",
+            [(2, DAY_1 + timedelta(hours=23))],
+            archived_checksum=archive.chain_boundary("order").last_checksum,
+        )
+        rerun = await archive_audit_logs(session_factory, archive, before=DAY_2)
+
+        assert rerun.dropped_before is None
+        assert await live_sequence_ids(session_factory) == [2]
+
+        # The next day's run archives it with its first partition
+        later = await archive_audit_logs(session_factory, archive, before=DAY_3)
+        assert [s.chains["order"].first_sequence_id for s in later.segments] == [2]
+        assert later.dropped_before == DAY_3
+        assert await live_sequence_ids(session_factory) == []
+
+        async with session_factory() as session:
+            repo = AuditRepository(session, archive=archive)
+            exported = [row async for row in repo.stream_audit_logs(AuditQueryFilters())]
+            assert await repo.verify_chain_integrity("order") == (True, [])
+        assert [row["sequence_id"] for row in exported] == [2, 1]
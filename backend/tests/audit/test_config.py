@@ -3,7 +3,7 @@
 TDD: Write tests FIRST, then implement config to make them pass.
 """
 
-from src.audit.models import AuditEventType, ValueMode
+from src.audit.models import AuditEventType, ChainShardStrategy, ResourceType, ValueMode
 
 
 class TestTier0Events:
@@ -480,3 +480,31 @@ class TestIsSyncRequiredFunction:
 
         # AUTH_LOGOUT is not in tier 0
         assert is_sync_required(AuditEventType.AUTH_LOGOUT) is False
+
+
+class TestGetChainKeyFunction:
+    """Tests for get_chain_key() helper function."""
+
+    def test_no_sharding_uses_default_chain(self):
+        from src.audit.config import get_chain_key
+
+        assert get_chain_key(ResourceType.ORDER, "order-1") == "default"
+
+    def test_resource_type_sharding(self):
+        from src.audit.config import get_chain_key
+
+        key = get_chain_key(ResourceType.POSITION, "pos-1", ChainShardStrategy.RESOURCE_TYPE)
+
+        assert key == "position"
+
+    def test_resource_id_hash_is_stable_and_bounded(self):
+        """Hashing keeps one resource on one chain and spreads resources over N."""
+        from src.audit.config import get_chain_key
+
+        strategy = ChainShardStrategy.RESOURCE_ID_HASH
+        keys = {get_chain_key(ResourceType.ORDER, f"order-{i}", strategy, 4) for i in range(200)}
+
+        assert keys == {"shard-00", "shard-01", "shard-02", "shard-03"}
+        assert get_chain_key(ResourceType.ORDER, "order-7", strategy, 4) == get_chain_key(
+            ResourceType.ORDER, "order-7", strategy, 4
+        )
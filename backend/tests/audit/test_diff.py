@@ -492,6 +492,18 @@ class TestEnforceSizeLimit:
         assert hash_val is not None
         assert mode == ValueMode.REFERENCE
 
+    def test_reuses_precomputed_encoding(self):
+        """enforce_size_limit measures and hashes the encoding it is given."""
+        from src.audit.canonical import canonical_json
+        from src.audit.diff import enforce_size_limit
+
+        large_value = {"data": "x" * (MAX_VALUE_SIZE_BYTES + 1)}
+        encoded = canonical_json(large_value)
+
+        assert enforce_size_limit(large_value, "order", "order-123", encoded=encoded) == (
+            enforce_size_limit(large_value, "order", "order-123")
+        )
+
 
 class TestIntegration:
     """Integration tests combining diff and redaction."""
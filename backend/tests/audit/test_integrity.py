@@ -658,3 +658,71 @@ class TestVerifyChain:
         assert is_valid is False
         # Should have multiple errors
         assert len(errors) >= 2
+
+
+class TestVerifyAnchor:
+    """Tests for verify_anchor function."""
+
+    def _anchor(self, heads: dict) -> dict:
+        from src.audit.integrity import compute_checksum
+
+        event = create_test_event(
+            event_type=AuditEventType.CHAIN_ANCHORED,
+            resource_type=ResourceType.AUDIT_CHAIN,
+            resource_id="root",
+            new_value={"heads": heads},
+        )
+        return {
+            "sequence_id": 20,
+            "event_id": str(event.event_id),
+            "timestamp": event.timestamp.isoformat(),
+            "event_type": event.event_type.value,
+            "actor_id": event.actor_id,
+            "resource_type": event.resource_type.value,
+            "resource_id": event.resource_id,
+            "old_value": None,
+            "new_value": event.new_value,
+            "checksum": compute_checksum(event, sequence_id=20, prev_checksum=None),
+            "prev_checksum": None,
+        }
+
+    def test_matching_heads_are_valid(self):
+        from src.audit.integrity import verify_anchor
+
+        anchor = self._anchor({"order": {"sequence_id": 5, "checksum": "a" * 64}})
+        rows = [{"sequence_id": 5, "chain_key": "order", "checksum": "a" * 64}]
+
+        assert verify_anchor(anchor, rows) == (True, [])
+
+    def test_rewritten_shard_is_detected(self):
+        from src.audit.integrity import verify_anchor
+
+        anchor = self._anchor({"order": {"sequence_id": 5, "checksum": "a" * 64}})
+        rows = [{"sequence_id": 5, "chain_key": "order", "checksum": "f" * 64}]
+
+        is_valid, errors = verify_anchor(anchor, rows)
+
+        assert is_valid is False
+        assert "diverges" in errors[0]
+
+    def test_missing_head_is_detected(self):
+        from src.audit.integrity import verify_anchor
+
+        anchor = self._anchor({"order": {"sequence_id": 5, "checksum": "a" * 64}})
+
+        is_valid, errors = verify_anchor(anchor, [])
+
+        assert is_valid is False
+        assert "not found" in errors[0]
+
+    def test_tampered_anchor_is_detected(self):
+        from src.audit.integrity import verify_anchor
+
+        anchor = self._anchor({"order": {"sequence_id": 5, "checksum": "a" * 64}})
+        anchor["new_value"] = {"heads": {"order": {"sequence_id": 5, "checksum": "f" * 64}}}
+        rows = [{"sequence_id": 5, "chain_key": "order", "checksum": "f" * 64}]
+
+        is_valid, errors = verify_anchor(anchor, rows)
+
+        assert is_valid is False
+        assert "Invalid checksum on anchor" in errors[0]
@@ -352,6 +352,89 @@ class TestPersistAuditEvent:
         assert "orders" in str(first_call)
 
 
+def create_batch_mock_session(sequence_ids: list[int], chain_head_checksum: str | None = None):
+    """Create a mock session for persist_audit_events tests."""
+    mock_session = AsyncMock()
+
+    chain_head_result = MagicMock()
+    chain_head_result.fetchone.return_value = (
+        ("default", chain_head_checksum, 1) if chain_head_checksum else None
+    )
+    sequence_result = MagicMock()
+    sequence_result.scalars.return_value.all.return_value = sequence_ids
+
+    mock_session.execute = AsyncMock(
+        side_effect=[chain_head_result, sequence_result] + [MagicMock()] * 10
+    )
+    return mock_session
+
+
+class TestPersistAuditEvents:
+    """Tests for persist_audit_events batch append."""
+
+    @pytest.mark.asyncio
+    async def test_batch_chains_checksums_in_order(self):
+        """Each event's checksum chains from the previous one in the batch."""
+        from src.audit.integrity import compute_checksum
+        from src.audit.repository import AuditRepository
+
+        mock_session = create_batch_mock_session([12, 10, 11], chain_head_checksum="head")
+        events = [create_test_event(resource_id=f"order-{i}") for i in range(3)]
+
+        result = await AuditRepository(mock_session).persist_audit_events(events)
+
+        first = compute_checksum(events[0], 10, "head")
+        second = compute_checksum(events[1], 11, first)
+        third = compute_checksum(events[2], 12, second)
+        assert result == [(10, first), (11, second), (12, third)]
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_one_statement_per_step(self):
+        """Lock, sequence allocation, INSERT and head update run once per batch."""
+        from src.audit.repository import AuditRepository
+
+        mock_session = create_batch_mock_session([1, 2, 3])
+        events = [create_test_event() for _ in range(3)]
+
+        await AuditRepository(mock_session).persist_audit_events(events, chain_key="orders")
+
+        calls = mock_session.execute.call_args_list
+        assert len(calls) == 4
+        assert "for update" in str(calls[0][0][0]).lower()
+        assert "generate_series" in str(calls[1][0][0])
+        assert calls[1][0][1] == {"count": 3}
+        insert_sql = str(calls[2][0][0]).lower()
+        assert "insert into audit_logs" in insert_sql
+        assert calls[2][0][1]["sequence_id_2"] == 3
+        assert calls[2][0][1]["prev_checksum_1"] == calls[2][0][1]["checksum_0"]
+        assert calls[3][0][1]["sequence_id"] == 3
+        assert calls[3][0][1]["chain_key"] == "orders"
+
+    @pytest.mark.asyncio
+    async def test_batch_insert_is_chunked(self):
+        """INSERTs are split at MAX_BATCH_SIZE rows."""
+        from src.audit.repository import AuditRepository
+
+        mock_session = create_batch_mock_session([1, 2, 3])
+        events = [create_test_event() for _ in range(3)]
+
+        with patch("src.audit.repository.MAX_BATCH_SIZE", 2):
+            await AuditRepository(mock_session).persist_audit_events(events)
+
+        inserts = [c for c in mock_session.execute.call_args_list if "audit_logs" in str(c[0][0])]
+        assert len(inserts) == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_noop(self):
+        """An empty batch does not touch the database."""
+        from src.audit.repository import AuditRepository
+
+        mock_session = AsyncMock()
+
+        assert await AuditRepository(mock_session).persist_audit_events([]) == []
+        mock_session.execute.assert_not_called()
+
+
 class TestGetAuditEvent:
     """Tests for get_audit_event method."""
 
@@ -646,6 +729,65 @@ class TestQueryAuditLogs:
         assert "offset" in query
 
 
+class TestKeysetQueries:
+    """Tests for cursor pagination in the repository."""
+
+    def test_cursor_round_trip(self):
+        from src.audit.repository import decode_cursor, encode_cursor
+
+        ts = datetime(2026, 2, 1, 12, 30, tzinfo=timezone.utc)
+        cursor = encode_cursor(ts, 42)
+
+        assert decode_cursor(cursor) == (ts.isoformat(), 42)
+        assert "=" not in cursor
+
+    def test_malformed_cursor_raises_value_error(self):
+        from src.audit.repository import decode_cursor
+
+        with pytest.raises(ValueError):
+            decode_cursor("garbage")
+
+    @pytest.mark.asyncio
+    async def test_cursor_adds_keyset_clause_and_ignores_offset(self):
+        from src.audit.repository import AuditQueryFilters, AuditRepository, encode_cursor
+
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        repo = AuditRepository(mock_session)
+        ts = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        await repo.query_audit_logs(AuditQueryFilters(offset=50, cursor=encode_cursor(ts, 9)))
+
+        query, params = mock_session.execute.call_args[0]
+        assert "(timestamp, sequence_id) <" in str(query)
+        assert params["cursor_timestamp"] == ts
+        assert params["cursor_sequence_id"] == 9
+        assert params["offset"] == 0
+
+    @pytest.mark.asyncio
+    async def test_query_audit_page_returns_next_cursor(self):
+        from src.audit.repository import AuditQueryFilters, AuditRepository, decode_cursor
+
+        ts = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        rows = [
+            create_mock_row({**create_full_audit_row(), "timestamp": ts, "sequence_id": seq})
+            for seq in (3, 2, 1)
+        ]
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = rows
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        repo = AuditRepository(mock_session)
+        logs, next_cursor = await repo.query_audit_page(AuditQueryFilters(limit=2))
+
+        assert [log["sequence_id"] for log in logs] == [3, 2]
+        assert decode_cursor(next_cursor) == (ts.isoformat(), 2)
+        assert mock_session.execute.call_args[0][1]["limit"] == 3
+
+
 class TestGetChainHead:
     """Tests for get_chain_head method."""
 
@@ -691,6 +833,58 @@ class TestGetChainHead:
         assert result is None
 
 
+class TestChainAnchors:
+    """Tests for get_chain_heads and verify_anchor_integrity."""
+
+    @pytest.mark.asyncio
+    async def test_get_chain_heads_excludes_root(self):
+        from src.audit.repository import AuditRepository
+
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [
+            ("alert", "a" * 64, 7, None),
+            ("order", "b" * 64, 9, None),
+        ]
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        repo = AuditRepository(mock_session)
+        heads = await repo.get_chain_heads()
+
+        assert [h["chain_key"] for h in heads] == ["alert", "order"]
+        assert heads[1]["sequence_id"] == 9
+        assert mock_session.execute.call_args[0][1] == {"exclude": "root"}
+
+    @pytest.mark.asyncio
+    async def test_verify_anchor_integrity_fetches_anchored_heads(self):
+        from src.audit.repository import AuditRepository
+
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [(7, "alert", "a" * 64), (9, "order", "f" * 64)]
+        mock_session.execute = AsyncMock(return_value=mock_result)
+        anchor = {
+            "sequence_id": 10,
+            "checksum": "c" * 64,
+            "prev_checksum": None,
+            "new_value": {
+                "heads": {
+                    "alert": {"sequence_id": 7, "checksum": "a" * 64},
+                    "order": {"sequence_id": 9, "checksum": "b" * 64},
+                }
+            },
+        }
+
+        repo = AuditRepository(mock_session)
+        with patch("src.audit.integrity.verify_checksum", return_value=True):
+            is_valid, errors = await repo.verify_anchor_integrity(anchor)
+
+        assert mock_session.execute.call_args[0][1] == {"seq_0": 7, "seq_1": 9}
+        assert is_valid is False
+        assert len(errors) == 1
+        assert "'order'" in errors[0]
+
+
 class TestVerifyChainIntegrity:
     """Tests for verify_chain_integrity method."""
 
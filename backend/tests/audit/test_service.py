@@ -14,12 +14,34 @@ from src.audit.models import (
     AuditEvent,
     AuditEventType,
     AuditSeverity,
+    ChainShardStrategy,
     EventSource,
     ResourceType,
     ValueMode,
 )
 
 
+def make_event(
+    resource_type: ResourceType = ResourceType.ALERT,
+    resource_id: str = "alert-456",
+) -> AuditEvent:
+    return AuditEvent(
+        event_id=uuid4(),
+        timestamp=datetime.now(tz=timezone.utc),
+        event_type=AuditEventType.ALERT_EMITTED,
+        severity=AuditSeverity.INFO,
+        actor_id="user-123",
+        actor_type=ActorType.USER,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        request_id="req-789",
+        source=EventSource.WEB,
+        environment="production",
+        service="trading-api",
+        version="1.0.0",
+    )
+
+
 class TestAuditServiceInit:
     """Tests for AuditService initialization."""
 
@@ -135,9 +157,9 @@ class TestAuditServiceLog:
 
             # Should have called redact_sensitive_fields with old_value
             calls = mock_redact.call_args_list
-            assert any(
-                call[0][0] == {"password": "secret"} for call in calls
-            ), "redact_sensitive_fields should be called with old_value"
+            assert any(call[0][0] == {"password": "secret"} for call in calls), (
+                "redact_sensitive_fields should be called with old_value"
+            )
 
     def test_log_applies_redaction_to_new_value(self):
         """log() should apply redaction to new_value."""
@@ -163,37 +185,41 @@ class TestAuditServiceLog:
 
             # Should have called redact_sensitive_fields with new_value
             calls = mock_redact.call_args_list
-            assert any(
-                call[0][0] == {"api_key": "secret"} for call in calls
-            ), "redact_sensitive_fields should be called with new_value"
+            assert any(call[0][0] == {"api_key": "secret"} for call in calls), (
+                "redact_sensitive_fields should be called with new_value"
+            )
+
+    def test_log_encodes_values_once_for_checksum_and_storage(self):
+        """log() attaches each value's canonical JSON; checksums are unchanged."""
+        from dataclasses import replace
 
-    def test_log_computes_diff_when_old_and_new_provided(self):
-        """log() should compute diff when old and new values are provided."""
+        from src.audit.integrity import compute_checksum
         from src.audit.service import AuditService
 
-        mock_repo = MagicMock()
-        service = AuditService(repository=mock_repo)
+        queue: asyncio.Queue = asyncio.Queue()
+        service = AuditService(repository=MagicMock(), async_queue=queue)
 
-        with patch("src.audit.service.redact_sensitive_fields", side_effect=lambda d, r: d):
-            with patch("src.audit.service.compute_diff_jsonpatch") as mock_diff:
-                mock_diff.return_value = {
-                    "patch": [{"op": "replace", "path": "/name", "value": "new"}]
-                }
+        service.log(
+            event_type=AuditEventType.ALERT_EMITTED,
+            actor_id="user-123",
+            actor_type=ActorType.USER,
+            resource_type=ResourceType.CONFIG,
+            resource_id="config-456",
+            request_id="req-789",
+            source=EventSource.WEB,
+            severity=AuditSeverity.INFO,
+            old_value={"name": "old", "password": "hunter22"},
+            new_value={"name": "new"},
+        )
 
-                service.log(
-                    event_type=AuditEventType.CONFIG_UPDATED,
-                    actor_id="user-123",
-                    actor_type=ActorType.USER,
-                    resource_type=ResourceType.CONFIG,
-                    resource_id="config-456",
-                    request_id="req-789",
-                    source=EventSource.WEB,
-                    severity=AuditSeverity.INFO,
-                    old_value={"name": "old"},
-                    new_value={"name": "new"},
-                )
+        event = queue.get_nowait()
+        assert event.old_value == {"name": "old", "password": "hu****22"}
+        assert event.old_value_json == '{"name": "old", "password": "hu****22"}'
+        assert event.new_value_json == '{"name": "new"}'
 
-                mock_diff.assert_called_once()
+        # Same checksum as an event that has to encode its values itself
+        plain = replace(event, old_value_json=None, new_value_json=None)
+        assert compute_checksum(event, 7, "prev") == compute_checksum(plain, 7, "prev")
 
     def test_log_enforces_size_limit_on_old_value(self):
         """log() should enforce size limit on old_value."""
@@ -330,11 +356,12 @@ class TestPersistSync:
 
     @pytest.mark.asyncio
     async def test_persist_sync_schedules_repository_call(self):
-        """_persist_sync should schedule repository.persist_audit_event."""
+        """_persist_sync should schedule a group commit of the event."""
         from src.audit.service import AuditService
 
         mock_repo = MagicMock()
-        mock_repo.persist_audit_event = AsyncMock(return_value=(1, "checksum"))
+        mock_repo.persist_audit_events = AsyncMock(return_value=[(1, "checksum")])
+        mock_repo.commit = AsyncMock()
 
         service = AuditService(repository=mock_repo)
 
@@ -360,7 +387,8 @@ class TestPersistSync:
         # Give the scheduled task time to run
         await asyncio.sleep(0.1)
 
-        mock_repo.persist_audit_event.assert_awaited_once_with(event)
+        mock_repo.persist_audit_events.assert_awaited_once_with([event], chain_key="default")
+        mock_repo.commit.assert_awaited_once()
 
 
 class TestEnqueueAsync:
@@ -450,7 +478,7 @@ class TestStartWorkers:
         from src.audit.service import AuditService
 
         mock_repo = MagicMock()
-        mock_repo.persist_audit_event = AsyncMock(return_value=(1, "checksum"))
+        mock_repo.persist_audit_events = AsyncMock(return_value=[(1, "checksum")])
 
         service = AuditService(repository=mock_repo)
 
@@ -468,7 +496,7 @@ class TestStartWorkers:
         from src.audit.service import AuditService
 
         mock_repo = MagicMock()
-        mock_repo.persist_audit_event = AsyncMock(return_value=(1, "checksum"))
+        mock_repo.persist_audit_events = AsyncMock(return_value=[(1, "checksum")])
 
         service = AuditService(repository=mock_repo)
 
@@ -485,7 +513,7 @@ class TestStartWorkers:
         from src.audit.service import AuditService
 
         mock_repo = MagicMock()
-        mock_repo.persist_audit_event = AsyncMock(return_value=(1, "checksum"))
+        mock_repo.persist_audit_events = AsyncMock(return_value=[(1, "checksum")])
 
         service = AuditService(repository=mock_repo)
 
@@ -512,11 +540,49 @@ class TestStartWorkers:
         # Give worker time to process
         await asyncio.sleep(0.1)
 
-        mock_repo.persist_audit_event.assert_awaited_once_with(event)
+        mock_repo.persist_audit_events.assert_awaited_once_with([event], chain_key="default")
 
         # Clean up
         await service.stop()
 
+    @pytest.mark.asyncio
+    async def test_workers_drain_queue_in_batches(self):
+        """A worker appends already-queued events together, up to batch_size."""
+        from src.audit.service import AuditService
+
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(return_value=[])
+
+        service = AuditService(repository=mock_repo, batch_size=3)
+        events = [
+            AuditEvent(
+                event_id=uuid4(),
+                timestamp=datetime.now(tz=timezone.utc),
+                event_type=AuditEventType.ALERT_EMITTED,
+                severity=AuditSeverity.INFO,
+                actor_id="user-123",
+                actor_type=ActorType.USER,
+                resource_type=ResourceType.ALERT,
+                resource_id=f"alert-{i}",
+                request_id="req-789",
+                source=EventSource.WEB,
+                environment="production",
+                service="trading-api",
+                version="1.0.0",
+            )
+            for i in range(5)
+        ]
+        for event in events:
+            service._queue.put_nowait(event)
+
+        service.start_workers(num_workers=1)
+        await asyncio.sleep(0.1)
+
+        batches = [c.args[0] for c in mock_repo.persist_audit_events.await_args_list]
+        assert batches == [events[:3], events[3:]]
+
+        await service.stop()
+
 
 class TestStop:
     """Tests for AuditService.stop() method."""
@@ -527,7 +593,7 @@ class TestStop:
         from src.audit.service import AuditService
 
         mock_repo = MagicMock()
-        mock_repo.persist_audit_event = AsyncMock(return_value=(1, "checksum"))
+        mock_repo.persist_audit_events = AsyncMock(return_value=[(1, "checksum")])
 
         service = AuditService(repository=mock_repo)
         service.start_workers(num_workers=2)
@@ -546,7 +612,7 @@ class TestStop:
         from src.audit.service import AuditService
 
         mock_repo = MagicMock()
-        mock_repo.persist_audit_event = AsyncMock(return_value=(1, "checksum"))
+        mock_repo.persist_audit_events = AsyncMock(return_value=[(1, "checksum")])
 
         service = AuditService(repository=mock_repo)
 
@@ -589,7 +655,7 @@ class TestStop:
         from src.audit.service import AuditService
 
         mock_repo = MagicMock()
-        mock_repo.persist_audit_event = AsyncMock(return_value=(1, "checksum"))
+        mock_repo.persist_audit_events = AsyncMock(return_value=[(1, "checksum")])
 
         service = AuditService(repository=mock_repo)
         service.start_workers()
@@ -667,6 +733,471 @@ class TestLogWithOptionalParameters:
         assert isinstance(result, UUID)
 
 
+class TestChainSharding:
+    """Tests for sharding events across hash chains and anchoring."""
+
+    @pytest.mark.asyncio
+    async def test_workers_append_one_batch_per_chain(self):
+        """Queued events are grouped by chain key, keeping queue order."""
+        from src.audit.service import AuditService
+
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(return_value=[])
+
+        service = AuditService(
+            repository=mock_repo, chain_strategy=ChainShardStrategy.RESOURCE_TYPE
+        )
+        alert_1 = make_event(ResourceType.ALERT, "alert-1")
+        order = make_event(ResourceType.ORDER, "order-1")
+        alert_2 = make_event(ResourceType.ALERT, "alert-2")
+        for event in (alert_1, order, alert_2):
+            service._queue.put_nowait(event)
+
+        service.start_workers(num_workers=1)
+        await asyncio.sleep(0.1)
+
+        calls = {
+            c.kwargs["chain_key"]: c.args[0] for c in mock_repo.persist_audit_events.await_args_list
+        }
+        assert calls == {"alert": [alert_1, alert_2], "order": [order]}
+
+        await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_failing_chain_does_not_drop_other_chains(self):
+        """An error on one chain's append still persists the other chains."""
+        from src.audit.service import AuditService
+
+        async def persist(events, chain_key):
+            if chain_key == "order":
+                raise RuntimeError("lock timeout")
+            return []
+
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(side_effect=persist)
+
+        service = AuditService(
+            repository=mock_repo, chain_strategy=ChainShardStrategy.RESOURCE_TYPE
+        )
+        service._queue.put_nowait(make_event(ResourceType.ORDER, "order-1"))
+        service._queue.put_nowait(make_event(ResourceType.ALERT, "alert-1"))
+
+        service.start_workers(num_workers=1)
+        await asyncio.sleep(0.1)
+
+        chains = [c.kwargs["chain_key"] for c in mock_repo.persist_audit_events.await_args_list]
+        assert chains == ["order", "alert"]
+        assert service._queue.empty()
+
+        await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_bad_event_does_not_drop_its_batch(self, caplog):
+        """A failing batch is split and retried; only the bad event is dropped."""
+        from src.audit.service import AuditService
+
+        events = [make_event(ResourceType.ALERT, f"alert-{i}") for i in range(5)]
+        bad = events[3]
+        persisted: list[AuditEvent] = []
+
+        async def persist(batch, chain_key):
+            if bad in batch:
+                raise ValueError("value too long")
+            persisted.extend(batch)
+            return []
+
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(side_effect=persist)
+        mock_repo.commit = AsyncMock()
+
+        service = AuditService(repository=mock_repo)
+        for event in events:
+            service._queue.put_nowait(event)
+
+        service.start_workers(num_workers=1)
+        await asyncio.sleep(0.1)
+
+        assert persisted == [e for e in events if e is not bad]
+        assert f"Dropped queued audit event {bad.event_id}" in caplog.text
+        assert caplog.text.count("Dropped queued audit event") == 1
+        assert service._queue.empty()
+
+        await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_each_chain_appends_in_its_own_savepoint(self):
+        """A failed chain rolls back to its savepoint, not the whole transaction."""
+        from src.audit.service import AuditService
+
+        log: list[str] = []
+
+        class Savepoint:
+            async def __aenter__(self):
+                log.append("begin")
+
+            async def __aexit__(self, exc_type, exc, tb):
+                log.append("rollback" if exc_type else "release")
+                return False
+
+        async def persist(events, chain_key):
+            log.append(chain_key)
+            if chain_key == "order":
+                raise RuntimeError("lock timeout")
+            return []
+
+        mock_repo = MagicMock()
+        mock_repo.savepoint = Savepoint
+        mock_repo.persist_audit_events = AsyncMock(side_effect=persist)
+
+        service = AuditService(
+            repository=mock_repo, chain_strategy=ChainShardStrategy.RESOURCE_TYPE
+        )
+        service._queue.put_nowait(make_event(ResourceType.ORDER, "order-1"))
+        service._queue.put_nowait(make_event(ResourceType.ALERT, "alert-1"))
+
+        service.start_workers(num_workers=1)
+        await asyncio.sleep(0.1)
+
+        assert log == ["begin", "order", "rollback", "begin", "alert", "release"]
+
+        await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_persist_sync_uses_hashed_chain(self):
+        """Tier-0 events go to the resource_id hash shard."""
+        from src.audit.config import get_chain_key
+        from src.audit.service import AuditService
+
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(return_value=[(1, "checksum")])
+        mock_repo.commit = AsyncMock()
+
+        service = AuditService(
+            repository=mock_repo,
+            chain_strategy=ChainShardStrategy.RESOURCE_ID_HASH,
+            shard_count=4,
+        )
+        event = make_event(ResourceType.ORDER, "order-42")
+        service._persist_sync(event)
+        await asyncio.sleep(0.05)
+
+        expected = get_chain_key(
+            ResourceType.ORDER, "order-42", ChainShardStrategy.RESOURCE_ID_HASH, 4
+        )
+        mock_repo.persist_audit_events.assert_awaited_once_with([event], chain_key=expected)
+
+    @pytest.mark.asyncio
+    async def test_anchor_chains_commits_heads_to_root(self):
+        """anchor_chains appends every shard head to the root chain."""
+        from src.audit.service import AuditService
+
+        mock_repo = MagicMock()
+        mock_repo.get_chain_heads = AsyncMock(
+            return_value=[
+                {"chain_key": "alert", "checksum": "a" * 64, "sequence_id": 7},
+                {"chain_key": "order", "checksum": "b" * 64, "sequence_id": 9},
+            ]
+        )
+        mock_repo.persist_audit_event = AsyncMock(return_value=(10, "c" * 64))
+        mock_repo.commit = AsyncMock()
+
+        service = AuditService(repository=mock_repo)
+        result = await service.anchor_chains()
+
+        assert result == (10, "c" * 64)
+        mock_repo.commit.assert_awaited_once()
+        mock_repo.get_chain_heads.assert_awaited_once_with(exclude="root")
+        anchor = mock_repo.persist_audit_event.await_args.args[0]
+        assert mock_repo.persist_audit_event.await_args.kwargs == {"chain_key": "root"}
+        assert anchor.event_type == AuditEventType.CHAIN_ANCHORED
+        assert anchor.resource_type == ResourceType.AUDIT_CHAIN
+        assert anchor.new_value == {
+            "heads": {
+                "alert": {"sequence_id": 7, "checksum": "a" * 64},
+                "order": {"sequence_id": 9, "checksum": "b" * 64},
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_anchor_chains_skips_when_no_chains(self):
+        from src.audit.service import AuditService
+
+        mock_repo = MagicMock()
+        mock_repo.get_chain_heads = AsyncMock(return_value=[])
+        mock_repo.persist_audit_event = AsyncMock()
+
+        service = AuditService(repository=mock_repo)
+
+        assert await service.anchor_chains() is None
+        mock_repo.persist_audit_event.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_workers_anchor_periodically(self):
+        """start_workers runs the anchor loop when an interval is set."""
+        from src.audit.service import AuditService
+
+        mock_repo = MagicMock()
+        mock_repo.get_chain_heads = AsyncMock(
+            return_value=[{"chain_key": "order", "checksum": "b" * 64, "sequence_id": 9}]
+        )
+        mock_repo.persist_audit_event = AsyncMock(return_value=(10, "c" * 64))
+        mock_repo.commit = AsyncMock()
+
+        service = AuditService(repository=mock_repo, anchor_interval_seconds=0.02)
+        service.start_workers(num_workers=1)
+        await asyncio.sleep(0.1)
+        await service.stop()
+
+        assert mock_repo.persist_audit_event.await_count >= 2
+        assert service._anchor_task is None
+
+
+class TestLogCritical:
+    """Tests for the awaitable tier-0 group-commit path."""
+
+    def _log_critical(self, service, resource_id: str = "order-1"):
+        return service.log_critical(
+            event_type=AuditEventType.ORDER_PLACED,
+            actor_id="user-123",
+            actor_type=ActorType.USER,
+            resource_type=ResourceType.ORDER,
+            resource_id=resource_id,
+            request_id="req-789",
+            source=EventSource.WEB,
+            severity=AuditSeverity.INFO,
+        )
+
+    @pytest.mark.asyncio
+    async def test_resolves_after_commit(self):
+        """The awaitable resolves to the event ID only after commit."""
+        from src.audit.service import AuditService
+
+        order: list[str] = []
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(
+            side_effect=lambda events, chain_key: order.append("append")
+        )
+        mock_repo.commit = AsyncMock(side_effect=lambda: order.append("commit"))
+
+        service = AuditService(repository=mock_repo)
+        event_id = await self._log_critical(service)
+
+        assert isinstance(event_id, UUID)
+        assert order == ["append", "commit"]
+        committed = mock_repo.persist_audit_events.await_args.args[0]
+        assert committed[0].event_id == event_id
+
+        await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_events_share_one_commit(self):
+        """Events submitted while a commit is in flight are committed together."""
+        from src.audit.service import AuditService
+
+        release = asyncio.Event()
+
+        async def slow_commit():
+            await release.wait()
+
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(return_value=[])
+        mock_repo.commit = AsyncMock(side_effect=slow_commit)
+
+        service = AuditService(repository=mock_repo)
+        first = self._log_critical(service, "order-0")
+        await asyncio.sleep(0.01)  # first commit now in flight
+        rest = [self._log_critical(service, f"order-{i}") for i in range(1, 11)]
+        release.set()
+        await asyncio.gather(first, *rest)
+
+        assert mock_repo.commit.await_count == 2
+        batches = [len(c.args[0]) for c in mock_repo.persist_audit_events.await_args_list]
+        assert batches == [1, 10]
+        assert service.commit_stats.groups == 2
+        assert service.commit_stats.max_group_size == 10
+
+        await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_group_is_split_per_chain_in_one_transaction(self):
+        from src.audit.service import AuditService
+
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(return_value=[])
+        mock_repo.commit = AsyncMock()
+
+        service = AuditService(
+            repository=mock_repo,
+            chain_strategy=ChainShardStrategy.RESOURCE_ID_HASH,
+            shard_count=8,
+        )
+        await asyncio.gather(*(self._log_critical(service, f"order-{i}") for i in range(20)))
+
+        chains = [c.kwargs["chain_key"] for c in mock_repo.persist_audit_events.await_args_list]
+        assert len(chains) == len(set(chains)) > 1
+        mock_repo.commit.assert_awaited_once()
+
+        await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_rejects_the_group(self):
+        from src.audit.service import AuditService
+
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(return_value=[])
+        mock_repo.commit = AsyncMock(side_effect=RuntimeError("disk full"))
+        mock_repo.rollback = AsyncMock()
+
+        service = AuditService(repository=mock_repo)
+
+        with pytest.raises(RuntimeError, match="disk full"):
+            await self._log_critical(service)
+        mock_repo.rollback.assert_awaited_once()
+        assert service.commit_stats.failures == 1
+
+        # The committer keeps serving later events
+        mock_repo.commit = AsyncMock()
+        assert isinstance(await self._log_critical(service), UUID)
+
+        await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_commit_rolls_back_and_rejects_pending(self):
+        """Cancelling the committer mid-commit fails every waiting caller."""
+        from src.audit.service import AuditService
+
+        async def hung_commit():
+            await asyncio.Event().wait()
+
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(return_value=[])
+        mock_repo.commit = AsyncMock(side_effect=hung_commit)
+        mock_repo.rollback = AsyncMock()
+
+        service = AuditService(repository=mock_repo)
+        in_flight = asyncio.ensure_future(self._log_critical(service, "order-0"))
+        await asyncio.sleep(0.01)  # first commit now in flight
+        waiting = asyncio.ensure_future(self._log_critical(service, "order-1"))
+        await asyncio.sleep(0)
+
+        service._committer.cancel()
+        results = await asyncio.wait_for(
+            asyncio.gather(in_flight, waiting, return_exceptions=True), timeout=1.0
+        )
+
+        assert all(isinstance(r, RuntimeError) and "stopped" in str(r) for r in results)
+        mock_repo.rollback.assert_awaited_once()
+        assert service._committer.done()
+
+        await service.stop()
+
+
+class TestSharedCommitter:
+    """Tier-0 and tier-1 writes share one group committer."""
+
+    def _log(self, service, event_type: AuditEventType, resource_id: str):
+        return service.log(
+            event_type=event_type,
+            actor_id="user-123",
+            actor_type=ActorType.USER,
+            resource_type=ResourceType.ORDER,
+            resource_id=resource_id,
+            request_id="req-789",
+            source=EventSource.WEB,
+            severity=AuditSeverity.INFO,
+        )
+
+    @pytest.mark.asyncio
+    async def test_tier1_batches_are_committed(self):
+        from src.audit.service import AuditService
+
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(return_value=[])
+        mock_repo.commit = AsyncMock()
+
+        service = AuditService(repository=mock_repo)
+        service.start_workers(num_workers=1)
+        self._log(service, AuditEventType.ALERT_EMITTED, "alert-1")
+        await asyncio.sleep(0.1)
+
+        mock_repo.commit.assert_awaited_once()
+        assert service.commit_stats.events == 1
+
+        await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_session_is_never_used_concurrently(self):
+        """Tier-0 commits, tier-1 batches and anchors never overlap on the session."""
+        from src.audit.service import AuditService
+
+        active = 0
+        peak = 0
+
+        async def use_session(*args, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return (1, "c" * 64)
+
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(side_effect=use_session)
+        mock_repo.persist_audit_event = AsyncMock(side_effect=use_session)
+        mock_repo.get_chain_heads = AsyncMock(
+            return_value=[{"chain_key": "order", "checksum": "b" * 64, "sequence_id": 9}]
+        )
+        mock_repo.commit = AsyncMock(side_effect=use_session)
+
+        service = AuditService(repository=mock_repo)
+        service.start_workers(num_workers=2)
+        for i in range(5):
+            self._log(service, AuditEventType.ALERT_EMITTED, f"alert-{i}")
+        for i in range(5):
+            self._log(service, AuditEventType.ORDER_PLACED, f"order-{i}")
+        await asyncio.gather(service.anchor_chains(), asyncio.sleep(0.2))
+
+        assert peak == 1
+        assert service.commit_stats.events == 10
+
+        await service.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_tier0_commit_keeps_committed_tier1_batch(self):
+        """A failing tier-0 commit only rolls back its own group."""
+        from src.audit.service import AuditService
+
+        calls: list[str] = []
+        mock_repo = MagicMock()
+        mock_repo.persist_audit_events = AsyncMock(return_value=[])
+        mock_repo.commit = AsyncMock(side_effect=lambda: calls.append("commit"))
+        mock_repo.rollback = AsyncMock(side_effect=lambda: calls.append("rollback"))
+
+        service = AuditService(repository=mock_repo)
+        service.start_workers(num_workers=1)
+        self._log(service, AuditEventType.ALERT_EMITTED, "alert-1")
+        await asyncio.sleep(0.1)
+
+        mock_repo.commit.side_effect = RuntimeError("disk full")
+        with pytest.raises(RuntimeError, match="disk full"):
+            await service.log_critical(
+                event_type=AuditEventType.ORDER_PLACED,
+                actor_id="user-123",
+                actor_type=ActorType.USER,
+                resource_type=ResourceType.ORDER,
+                resource_id="order-1",
+                request_id="req-789",
+                source=EventSource.WEB,
+                severity=AuditSeverity.INFO,
+            )
+
+        # The tier-1 event was committed in its own transaction first
+        assert calls == ["commit", "rollback"]
+        assert service.commit_stats.events == 1
+
+        await service.stop()
+
+
 class TestAuditServiceIntegration:
     """Integration tests for AuditService."""
 
@@ -676,11 +1207,12 @@ class TestAuditServiceIntegration:
         from src.audit.service import AuditService
 
         mock_repo = MagicMock()
-        mock_repo.persist_audit_event = AsyncMock(return_value=(1, "checksum"))
+        mock_repo.persist_audit_events = AsyncMock(return_value=[(1, "checksum")])
+        mock_repo.commit = AsyncMock()
 
         service = AuditService(repository=mock_repo)
 
-        # ORDER_PLACED is tier-0, should be persisted synchronously
+        # ORDER_PLACED is tier-0, should be group-committed
         event_id = service.log(
             event_type=AuditEventType.ORDER_PLACED,
             actor_id="user-123",
@@ -696,7 +1228,8 @@ class TestAuditServiceIntegration:
         assert isinstance(event_id, UUID)
         # Wait a bit for any async operations
         await asyncio.sleep(0.1)
-        mock_repo.persist_audit_event.assert_called_once()
+        mock_repo.persist_audit_events.assert_called_once()
+        mock_repo.commit.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_full_tier1_flow(self):
@@ -704,7 +1237,7 @@ class TestAuditServiceIntegration:
         from src.audit.service import AuditService
 
         mock_repo = MagicMock()
-        mock_repo.persist_audit_event = AsyncMock(return_value=(1, "checksum"))
+        mock_repo.persist_audit_events = AsyncMock(return_value=[(1, "checksum")])
 
         service = AuditService(repository=mock_repo)
         service.start_workers(num_workers=1)
@@ -727,6 +1260,6 @@ class TestAuditServiceIntegration:
         # Wait for worker to process
         await asyncio.sleep(0.2)
 
-        mock_repo.persist_audit_event.assert_called_once()
+        mock_repo.persist_audit_events.assert_called_once()
 
         await service.stop()
@@ -23,7 +23,7 @@ class TestInitAuditService:
 
                 init_audit_service(mock_session)
 
-                MockRepo.assert_called_once_with(mock_session)
+                MockRepo.assert_called_once_with(mock_session, archive=None)
 
     def test_init_audit_service_creates_service_with_repository(self):
         """init_audit_service should create service with the repository."""
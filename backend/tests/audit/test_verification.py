@@ -0,0 +1,272 @@
+"""Tests for streaming, checkpointed audit chain verification."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from src.audit.integrity import ChainVerifier, compute_checksum
+from src.audit.models import (
+    ActorType,
+    AuditEvent,
+    AuditEventType,
+    AuditSeverity,
+    EventSource,
+    ResourceType,
+)
+from src.audit.repository import AuditRepository
+from src.audit.verification import verify_chains
+
+BASE_TIME = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    """File-backed SQLite with audit tables, shareable across sessions."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'audit.db'}")
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("""
+            CREATE TABLE audit_logs (
+                id TEXT PRIMARY KEY,
+                sequence_id INTEGER NOT NULL,
+                timestamp TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                severity TEXT NOT NULL,
+                actor_id TEXT NOT NULL,
+                actor_type TEXT NOT NULL,
+                resource_type TEXT NOT NULL,
+                resource_id TEXT NOT NULL,
+                request_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                environment TEXT NOT NULL,
+                service TEXT NOT NULL,
+                version TEXT NOT NULL,
+                correlation_id TEXT,
+                value_mode TEXT NOT NULL,
+                old_value TEXT,
+                new_value TEXT,
+                metadata TEXT,
+                checksum TEXT NOT NULL,
+                prev_checksum TEXT,
+                chain_key TEXT NOT NULL
+            )
+        """)
+        )
+        await conn.execute(
+            text("""
+            CREATE TABLE audit_chain_head (
+                chain_key TEXT PRIMARY KEY,
+                checksum TEXT NOT NULL,
+                sequence_id INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        )
+        await conn.execute(
+            text("""
+            CREATE TABLE audit_verification_checkpoint (
+                chain_key TEXT PRIMARY KEY,
+                sequence_id INTEGER NOT NULL,
+                checksum TEXT NOT NULL,
+                events_verified INTEGER NOT NULL,
+                verified_at TEXT NOT NULL
+            )
+        """)
+        )
+
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+async def append_chain(factory, chain_key: str, sequence_ids: list[int]) -> list[str]:
+    """Insert a correctly chained run of events; returns their checksums."""
+    async with factory() as session:
+        head = await AuditRepository(session).get_chain_head(chain_key)
+        prev_checksum = head["checksum"] if head else None
+        checksums = []
+        for sequence_id in sequence_ids:
+            event = AuditEvent(
+                event_id=uuid4(),
+                timestamp=BASE_TIME + timedelta(seconds=sequence_id),
+                event_type=AuditEventType.ORDER_PLACED,
+                severity=AuditSeverity.INFO,
+                actor_id="user-123",
+                actor_type=ActorType.USER,
+                resource_type=ResourceType.ORDER,
+                resource_id=f"order-{sequence_id}",
+                request_id="req-789",
+                source=EventSource.WEB,
+                environment="production",
+                service="trading-api",
+                version="1.0.0",
+            )
+            checksum = compute_checksum(event, sequence_id, prev_checksum)
+            await session.execute(
+                text("""
+                    INSERT INTO audit_logs VALUES (
+                        :id, :sequence_id, :timestamp, 'order_placed', 'info',
+                        'user-123', 'user', 'order', :resource_id, 'req-789', 'web',
+                        'production', 'trading-api', '1.0.0', NULL, 'diff',
+                        NULL, NULL, NULL, :checksum, :prev_checksum, :chain_key
+                    )
+                """),
+                {
+                    "id": str(event.event_id),
+                    "sequence_id": sequence_id,
+                    "timestamp": event.timestamp.isoformat(),
+                    "resource_id": event.resource_id,
+                    "checksum": checksum,
+                    "prev_checksum": prev_checksum,
+                    "chain_key": chain_key,
+                },
+            )
+            checksums.append(checksum)
+            prev_checksum = checksum
+        await session.execute(
+            text("""
+                INSERT INTO audit_chain_head VALUES (:chain_key, :checksum, :sequence_id, 'now')
+                ON CONFLICT (chain_key) DO UPDATE SET
+                    checksum = excluded.checksum, sequence_id = excluded.sequence_id
+            """),
+            {"chain_key": chain_key, "checksum": prev_checksum, "sequence_id": sequence_ids[-1]},
+        )
+        await session.commit()
+    return checksums
+
+
+class TestChainVerifier:
+    """Tests for incremental ChainVerifier."""
+
+    def test_pages_verify_like_one_list(self):
+        """Feeding a chain in pages carries the link across page boundaries."""
+        rows = [
+            {"sequence_id": 1, "checksum": "a", "prev_checksum": None},
+            {"sequence_id": 2, "checksum": "b", "prev_checksum": "a"},
+            {"sequence_id": 3, "checksum": "c", "prev_checksum": "x"},
+        ]
+        verifier = ChainVerifier()
+        verifier.update(rows[:2])
+        verifier.update(rows[2:])
+
+        assert verifier.events_verified == 3
+        assert any("Chain broken at sequence_id=3" in e for e in verifier.errors)
+
+    def test_resume_requires_link_to_checkpoint(self):
+        verifier = ChainVerifier(prev_sequence_id=5, prev_checksum="e")
+        verifier.update([{"sequence_id": 6, "checksum": "f", "prev_checksum": None}])
+
+        assert any("Chain broken at sequence_id=6" in e for e in verifier.errors)
+
+
+class TestVerifyChainStreaming:
+    """Tests for AuditRepository.verify_chain_streaming on SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_verifies_whole_chain_across_pages(self, session_factory):
+        checksums = await append_chain(session_factory, "orders", list(range(1, 26)))
+
+        async with session_factory() as session:
+            result = await AuditRepository(session).verify_chain_streaming("orders", page_size=4)
+
+        assert result.is_valid, result.errors
+        assert result.events_verified == 25
+        assert result.verified_sequence_id == 25
+        assert result.verified_checksum == checksums[-1]
+        assert result.events_per_second > 0
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(self, session_factory):
+        await append_chain(session_factory, "orders", [1, 2, 3])
+        async with session_factory() as session:
+            await AuditRepository(session).verify_chain_streaming("orders")
+            await session.commit()
+
+        await append_chain(session_factory, "orders", [4, 5])
+        async with session_factory() as session:
+            repo = AuditRepository(session)
+            result = await repo.verify_chain_streaming("orders")
+            await session.commit()
+            checkpoint = await repo.get_verification_checkpoint("orders")
+
+        assert result.resumed_from == 3
+        assert result.events_verified == 2
+        assert result.is_valid, result.errors
+        assert checkpoint["sequence_id"] == 5
+        assert checkpoint["events_verified"] == 5
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_stops_at_first_break(self, session_factory):
+        await append_chain(session_factory, "orders", [1, 2, 3, 4])
+        async with session_factory() as session:
+            await session.execute(
+                text("UPDATE audit_logs SET resource_id = 'forged' WHERE sequence_id = 3")
+            )
+            await session.commit()
+
+        async with session_factory() as session:
+            repo = AuditRepository(session)
+            result = await repo.verify_chain_streaming("orders", page_size=2)
+            await session.commit()
+            checkpoint = await repo.get_verification_checkpoint("orders")
+
+        assert not result.is_valid
+        assert any("Invalid checksum at sequence_id=3" in e for e in result.errors)
+        assert result.verified_sequence_id == 2
+        assert checkpoint["sequence_id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_rewritten_checkpoint_event_restarts_from_scratch(self, session_factory):
+        await append_chain(session_factory, "orders", [1, 2, 3])
+        async with session_factory() as session:
+            await AuditRepository(session).verify_chain_streaming("orders")
+            await session.commit()
+            await session.execute(
+                text("UPDATE audit_logs SET checksum = 'forged' WHERE sequence_id = 3")
+            )
+            await session.commit()
+
+        async with session_factory() as session:
+            result = await AuditRepository(session).verify_chain_streaming("orders")
+
+        assert result.resumed_from is None
+        assert result.events_verified == 3
+        assert not result.is_valid
+
+    @pytest.mark.asyncio
+    async def test_max_events_bounds_one_run(self, session_factory):
+        await append_chain(session_factory, "orders", list(range(1, 11)))
+
+        async with session_factory() as session:
+            result = await AuditRepository(session).verify_chain_streaming(
+                "orders", page_size=3, max_events=4
+            )
+
+        assert result.events_verified == 4
+        assert result.verified_sequence_id == 4
+
+
+class TestVerifyChains:
+    """Tests for parallel verify_chains."""
+
+    @pytest.mark.asyncio
+    async def test_verifies_every_chain_in_parallel(self, session_factory):
+        await append_chain(session_factory, "alert", [1, 3, 5])
+        await append_chain(session_factory, "order", [2, 4, 6, 7])
+
+        report = await verify_chains(session_factory, concurrency=2, page_size=2)
+
+        assert [r.chain_key for r in report.results] == ["alert", "order"]
+        assert report.is_valid
+        assert report.events_verified == 7
+        assert report.events_per_second > 0
+
+        # Second run only reads new events
+        rerun = await verify_chains(session_factory)
+        assert rerun.events_verified == 0
+        assert [r.resumed_from for r in rerun.results] == [5, 7]
@@ -81,3 +81,33 @@ async def test_compression_settings_configured(db_session: AsyncSession):
     assert len(orderby_rows) == 1
     assert orderby_rows[0][0] == "executed_at"
     assert orderby_rows[0][1] is False, "executed_at should be ordered DESC"
+
+
+@pytest.mark.asyncio
+async def test_greeks_snapshots_is_hypertable(db_session: AsyncSession):
+    """greeks_snapshots should be a hypertable partitioned on as_of_ts."""
+    result = await db_session.execute(
+        text("""
+            SELECT column_name
+            FROM timescaledb_information.dimensions
+            WHERE hypertable_name = 'greeks_snapshots'
+        """)
+    )
+    row = result.fetchone()
+    assert row is not None
+    assert row[0] == "as_of_ts"
+
+
+@pytest.mark.asyncio
+async def test_greeks_continuous_aggregates_exist(db_session: AsyncSession):
+    """1m/15m/1h continuous aggregates should exist over greeks_snapshots."""
+    result = await db_session.execute(
+        text("""
+            SELECT view_name
+            FROM timescaledb_information.continuous_aggregates
+            WHERE hypertable_name = 'greeks_snapshots'
+            ORDER BY view_name
+        """)
+    )
+    views = [row[0] for row in result.fetchall()]
+    assert views == ["greeks_snapshots_15m", "greeks_snapshots_1h", "greeks_snapshots_1m"]
@@ -19,6 +19,7 @@ Test cases:
 
 from __future__ import annotations
 
+import asyncio
 import time
 from datetime import datetime, timezone
 
@@ -380,3 +381,143 @@ class TestCacheSize:
 
         data_cache.clear()
         assert data_cache.size == 0
+
+
+class TestCacheBounds:
+    """Tests for LRU/TTL bounds and counters."""
+
+    def test_lru_eviction_by_entries(self) -> None:
+        """The least recently used entry is evicted past max entries."""
+        cache = DataCache(config=DegradationConfig(cache_max_entries=2))
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert set(cache.keys()) == {"a", "c"}
+        assert cache.stats.evictions == 1
+
+    def test_eviction_by_bytes(self) -> None:
+        """Entries are evicted to keep the byte estimate within bounds."""
+        cache = DataCache(config=DegradationConfig(cache_max_bytes=100))
+        cache.set("a", "x" * 40)
+        cache.set("b", "x" * 40)
+        assert cache.byte_size == 84
+
+        cache.set("c", "x" * 40)
+
+        assert list(cache.keys()) == ["b", "c"]
+        assert cache.byte_size == 84
+        assert cache.stats.evictions == 1
+
+    def test_oversized_value_not_cached(self) -> None:
+        """A value larger than the byte bound is not cached."""
+        cache = DataCache(config=DegradationConfig(cache_max_bytes=10))
+        cache.set("a", "x" * 20)
+
+        assert cache.size == 0
+        assert cache.byte_size == 0
+
+    def test_overwrite_and_clear_adjust_bytes(self, data_cache: DataCache) -> None:
+        """Replacing or clearing entries keeps the byte estimate accurate."""
+        data_cache.set("a", "x" * 10)
+        data_cache.set("a", "x" * 20)
+        assert data_cache.byte_size == 22
+
+        data_cache.clear("a")
+        assert data_cache.byte_size == 0
+
+    def test_ttl_expiry(self, data_cache: DataCache, config: DegradationConfig) -> None:
+        """Entries older than the TTL are dropped on access."""
+        data_cache.set("a", 1)
+        data_cache._cache["a"].cached_at_mono -= config.cache_ttl_ms / 1000 + 1
+
+        assert data_cache.get("a") is None
+        assert data_cache.size == 0
+        assert data_cache.stats.expirations == 1
+
+    def test_hit_miss_counters(self, data_cache: DataCache) -> None:
+        """Lookups are counted as hits, stale hits, and misses."""
+        data_cache.set("fresh", 1)
+        data_cache.set("stale", 2, stale_threshold_ms=0)
+        data_cache._cache["stale"].cached_at_mono -= 1
+
+        data_cache.get("fresh")
+        data_cache.get_if_fresh("stale")
+        data_cache.get("missing")
+
+        assert data_cache.stats.hits == 2
+        assert data_cache.stats.stale_hits == 1
+        assert data_cache.stats.misses == 1
+        assert data_cache.stats.hit_rate == pytest.approx(2 / 3)
+
+
+class TestGetOrRefresh:
+    """Tests for stale-while-revalidate."""
+
+    @pytest.mark.asyncio
+    async def test_miss_calls_loader_once_for_concurrent_callers(
+        self, data_cache: DataCache
+    ) -> None:
+        """Concurrent misses share one loader call."""
+        calls = 0
+
+        async def loader() -> dict:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        results = await asyncio.gather(*(data_cache.get_or_refresh("k", loader) for _ in range(5)))
+
+        assert results == [({"value": 1}, False)] * 5
+        assert calls == 1
+        assert data_cache.stats.refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_served_while_refreshing(self, data_cache: DataCache) -> None:
+        """Stale data is returned immediately; one refresh runs in the background."""
+        data_cache.set("k", "old", stale_threshold_ms=0)
+        data_cache._cache["k"].cached_at_mono -= 1
+        release = asyncio.Event()
+        calls = 0
+
+        async def loader() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "new"
+
+        assert await data_cache.get_or_refresh("k", loader) == ("old", True)
+        assert await data_cache.get_or_refresh("k", loader) == ("old", True)
+
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert calls == 1
+        assert data_cache.get("k").data == "new"
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_error_keeps_stale(self, data_cache: DataCache) -> None:
+        """A failed background refresh leaves the stale entry in place."""
+        data_cache.set("k", "old", stale_threshold_ms=0)
+        data_cache._cache["k"].cached_at_mono -= 1
+
+        async def loader() -> str:
+            raise ConnectionError("broker down")
+
+        assert await data_cache.get_or_refresh("k", loader) == ("old", True)
+        await asyncio.sleep(0.01)
+
+        assert data_cache.get("k").data == "old"
+        assert data_cache.stats.refresh_errors == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_propagates_loader_error(self, data_cache: DataCache) -> None:
+        """On a miss there is nothing to serve, so the loader error is raised."""
+
+        async def loader() -> str:
+            raise ConnectionError("broker down")
+
+        with pytest.raises(ConnectionError):
+            await data_cache.get_or_refresh("k", loader)
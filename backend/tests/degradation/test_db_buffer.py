@@ -21,13 +21,26 @@ Test cases:
 from __future__ import annotations
 
 import json
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from src.degradation.config import DegradationConfig
-from src.degradation.db_buffer import BufferEntry, DBBuffer
+from src.degradation.db_buffer import (
+    WAL_MAGIC,
+    BufferEntry,
+    DBBuffer,
+    FlushStats,
+    FlushTarget,
+)
+
+# Flush target for the "order" entries used throughout
+ORDERS = {"order": FlushTarget(table="orders")}
 
 
 @pytest.fixture
@@ -377,7 +390,7 @@ class TestFlushClearsBuffer:
         self, config: DegradationConfig, temp_wal_path: Path
     ) -> None:
         """Flushing clears buffer and WAL."""
-        buffer = DBBuffer(config=config, wal_path=temp_wal_path)
+        buffer = DBBuffer(config=config, wal_path=temp_wal_path, flush_targets=ORDERS)
 
         # Add entries
         for i in range(5):
@@ -412,7 +425,7 @@ class TestFlushClearsBuffer:
         self, config: DegradationConfig, temp_wal_path: Path
     ) -> None:
         """Flush returns the count of flushed entries."""
-        buffer = DBBuffer(config=config, wal_path=temp_wal_path)
+        buffer = DBBuffer(config=config, wal_path=temp_wal_path, flush_targets=ORDERS)
 
         # Add 3 entries
         for i in range(3):
@@ -549,3 +562,351 @@ class TestDuplicateIdempotentKeys:
 
         # Should have deduplicated or kept original
         assert buffer.entry_count == 1
+
+
+def make_entry(i: int, payload: str = "") -> BufferEntry:
+    """Create an order entry with a distinct idempotent key."""
+    return BufferEntry(
+        resource_type="order",
+        resource_id=str(i),
+        data={"value": i, "payload": payload},
+        timestamp=datetime.now(tz=timezone.utc),
+        idempotent_key=f"order:{i}:1",
+    )
+
+
+class TestSegmentedWAL:
+    """Tests for segment rotation, CRC checks, and group commit."""
+
+    @pytest.fixture
+    def segment_config(self) -> DegradationConfig:
+        """Config whose WAL rotates every few records."""
+        return DegradationConfig(
+            db_buffer_max_entries=100,
+            db_buffer_max_bytes=100_000,
+            db_wal_segment_max_bytes=256,
+        )
+
+    def test_rotation_and_streaming_replay(
+        self, segment_config: DegradationConfig, temp_wal_path: Path
+    ) -> None:
+        """Entries spanning several segments are restored in order."""
+        buffer = DBBuffer(config=segment_config, wal_path=temp_wal_path)
+        for i in range(10):
+            buffer.add(make_entry(i, "x" * 50))
+
+        sealed = sorted(temp_wal_path.parent.glob(f"{temp_wal_path.name}.*"))
+        assert len(sealed) >= 2
+
+        restored = DBBuffer(config=segment_config, wal_path=temp_wal_path)
+        assert list(restored._entries) == [f"order:{i}:1" for i in range(10)]
+        assert restored.byte_count == buffer.byte_count
+
+    @pytest.mark.asyncio
+    async def test_flush_removes_segments(
+        self, segment_config: DegradationConfig, temp_wal_path: Path
+    ) -> None:
+        """Flushed segments are deleted and the active segment truncated."""
+        buffer = DBBuffer(config=segment_config, wal_path=temp_wal_path, flush_targets=ORDERS)
+        for i in range(10):
+            buffer.add(make_entry(i, "x" * 50))
+
+        await buffer.flush_to_db(AsyncMock())
+
+        assert list(temp_wal_path.parent.glob(f"{temp_wal_path.name}.*")) == []
+        assert temp_wal_path.read_bytes() == b""
+
+        buffer.add(make_entry(99))
+        assert DBBuffer(config=segment_config, wal_path=temp_wal_path).entry_count == 1
+
+    def test_torn_tail_is_discarded(self, config: DegradationConfig, temp_wal_path: Path) -> None:
+        """A partially written last record is dropped; earlier ones survive."""
+        buffer = DBBuffer(config=config, wal_path=temp_wal_path)
+        buffer.add(make_entry(1))
+        buffer.add(make_entry(2))
+        buffer.close()
+        raw = temp_wal_path.read_bytes()
+        temp_wal_path.write_bytes(raw[:-5])
+
+        restored = DBBuffer(config=config, wal_path=temp_wal_path)
+        assert list(restored._entries) == ["order:1:1"]
+
+        # New records are appended after the last valid one
+        restored.add(make_entry(3))
+        again = DBBuffer(config=config, wal_path=temp_wal_path)
+        assert list(again._entries) == ["order:1:1", "order:3:1"]
+
+    def test_crc_mismatch_stops_segment(
+        self, config: DegradationConfig, temp_wal_path: Path
+    ) -> None:
+        """A record whose CRC does not match is not replayed."""
+        buffer = DBBuffer(config=config, wal_path=temp_wal_path)
+        buffer.add(make_entry(1))
+        buffer.close()
+        raw = bytearray(temp_wal_path.read_bytes())
+        raw[-2] ^= 0xFF
+        temp_wal_path.write_bytes(bytes(raw))
+
+        assert DBBuffer(config=config, wal_path=temp_wal_path).entry_count == 0
+
+    def test_legacy_jsonl_wal_is_migrated(
+        self, config: DegradationConfig, temp_wal_path: Path
+    ) -> None:
+        """A JSONL WAL from before segmentation is restored and rewritten."""
+        lines = [json.dumps(make_entry(i).to_dict()) for i in range(3)]
+        temp_wal_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        restored = DBBuffer(config=config, wal_path=temp_wal_path)
+        assert restored.entry_count == 3
+        restored.close()
+
+        # Rewritten into a sealed segment; the JSONL file is gone
+        sealed = list(temp_wal_path.parent.glob(f"{temp_wal_path.name}.*"))
+        assert len(sealed) == 1
+        assert sealed[0].read_bytes().startswith(WAL_MAGIC)
+        assert temp_wal_path.read_bytes() == b""
+        assert DBBuffer(config=config, wal_path=temp_wal_path).entry_count == 3
+
+    def test_group_commit_batches_fsync(self, temp_wal_path: Path) -> None:
+        """Appends inside the sync interval share one fsync."""
+        config = DegradationConfig(db_wal_sync_interval_ms=60_000)
+        buffer = DBBuffer(config=config, wal_path=temp_wal_path)
+        for i in range(5):
+            buffer.add(make_entry(i))
+
+        assert buffer._wal is not None
+        assert buffer._wal.sync_count == 0
+
+        buffer.sync_wal()
+        buffer.sync_wal()  # nothing new to sync
+        assert buffer._wal.sync_count == 1
+        buffer.close()
+
+    def test_quiet_period_is_synced_on_deadline(self, temp_wal_path: Path) -> None:
+        """Records left unsynced when appends stop are fsynced by the timer."""
+        config = DegradationConfig(db_wal_sync_interval_ms=50)
+        buffer = DBBuffer(config=config, wal_path=temp_wal_path)
+        assert buffer._wal is not None
+        buffer._wal._last_sync = time.monotonic()
+        buffer.add(make_entry(1))
+        buffer.add(make_entry(2))
+        assert buffer._wal.sync_count == 0
+
+        deadline = time.monotonic() + 2
+        while buffer._wal.sync_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert buffer._wal.sync_count == 1
+        assert buffer._wal._dirty is False
+        buffer.close()
+
+
+@pytest_asyncio.fixture
+async def orders_session():
+    """In-memory SQLite session with a buffered_orders table."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("CREATE TABLE buffered_orders (order_id TEXT PRIMARY KEY, qty INTEGER, note TEXT)")
+        )
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+def make_order(order_id: str, seq: int, qty: int) -> BufferEntry:
+    """Create a full-row order entry."""
+    return BufferEntry(
+        resource_type="order",
+        resource_id=order_id,
+        data={"qty": qty, "note": f"seq{seq}"},
+        timestamp=datetime.now(tz=timezone.utc),
+        idempotent_key=f"order:{order_id}:{seq}",
+    )
+
+
+class TestBulkFlush:
+    """Tests for grouped, deduplicated, batched flush."""
+
+    @pytest.fixture
+    def flush_config(self) -> DegradationConfig:
+        """Config with small flush batches."""
+        return DegradationConfig(
+            db_buffer_max_entries=100,
+            db_buffer_max_bytes=100_000,
+            db_buffer_flush_batch_size=2,
+        )
+
+    @pytest.fixture
+    def targets(self) -> dict[str, FlushTarget]:
+        return {"order": FlushTarget(table="buffered_orders", key_column="order_id")}
+
+    @pytest.mark.asyncio
+    async def test_flush_upserts_latest_per_resource(
+        self,
+        flush_config: DegradationConfig,
+        targets: dict[str, FlushTarget],
+        temp_wal_path: Path,
+        orders_session: AsyncSession,
+    ) -> None:
+        """Only the latest entry per resource_id is written; all are flushed."""
+        await orders_session.execute(
+            text("INSERT INTO buffered_orders VALUES ('A', 1, 'before outage')")
+        )
+        await orders_session.commit()
+
+        buffer = DBBuffer(config=flush_config, wal_path=temp_wal_path, flush_targets=targets)
+        for entry in [
+            make_order("A", 1, 10),
+            make_order("B", 1, 20),
+            make_order("A", 2, 11),
+            make_order("C", 1, 30),
+        ]:
+            buffer.add(entry)
+
+        progress: list[tuple[int, int]] = []
+        flushed = await buffer.flush_to_db(
+            orders_session, progress=lambda s: progress.append((s.flushed, s.remaining))
+        )
+
+        assert flushed == 4
+        assert buffer.entry_count == 0
+        assert buffer.byte_count == 0
+        rows = (
+            await orders_session.execute(text("SELECT * FROM buffered_orders ORDER BY order_id"))
+        ).all()
+        assert rows == [("A", 11, "seq2"), ("B", 20, "seq1"), ("C", 30, "seq1")]
+        # Three rows in batches of two; the first batch carries both A entries
+        assert progress == [(3, 1), (4, 0)]
+        stats = buffer.flush_stats
+        assert stats.rows_written == 3
+        assert stats.batches == 2
+        assert stats.in_progress is False
+        assert stats.eta_seconds == 0.0
+
+    @pytest.mark.asyncio
+    async def test_rejected_rows_are_quarantined(
+        self,
+        flush_config: DegradationConfig,
+        temp_wal_path: Path,
+        orders_session: AsyncSession,
+    ) -> None:
+        """Rows the database rejects are rolled back to a savepoint and set aside."""
+        targets = {
+            "order": FlushTarget(table="buffered_orders", key_column="order_id"),
+            "fill": FlushTarget(table="missing_table"),
+        }
+        buffer = DBBuffer(config=flush_config, wal_path=temp_wal_path, flush_targets=targets)
+        bad_column = BufferEntry(
+            resource_type="order",
+            resource_id="X",
+            data={"missing_column": 1},
+            timestamp=datetime.now(tz=timezone.utc),
+            idempotent_key="order:X:1",
+        )
+        fill = BufferEntry(
+            resource_type="fill",
+            resource_id="F1",
+            data={"qty": 10},
+            timestamp=datetime.now(tz=timezone.utc),
+            idempotent_key="fill:F1:1",
+        )
+        unmapped = BufferEntry(
+            resource_type="position",
+            resource_id="P1",
+            data={"qty": 10},
+            timestamp=datetime.now(tz=timezone.utc),
+            idempotent_key="position:P1:1",
+        )
+        for entry in [make_order("A", 1, 10), bad_column, fill, unmapped, make_order("B", 1, 20)]:
+            buffer.add(entry)
+
+        flushed = await buffer.flush_to_db(orders_session)
+
+        assert flushed == 2
+        rows = (await orders_session.execute(text("SELECT order_id FROM buffered_orders"))).all()
+        assert sorted(r[0] for r in rows) == ["A", "B"]
+        stats = buffer.flush_stats
+        assert stats.remaining == 0
+        assert stats.last_error is None
+        assert {e.idempotent_key for e in buffer.quarantined_entries} == {
+            "order:X:1",
+            "fill:F1:1",
+            "position:P1:1",
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_keeps_remainder(
+        self,
+        flush_config: DegradationConfig,
+        targets: dict[str, FlushTarget],
+        temp_wal_path: Path,
+    ) -> None:
+        """A failing commit stops the flush; the batch stays buffered and in the WAL."""
+        buffer = DBBuffer(config=flush_config, wal_path=temp_wal_path, flush_targets=targets)
+        buffer.add(make_order("A", 1, 10))
+        session = AsyncMock()
+        session.commit.side_effect = ConnectionError("connection lost")
+
+        flushed = await buffer.flush_to_db(session)
+
+        assert flushed == 0
+        session.rollback.assert_awaited_once()
+        assert buffer.flush_stats.remaining == 1
+        assert buffer.flush_stats.quarantined == 0
+        assert buffer.flush_stats.last_error == "connection lost"
+        restored = DBBuffer(config=flush_config, wal_path=temp_wal_path)
+        assert "order:A:1" in restored._entries
+
+    @pytest.mark.asyncio
+    async def test_invalid_identifier_is_quarantined(
+        self,
+        flush_config: DegradationConfig,
+        targets: dict[str, FlushTarget],
+        temp_wal_path: Path,
+        orders_session: AsyncSession,
+    ) -> None:
+        """Entries with non-identifier keys are set aside; the rest still flush."""
+        targets = {**targets, "fill": FlushTarget(table="fills; DROP TABLE orders")}
+        buffer = DBBuffer(config=flush_config, wal_path=temp_wal_path, flush_targets=targets)
+        bad_column = BufferEntry(
+            resource_type="order",
+            resource_id="X",
+            data={"qty; DROP TABLE orders": 1},
+            timestamp=datetime.now(tz=timezone.utc),
+            idempotent_key="order:X:1",
+        )
+        bad_table = BufferEntry(
+            resource_type="fill",
+            resource_id="F1",
+            data={"qty": 1},
+            timestamp=datetime.now(tz=timezone.utc),
+            idempotent_key="fill:F1:1",
+        )
+        for entry in [bad_table, make_order("A", 1, 10), bad_column, make_order("B", 1, 20)]:
+            buffer.add(entry)
+
+        assert await buffer.flush_to_db(orders_session) == 2
+
+        rows = (await orders_session.execute(text("SELECT order_id FROM buffered_orders"))).all()
+        assert sorted(r[0] for r in rows) == ["A", "B"]
+        stats = buffer.flush_stats
+        assert stats.last_error is None
+        assert stats.remaining == 0
+        assert stats.quarantined == 2
+        assert {e.idempotent_key for e in buffer.quarantined_entries} == {
+            "order:X:1",
+            "fill:F1:1",
+        }
+        # Not retried by later flushes, but kept in the WAL
+        assert await buffer.flush_to_db(orders_session) == 0
+        restored = DBBuffer(config=flush_config, wal_path=temp_wal_path)
+        assert {"order:X:1", "fill:F1:1"} <= set(restored._entries)
+
+    def test_flush_stats_throughput(self) -> None:
+        """Throughput and ETA are derived from flushed entries and elapsed time."""
+        stats = FlushStats(flushed=100, remaining=50, elapsed_seconds=2.0)
+
+        assert stats.entries_per_second == 50.0
+        assert stats.eta_seconds == 1.0
+        assert FlushStats(remaining=5).eta_seconds is None
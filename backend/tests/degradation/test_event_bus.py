@@ -1,6 +1,7 @@
 """Tests for EventBus with drop-on-full behavior."""
 
 import asyncio
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -511,3 +512,165 @@ class TestMetrics:
 
         event_bus.subscribe(handler2)
         assert event_bus.subscriber_count == 2
+
+
+class TestPerSubscriberDispatch:
+    """Tests for per-subscriber queues, priority lanes, and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_delay_others(self, event_bus: EventBus) -> None:
+        """A blocked handler only backs up its own queue."""
+        release = asyncio.Event()
+        fast_received: list[SystemEvent] = []
+
+        async def slow_handler(event: SystemEvent) -> None:
+            await release.wait()
+
+        async def fast_handler(event: SystemEvent) -> None:
+            fast_received.append(event)
+
+        event_bus.subscribe(slow_handler, name="slow")
+        event_bus.subscribe(fast_handler, name="fast")
+        await event_bus.start()
+
+        for _ in range(3):
+            await event_bus.publish(create_test_event())
+        await asyncio.sleep(0.05)
+
+        assert len(fast_received) == 3
+        stats = {s.name: s for s in event_bus.subscriber_stats()}
+        assert stats["slow"].backlog == 2
+        assert stats["fast"].delivered == 3
+
+        release.set()
+        await event_bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_critical_events_skip_normal_backlog(self, fallback_log_path: Path) -> None:
+        """Queued critical events are handled before queued non-critical ones."""
+        bus = EventBus(config=DegradationConfig(), fallback_log_path=fallback_log_path)
+        release = asyncio.Event()
+        received: list[SystemEvent] = []
+
+        async def handler(event: SystemEvent) -> None:
+            await release.wait()
+            received.append(event)
+
+        bus.subscribe(handler)
+        await bus.start()
+
+        first = create_test_event()
+        await bus.publish(first)
+        await asyncio.sleep(0.01)  # handler now blocked on the first event
+        normal = [create_test_event() for _ in range(3)]
+        for event in normal:
+            await bus.publish(event)
+        critical = create_critical_event()
+        await bus.publish(critical)
+        await asyncio.sleep(0.01)
+
+        release.set()
+        await asyncio.sleep(0.05)
+
+        assert received == [first, critical, *normal]
+        await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_subscriber_queue_drops_and_counts(self, fallback_log_path: Path) -> None:
+        """Non-critical overflow is dropped per subscriber and logged."""
+        config = DegradationConfig(event_bus_subscriber_queue_size=2)
+        bus = EventBus(config=config, fallback_log_path=fallback_log_path)
+        release = asyncio.Event()
+
+        async def slow_handler(event: SystemEvent) -> None:
+            await release.wait()
+
+        async def fast_handler(event: SystemEvent) -> None:
+            pass
+
+        bus.subscribe(slow_handler, name="slow")
+        bus.subscribe(fast_handler, name="fast")
+        await bus.start()
+
+        await bus.publish(create_test_event())
+        await asyncio.sleep(0.01)  # slow handler holds the first event
+        for _ in range(4):
+            await bus.publish(create_test_event())
+        await asyncio.sleep(0.05)
+
+        stats = {s.name: s for s in bus.subscriber_stats()}
+        assert stats["slow"].dropped == 2
+        assert stats["slow"].backlog == 2
+        assert stats["fast"].dropped == 0
+        assert stats["fast"].delivered == 5
+        assert bus.drop_count == 0  # ingress never overflowed
+        assert "SubscriberQueueFull:slow" in fallback_log_path.read_text()
+
+        release.set()
+        await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_critical_lane_triggers_emergency(self, fallback_log_path: Path) -> None:
+        """A dropped critical event still triggers local emergency degradation."""
+        config = DegradationConfig(event_bus_critical_queue_size=1)
+        bus = EventBus(config=config, fallback_log_path=fallback_log_path)
+        callback = MagicMock()
+        bus.set_emergency_callback(callback)
+        release = asyncio.Event()
+
+        async def handler(event: SystemEvent) -> None:
+            await release.wait()
+
+        bus.subscribe(handler)
+        await bus.start()
+
+        await bus.publish(create_critical_event())
+        await asyncio.sleep(0.01)  # handler holds the first event
+        await bus.publish(create_critical_event())
+        dropped = create_critical_event()
+        await bus.publish(dropped)
+        await asyncio.sleep(0.05)
+
+        callback.assert_called_once_with(dropped)
+        assert bus.subscriber_stats()[0].critical_dropped == 1
+
+        release.set()
+        await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_stats_track_lag_and_errors(self, event_bus: EventBus) -> None:
+        """Lag is measured from event creation; handler errors are counted."""
+
+        async def failing_handler(event: SystemEvent) -> None:
+            raise ValueError("boom")
+
+        event_bus.subscribe(failing_handler)
+        event = create_test_event()
+        event = replace(event, event_time_mono=event.event_time_mono - 0.5)
+        await event_bus.publish(event)
+        await event_bus.start()
+        await asyncio.sleep(0.05)
+
+        (stats,) = event_bus.subscriber_stats()
+        assert stats.name.endswith("failing_handler")
+        assert stats.delivered == 1
+        assert stats.errors == 1
+        assert stats.last_lag_seconds >= 0.5
+        assert stats.max_lag_seconds == stats.last_lag_seconds
+        await event_bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_subscribe_after_start(self, event_bus: EventBus) -> None:
+        """Handlers subscribed while running get their own dispatch task."""
+        await event_bus.start()
+        received: list[SystemEvent] = []
+
+        async def handler(event: SystemEvent) -> None:
+            received.append(event)
+
+        event_bus.subscribe(handler)
+        await event_bus.publish(create_test_event())
+        await asyncio.sleep(0.05)
+
+        assert len(received) == 1
+        await event_bus.stop()
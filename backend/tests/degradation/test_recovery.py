@@ -16,10 +16,13 @@ Test cases:
 from __future__ import annotations
 
 import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from src.degradation.config import DegradationConfig
+from src.degradation.db_buffer import BufferEntry, DBBuffer, FlushTarget
 from src.degradation.event_bus import EventBus
 from src.degradation.models import (
     RecoveryStage,
@@ -425,3 +428,73 @@ class TestStageChecks:
         success = await recovery_orchestrator.advance_stage(run_id)
         assert success is True
         assert recovery_orchestrator.is_recovering is False
+
+    @pytest.mark.asyncio
+    async def test_ready_stage_waits_for_db_buffer_flush(
+        self, config: DegradationConfig, state_service: SystemStateService
+    ) -> None:
+        """READY does not complete while buffered DB writes remain."""
+        db_buffer = DBBuffer(config=config, flush_targets={"order": FlushTarget(table="orders")})
+        db_buffer.add(
+            BufferEntry(
+                resource_type="order",
+                resource_id="1",
+                data={"qty": 1},
+                timestamp=datetime.now(tz=timezone.utc),
+                idempotent_key="order:1:1",
+            )
+        )
+        orchestrator = RecoveryOrchestrator(config, state_service, db_buffer=db_buffer)
+        run_id = await orchestrator.start_recovery(
+            trigger=RecoveryTrigger.MANUAL,
+            operator_id="test_operator",
+        )
+        for _ in range(3):
+            await orchestrator.advance_stage(run_id)
+        assert orchestrator.current_stage == RecoveryStage.READY
+
+        assert await orchestrator.advance_stage(run_id) is False
+        assert orchestrator.is_recovering is True
+
+        await db_buffer.flush_to_db(AsyncMock())
+        assert await orchestrator.advance_stage(run_id) is True
+        assert state_service.mode == SystemMode.NORMAL
+
+    @pytest.mark.asyncio
+    async def test_ready_stage_starts_db_buffer_flush(
+        self, config: DegradationConfig, state_service: SystemStateService
+    ) -> None:
+        """With a session factory, READY flushes the backlog itself."""
+        db_buffer = DBBuffer(config=config, flush_targets={"order": FlushTarget(table="orders")})
+        db_buffer.add(
+            BufferEntry(
+                resource_type="order",
+                resource_id="1",
+                data={"qty": 1},
+                timestamp=datetime.now(tz=timezone.utc),
+                idempotent_key="order:1:1",
+            )
+        )
+        session = AsyncMock()
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        orchestrator = RecoveryOrchestrator(
+            config, state_service, db_buffer=db_buffer, db_session_factory=session_factory
+        )
+        run_id = await orchestrator.start_recovery(
+            trigger=RecoveryTrigger.MANUAL,
+            operator_id="test_operator",
+        )
+        for _ in range(3):
+            await orchestrator.advance_stage(run_id)
+
+        assert await orchestrator.advance_stage(run_id) is False
+        assert orchestrator._flush_task is not None
+        await orchestrator._flush_task
+
+        session.commit.assert_awaited()
+        assert await orchestrator.advance_stage(run_id) is True
+        assert state_service.mode == SystemMode.NORMAL
@@ -1718,6 +1718,153 @@ class TestConstraintResolverCacheInvalidation(TestConstraintResolverFixtures):
         await resolver.invalidate_cache("AAPL")
 
 
+class TestConstraintRegistryIndex(TestConstraintResolverFixtures):
+    """Tests for the compiled symbol/strategy index and registry version."""
+
+    def test_filter_by_symbol_matches_scan_in_registration_order(
+        self,
+        sample_constraint_all_symbols,
+        sample_constraint_aapl,
+        sample_constraint_high_priority,
+    ):
+        from src.governance.constraints.registry import ConstraintRegistry
+
+        registry = ConstraintRegistry()
+        registry.register(sample_constraint_aapl)
+        registry.register(sample_constraint_all_symbols)
+        registry.register(sample_constraint_high_priority)
+
+        for symbol in ("AAPL", "GOOGL", "UNKNOWN"):
+            expected = [
+                c
+                for c in registry.list_all()
+                if not c.applies_to.symbols or symbol in c.applies_to.symbols
+            ]
+            assert registry.filter_by_symbol(symbol) == expected
+
+        strategies = {s for c in registry.list_all() for s in c.applies_to.strategies}
+        for strategy_id in (*strategies, "unknown_strategy"):
+            expected = [
+                c
+                for c in registry.list_all()
+                if not c.applies_to.strategies or strategy_id in c.applies_to.strategies
+            ]
+            assert registry.filter_by_strategy(strategy_id) == expected
+
+    def test_changes_bump_version_and_rebuild_index(
+        self, sample_constraint_aapl, sample_constraint_all_symbols
+    ):
+        from src.governance.constraints.registry import ConstraintRegistry
+
+        registry = ConstraintRegistry()
+        registry.register(sample_constraint_aapl)
+        version = registry.version
+        assert registry.filter_by_symbol("GOOGL") == []
+
+        registry.register(sample_constraint_all_symbols)
+        assert registry.version == version + 1
+        assert registry.filter_by_symbol("GOOGL") == [sample_constraint_all_symbols]
+
+        registry.unregister(sample_constraint_all_symbols.id)
+        assert registry.version == version + 2
+        assert registry.filter_by_symbol("GOOGL") == []
+
+
+class TestConstraintResolverMemoization(TestConstraintResolverFixtures):
+    """Tests for memoized resolution keyed by registry versions."""
+
+    def test_resolve_memoizes_until_registry_changes(
+        self,
+        hypothesis_registry,
+        constraint_registry,
+        sample_constraint_high_priority,
+    ):
+        from unittest.mock import patch
+
+        from src.governance.constraints.resolver import ConstraintResolver
+
+        resolver = ConstraintResolver(
+            constraint_registry=constraint_registry,
+            hypothesis_registry=hypothesis_registry,
+        )
+
+        with patch.object(
+            constraint_registry,
+            "filter_by_symbol",
+            wraps=constraint_registry.filter_by_symbol,
+        ) as spy:
+            first = resolver.resolve("AAPL")
+            assert resolver.resolve("AAPL") is first
+            assert spy.call_count == 1
+
+            constraint_registry.register(sample_constraint_high_priority)
+            updated = resolver.resolve("AAPL")
+
+        assert spy.call_count == 2
+        assert updated.version != first.version
+        assert "high_priority_constraint" in [c.constraint_id for c in updated.constraints]
+
+    def test_hypothesis_change_recomputes_activation(
+        self,
+        hypothesis_registry,
+        sample_constraint_requires_active_hypothesis,
+    ):
+        from src.governance.constraints.registry import ConstraintRegistry
+        from src.governance.constraints.resolver import ConstraintResolver
+
+        constraint_registry = ConstraintRegistry()
+        constraint_registry.register(sample_constraint_requires_active_hypothesis)
+        resolver = ConstraintResolver(
+            constraint_registry=constraint_registry,
+            hypothesis_registry=hypothesis_registry,
+        )
+        assert resolver.resolve("AAPL").constraints
+
+        hypothesis_registry.unregister("momentum_persistence")
+
+        assert resolver.resolve("AAPL").constraints == []
+
+    def test_activation_evaluated_once_across_symbols(
+        self,
+        hypothesis_registry,
+        sample_constraint_requires_active_hypothesis,
+    ):
+        from unittest.mock import patch
+
+        from src.governance.constraints.registry import ConstraintRegistry
+        from src.governance.constraints.resolver import ConstraintResolver
+
+        constraint_registry = ConstraintRegistry()
+        constraint_registry.register(sample_constraint_requires_active_hypothesis)
+        resolver = ConstraintResolver(
+            constraint_registry=constraint_registry,
+            hypothesis_registry=hypothesis_registry,
+        )
+
+        with patch.object(
+            resolver, "_is_constraint_active", wraps=resolver._is_constraint_active
+        ) as spy:
+            for symbol in ("AAPL", "MSFT", "GOOGL"):
+                resolver.resolve(symbol)
+
+        assert spy.call_count == 1
+
+    def test_invalidate_forces_recompute(self, hypothesis_registry, constraint_registry):
+        from src.governance.constraints.resolver import ConstraintResolver
+
+        resolver = ConstraintResolver(
+            constraint_registry=constraint_registry,
+            hypothesis_registry=hypothesis_registry,
+        )
+        first = resolver.resolve("AAPL")
+
+        resolver.invalidate()
+
+        second = resolver.resolve("AAPL")
+        assert second is not first
+        assert second.version == first.version
+
+
 class TestConstraintResolverResolvedAction(TestConstraintResolverFixtures):
     """Tests for ResolvedAction model."""
 
@@ -815,9 +815,7 @@ class TestGreeksAggregatorTopContributors:
             _make_position_greeks(position_id=2, dollar_delta=Decimal("3000.00")),
         ]
 
-        result = agg.get_top_contributors(
-            positions, RiskMetric.IMPLIED_VOLATILITY, top_n=10
-        )
+        result = agg.get_top_contributors(positions, RiskMetric.IMPLIED_VOLATILITY, top_n=10)
 
         assert result == []
 
@@ -986,3 +984,128 @@ class TestGreeksAggregatorTopContributors:
 
         # Should return all 2 positions
         assert len(result) == 2
+
+
+class TestStatefulGreeksAggregator:
+    """Tests for delta-maintained aggregates."""
+
+    def test_matches_full_aggregation(self):
+        """Upserts and removes give the same result as re-aggregating."""
+        from src.greeks.aggregator import GreeksAggregator, StatefulGreeksAggregator
+
+        positions = [
+            _make_position_greeks(1, strategy_id="s1"),
+            _make_position_greeks(2, strategy_id="s1", dollar_delta=Decimal("-700")),
+            _make_position_greeks(3, strategy_id="s2", valid=False),
+            _make_position_greeks(4, quality_warnings=["stale"]),
+        ]
+        stateful = StatefulGreeksAggregator("acc_001")
+        stateful.reset(positions)
+
+        # Replace one leg, remove another
+        replacement = _make_position_greeks(2, strategy_id="s1", dollar_delta=Decimal("1234"))
+        stateful.upsert(replacement)
+        stateful.remove(3)
+        expected_positions = [positions[0], replacement, positions[3]]
+
+        account, strategies = stateful.snapshot()
+        exp_account, exp_strategies = GreeksAggregator().aggregate_by_strategy(
+            expected_positions, "acc_001"
+        )
+
+        assert account.dollar_delta == exp_account.dollar_delta
+        assert account.total_legs_count == exp_account.total_legs_count
+        assert account.valid_notional == exp_account.valid_notional
+        assert account.missing_positions == exp_account.missing_positions == []
+        assert account.warning_legs_count == exp_account.warning_legs_count == 1
+        assert set(strategies) == set(exp_strategies) == {"s1", "_unassigned_"}
+        assert strategies["s1"].dollar_delta == exp_strategies["s1"].dollar_delta
+
+    def test_tracks_missing_and_high_risk(self):
+        from src.greeks.aggregator import StatefulGreeksAggregator
+
+        stateful = StatefulGreeksAggregator("acc_001")
+        stateful.upsert(_make_position_greeks(1, valid=False, gamma_dollar=Decimal("5000")))
+        account, _ = stateful.snapshot()
+        assert account.missing_positions == [1]
+        assert account.has_high_risk_missing_legs is True
+
+        stateful.upsert(_make_position_greeks(1))
+        account, _ = stateful.snapshot()
+        assert account.missing_positions == []
+        assert account.has_high_risk_missing_legs is False
+
+    def test_timestamps_survive_restamping(self):
+        """Bounds come from insert-time stamps, or the caller's as_of_ts."""
+        from src.greeks.aggregator import StatefulGreeksAggregator
+
+        old = datetime.now(timezone.utc) - timedelta(minutes=5)
+        pg = _make_position_greeks(1, as_of_ts=old)
+        stateful = StatefulGreeksAggregator("acc_001")
+        stateful.upsert(pg)
+        pg.as_of_ts = datetime.now(timezone.utc)
+
+        account, _ = stateful.snapshot()
+        assert account.as_of_ts_min == old
+
+        now = datetime.now(timezone.utc)
+        account, _ = stateful.snapshot(as_of_ts=now)
+        assert account.as_of_ts == now
+
+        stateful.remove(1)
+        account, strategies = stateful.snapshot()
+        assert account.has_positions is False
+        assert strategies == {}
+
+    def test_top_contributors_match_full_sort_under_random_updates(self):
+        """Heap-maintained top-K equals a full sort after arbitrary deltas."""
+        import random
+
+        from src.greeks.aggregator import GreeksAggregator, StatefulGreeksAggregator
+        from src.greeks.models import RiskMetric
+
+        rng = random.Random(11)  # noqa: S311
+
+        def random_leg(pid: int):
+            return _make_position_greeks(
+                pid,
+                dollar_delta=Decimal(rng.randint(-100000, 100000)),
+                gamma_dollar=Decimal(rng.randint(-5000, 5000)),
+                vega_per_1pct=Decimal(rng.randint(-3000, 3000)),
+                theta_per_day=Decimal(rng.randint(-500, 500)),
+                valid=rng.random() > 0.05,
+            )
+
+        stateful = StatefulGreeksAggregator("acc_001", top_k=5)
+        stateful.reset([random_leg(pid) for pid in range(200)])
+
+        for _ in range(500):
+            pid = rng.randrange(250)
+            if rng.random() < 0.2:
+                stateful.remove(pid)
+            else:
+                stateful.apply(upserts=[random_leg(pid)])
+
+            if rng.random() < 0.2:
+                held = [stateful.get(p) for p in range(250) if p in stateful]
+                for metric in (RiskMetric.DELTA, RiskMetric.GAMMA, RiskMetric.VEGA):
+                    expected = GreeksAggregator().get_top_contributors(held, metric, top_n=5)
+                    actual = stateful.get_top_contributors(metric, top_n=5)
+                    assert [c.contribution_abs for c in actual] == [
+                        c.contribution_abs for c in expected
+                    ]
+
+    def test_top_contributors_beyond_top_k_falls_back(self):
+        from src.greeks.aggregator import StatefulGreeksAggregator
+        from src.greeks.models import RiskMetric
+
+        stateful = StatefulGreeksAggregator("acc_001", top_k=2)
+        stateful.reset(
+            [_make_position_greeks(pid, dollar_delta=Decimal(pid * 100)) for pid in range(1, 6)]
+        )
+
+        result = stateful.get_top_contributors(RiskMetric.DELTA, top_n=4)
+
+        assert [c.position.position_id for c in result] == [5, 4, 3, 2]
+        assert [c.rank for c in result] == [1, 2, 3, 4]
+        assert stateful.get_top_contributors(RiskMetric.IMPLIED_VOLATILITY) == []
@@ -1,8 +1,14 @@
 """Tests for Black-Scholes Greeks calculator."""
 
+import math
 from decimal import Decimal
 
-from src.greeks.black_scholes import calculate_bs_greeks
+import numpy as np
+from src.greeks.black_scholes import (
+    calculate_bs_greeks,
+    calculate_bs_greeks_batch,
+    norm_cdf_array,
+)
 
 
 class TestBlackScholesGreeks:
@@ -236,3 +242,72 @@ class TestBlackScholesEdgeCases:
         assert result.gamma == Decimal("0")
         assert result.vega == Decimal("0")
         assert result.theta == Decimal("0")
+
+
+class TestBlackScholesBatch:
+    """Tests for vectorized BS pricing."""
+
+    def test_batch_matches_scalar(self):
+        """Batch Greeks should match the scalar path leg by leg."""
+        legs = [
+            (100, 100, 0.25, 0.20, True),
+            (100, 100, 0.25, 0.20, False),
+            (150, 100, 0.10, 0.35, True),
+            (50, 100, 1.50, 0.60, False),
+            (420, 400, 0.02, 0.15, True),
+        ]
+        batch = calculate_bs_greeks_batch(
+            spot=[leg[0] for leg in legs],
+            strike=[leg[1] for leg in legs],
+            time_to_expiry_years=[leg[2] for leg in legs],
+            risk_free_rate=0.05,
+            volatility=[leg[3] for leg in legs],
+            is_call=[leg[4] for leg in legs],
+        )
+
+        for i, (spot, strike, t, vol, is_call) in enumerate(legs):
+            scalar = calculate_bs_greeks(
+                spot=Decimal(str(spot)),
+                strike=Decimal(str(strike)),
+                time_to_expiry_years=Decimal(str(t)),
+                risk_free_rate=Decimal("0.05"),
+                volatility=Decimal(str(vol)),
+                is_call=is_call,
+            )
+            assert abs(batch.delta[i] - float(scalar.delta)) < 1e-6
+            assert abs(batch.gamma[i] - float(scalar.gamma)) < 1e-8
+            assert abs(batch.vega[i] - float(scalar.vega)) < 1e-6
+            assert abs(batch.theta[i] - float(scalar.theta)) < 1e-6
+
+    def test_put_call_parity(self):
+        """C - P = S - K e^(-rT)."""
+        batch = calculate_bs_greeks_batch(
+            spot=[100, 100],
+            strike=[95, 95],
+            time_to_expiry_years=0.5,
+            risk_free_rate=0.05,
+            volatility=0.25,
+            is_call=[True, False],
+        )
+        parity = 100 - 95 * math.exp(-0.05 * 0.5)
+        assert abs((batch.price[0] - batch.price[1]) - parity) < 1e-9
+
+    def test_invalid_rows_zeroed_with_intrinsic_price(self):
+        """Invalid inputs get zero Greeks and intrinsic value as price."""
+        batch = calculate_bs_greeks_batch(
+            spot=[110, 90, 100],
+            strike=[100, 100, 0],
+            time_to_expiry_years=[0, 0.25, 0.25],
+            risk_free_rate=0.05,
+            volatility=[0.20, 0, 0.20],
+            is_call=[True, False, True],
+        )
+        assert batch.delta.tolist() == [0.0, 0.0, 0.0]
+        assert batch.gamma.tolist() == [0.0, 0.0, 0.0]
+        assert batch.price.tolist() == [10.0, 10.0, 0.0]
+
+    def test_norm_cdf_array_matches_erf(self):
+        """Vectorized CDF should match math.erf to near double precision."""
+        xs = np.linspace(-10, 10, 401)
+        expected = np.array([0.5 * (1 + math.erf(x / math.sqrt(2))) for x in xs])
+        assert np.max(np.abs(norm_cdf_array(xs) - expected)) < 1e-12
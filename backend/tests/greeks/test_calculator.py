@@ -10,6 +10,8 @@ Tests cover:
 
 from decimal import Decimal
 
+import pytest
+
 
 class TestPositionInfo:
     """Tests for PositionInfo dataclass."""
@@ -796,6 +798,60 @@ class TestFutuGreeksProvider:
 
         assert result == {}  # Position skipped due to invalid price
 
+    @pytest.mark.asyncio
+    async def test_fetch_greeks_async_shares_coalesced_batches(self):
+        """Concurrent async fetches in shared mode make one OpenD call per kind."""
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        from src.greeks.calculator import FutuGreeksProvider, PositionInfo
+        from src.greeks.futu_client import CoalescingFutuClient, FutuOptionGreeks
+
+        def position(position_id: int, symbol: str) -> PositionInfo:
+            return PositionInfo(
+                position_id=position_id,
+                symbol=symbol,
+                underlying_symbol="AAPL",
+                quantity=10,
+                multiplier=100,
+                option_type="call",
+                strike=Decimal("150.00"),
+                expiry="2024-01-19",
+            )
+
+        shared = MagicMock()
+        shared.get_underlying_price.return_value = {"US.AAPL": Decimal("150.00")}
+        shared.get_option_greeks.side_effect = lambda symbols, raise_errors=False: {
+            s: FutuOptionGreeks(
+                code=s,
+                delta=Decimal("0.5"),
+                gamma=Decimal("0.02"),
+                vega=Decimal("0.30"),
+                theta=Decimal("-0.04"),
+                implied_volatility=Decimal("0.25"),
+                underlying_price=Decimal("150.00"),
+            )
+            for s in symbols
+        }
+        client = CoalescingFutuClient(client=shared, coalesce_window_seconds=0.02)
+
+        with (
+            patch("src.greeks.futu_client.SharedFutuClient.configure"),
+            patch.object(CoalescingFutuClient, "get_instance", return_value=client),
+        ):
+            provider = FutuGreeksProvider()
+            first, second = await asyncio.gather(
+                provider.fetch_greeks_async([position(1, "AAPL_C1"), position(2, "AAPL_C2")]),
+                provider.fetch_greeks_async([position(3, "AAPL_C2")]),
+            )
+        client.close()
+
+        assert set(first) == {1, 2}
+        assert set(second) == {3}
+        assert second[3].underlying_price == Decimal("150.00")
+        shared.get_option_greeks.assert_called_once()
+        shared.get_underlying_price.assert_called_once()
+
 
 class TestGreeksProviderProtocol:
     """Tests for GreeksProvider protocol."""
@@ -988,6 +1044,72 @@ class TestGreeksCalculator:
         # delta * qty * mult * price = 0.45 * 10 * 100 * 150 = 67500
         assert results[0].dollar_delta == Decimal("67500")
 
+    @pytest.mark.asyncio
+    async def test_calculate_async_awaits_primary_and_offloads_sync_fallback(self):
+        """calculate_async awaits async providers and runs sync ones off the loop."""
+        import threading
+
+        from src.greeks.calculator import GreeksCalculator, PositionInfo, RawGreeks
+        from src.greeks.models import GreeksDataSource
+
+        calls: list[str] = []
+
+        class AsyncPrimary:
+            @property
+            def source(self) -> GreeksDataSource:
+                return GreeksDataSource.FUTU
+
+            def fetch_greeks(self, positions: list[PositionInfo]) -> dict[int, RawGreeks]:
+                raise AssertionError("sync path used")
+
+            async def fetch_greeks_async(
+                self, positions: list[PositionInfo]
+            ) -> dict[int, RawGreeks]:
+                calls.append("primary")
+                return {}
+
+        class BlockingFallback:
+            @property
+            def source(self) -> GreeksDataSource:
+                return GreeksDataSource.MODEL
+
+            def fetch_greeks(self, positions: list[PositionInfo]) -> dict[int, RawGreeks]:
+                calls.append(threading.current_thread().name)
+                return {
+                    1: RawGreeks(
+                        delta=Decimal("0.45"),
+                        gamma=Decimal("0.018"),
+                        vega=Decimal("0.28"),
+                        theta=Decimal("-0.035"),
+                        implied_vol=Decimal("0.22"),
+                        underlying_price=Decimal("150.00"),
+                    )
+                }
+
+        positions = [
+            PositionInfo(
+                position_id=1,
+                symbol="AAPL240119C00150000",
+                underlying_symbol="AAPL",
+                quantity=10,
+                multiplier=100,
+                option_type="call",
+                strike=Decimal("150.00"),
+                expiry="2024-01-19",
+            )
+        ]
+
+        calculator = GreeksCalculator(
+            primary_provider=AsyncPrimary(),
+            fallback_provider=BlockingFallback(),
+        )
+        results = await calculator.calculate_async(positions)
+
+        assert calls[0] == "primary"
+        assert calls[1] != threading.current_thread().name
+        assert results[0].source == GreeksDataSource.MODEL
+        assert results[0].dollar_delta == Decimal("67500")
+
     def test_calculate_partial_primary_with_fallback(self):
         """Primary returns some positions, fallback handles the rest."""
         from src.greeks.calculator import GreeksCalculator, PositionInfo, RawGreeks
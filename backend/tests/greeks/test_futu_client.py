@@ -1,6 +1,9 @@
 # backend/tests/greeks/test_futu_client.py
 """Tests for Futu Greeks client."""
 
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
@@ -8,6 +11,7 @@ import pandas as pd
 import pytest
 from src.greeks.futu_client import (
     AsyncFutuGreeksClient,
+    CoalescingFutuClient,
     FutuClientError,
     FutuGreeksClient,
     FutuOptionGreeks,
@@ -236,6 +240,14 @@ class TestSharedFutuClient:
 
         assert result == {}
 
+    def test_get_option_greeks_raise_errors(self):
+        """raise_errors surfaces the failure instead of returning {}."""
+        client = SharedFutuClient.get_instance()
+
+        with patch.dict("sys.modules", {"moomoo": None}):
+            with pytest.raises(FutuClientError):
+                client.get_option_greeks(["US.AAPL240119C00150000"], raise_errors=True)
+
     def test_shutdown_closes_connection(self):
         """Test shutdown closes the client connection."""
         instance = SharedFutuClient.get_instance()
@@ -279,3 +291,160 @@ class TestAsyncFutuGreeksClient:
             result = await client.get_option_greeks(["US.AAPL"])
 
         assert result == mock_greeks
+
+
+def _greeks(code: str) -> FutuOptionGreeks:
+    return FutuOptionGreeks(
+        code=code,
+        delta=Decimal("0.5"),
+        gamma=Decimal("0.01"),
+        vega=Decimal("0.1"),
+        theta=Decimal("-0.02"),
+        implied_volatility=Decimal("0.3"),
+        underlying_price=Decimal("150"),
+    )
+
+
+class RecordingSharedClient:
+    """SharedFutuClient stand-in that records each batched call."""
+
+    def __init__(self, missing: set[str] | None = None, fail: bool = False):
+        self.greeks_calls: list[list[str]] = []
+        self.price_calls: list[list[str]] = []
+        self.threads: list[str] = []
+        self._missing = missing or set()
+        self.fail = fail
+
+    def get_option_greeks(self, symbols, raise_errors=False):
+        self.threads.append(threading.current_thread().name)
+        self.greeks_calls.append(sorted(symbols))
+        if self.fail:
+            if raise_errors:
+                raise FutuClientError("OpenD unavailable")
+            return {}
+        return {s: _greeks(s) for s in symbols if s not in self._missing}
+
+    def get_underlying_price(self, symbols, raise_errors=False):
+        self.threads.append(threading.current_thread().name)
+        self.price_calls.append(sorted(symbols))
+        return {s: Decimal("150") for s in symbols}
+
+
+class TestCoalescingFutuClient:
+    """Tests for CoalescingFutuClient batching and caching."""
+
+    def setup_method(self):
+        self.shared = RecordingSharedClient()
+        self.client = CoalescingFutuClient(
+            client=self.shared, coalesce_window_seconds=0.02, cache_ttl_seconds=60
+        )
+
+    def teardown_method(self):
+        self.client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_overlapping_requests_share_one_call(self):
+        first, second = await asyncio.gather(
+            self.client.get_option_greeks_async(["US.A", "US.B"]),
+            self.client.get_option_greeks_async(["US.B", "US.C"]),
+        )
+
+        assert self.shared.greeks_calls == [["US.A", "US.B", "US.C"]]
+        assert set(first) == {"US.A", "US.B"}
+        assert set(second) == {"US.B", "US.C"}
+        assert self.client.stats.batches == 1
+
+    @pytest.mark.asyncio
+    async def test_runs_on_dedicated_pool(self):
+        await self.client.get_underlying_price_async(["US.AAPL"])
+
+        assert self.shared.threads == ["futu-opend_0"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookup_served_from_cache(self):
+        await self.client.get_option_greeks_async(["US.A"])
+        result = await self.client.get_option_greeks_async(["US.A"])
+
+        assert len(self.shared.greeks_calls) == 1
+        assert set(result) == {"US.A"}
+        assert self.client.stats.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_expires(self):
+        client = CoalescingFutuClient(
+            client=self.shared, coalesce_window_seconds=0, cache_ttl_seconds=0
+        )
+        try:
+            await client.get_option_greeks_async(["US.A"])
+            await client.get_option_greeks_async(["US.A"])
+        finally:
+            client.close()
+
+        assert len(self.shared.greeks_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_refetch(self):
+        await self.client.get_option_greeks_async(["US.A"])
+        self.client.invalidate()
+        await self.client.get_option_greeks_async(["US.A"])
+
+        assert len(self.shared.greeks_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_symbol_is_omitted_and_cached(self):
+        self.shared._missing = {"US.X"}
+
+        first = await self.client.get_option_greeks_async(["US.A", "US.X"])
+        second = await self.client.get_option_greeks_async(["US.X"])
+
+        assert set(first) == {"US.A"}
+        assert second == {}
+        assert len(self.shared.greeks_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_not_cached(self):
+        self.shared.fail = True
+        assert await self.client.get_option_greeks_async(["US.A"]) == {}
+
+        self.shared.fail = False
+        result = await self.client.get_option_greeks_async(["US.A"])
+
+        assert set(result) == {"US.A"}
+        assert len(self.shared.greeks_calls) == 2
+
+    def test_closed_client_fails_lookups(self):
+        self.client.close()
+
+        with pytest.raises(FutuClientError, match="closed"):
+            self.client.get_option_greeks(["US.A"])
+
+    def test_close_fails_lookups_left_without_a_batch(self):
+        client = CoalescingFutuClient(client=self.shared, coalesce_window_seconds=0)
+        # A lookup registered but never scheduled, as if its batch was lost
+        future = Future()
+        client._greeks._inflight["US.A"] = future
+        client._greeks._pending.append("US.A")
+
+        client.close()
+
+        with pytest.raises(FutuClientError, match="closed"):
+            future.result(timeout=1)
+
+    def test_blocking_callers_on_threads_coalesce(self):
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = list(
+                pool.map(
+                    self.client.get_underlying_price,
+                    [["US.AAPL"], ["US.AAPL", "US.MSFT"], ["US.MSFT"]],
+                )
+            )
+
+        assert self.shared.price_calls == [["US.AAPL", "US.MSFT"]]
+        assert results[1] == {"US.AAPL": Decimal("150"), "US.MSFT": Decimal("150")}
+
+    def test_get_instance_returns_singleton(self):
+        try:
+            assert CoalescingFutuClient.get_instance() is CoalescingFutuClient.get_instance()
+        finally:
+            CoalescingFutuClient.shutdown()
+        assert CoalescingFutuClient._instance is None
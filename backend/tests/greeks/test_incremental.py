@@ -0,0 +1,179 @@
+"""Tests for incremental Greeks recompute."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from src.greeks.aggregator import GreeksAggregator
+from src.greeks.alerts import AlertEngine
+from src.greeks.calculator import GreeksCalculator, ModelGreeksProvider, PositionInfo
+from src.greeks.incremental import IncrementalGreeksCalculator, RecomputeTolerance
+from src.greeks.models import GreeksLimitsConfig
+from src.greeks.monitor import GreeksMonitor
+
+NOW = datetime(2024, 3, 1, 15, 0, tzinfo=timezone.utc)
+
+
+class CountingProvider(ModelGreeksProvider):
+    """Model provider that records which positions it was asked to price."""
+
+    def __init__(self):
+        super().__init__()
+        self.requested: list[list[int]] = []
+
+    def fetch_greeks(self, positions):
+        self.requested.append([p.position_id for p in positions])
+        return super().fetch_greeks(positions)
+
+
+def make_positions(count: int = 4) -> list[PositionInfo]:
+    return [
+        PositionInfo(
+            position_id=i,
+            symbol=f"{'AAPL' if i % 2 == 0 else 'MSFT'}_C{i}",
+            underlying_symbol="AAPL" if i % 2 == 0 else "MSFT",
+            quantity=1,
+            multiplier=100,
+            option_type="call",
+            strike=Decimal("100"),
+            expiry="2099-01-16",
+        )
+        for i in range(count)
+    ]
+
+
+def make_calculator() -> tuple[IncrementalGreeksCalculator, CountingProvider]:
+    provider = CountingProvider()
+    provider.set_underlying_prices({"AAPL": Decimal("100"), "MSFT": Decimal("100")})
+    calculator = GreeksCalculator(primary_provider=provider)
+    return IncrementalGreeksCalculator(calculator), provider
+
+
+PRICES = {"AAPL": Decimal("100"), "MSFT": Decimal("100")}
+
+
+class TestIncrementalGreeksCalculator:
+    """Tests for recompute decisions."""
+
+    def test_first_cycle_computes_everything(self):
+        incremental, provider = make_calculator()
+        result = incremental.calculate(make_positions(), PRICES, now=NOW)
+
+        assert result.stats.recomputed == 4
+        assert result.stats.reused == 0
+        assert provider.requested == [[0, 1, 2, 3]]
+
+    def test_unchanged_inputs_reuse_cache(self):
+        incremental, provider = make_calculator()
+        positions = make_positions()
+        first = incremental.calculate(positions, PRICES, now=NOW)
+
+        later = NOW + timedelta(seconds=30)
+        second = incremental.calculate(positions, PRICES, now=later)
+
+        assert second.stats.reused == 4
+        assert second.stats.calculator_calls == 0
+        assert len(provider.requested) == 1
+        assert second.greeks[0] is first.greeks[0]
+        assert all(pg.as_of_ts == later for pg in second.greeks)
+
+    def test_only_moved_underlying_is_recomputed(self):
+        incremental, provider = make_calculator()
+        positions = make_positions()
+        incremental.calculate(positions, PRICES, now=NOW)
+
+        moved = {"AAPL": Decimal("101"), "MSFT": Decimal("100.05")}
+        result = incremental.calculate(positions, moved, now=NOW + timedelta(seconds=30))
+
+        assert [pg.position_id for pg in result.recomputed] == [0, 2]
+        assert provider.requested[-1] == [0, 2]
+
+    def test_iv_move_and_time_bucket_trigger_recompute(self):
+        incremental, _ = make_calculator()
+        positions = make_positions(2)
+        ivs = {"AAPL_C0": Decimal("0.30"), "MSFT_C1": Decimal("0.30")}
+        incremental.calculate(positions, PRICES, ivs, now=NOW)
+
+        bumped = {"AAPL_C0": Decimal("0.32"), "MSFT_C1": Decimal("0.301")}
+        result = incremental.calculate(positions, PRICES, bumped, now=NOW)
+        assert [pg.position_id for pg in result.recomputed] == [0]
+
+        result = incremental.calculate(positions, PRICES, bumped, now=NOW + timedelta(hours=1))
+        assert result.stats.recomputed == 2
+
+    def test_missing_price_and_changed_terms_recompute(self):
+        incremental, _ = make_calculator()
+        positions = make_positions(2)
+        incremental.calculate(positions, PRICES, now=NOW)
+
+        positions[1].quantity = 5
+        result = incremental.calculate(positions, {"MSFT": Decimal("100")}, now=NOW)
+
+        assert {pg.position_id for pg in result.recomputed} == {0, 1}
+
+    def test_removed_positions_dropped(self):
+        incremental, _ = make_calculator()
+        incremental.calculate(make_positions(4), PRICES, now=NOW)
+
+        result = incremental.calculate(make_positions(2), PRICES, now=NOW)
+
+        assert sorted(result.removed) == [2, 3]
+        assert len(incremental) == 2
+
+    def test_tolerance_is_configurable(self):
+        provider = CountingProvider()
+        provider.set_underlying_prices(PRICES)
+        incremental = IncrementalGreeksCalculator(
+            GreeksCalculator(primary_provider=provider),
+            RecomputeTolerance(underlying_price_pct=Decimal("0.05")),
+        )
+        positions = make_positions()
+        incremental.calculate(positions, PRICES, now=NOW)
+
+        moved = {"AAPL": Decimal("103"), "MSFT": Decimal("97")}
+        result = incremental.calculate(positions, moved, now=NOW)
+
+        assert result.stats.reused == 4
+
+
+class TestGreeksMonitorIncremental:
+    """Tests for GreeksMonitor incremental mode."""
+
+    @pytest.mark.asyncio
+    async def test_incremental_matches_full_recompute(self):
+        provider = CountingProvider()
+        provider.set_underlying_prices(PRICES)
+        monitor = GreeksMonitor(
+            account_id="acc_001",
+            limits_config=GreeksLimitsConfig.default_account_config("acc_001"),
+            calculator=GreeksCalculator(primary_provider=provider),
+            aggregator=GreeksAggregator(),
+            alert_engine=AlertEngine(),
+            incremental=True,
+        )
+        positions = make_positions(6)
+
+        with patch("src.greeks.monitor.greeks_ws_manager") as ws:
+            ws.broadcast_greeks_update = AsyncMock()
+            ws.broadcast_alert = AsyncMock()
+
+            await monitor.check(positions, PRICES)
+            provider.set_underlying_prices({"AAPL": Decimal("105"), "MSFT": Decimal("100")})
+            result = await monitor.check(
+                positions[:5], {"AAPL": Decimal("105"), "MSFT": Decimal("100")}
+            )
+
+        assert result.incremental_stats is not None
+        assert result.incremental_stats.recomputed == 3
+        assert result.incremental_stats.reused == 2
+        assert result.incremental_stats.removed == 1
+
+        full = GreeksAggregator().aggregate(
+            GreeksCalculator(primary_provider=provider).calculate(positions[:5]),
+            scope="ACCOUNT",
+            scope_id="acc_001",
+        )
+        assert result.account_greeks.dollar_delta == full.dollar_delta
+        assert result.account_greeks.total_legs_count == 5
+        assert monitor.get_current_greeks() is result.account_greeks
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from src.greeks.iv_cache import IVCacheEntry, IVCacheManager
@@ -125,3 +125,33 @@ class TestIVCacheManager:
         result = await cache.get_or_default("AAPL240119C00150000", "AAPL", Decimal("0.35"))
 
         assert result == Decimal("0.35")
+
+
+class TestIVCacheManagerSetMany:
+    """Tests for batch IV caching."""
+
+    @pytest.mark.asyncio
+    async def test_set_many_stores_each_entry(self):
+        mock_redis = AsyncMock()
+        pipe = MagicMock(execute=AsyncMock())
+        pipe.__aenter__.return_value = pipe
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+        cache = IVCacheManager(mock_redis)
+        now = datetime.now(timezone.utc)
+        entries = [
+            IVCacheEntry(
+                symbol=f"AAPL_C{strike}",
+                implied_vol=Decimal("0.25"),
+                underlying_price=Decimal("150.00"),
+                as_of_ts=now,
+            )
+            for strike in (140, 150)
+        ]
+
+        await cache.set_many(entries)
+
+        # One pipelined round trip, no per-entry writes
+        keys = [call.args[0] for call in pipe.set.call_args_list]
+        assert keys == ["iv:AAPL_C140", "iv:AAPL_C150"]
+        pipe.execute.assert_awaited_once()
+        mock_redis.set.assert_not_awaited()
@@ -0,0 +1,218 @@
+"""Tests for the local implied volatility solver."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+from redis.exceptions import WatchError
+from src.greeks.black_scholes import calculate_bs_greeks_batch
+from src.greeks.calculator import GreeksCalculator, ModelGreeksProvider, PositionInfo
+from src.greeks.iv_cache import IVCacheManager
+from src.greeks.iv_solver import LocalIVSolver, OptionQuote, solve_implied_vol_batch
+
+
+class TestSolveImpliedVolBatch:
+    """Tests for vectorized IV inversion."""
+
+    def test_recovers_known_vols(self):
+        """Round-trip: price with known IV, solve, recover the IV."""
+        rng = np.random.default_rng(7)
+        n = 500
+        spot = rng.uniform(80, 120, n)
+        strike = rng.uniform(60, 140, n)
+        t = rng.uniform(0.02, 2.0, n)
+        vol = rng.uniform(0.08, 1.5, n)
+        is_call = rng.random(n) < 0.5
+        prices = calculate_bs_greeks_batch(spot, strike, t, 0.05, vol, is_call).price
+
+        result = solve_implied_vol_batch(prices, spot, strike, t, 0.05, is_call)
+
+        # Deep OTM legs with near-zero vega cannot be pinned down in vol space
+        identifiable = prices > 1e-3
+        assert result.converged[identifiable].all()
+        assert np.allclose(result.implied_vol[identifiable], vol[identifiable], atol=1e-4)
+        assert result.diagnostics.max_abs_error < 1e-6
+
+    def test_rejects_prices_outside_arbitrage_bounds(self):
+        """Prices below intrinsic or above spot are rejected, not solved."""
+        result = solve_implied_vol_batch(
+            price=[5.0, 120.0, float("nan")],
+            spot=100,
+            strike=[90, 100, 100],
+            time_to_expiry_years=0.25,
+            risk_free_rate=0.05,
+            is_call=True,
+        )
+        assert not result.converged.any()
+        assert np.isnan(result.implied_vol).all()
+        assert result.diagnostics.rejected == 3
+
+    def test_bisection_fallback_is_reported(self):
+        """Extreme legs that Newton overshoots still converge via bisection."""
+        prices = calculate_bs_greeks_batch(100, [100, 200], 0.05, 0.0, [0.2, 3.5], True).price
+        result = solve_implied_vol_batch(prices, 100, [100, 200], 0.05, 0.0, True)
+
+        assert result.converged.all()
+        assert result.diagnostics.converged == 2
+        assert result.diagnostics.newton_only + result.diagnostics.bisection_fallback == 2
+        assert result.diagnostics.convergence_rate == 1.0
+
+
+def make_quote(symbol: str, strike: str, bid: str, ask: str, option_type: str = "call"):
+    expiry = (datetime.now(timezone.utc).date() + timedelta(days=30)).isoformat()
+    return OptionQuote(
+        symbol=symbol,
+        underlying_symbol="AAPL",
+        option_type=option_type,
+        strike=Decimal(strike),
+        expiry=expiry,
+        bid=Decimal(bid),
+        ask=Decimal(ask),
+        underlying_price=Decimal("150"),
+    )
+
+
+class FakePipeline:
+    """Buffers set() until execute(); fails execute() if a watched key changed."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._queued: list[tuple[str, str]] = []
+        self._watched: dict[str, str | None] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._queued.clear()
+
+    async def watch(self, *keys):
+        self._watched = {k: self._redis.data.get(k) for k in keys}
+
+    async def mget(self, keys):
+        return await self._redis.mget(keys)
+
+    def multi(self):
+        pass
+
+    def set(self, key, value, ex=None):
+        self._queued.append((key, value))
+        return self
+
+    async def execute(self):
+        queued, self._queued = self._queued, []
+        watched, self._watched = self._watched, {}
+        if any(self._redis.data.get(k) != v for k, v in watched.items()):
+            raise WatchError("Watched variable changed.")
+        for key, value in queued:
+            self._redis.data[key] = value
+        return [True] * len(queued)
+
+
+class DictRedis:
+    """Dict-backed async Redis supporting get/set/mget and pipelines."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class TestLocalIVSolver:
+    """Tests for chain solving and cache feeding."""
+
+    def test_solve_chain_skips_bad_quotes(self):
+        solver = LocalIVSolver()
+        quotes = [
+            make_quote("AAPL_C150", "150", "4.00", "4.20"),
+            make_quote("AAPL_P140", "140", "1.10", "1.20", option_type="put"),
+            make_quote("AAPL_C160", "160", "0", "0.50"),  # one-sided
+        ]
+
+        report = solver.solve_chain(quotes)
+
+        assert [e.symbol for e in report.entries] == ["AAPL_C150", "AAPL_P140"]
+        assert report.unsolved == ["AAPL_C160"]
+        assert report.diagnostics.total == 3
+        assert report.diagnostics.rejected == 1
+        for entry in report.entries:
+            assert Decimal("0.05") < entry.implied_vol < Decimal("1")
+            assert entry.underlying_symbol == "AAPL"
+
+    @pytest.mark.asyncio
+    async def test_solve_and_cache_writes_entries(self):
+        iv_cache = AsyncMock()
+        solver = LocalIVSolver(iv_cache)
+
+        report = await solver.solve_and_cache([make_quote("AAPL_C150", "150", "4.00", "4.20")])
+
+        iv_cache.set_many.assert_awaited_once_with(report.entries)
+
+    def test_model_provider_uses_solved_ivs(self):
+        """Fallback Greeks use the locally solved IV instead of the default."""
+        solver = LocalIVSolver()
+        quote = make_quote("AAPL_C150", "150", "9.00", "9.20")
+        report = solver.solve_chain([quote])
+
+        provider = ModelGreeksProvider(default_iv=Decimal("0.30"))
+        provider.set_underlying_prices({"AAPL": Decimal("150")})
+        provider.set_implied_vols({e.symbol: e.implied_vol for e in report.entries})
+
+        position = PositionInfo(
+            position_id=1,
+            symbol="AAPL_C150",
+            underlying_symbol="AAPL",
+            quantity=1,
+            multiplier=100,
+            option_type="call",
+            strike=Decimal("150"),
+            expiry=quote.expiry,
+        )
+        raw = provider.fetch_greeks([position])[1]
+
+        assert raw.implied_vol == report.entries[0].implied_vol
+        assert raw.implied_vol != Decimal("0.30")
+
+    @pytest.mark.asyncio
+    async def test_model_provider_reads_solved_ivs_from_cache(self):
+        """IVs written by solve_and_cache change the async fallback Greeks."""
+        iv_cache = IVCacheManager(DictRedis())
+        solver = LocalIVSolver(iv_cache)
+        quote = make_quote("AAPL_C150", "150", "9.00", "9.20")
+        report = await solver.solve_and_cache([quote])
+        solved_iv = report.entries[0].implied_vol
+
+        position = PositionInfo(
+            position_id=1,
+            symbol="AAPL_C150",
+            underlying_symbol="AAPL",
+            quantity=1,
+            multiplier=100,
+            option_type="call",
+            strike=Decimal("150"),
+            expiry=quote.expiry,
+        )
+        cached = ModelGreeksProvider(iv_cache=iv_cache, default_iv=Decimal("0.30"))
+        uncached = ModelGreeksProvider(default_iv=Decimal("0.30"))
+        for provider in (cached, uncached):
+            provider.set_underlying_prices({"AAPL": Decimal("150")})
+
+        with_solved = (await GreeksCalculator(cached).calculate_async([position]))[0]
+        with_default = (await GreeksCalculator(uncached).calculate_async([position]))[0]
+
+        assert with_solved.implied_vol == solved_iv
+        assert with_default.implied_vol == Decimal("0.30")
+        assert with_solved.vega_per_1pct != with_default.vega_per_1pct
+        assert with_solved.dollar_delta != with_default.dollar_delta
@@ -0,0 +1,261 @@
+"""Tests for per-underlying IV surface."""
+
+import math
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from redis.exceptions import WatchError
+from src.greeks.iv_cache import IVCacheEntry, IVCacheManager, IVLookup
+from src.greeks.iv_surface import IVSurface
+
+TODAY = date(2024, 1, 2)
+NOW = datetime(2024, 1, 2, 15, 0, tzinfo=timezone.utc)
+
+
+def build_surface() -> IVSurface:
+    surface = IVSurface("AAPL")
+    for strike, iv in (("90", "0.30"), ("100", "0.25"), ("110", "0.22")):
+        surface.add_point(Decimal(strike), "2024-02-01", Decimal(iv), Decimal("100"), NOW)
+    for strike, iv in (("90", "0.28"), ("100", "0.24"), ("110", "0.21")):
+        surface.add_point(Decimal(strike), "2024-07-01", Decimal(iv), Decimal("100"), NOW)
+    return surface
+
+
+class TestIVSurface:
+    """Tests for IVSurface interpolation and serialization."""
+
+    def test_exact_grid_point(self):
+        surface = build_surface()
+        assert surface.interpolate(Decimal("100"), "2024-02-01", today=TODAY) == Decimal("0.25")
+
+    def test_interpolates_across_moneyness(self):
+        surface = build_surface()
+        iv = surface.interpolate(Decimal("95"), "2024-02-01", today=TODAY)
+        assert iv == Decimal("0.275")
+
+    def test_flat_beyond_wings(self):
+        surface = build_surface()
+        assert surface.interpolate(Decimal("50"), "2024-02-01", today=TODAY) == Decimal("0.3")
+        assert surface.interpolate(Decimal("200"), "2024-02-01", today=TODAY) == Decimal("0.22")
+
+    def test_interpolates_total_variance_across_expiries(self):
+        surface = build_surface()
+        iv = surface.interpolate(Decimal("100"), "2024-04-01", today=TODAY)
+
+        t0, t1, t = 30 / 365, 181 / 365, 90 / 365
+        w = 0.25**2 * t0 + (t - t0) / (t1 - t0) * (0.24**2 * t1 - 0.25**2 * t0)
+        assert float(iv) == pytest.approx(math.sqrt(w / t), abs=1e-6)
+
+    def test_uses_current_spot_for_moneyness(self):
+        """Sticky moneyness: a spot move shifts which grid cell a strike hits."""
+        surface = build_surface()
+        iv = surface.interpolate(Decimal("110"), "2024-02-01", Decimal("110"), today=TODAY)
+        assert iv == Decimal("0.25")
+
+    def test_nearby_strikes_share_a_cell(self):
+        surface = IVSurface("AAPL")
+        surface.add_point(Decimal("100.2"), "2024-02-01", Decimal("0.20"), Decimal("100"), NOW)
+        surface.add_point(Decimal("100.3"), "2024-02-01", Decimal("0.21"), Decimal("100"), NOW)
+        assert len(surface) == 1
+
+    def test_empty_or_expired_returns_none(self):
+        surface = build_surface()
+        assert surface.interpolate(Decimal("100"), "2024-09-01", today=date(2024, 8, 1)) is None
+        assert IVSurface("AAPL").interpolate(Decimal("100"), "2024-02-01", today=TODAY) is None
+
+    def test_json_round_trip(self):
+        surface = build_surface()
+        restored = IVSurface.from_json(surface.to_json())
+
+        assert restored.underlying_symbol == "AAPL"
+        assert restored.expiries == surface.expiries
+        assert restored.interpolate(Decimal("95"), "2024-04-01", today=TODAY) == (
+            surface.interpolate(Decimal("95"), "2024-04-01", today=TODAY)
+        )
+
+
+class FakePipeline:
+    """Buffers set() until execute(); fails execute() if a watched key changed."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._queued: list[tuple[str, str]] = []
+        self._watched: dict[str, str | None] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._queued.clear()
+
+    async def watch(self, *keys):
+        self._watched = {k: self._redis.data.get(k) for k in keys}
+
+    async def mget(self, keys):
+        return await self._redis.mget(keys)
+
+    def multi(self):
+        pass
+
+    def set(self, key, value, ex=None):
+        self._queued.append((key, value))
+        return self
+
+    async def execute(self):
+        queued, self._queued = self._queued, []
+        watched, self._watched = self._watched, {}
+        if any(self._redis.data.get(k) != v for k, v in watched.items()):
+            raise WatchError("Watched variable changed.")
+        for key, value in queued:
+            self._redis.data[key] = value
+        return [True] * len(queued)
+
+
+class FakeRedis:
+    """Dict-backed async Redis supporting get/set/mget and pipelines.
+
+    Coroutine factories in interleaved run once, right after the next
+    mget, to stand in for a concurrent writer.
+    """
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.mget_calls = 0
+        self.interleaved: list = []
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        values = [self.data.get(k) for k in keys]
+        while self.interleaved:
+            await self.interleaved.pop()()
+        return values
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def make_entry(symbol: str, underlying: str, strike: str, iv: str, days: int) -> IVCacheEntry:
+    return IVCacheEntry(
+        symbol=symbol,
+        implied_vol=Decimal(iv),
+        underlying_price=Decimal("100"),
+        underlying_symbol=underlying,
+        as_of_ts=datetime.now(timezone.utc),
+        strike=Decimal(strike),
+        expiry=(date.today() + timedelta(days=days)).isoformat(),
+    )
+
+
+class TestIVCacheManagerSurface:
+    """Tests for surface maintenance in IVCacheManager."""
+
+    @pytest.mark.asyncio
+    async def test_set_many_builds_surfaces_per_underlying(self):
+        redis = FakeRedis()
+        cache = IVCacheManager(redis)
+
+        await cache.set_many(
+            [
+                make_entry("AAPL_C90", "AAPL", "90", "0.30", 30),
+                make_entry("AAPL_C110", "AAPL", "110", "0.20", 30),
+                make_entry("MSFT_C100", "MSFT", "100", "0.40", 30),
+            ]
+        )
+
+        surfaces = await cache.get_surfaces(["AAPL", "MSFT", "TSLA"])
+        assert set(surfaces) == {"AAPL", "MSFT"}
+        assert len(surfaces["AAPL"]) == 2
+        # One mget to merge on write, one to load
+        assert redis.mget_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_surface_built_incrementally(self):
+        redis = FakeRedis()
+        cache = IVCacheManager(redis)
+
+        await cache.set(make_entry("AAPL_C90", "AAPL", "90", "0.30", 30))
+        await cache.set(make_entry("AAPL_C110", "AAPL", "110", "0.20", 30))
+
+        surface = await cache.get_surface("AAPL")
+        assert surface is not None
+        assert len(surface) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_surface_writes_are_merged(self):
+        """A surface changed between read and write is re-read, not overwritten."""
+        redis = FakeRedis()
+        cache = IVCacheManager(redis)
+        other = IVCacheManager(redis)
+        redis.interleaved.append(
+            lambda: other.set(make_entry("AAPL_C110", "AAPL", "110", "0.20", 30))
+        )
+
+        await cache.set(make_entry("AAPL_C90", "AAPL", "90", "0.30", 30))
+
+        surface = await cache.get_surface("AAPL")
+        assert surface is not None
+        assert len(surface) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_or_default_many_batches_lookups(self):
+        """Each fallback level is one mget however many options are resolved."""
+        redis = FakeRedis()
+        cache = IVCacheManager(redis)
+        await cache.set_many(
+            [
+                make_entry("AAPL_C90", "AAPL", "90", "0.30", 30),
+                make_entry("AAPL_C110", "AAPL", "110", "0.20", 30),
+                make_entry("MSFT_C100", "MSFT", "100", "0.40", 30),
+            ]
+        )
+        expiry = (date.today() + timedelta(days=30)).isoformat()
+        redis.mget_calls = 0
+
+        ivs = await cache.get_or_default_many(
+            [
+                IVLookup("AAPL_C90", "AAPL", Decimal("90"), expiry),
+                IVLookup("AAPL_C100", "AAPL", Decimal("100"), expiry),
+                IVLookup("MSFT_C200", "MSFT"),
+                IVLookup("TSLA_C200", "TSLA"),
+            ],
+            default_iv=Decimal("0.35"),
+        )
+
+        assert ivs == {
+            "AAPL_C90": Decimal("0.30"),
+            "AAPL_C100": Decimal("0.25"),
+            "MSFT_C200": Decimal("0.40"),
+            "TSLA_C200": Decimal("0.35"),
+        }
+        # Option keys, surfaces, underlying averages
+        assert redis.mget_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_get_or_default_interpolates_from_surface(self):
+        """Uncached strike gets a surface IV, not the last-cached option's IV."""
+        redis = FakeRedis()
+        cache = IVCacheManager(redis)
+        await cache.set_many(
+            [
+                make_entry("AAPL_C90", "AAPL", "90", "0.30", 30),
+                make_entry("AAPL_C110", "AAPL", "110", "0.20", 30),
+            ]
+        )
+
+        iv = await cache.get_or_default(
+            "AAPL_C100",
+            "AAPL",
+            strike=Decimal("100"),
+            expiry=(date.today() + timedelta(days=30)).isoformat(),
+        )
+
+        assert iv == Decimal("0.25")
+        # Without strike/expiry the underlying proxy (last write) is still used
+        assert await cache.get_or_default("AAPL_C100", "AAPL") == Decimal("0.20")
@@ -258,8 +258,8 @@ class TestGreeksMonitor:
                 strategy_id="momentum_v1",
             ),
         ]
-        mock_calculator = MagicMock()
-        mock_calculator.calculate.return_value = position_greeks
+        mock_calculator = MagicMock(calculate_async=AsyncMock())
+        mock_calculator.calculate_async.return_value = position_greeks
 
         # Create mock aggregator
         account_greeks = _make_aggregated_greeks(
@@ -306,7 +306,7 @@ class TestGreeksMonitor:
         result = await monitor.check(positions)
 
         # Verify calculator was called
-        mock_calculator.calculate.assert_called_once_with(positions)
+        mock_calculator.calculate_async.assert_awaited_once_with(positions)
 
         # Verify aggregator was called
         mock_aggregator.aggregate_by_strategy.assert_called_once()
@@ -333,8 +333,8 @@ class TestGreeksMonitor:
         config = GreeksLimitsConfig.default_account_config(account_id)
 
         # Create mock dependencies
-        mock_calculator = MagicMock()
-        mock_calculator.calculate.return_value = [
+        mock_calculator = MagicMock(calculate_async=AsyncMock())
+        mock_calculator.calculate_async.return_value = [
             _make_position_greeks(dollar_delta=Decimal("45000"))
         ]
 
@@ -394,8 +394,8 @@ class TestGreeksMonitor:
         account_id = "acc_001"
         config = GreeksLimitsConfig.default_account_config(account_id)
 
-        mock_calculator = MagicMock()
-        mock_calculator.calculate.return_value = [_make_position_greeks()]
+        mock_calculator = MagicMock(calculate_async=AsyncMock())
+        mock_calculator.calculate_async.return_value = [_make_position_greeks()]
 
         account_greeks = _make_aggregated_greeks()
         mock_aggregator = MagicMock()
@@ -438,8 +438,8 @@ class TestGreeksMonitor:
         account_id = "acc_001"
         config = GreeksLimitsConfig.default_account_config(account_id)
 
-        mock_calculator = MagicMock()
-        mock_calculator.calculate.return_value = [_make_position_greeks()]
+        mock_calculator = MagicMock(calculate_async=AsyncMock())
+        mock_calculator.calculate_async.return_value = [_make_position_greeks()]
 
         account_greeks = _make_aggregated_greeks()
         mock_aggregator = MagicMock()
@@ -490,8 +490,8 @@ class TestGreeksMonitor:
 
         account_id = "acc_001"
 
-        mock_calculator = MagicMock()
-        mock_calculator.calculate.return_value = [_make_position_greeks()]
+        mock_calculator = MagicMock(calculate_async=AsyncMock())
+        mock_calculator.calculate_async.return_value = [_make_position_greeks()]
 
         account_greeks = _make_aggregated_greeks(dollar_delta=Decimal("45000"))
         mock_aggregator = MagicMock()
@@ -821,3 +821,87 @@ class TestGreeksRepositoryGetHistory:
 
         assert len(points) == 3
         assert all(p.point_count == 1 for p in points)
+
+    @pytest.mark.asyncio
+    async def test_get_history_buckets_are_epoch_aligned(self, db_session):
+        """Fallback buckets align to the epoch like time_bucket."""
+        from src.greeks.repository import GreeksRepository
+
+        repo = GreeksRepository(db_session)
+        base_time = datetime(2026, 1, 15, 10, 33, 0, tzinfo=timezone.utc)
+
+        # 10:33, 10:34 -> 10:30 bucket; 10:36 -> 10:35 bucket
+        for offset in (0, 60, 180):
+            await repo.save_snapshot(
+                _make_aggregated_greeks(as_of_ts=base_time + timedelta(seconds=offset))
+            )
+
+        points = await repo.get_history(
+            scope="ACCOUNT",
+            scope_id="acc_001",
+            start_ts=base_time - timedelta(hours=1),
+            end_ts=base_time + timedelta(hours=1),
+            interval_seconds=300,
+        )
+
+        assert [p.ts for p in points] == [
+            datetime(2026, 1, 15, 10, 30, tzinfo=timezone.utc),
+            datetime(2026, 1, 15, 10, 35, tzinfo=timezone.utc),
+        ]
+        assert [p.point_count for p in points] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_get_history_uses_continuous_aggregate_on_timescaledb(self):
+        """On PostgreSQL, bucketing runs in SQL against the matching aggregate."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from sqlalchemy.dialects import postgresql
+        from src.greeks.repository import GreeksRepository
+
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        row = MagicMock(
+            ts=datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc),
+            dollar_delta=Decimal("12500"),
+            gamma_dollar=Decimal("2000"),
+            vega_per_1pct=Decimal("15000"),
+            theta_per_day=Decimal("-3000"),
+            coverage_pct=Decimal("100"),
+            point_count=240,
+        )
+        session.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[row])))
+
+        repo = GreeksRepository(session)
+        end_ts = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+        points = await repo.get_history(
+            scope="ACCOUNT",
+            scope_id="acc_001",
+            start_ts=end_ts - timedelta(days=7),
+            end_ts=end_ts,
+            interval_seconds=3600,
+        )
+
+        sql = str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "time_bucket" in sql
+        assert "FROM greeks_snapshots_1h" in sql
+        assert points[0].dollar_delta == Decimal("12500")
+        assert points[0].point_count == 240
+
+
+class TestSelectHistoryAggregate:
+    """Tests for choosing the continuous aggregate behind a history interval."""
+
+    def test_picks_coarsest_aggregate_dividing_interval(self):
+        from src.greeks.repository import select_history_aggregate
+
+        assert select_history_aggregate(60) == 60
+        assert select_history_aggregate(300) == 60
+        assert select_history_aggregate(1800) == 900
+        assert select_history_aggregate(3600) == 3600
+        assert select_history_aggregate(86400) == 3600
+
+    def test_falls_back_to_raw_for_sub_minute_or_unaligned(self):
+        from src.greeks.repository import select_history_aggregate
+
+        assert select_history_aggregate(30) is None
+        assert select_history_aggregate(90) is None
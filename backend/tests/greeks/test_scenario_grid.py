@@ -0,0 +1,275 @@
+"""Tests for the full-revaluation scenario grid."""
+
+import math
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from src.greeks.aggregator import GreeksAggregator
+from src.greeks.alerts import AlertEngine
+from src.greeks.black_scholes import calculate_bs_greeks
+from src.greeks.calculator import GreeksCalculator, ModelGreeksProvider, PositionInfo
+from src.greeks.models import GreeksDataSource, GreeksLimitsConfig, GreeksModel, PositionGreeks
+from src.greeks.monitor import GreeksMonitor
+from src.greeks.scenario_grid import ScenarioGridConfig, calculate_scenario_grid
+
+TODAY = date(2024, 3, 1)
+
+
+def make_leg(
+    position_id: int = 1,
+    option_type: str = "call",
+    strike: str = "100",
+    expiry: str = "2024-06-01",
+    quantity: int = 1,
+    underlying_price: str = "100",
+    implied_vol: Decimal | None = None,
+    valid: bool = True,
+) -> PositionGreeks:
+    return PositionGreeks(
+        position_id=position_id,
+        symbol=f"AAPL_{option_type[0].upper()}{position_id}",
+        underlying_symbol="AAPL",
+        quantity=quantity,
+        multiplier=100,
+        underlying_price=Decimal(underlying_price),
+        option_type=option_type,
+        strike=Decimal(strike),
+        expiry=expiry,
+        dollar_delta=Decimal("0"),
+        gamma_dollar=Decimal("0"),
+        gamma_pnl_1pct=Decimal("0"),
+        vega_per_1pct=Decimal("0"),
+        theta_per_day=Decimal("0"),
+        source=GreeksDataSource.MODEL,
+        model=GreeksModel.BS,
+        valid=valid,
+        implied_vol=implied_vol,
+    )
+
+
+def bs_price(spot: float, strike: float, days: int, vol: float, is_call: bool) -> float:
+    """Reference Black-Scholes price using math.erf."""
+    t = days / 365
+    d1 = (math.log(spot / strike) + (0.05 + 0.5 * vol * vol) * t) / (vol * math.sqrt(t))
+    d2 = d1 - vol * math.sqrt(t)
+
+    def cdf(x: float) -> float:
+        return 0.5 * (1 + math.erf(x / math.sqrt(2)))
+
+    call = spot * cdf(d1) - strike * math.exp(-0.05 * t) * cdf(d2)
+    return call if is_call else call - spot + strike * math.exp(-0.05 * t)
+
+
+class TestScenarioGrid:
+    """Tests for calculate_scenario_grid."""
+
+    def test_shape_follows_config(self):
+        config = ScenarioGridConfig(
+            spot_shocks_pct=[Decimal("-1"), Decimal("0"), Decimal("1")],
+            iv_shocks_pts=[Decimal("0"), Decimal("5")],
+            time_steps_days=[0, 1, 7, 30],
+        )
+        result = calculate_scenario_grid([make_leg()], config=config, today=TODAY)
+
+        assert config.scenario_count == 24
+        assert result.pnl.shape == (3, 2, 4)
+        assert result.dollar_greeks["dollar_delta"].shape == (3, 2, 4)
+        assert result.legs_priced == 1
+
+    def test_zero_scenario_has_zero_pnl(self):
+        legs = [make_leg(1, "call"), make_leg(2, "put", strike="95", quantity=-3)]
+        config = ScenarioGridConfig(
+            spot_shocks_pct=[Decimal("0")], iv_shocks_pts=[Decimal("0")], time_steps_days=[0]
+        )
+        result = calculate_scenario_grid(legs, config=config, today=TODAY)
+
+        assert result.pnl[0, 0, 0] == pytest.approx(0.0, abs=1e-9)
+
+    def test_pnl_matches_direct_repricing(self):
+        """Each grid point equals repricing the leg at shocked inputs."""
+        legs = [
+            make_leg(1, "call", strike="105", quantity=2),
+            make_leg(2, "put", strike="95", quantity=-1),
+        ]
+        config = ScenarioGridConfig(
+            spot_shocks_pct=[Decimal("-10"), Decimal("5")],
+            iv_shocks_pts=[Decimal("-5"), Decimal("10")],
+            time_steps_days=[0, 7],
+        )
+        result = calculate_scenario_grid(legs, config=config, today=TODAY)
+
+        days = (date(2024, 6, 1) - TODAY).days
+        for i, spot_shock in enumerate([-0.10, 0.05]):
+            for j, iv_shock in enumerate([-0.05, 0.10]):
+                for k, roll in enumerate([0, 7]):
+                    expected = 0.0
+                    for strike, is_call, qty in [(105, True, 2), (95, False, -1)]:
+                        shocked = bs_price(
+                            100 * (1 + spot_shock), strike, days - roll, 0.30 + iv_shock, is_call
+                        )
+                        base = bs_price(100, strike, days, 0.30, is_call)
+                        expected += (shocked - base) * qty * 100
+                    assert result.pnl[i, j, k] == pytest.approx(expected, rel=1e-4, abs=0.05)
+
+    def test_full_revaluation_captures_convexity(self):
+        """Long options gain on both sides of a large move."""
+        config = ScenarioGridConfig(
+            spot_shocks_pct=[Decimal("-10"), Decimal("10")],
+            iv_shocks_pts=[Decimal("0")],
+            time_steps_days=[0],
+        )
+        straddle = [make_leg(1, "call"), make_leg(2, "put")]
+        result = calculate_scenario_grid(straddle, config=config, today=TODAY)
+
+        assert result.pnl[0, 0, 0] > 0
+        assert result.pnl[1, 0, 0] > 0
+
+    def test_leg_rolled_past_expiry_values_at_intrinsic(self):
+        leg = make_leg(1, "call", strike="90", expiry="2024-03-02", quantity=1)
+        config = ScenarioGridConfig(
+            spot_shocks_pct=[Decimal("0")], iv_shocks_pts=[Decimal("0")], time_steps_days=[0, 5]
+        )
+        result = calculate_scenario_grid([leg], config=config, today=TODAY)
+
+        base = bs_price(100, 90, 1, 0.30, True)
+        assert result.pnl[0, 0, 1] == pytest.approx((10.0 - base) * 100, abs=0.05)
+        assert result.dollar_greeks["gamma_dollar"][0, 0, 1] == 0.0
+        assert result.dollar_greeks["vega_per_1pct"][0, 0, 1] == 0.0
+
+    def test_dollar_delta_uses_shocked_spot(self):
+        leg = make_leg(1, "call", quantity=1)
+        config = ScenarioGridConfig(
+            spot_shocks_pct=[Decimal("0"), Decimal("10")],
+            iv_shocks_pts=[Decimal("0")],
+            time_steps_days=[0],
+        )
+        result = calculate_scenario_grid([leg], config=config, today=TODAY)
+
+        delta_up = float(
+            calculate_bs_greeks(
+                spot=Decimal("110"),
+                strike=Decimal("100"),
+                time_to_expiry_years=Decimal(92) / Decimal("365"),
+                risk_free_rate=Decimal("0.05"),
+                volatility=Decimal("0.30"),
+                is_call=True,
+            ).delta
+        )
+        assert result.dollar_greeks["dollar_delta"][1, 0, 0] == pytest.approx(
+            delta_up * 100 * 110, rel=1e-4
+        )
+
+    def test_iv_precedence(self):
+        """Override beats leg IV, leg IV beats the config default."""
+        config = ScenarioGridConfig(
+            spot_shocks_pct=[Decimal("0")], iv_shocks_pts=[Decimal("0")], time_steps_days=[0]
+        )
+        leg = make_leg(1, "call", implied_vol=Decimal("0.50"))
+
+        with_leg_iv = calculate_scenario_grid([leg], config=config, today=TODAY)
+        with_override = calculate_scenario_grid(
+            [leg], config=config, implied_vols={leg.symbol: Decimal("0.20")}, today=TODAY
+        )
+        with_default = calculate_scenario_grid([make_leg(1, "call")], config=config, today=TODAY)
+
+        thetas = [
+            r.dollar_greeks["theta_per_day"][0, 0, 0]
+            for r in (with_override, with_default, with_leg_iv)
+        ]
+        # Theta of a long call grows in magnitude with IV
+        assert thetas[0] > thetas[1] > thetas[2]
+
+    def test_breaches_against_hard_limits(self):
+        legs = [make_leg(1, "call", quantity=10)]
+        config = ScenarioGridConfig(
+            spot_shocks_pct=[Decimal("-10"), Decimal("0"), Decimal("10")],
+            iv_shocks_pts=[Decimal("0")],
+            time_steps_days=[0],
+        )
+        base = calculate_scenario_grid(legs, config=config, today=TODAY)
+        limit = Decimal(str(round(float(base.dollar_greeks["dollar_delta"][1, 0, 0]) * 1.2)))
+
+        result = calculate_scenario_grid(
+            legs, config=config, limits={"dollar_delta": limit}, today=TODAY
+        )
+
+        assert result.breaches["dollar_delta"][:, 0, 0].tolist() == [False, False, True]
+        assert result.breach_any[2, 0, 0]
+        assert result.breach_map() == [(Decimal("10"), Decimal("0"), 0, ["dollar_delta"])]
+
+    def test_worst_case(self):
+        config = ScenarioGridConfig(
+            spot_shocks_pct=[Decimal("-10"), Decimal("0"), Decimal("10")],
+            iv_shocks_pts=[Decimal("0")],
+            time_steps_days=[0],
+        )
+        result = calculate_scenario_grid([make_leg(1, "call")], config=config, today=TODAY)
+
+        pnl, scenario = result.worst_case()
+        assert pnl < 0
+        assert scenario == (Decimal("-10"), Decimal("0"), 0)
+
+    def test_invalid_legs_skipped(self):
+        legs = [
+            make_leg(1, "call"),
+            make_leg(2, "call", valid=False),
+            make_leg(3, "call", expiry=""),
+        ]
+        result = calculate_scenario_grid(legs, today=TODAY)
+
+        assert result.legs_priced == 1
+        assert result.legs_skipped == 2
+
+    def test_empty_book(self):
+        result = calculate_scenario_grid([], limits={"dollar_delta": Decimal("1")}, today=TODAY)
+
+        assert result.legs_priced == 0
+        assert not result.pnl.any()
+        assert result.breach_map() == []
+
+
+class TestGreeksMonitorScenarioGrid:
+    """Tests for running the scenario grid in the monitor cycle."""
+
+    @pytest.mark.asyncio
+    async def test_monitor_runs_grid_when_configured(self):
+        provider = ModelGreeksProvider()
+        provider.set_underlying_prices({"AAPL": Decimal("100")})
+        config = ScenarioGridConfig(time_steps_days=[0])
+        monitor = GreeksMonitor(
+            account_id="acc_001",
+            limits_config=GreeksLimitsConfig.default_account_config("acc_001"),
+            calculator=GreeksCalculator(primary_provider=provider),
+            aggregator=GreeksAggregator(),
+            alert_engine=AlertEngine(),
+            scenario_config=config,
+        )
+        positions = [
+            PositionInfo(
+                position_id=1,
+                symbol="AAPL_C1",
+                underlying_symbol="AAPL",
+                quantity=1,
+                multiplier=100,
+                option_type="call",
+                strike=Decimal("100"),
+                expiry="2099-01-16",
+            )
+        ]
+
+        with patch("src.greeks.monitor.greeks_ws_manager") as ws:
+            ws.broadcast_greeks_update = AsyncMock()
+            ws.broadcast_alert = AsyncMock()
+            result = await monitor.check(positions)
+
+        assert result.scenario_grid is not None
+        assert result.scenario_grid.pnl.shape == (11, 3, 1)
+        assert result.scenario_grid.legs_priced == 1
+        assert set(result.scenario_grid.breaches) == {
+            "dollar_delta",
+            "gamma_dollar",
+            "vega_per_1pct",
+            "theta_per_day",
+        }
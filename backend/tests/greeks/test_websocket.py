@@ -1,9 +1,51 @@
 """Tests for Greeks WebSocket manager."""
 
-from unittest.mock import AsyncMock
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from src.greeks.websocket import GreeksWebSocketManager
+from src.greeks import websocket as ws_module
+from src.greeks.websocket import GreeksWebSocketManager, _diff
+
+
+def _frames(mock_ws) -> list[dict]:
+    return [json.loads(call.args[0]) for call in mock_ws.send_text.call_args_list]
+
+
+def _greeks(delta: float, strategies: dict | None = None) -> dict:
+    return {
+        "account": {"dollar_delta": delta, "gamma_dollar": 100.0},
+        "strategies": strategies or {},
+    }
+
+
+class BlockingWebSocket:
+    """WebSocket whose sends block until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.sent: list[str] = []
+        self.closed_with: int | None = None
+
+    async def send_text(self, text: str) -> None:
+        await self.release.wait()
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+
+class SlowWebSocket(BlockingWebSocket):
+    """WebSocket whose sends complete after a fixed delay."""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    async def send_text(self, text: str) -> None:
+        await asyncio.sleep(self.delay)
+        self.sent.append(text)
 
 
 class TestGreeksWebSocketManager:
@@ -39,17 +81,179 @@ class TestGreeksWebSocketManager:
         await manager.connect("acc123", mock_ws2)
 
         await manager.broadcast_greeks_update("acc123", {"test": "data"})
+        assert await manager.flush("acc123")
 
-        mock_ws1.send_json.assert_called_once()
-        mock_ws2.send_json.assert_called_once()
+        mock_ws1.send_text.assert_called_once()
+        mock_ws2.send_text.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_broadcast_handles_disconnected_client(self):
         manager = GreeksWebSocketManager()
         mock_ws = AsyncMock()
-        mock_ws.send_json.side_effect = Exception("Connection closed")
+        mock_ws.send_text.side_effect = Exception("Connection closed")
 
         await manager.connect("acc123", mock_ws)
 
         # Should not raise
         await manager.broadcast_greeks_update("acc123", {"test": "data"})
+        await manager.flush("acc123")
+
+        assert manager.get_connection_count("acc123") == 0
+
+
+class TestBroadcastFrames:
+    """Tests for snapshot/delta framing."""
+
+    @pytest.mark.asyncio
+    async def test_unsent_snapshot_is_latest_wins(self):
+        manager = GreeksWebSocketManager()
+        mock_ws = AsyncMock()
+        await manager.connect("acc123", mock_ws)
+
+        # No sender turn in between: the client only ever sees the latest state
+        await manager.broadcast_greeks_update("acc123", _greeks(1000.0))
+        await manager.broadcast_greeks_update("acc123", _greeks(1500.0))
+        await manager.flush("acc123")
+
+        (frame,) = _frames(mock_ws)
+        assert frame["type"] == "greeks_update"
+        assert frame["seq"] == 2
+        assert frame["data"]["account"]["dollar_delta"] == 1500.0
+
+    @pytest.mark.asyncio
+    async def test_first_update_is_snapshot_then_deltas(self):
+        manager = GreeksWebSocketManager()
+        mock_ws = AsyncMock()
+        await manager.connect("acc123", mock_ws)
+
+        await manager.broadcast_greeks_update("acc123", _greeks(1000.0, {"s1": {"d": 1.0}}))
+        await manager.flush("acc123")
+        await manager.broadcast_greeks_update("acc123", _greeks(1500.0))
+        await manager.flush("acc123")
+
+        snapshot, delta = _frames(mock_ws)
+        assert snapshot["type"] == "greeks_update"
+        assert snapshot["seq"] == 1
+        assert snapshot["data"] == _greeks(1000.0, {"s1": {"d": 1.0}})
+        assert delta["type"] == "greeks_delta"
+        assert delta["seq"] == 2
+        assert delta["data"] == {"account": {"dollar_delta": 1500.0}}
+        assert delta["removed"] == [["strategies", "s1"]]
+
+    @pytest.mark.asyncio
+    async def test_late_joiner_gets_latest_snapshot(self):
+        manager = GreeksWebSocketManager()
+        await manager.broadcast_greeks_update("acc123", _greeks(1000.0))
+        await manager.broadcast_greeks_update("acc123", _greeks(2000.0))
+
+        mock_ws = AsyncMock()
+        await manager.connect("acc123", mock_ws)
+        await manager.flush("acc123")
+        await manager.broadcast_greeks_update("acc123", _greeks(2500.0))
+        await manager.flush("acc123")
+
+        snapshot, delta = _frames(mock_ws)
+        assert snapshot["type"] == "greeks_update"
+        assert snapshot["data"]["account"]["dollar_delta"] == 2000.0
+        assert delta["seq"] == snapshot["seq"] + 1
+
+    @pytest.mark.asyncio
+    async def test_each_update_serialized_once(self):
+        manager = GreeksWebSocketManager()
+        clients = [AsyncMock() for _ in range(5)]
+        for client in clients:
+            await manager.connect("acc123", client)
+
+        with patch.object(ws_module, "_dumps", wraps=ws_module._dumps) as dumps:
+            await manager.broadcast_greeks_update("acc123", _greeks(1000.0))
+            await manager.flush("acc123")
+            await manager.broadcast_greeks_update("acc123", _greeks(1100.0))
+            await manager.broadcast_alert("acc123", {"level": "warn"})
+            await manager.flush("acc123")
+
+        assert dumps.call_count == 3
+        assert all(client.send_text.call_count == 3 for client in clients)
+
+    def test_diff_nested_changes_and_removals(self):
+        old = {"a": {"x": 1, "y": 2}, "b": 3, "c": {"z": 1}}
+        new = {"a": {"x": 1, "y": 5}, "b": 3, "d": 4}
+
+        changed, removed = _diff(old, new)
+
+        assert changed == {"a": {"y": 5}, "d": 4}
+        assert removed == [["c"]]
+
+
+class TestSlowConsumers:
+    """Tests for bounded queues and slow consumer handling."""
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_broadcast_or_others(self):
+        manager = GreeksWebSocketManager(max_queue_size=4, max_resyncs=100)
+        slow = BlockingWebSocket()
+        fast = AsyncMock()
+        await manager.connect("acc123", slow)
+        await manager.connect("acc123", fast)
+
+        for i in range(20):
+            await asyncio.wait_for(
+                manager.broadcast_greeks_update("acc123", _greeks(float(i))), timeout=0.1
+            )
+        await asyncio.sleep(0)
+
+        assert fast.send_text.call_count == 20
+        assert manager._connections["acc123"][slow].backlog <= 4
+        assert manager.stats.frames_dropped > 0
+
+        # Once released, the slow client converges on the latest state
+        slow.release.set()
+        assert await manager.flush("acc123")
+        last = json.loads(slow.sent[-1])
+        assert last["type"] == "greeks_update"
+        assert last["data"]["account"]["dollar_delta"] == 19.0
+
+    @pytest.mark.asyncio
+    async def test_repeatedly_degraded_client_is_disconnected(self):
+        """A client that drains but never catches up is dropped."""
+        manager = GreeksWebSocketManager(max_queue_size=2, max_resyncs=2)
+        slow = SlowWebSocket(delay=0.005)
+        await manager.connect("acc123", slow)
+
+        for i in range(100):
+            await manager.broadcast_greeks_update("acc123", _greeks(float(i)))
+            await asyncio.sleep(0.001)
+            if not manager.get_connection_count("acc123"):
+                break
+
+        assert manager.get_connection_count("acc123") == 0
+        assert slow.closed_with == ws_module.SLOW_CONSUMER_CLOSE_CODE
+        assert manager.stats.slow_disconnects == 1
+
+    @pytest.mark.asyncio
+    async def test_alerts_are_not_dropped(self):
+        manager = GreeksWebSocketManager(max_queue_size=3, max_resyncs=100)
+        slow = BlockingWebSocket()
+        await manager.connect("acc123", slow)
+
+        await manager.broadcast_greeks_update("acc123", _greeks(1.0))
+        await manager.broadcast_alert("acc123", {"level": "crit"})
+        for i in range(5):
+            await manager.broadcast_greeks_update("acc123", _greeks(float(i)))
+
+        slow.release.set()
+        await manager.flush("acc123")
+
+        types = [json.loads(text)["type"] for text in slow.sent]
+        assert "greeks_alert" in types
+
+    @pytest.mark.asyncio
+    async def test_stalled_send_disconnects(self):
+        manager = GreeksWebSocketManager(send_timeout_seconds=0.01)
+        slow = BlockingWebSocket()
+        await manager.connect("acc123", slow)
+
+        await manager.broadcast_greeks_update("acc123", _greeks(1.0))
+        await asyncio.sleep(0.05)
+
+        assert manager.get_connection_count("acc123") == 0
+        assert slow.closed_with == ws_module.SLOW_CONSUMER_CLOSE_CODE
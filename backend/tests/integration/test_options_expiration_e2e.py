@@ -146,7 +146,7 @@ class TestThresholdMatchingLogic:
             symbol="AAPL240119C150",
             expiry=tomorrow,
         )
-        mock_portfolio.get_positions.return_value = [position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -184,7 +184,7 @@ class TestThresholdMatchingLogic:
             expiry=today,
             put_call=PutCall.PUT,
         )
-        mock_portfolio.get_positions.return_value = [position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -225,7 +225,7 @@ class TestThresholdMatchingLogic:
             symbol="NVDA240119C500",
             expiry=today,
         )
-        mock_portfolio.get_positions.return_value = [position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -265,7 +265,7 @@ class TestThresholdMatchingLogic:
             symbol="MSFT240119C400",
             expiry=expiry_date,
         )
-        mock_portfolio.get_positions.return_value = [position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -294,7 +294,7 @@ class TestThresholdMatchingLogic:
             symbol="META240119C350",
             expiry=expiry_date,
         )
-        mock_portfolio.get_positions.return_value = [position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -463,7 +463,7 @@ class TestTransactionAtomicity:
             symbol="AAPL240119C150",
             expiry=today,  # DTE=0, 4 thresholds
         )
-        mock_portfolio.get_positions.return_value = [position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
         # Simulate: first 2 succeed, third fails, fourth succeeds
         call_count = [0]
@@ -474,6 +474,8 @@ class TestTransactionAtomicity:
                 raise Exception("Simulated DB error")
             return (True, uuid4())
 
+        # Bulk write fails, so the checker retries alert by alert
+        mock_alert_repo.persist_alerts.side_effect = Exception("Bulk write failed")
         mock_alert_repo.persist_alert.side_effect = persist_with_failure
 
         checker = ExpirationChecker(
@@ -516,7 +518,7 @@ class TestTransactionAtomicity:
             expiry=today,
         )
 
-        mock_portfolio.get_positions.return_value = [pos1, pos2]
+        mock_portfolio.get_expiring_option_positions.return_value = ([pos1, pos2], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -835,7 +837,7 @@ class TestTimezoneBoundaryTests:
             symbol="TEST_BOUNDARY",
             expiry=tomorrow,
         )
-        mock_portfolio.get_positions.return_value = [position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -871,7 +873,7 @@ class TestTimezoneBoundaryTests:
             symbol="TEST_TZ",
             expiry=today_ny,  # Expires "today" in NY time
         )
-        mock_portfolio.get_positions.return_value = [position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -904,7 +906,7 @@ class TestTimezoneBoundaryTests:
             symbol="TEST_DST_SPRING",
             expiry=dst_date,
         )
-        mock_portfolio.get_positions.return_value = [position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
         # Mock datetime.now to return a specific time during DST
         with patch("src.options.checker.datetime") as mock_datetime:
@@ -942,7 +944,7 @@ class TestTimezoneBoundaryTests:
             symbol="TEST_DST_FALL",
             expiry=dst_date,
         )
-        mock_portfolio.get_positions.return_value = [position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
         # Mock datetime.now to return a specific time during fall back
         with patch("src.options.checker.datetime") as mock_datetime:
@@ -1005,7 +1007,7 @@ class TestTimezoneBoundaryTests:
                 symbol="TEST_2359",
                 expiry=date(2024, 1, 15),  # Same day
             )
-            mock_portfolio.get_positions.return_value = [position]
+            mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
             checker = ExpirationChecker(
                 portfolio=mock_portfolio,
@@ -1037,7 +1039,7 @@ class TestTimezoneBoundaryTests:
                 symbol="TEST_0001",
                 expiry=date(2024, 1, 16),  # Tomorrow
             )
-            mock_portfolio.get_positions.return_value = [position]
+            mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
             checker = ExpirationChecker(
                 portfolio=mock_portfolio,
@@ -1096,7 +1098,7 @@ class TestFullE2EFlow:
                 expiry=today + timedelta(days=30),  # DTE=30, 0 alerts
             ),
         ]
-        mock_portfolio.get_positions.return_value = positions
+        mock_portfolio.get_expiring_option_positions.return_value = (positions, 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -1135,7 +1137,7 @@ class TestFullE2EFlow:
             put_call=PutCall.CALL,
             quantity=5,
         )
-        mock_portfolio.get_positions.return_value = [position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -1185,7 +1187,7 @@ class TestFullE2EFlow:
                 symbol="MULTI_RUN",
                 expiry=date(2024, 1, 15),  # DTE=3
             )
-            mock_portfolio.get_positions.return_value = [position]
+            mock_portfolio.get_expiring_option_positions.return_value = ([position], 0)
 
             checker = ExpirationChecker(
                 portfolio=mock_portfolio,
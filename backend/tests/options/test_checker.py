@@ -34,7 +34,7 @@ def mock_portfolio():
 def mock_alert_repo():
     """Create a mock AlertRepository."""
     repo = AsyncMock()
-    repo.persist_alert.return_value = (True, "alert-123")  # is_new=True
+    repo.persist_alerts.side_effect = lambda alerts: [(True, "alert-123")] * len(alerts)
     return repo
 
 
@@ -48,7 +48,7 @@ class TestExpirationChecker:
         """Should create alerts for positions within threshold."""
         from src.options.checker import ExpirationChecker
 
-        mock_portfolio.get_positions.return_value = [mock_position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([mock_position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -60,7 +60,7 @@ class TestExpirationChecker:
 
         assert stats["positions_checked"] == 1
         assert stats["alerts_created"] >= 1  # At least 1 threshold triggered
-        assert mock_alert_repo.persist_alert.called
+        mock_alert_repo.persist_alerts.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_check_expirations_deduplicates(
@@ -69,8 +69,10 @@ class TestExpirationChecker:
         """Should count deduplicated alerts correctly."""
         from src.options.checker import ExpirationChecker
 
-        mock_portfolio.get_positions.return_value = [mock_position]
-        mock_alert_repo.persist_alert.return_value = (False, "alert-123")  # is_new=False
+        mock_portfolio.get_expiring_option_positions.return_value = ([mock_position], 0)
+        mock_alert_repo.persist_alerts.side_effect = lambda alerts: (
+            [(False, "alert-123")] * len(alerts)
+        )  # is_new=False
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -90,7 +92,7 @@ class TestExpirationChecker:
         from src.options.checker import ExpirationChecker
 
         mock_position.expiry = None
-        mock_portfolio.get_positions.return_value = [mock_position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([mock_position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -113,7 +115,7 @@ class TestExpirationChecker:
         market_tz = ZoneInfo("America/New_York")
         market_today = datetime.now(market_tz).date()
         mock_position.expiry = market_today - timedelta(days=1)  # Yesterday in market tz
-        mock_portfolio.get_positions.return_value = [mock_position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([mock_position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -133,7 +135,7 @@ class TestExpirationChecker:
         from src.options.checker import ExpirationChecker
 
         mock_position.expiry = date.today() + timedelta(days=30)  # 30 days out
-        mock_portfolio.get_positions.return_value = [mock_position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([mock_position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -146,26 +148,30 @@ class TestExpirationChecker:
         assert stats["alerts_created"] == 0
 
     @pytest.mark.asyncio
-    async def test_check_expirations_filters_options_only(
+    async def test_check_expirations_queries_threshold_window(
         self, mock_portfolio, mock_alert_repo, mock_position
     ):
-        """Should only process OPTION positions."""
+        """Should fetch options through the largest threshold and count later ones."""
         from src.options.checker import ExpirationChecker
 
-        stock_position = MagicMock()
-        stock_position.asset_type = AssetType.STOCK
-
-        mock_portfolio.get_positions.return_value = [stock_position, mock_position]
+        market_tz = ZoneInfo("America/New_York")
+        mock_portfolio.get_expiring_option_positions.return_value = ([mock_position], 5)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
             alert_repo=mock_alert_repo,
+            market_tz=market_tz,
         )
 
         stats = await checker.check_expirations("acc123")
 
-        # Only the option should be checked
-        assert stats["positions_checked"] == 1
+        mock_portfolio.get_expiring_option_positions.assert_awaited_once_with(
+            account_id="acc123",
+            through=datetime.now(market_tz).date() + timedelta(days=7),
+        )
+        mock_portfolio.get_positions.assert_not_called()
+        assert stats["positions_checked"] == 6
+        assert stats["positions_not_expiring_soon"] == 5
 
     @pytest.mark.asyncio
     async def test_check_expirations_returns_run_id(
@@ -174,7 +180,7 @@ class TestExpirationChecker:
         """Stats should include run_id for traceability."""
         from src.options.checker import ExpirationChecker
 
-        mock_portfolio.get_positions.return_value = [mock_position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([mock_position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -199,7 +205,7 @@ class TestDTECalculation:
         ny_tz = ZoneInfo("America/New_York")
         ny_today = datetime.now(ny_tz).date()
         mock_position.expiry = ny_today
-        mock_portfolio.get_positions.return_value = [mock_position]
+        mock_portfolio.get_expiring_option_positions.return_value = ([mock_position], 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -0,0 +1,110 @@
+"""Performance tests for audit event encoding.
+
+Target: building and checksumming an event encodes each value once, and the
+per-event overhead is materially lower than the previous pipeline, which
+deep-copied values for redaction, computed a discarded JSON Patch diff and
+re-serialized each value for the size check and again for the checksum.
+"""
+
+import copy
+import hashlib
+import json
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.audit.config import CHECKSUM_FIELDS
+from src.audit.diff import _sensitive_fields, compute_diff_jsonpatch
+from src.audit.integrity import compute_checksum
+from src.audit.models import (
+    ActorType,
+    AuditEventType,
+    AuditSeverity,
+    EventSource,
+    ResourceType,
+)
+from src.audit.service import AuditService
+
+EVENT_COUNT = 2000
+
+
+def make_values(i: int) -> tuple[dict, dict]:
+    """A config change of typical size: nested limits plus a secret."""
+    old = {
+        "limits": {
+            f"SYM{j}": {"max_position": 1000 + j, "max_notional": 50000.0} for j in range(20)
+        },
+        "password": "hunter22",
+        "revision": i,
+    }
+    new = copy.deepcopy(old)
+    new["limits"]["SYM0"]["max_position"] = 2000
+    new["revision"] = i + 1
+    return old, new
+
+
+def legacy_event_overhead(old: dict, new: dict) -> str:
+    """The previous per-event pipeline, kept as the benchmark baseline."""
+    sensitive = _sensitive_fields("config")
+
+    def redact(value, key):
+        if isinstance(value, dict):
+            return {k: redact(v, k) for k, v in value.items()}
+        if isinstance(value, list):
+            return [redact(item, key) for item in value]
+        return "****" if key in sensitive else value
+
+    redacted_old = {k: redact(v, k) for k, v in copy.deepcopy(old).items()}
+    redacted_new = {k: redact(v, k) for k, v in copy.deepcopy(new).items()}
+    compute_diff_jsonpatch(redacted_old, redacted_new)
+    for value in (redacted_old, redacted_new):
+        len(json.dumps(value, sort_keys=True).encode("utf-8"))
+
+    content = dict.fromkeys(CHECKSUM_FIELDS)
+    content["event_id"] = str(uuid4())
+    content["timestamp"] = datetime.now(tz=timezone.utc).isoformat()
+    content["old_value"] = json.dumps(redacted_old, sort_keys=True)
+    content["new_value"] = json.dumps(redacted_new, sort_keys=True)
+    content["sequence_id"] = 1
+    content["prev_checksum"] = None
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class TestAuditSerializationPerformance:
+    """Benchmarks per-event encoding overhead."""
+
+    def test_single_pass_encoding_faster_than_legacy(self):
+        """Build + checksum beats the previous multi-pass pipeline."""
+        values = [make_values(i) for i in range(EVENT_COUNT)]
+        service = AuditService(repository=None)
+
+        start = time.perf_counter()
+        for old, new in values:
+            legacy_event_overhead(old, new)
+        legacy_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i, (old, new) in enumerate(values):
+            event = service._build_event(
+                event_type=AuditEventType.CONFIG_UPDATED,
+                actor_id="user-123",
+                actor_type=ActorType.USER,
+                resource_type=ResourceType.CONFIG,
+                resource_id=f"config-{i}",
+                request_id="req-789",
+                source=EventSource.API,
+                severity=AuditSeverity.WARNING,
+                old_value=old,
+                new_value=new,
+            )
+            compute_checksum(event, i + 1, None)
+        current_elapsed = time.perf_counter() - start
+
+        print(
+            f"\nAudit encoding {EVENT_COUNT} events: legacy "
+            f"{legacy_elapsed / EVENT_COUNT * 1e6:.0f} us/event, single-pass "
+            f"{current_elapsed / EVENT_COUNT * 1e6:.0f} us/event "
+            f"({legacy_elapsed / current_elapsed:.1f}x)"
+        )
+
+        assert current_elapsed < legacy_elapsed
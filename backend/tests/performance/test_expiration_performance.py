@@ -137,13 +137,16 @@ class TestExpirationCheckerPerformance:
         # Simulate mix of new and deduplicated alerts
         call_count = [0]
 
-        async def mock_persist(alert):
-            call_count[0] += 1
-            # First occurrence of each dedupe_key is new
-            is_new = call_count[0] % 3 != 0  # ~67% new alerts
-            return (is_new, f"alert-{call_count[0]}")
-
-        repo.persist_alert.side_effect = mock_persist
+        async def mock_persist(alerts):
+            results = []
+            for _ in alerts:
+                call_count[0] += 1
+                # First occurrence of each dedupe_key is new
+                is_new = call_count[0] % 3 != 0  # ~67% new alerts
+                results.append((is_new, f"alert-{call_count[0]}"))
+            return results
+
+        repo.persist_alerts.side_effect = mock_persist
         return repo
 
     @pytest.mark.asyncio
@@ -159,7 +162,7 @@ class TestExpirationCheckerPerformance:
         """
         # Generate test positions
         positions = generate_position_set(self.POSITION_COUNT)
-        mock_portfolio.get_positions.return_value = positions
+        mock_portfolio.get_expiring_option_positions.return_value = (positions, 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -220,7 +223,7 @@ class TestExpirationCheckerPerformance:
         target_time = self.TARGET_TIME_SECONDS * 2
 
         positions = generate_position_set(position_count)
-        mock_portfolio.get_positions.return_value = positions
+        mock_portfolio.get_expiring_option_positions.return_value = (positions, 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -264,7 +267,7 @@ class TestExpirationCheckerPerformance:
         positions = [
             create_mock_option_position(i, days_to_expiry=0) for i in range(position_count)
         ]
-        mock_portfolio.get_positions.return_value = positions
+        mock_portfolio.get_expiring_option_positions.return_value = (positions, 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
@@ -315,7 +318,7 @@ class TestExpirationCheckerPerformance:
         positions = [
             create_mock_option_position(i, days_to_expiry=30) for i in range(position_count)
         ]
-        mock_portfolio.get_positions.return_value = positions
+        mock_portfolio.get_expiring_option_positions.return_value = (positions, 0)
 
         checker = ExpirationChecker(
             portfolio=mock_portfolio,
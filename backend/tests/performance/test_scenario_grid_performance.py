@@ -0,0 +1,69 @@
+"""Performance tests for the full-revaluation scenario grid.
+
+Target: 5,000 option legs repriced across the default grid
+(11 spot × 3 IV × 2 time = 66 scenarios) in under 100 ms, so the grid can
+run inside every monitor cycle.
+"""
+
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from src.greeks.models import GreeksDataSource, GreeksModel, PositionGreeks
+from src.greeks.scenario_grid import ScenarioGridConfig, calculate_scenario_grid
+
+LEG_COUNT = 5000
+TODAY = date(2024, 3, 1)
+
+
+def generate_legs(count: int) -> list[PositionGreeks]:
+    """Generate legs across 30 underlyings with varied strikes/expiries."""
+    legs = []
+    for i in range(count):
+        legs.append(
+            PositionGreeks(
+                position_id=i,
+                symbol=f"SYM{i % 30}OPT{i}",
+                underlying_symbol=f"SYM{i % 30}",
+                quantity=(1 + i % 10) * (-1 if i % 3 == 0 else 1),
+                multiplier=100,
+                underlying_price=Decimal(100 + i % 30),
+                option_type="call" if i % 2 == 0 else "put",
+                strike=Decimal(80 + (i % 41)),
+                expiry=(TODAY + timedelta(days=1 + i % 180)).isoformat(),
+                dollar_delta=Decimal("0"),
+                gamma_dollar=Decimal("0"),
+                gamma_pnl_1pct=Decimal("0"),
+                vega_per_1pct=Decimal("0"),
+                theta_per_day=Decimal("0"),
+                source=GreeksDataSource.MODEL,
+                model=GreeksModel.BS,
+                implied_vol=Decimal("0.20") + Decimal(i % 20) / 100,
+            )
+        )
+    return legs
+
+
+class TestScenarioGridPerformance:
+    """Benchmarks the vectorized scenario grid."""
+
+    def test_5000_legs_default_grid_under_100ms(self):
+        """Default grid over 5,000 legs fits in a monitor cycle."""
+        legs = generate_legs(LEG_COUNT)
+        config = ScenarioGridConfig()
+        calculate_scenario_grid(legs, config=config, today=TODAY)  # warm-up
+
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            result = calculate_scenario_grid(legs, config=config, today=TODAY)
+            timings.append(time.perf_counter() - start)
+        elapsed = min(timings)
+
+        print(
+            f"\nScenario grid {LEG_COUNT} legs × {config.scenario_count} scenarios: "
+            f"{elapsed * 1000:.1f} ms"
+        )
+
+        assert result.legs_priced == LEG_COUNT
+        assert elapsed < 0.1
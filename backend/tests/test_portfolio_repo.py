@@ -1,8 +1,9 @@
-import pytest
+from datetime import date, timedelta
 from decimal import Decimal
 
+import pytest
 from src.db.repositories.portfolio_repo import PortfolioRepository
-from src.models import Account, Position, Transaction, AssetType, TransactionAction
+from src.models import Account, AssetType, Position, Transaction, TransactionAction
 
 
 @pytest.fixture
@@ -88,6 +89,57 @@ class TestPositionOperations:
         position = await repo.get_position("ACC001", "AAPL")
         assert position is None
 
+    async def test_get_expiring_option_positions(self, repo):
+        await repo.create_account("ACC001")
+        today = date(2026, 3, 2)
+        for symbol, asset_type, expiry in [
+            ("AAPL", AssetType.STOCK, None),
+            ("AAPL_EXPIRED", AssetType.OPTION, today - timedelta(days=1)),
+            ("AAPL_TODAY", AssetType.OPTION, today),
+            ("AAPL_WEEK", AssetType.OPTION, today + timedelta(days=7)),
+            ("AAPL_NOEXP", AssetType.OPTION, None),
+            ("AAPL_LATER", AssetType.OPTION, today + timedelta(days=8)),
+            ("AAPL_LATER2", AssetType.OPTION, today + timedelta(days=30)),
+        ]:
+            await repo.create_position(
+                account_id="ACC001",
+                symbol=symbol,
+                quantity=1,
+                avg_cost=Decimal("1.00"),
+                asset_type=asset_type,
+                expiry=expiry,
+            )
+
+        positions, later_count = await repo.get_expiring_option_positions(
+            "ACC001", through=today + timedelta(days=7)
+        )
+
+        assert {p.symbol for p in positions} == {
+            "AAPL_EXPIRED",
+            "AAPL_TODAY",
+            "AAPL_WEEK",
+            "AAPL_NOEXP",
+        }
+        assert later_count == 2
+
+    async def test_get_expiring_option_positions_empty_window(self, repo):
+        await repo.create_account("ACC001")
+        await repo.create_position(
+            account_id="ACC001",
+            symbol="AAPL_LATER",
+            quantity=1,
+            avg_cost=Decimal("1.00"),
+            asset_type=AssetType.OPTION,
+            expiry=date(2026, 6, 1),
+        )
+
+        positions, later_count = await repo.get_expiring_option_positions(
+            "ACC001", through=date(2026, 3, 9)
+        )
+
+        assert positions == []
+        assert later_count == 1
+
 
 class TestTransactionOperations:
     async def test_record_transaction(self, repo):
@@ -514,9 +514,13 @@ export interface GreeksLimits {
 }
 
 export interface GreeksWebSocketMessage {
-  type: 'greeks_update' | 'greeks_alert' | 'pong';
+  // greeks_update carries the full state; greeks_delta only changed fields
+  type: 'greeks_update' | 'greeks_delta' | 'greeks_alert' | 'pong';
   account_id: string;
   timestamp: string;
+  seq?: number;
+  // greeks_delta: key paths removed since the previous frame
+  removed?: string[][];
   data?: {
     account: {
       dollar_delta: number;